@@ -0,0 +1,156 @@
+"""
+Cross-tier CORTEX benchmark suite.
+
+Generates a synthetic brain (Tier 1 conversations, Tier 2 patterns and
+relationships, Tier 3 git repository), times routing, context building,
+pattern search, graph traversal, decay, crawls, template rendering and
+healthchecks, and writes JSON results with latency percentiles.
+
+Usage:
+    python scripts/benchmark_brain.py run --scale small --output results.json
+    python scripts/benchmark_brain.py run --baseline baseline.json   # exit 1 on regression
+    python scripts/benchmark_brain.py compare baseline.json results.json
+    python scripts/benchmark_brain.py generate --scale medium --brain-dir /tmp/brain
+    python scripts/benchmark_brain.py list
+
+Runs fully offline; the brain is cached in --brain-dir and reused while
+scale and seed are unchanged.
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.benchmarks import (
+    BenchmarkRunner,
+    BrainScale,
+    SCENARIOS,
+    SyntheticBrain,
+    compare_results,
+    load_results,
+    save_results,
+    select_scenarios,
+)
+
+DEFAULT_BRAIN_DIR = Path(tempfile.gettempdir()) / "cortex-benchmark-brain"
+
+
+def _brain(args) -> SyntheticBrain:
+    brain_dir = Path(args.brain_dir) / args.scale
+    brain = SyntheticBrain(brain_dir, BrainScale.preset(args.scale), seed=args.seed)
+    start = time.perf_counter()
+    brain.generate(force=args.regenerate)
+    print(f"Brain: {brain_dir} ({args.scale}, ready in {time.perf_counter() - start:.1f}s)")
+    return brain
+
+
+def _print_result(result) -> None:
+    if result.status != "ok":
+        print(f"  {result.name:<34} {result.status.upper()}: {result.error}")
+        return
+    target = ""
+    if result.target_ms is not None:
+        target = f"  target {result.target_ms:.0f}ms {'OK' if result.meets_target else 'MISSED'}"
+    print(
+        f"  {result.name:<34} p50 {result.p50_ms:9.2f}ms  p95 {result.p95_ms:9.2f}ms  "
+        f"p99 {result.p99_ms:9.2f}ms{target}"
+    )
+
+
+def cmd_run(args) -> int:
+    scenarios = select_scenarios(args.scenarios)
+    brain = _brain(args)
+    runner = BenchmarkRunner(brain, iterations=args.iterations, warmup=args.warmup)
+
+    print(f"Running {len(scenarios)} scenario(s)...")
+    results = runner.run(scenarios, progress=_print_result)
+
+    if args.output:
+        save_results(results, Path(args.output))
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        report = compare_results(
+            load_results(Path(args.baseline)), results,
+            threshold=args.threshold, min_delta_ms=args.min_delta_ms, metric=args.metric
+        )
+        print("\n" + report.format())
+        return 1 if report.regressions else 0
+    return 0
+
+
+def cmd_compare(args) -> int:
+    report = compare_results(
+        load_results(Path(args.baseline)), load_results(Path(args.current)),
+        threshold=args.threshold, min_delta_ms=args.min_delta_ms, metric=args.metric
+    )
+    print(report.format())
+    return 1 if report.regressions else 0
+
+
+def cmd_generate(args) -> int:
+    args.regenerate = True
+    _brain(args)
+    return 0
+
+
+def cmd_list(args) -> int:
+    for scenario in SCENARIOS:
+        target = f" (target {scenario.target_ms:.0f}ms)" if scenario.target_ms else ""
+        print(f"{scenario.name:<34} {scenario.description}{target}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CORTEX cross-tier benchmark suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def brain_options(sub):
+        sub.add_argument("--scale", default="small", choices=["tiny", "small", "medium", "large"])
+        sub.add_argument("--seed", type=int, default=42)
+        sub.add_argument("--brain-dir", default=str(DEFAULT_BRAIN_DIR))
+
+    def compare_options(sub):
+        sub.add_argument("--threshold", type=float, default=0.15,
+                         help="Relative slowdown flagged as regression (default: 0.15)")
+        sub.add_argument("--min-delta-ms", type=float, default=1.0,
+                         help="Ignore absolute changes below this (default: 1.0)")
+        sub.add_argument("--metric", default="p50_ms", choices=["p50_ms", "p95_ms", "p99_ms", "mean_ms"])
+
+    run = subparsers.add_parser("run", help="Run scenarios")
+    brain_options(run)
+    compare_options(run)
+    run.add_argument("--iterations", type=int, default=30)
+    run.add_argument("--warmup", type=int, default=3)
+    run.add_argument("--scenarios", nargs="*", help="Scenario name substrings (default: all)")
+    run.add_argument("--output", help="Write JSON results here")
+    run.add_argument("--baseline", help="Compare against this results file")
+    run.add_argument("--regenerate", action="store_true", help="Rebuild the synthetic brain")
+    run.set_defaults(func=cmd_run)
+
+    compare = subparsers.add_parser("compare", help="Compare two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare_options(compare)
+    compare.set_defaults(func=cmd_compare)
+
+    generate = subparsers.add_parser("generate", help="(Re)generate the synthetic brain only")
+    brain_options(generate)
+    generate.set_defaults(func=cmd_generate)
+
+    subparsers.add_parser("list", help="List scenarios").set_defaults(func=cmd_list)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
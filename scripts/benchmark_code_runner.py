@@ -0,0 +1,88 @@
+"""
+Benchmark CodeRunner sandbox pool vs fresh-subprocess execution.
+
+Workloads:
+- Demo script (execute_code)
+- Small pytest file with implementation module (run_tests)
+
+Reports executions per second for each mode.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.tdd.code_runner import CodeRunner
+
+DEMO_CODE = """
+def fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+print(fibonacci(30))
+"""
+
+TEST_CODE = """
+from implementation import fibonacci
+
+def test_base():
+    assert fibonacci(0) == 0
+
+def test_value():
+    assert fibonacci(10) == 55
+"""
+
+IMPLEMENTATION_CODE = """
+def fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+"""
+
+
+def measure(label, func, iterations):
+    # One untimed run so pool warm-up is not charged to the first job
+    func()
+    failures = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        failures += not func().success
+    elapsed = time.perf_counter() - start
+    rate = iterations / elapsed
+    # The subprocess path needs the pytest-json-report plugin for --json-report
+    print(f"  {label:<12} {elapsed*1000/iterations:8.1f}ms/run  {rate:8.1f} runs/s  failed={failures}")
+    return rate
+
+
+def benchmark(iterations=20):
+    print("\n" + "="*60)
+    print("CODE RUNNER BENCHMARK")
+    print("="*60)
+
+    pooled = CodeRunner(use_pool=True)
+    fresh = CodeRunner(use_pool=False)
+
+    try:
+        for name, call in (
+            ("execute_code", lambda runner: runner.execute_code(DEMO_CODE)),
+            ("run_tests", lambda runner: runner.run_tests(TEST_CODE, IMPLEMENTATION_CODE)),
+        ):
+            print(f"\n{name} ({iterations} runs):")
+            subprocess_rate = measure("subprocess", lambda: call(fresh), iterations)
+            pool_rate = measure("pool", lambda: call(pooled), iterations)
+            print(f"  Speedup: {pool_rate / subprocess_rate:.1f}x")
+    finally:
+        pooled.cleanup()
+        fresh.cleanup()
+    print("="*60)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,100 @@
+"""
+Offline benchmark for LLMOrchestrator using the deterministic simulated adapter.
+
+Compares:
+- sequential fallback vs hedged requests (p50/p95/p99 latency)
+- response cache hit rate on a workload with repeated prompts
+- time to first chunk for streaming vs full generation
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.llm.orchestrator import LLMOrchestrator
+from src.llm.response_cache import ResponseCache
+from src.llm.adapters.simulated_adapter import SimulatedAdapter
+
+REQUESTS = 200
+
+
+def make_orchestrator(**kwargs):
+    adapters = {
+        # Fast primary with a 4% slow tail (the case hedging is meant for)
+        "primary": SimulatedAdapter(config={
+            "latency_ms": 15, "jitter_ms": 5, "tail_ms": 250, "tail_rate": 0.04,
+            "failure_rate": 0.01, "seed": 7,
+        }),
+        "fallback": SimulatedAdapter(config={"latency_ms": 25, "jitter_ms": 5, "seed": 11}),
+    }
+    return LLMOrchestrator("primary", ["fallback"], adapters=adapters, **kwargs)
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    pick = lambda pct: ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+    return pick(0.50), pick(0.95), pick(0.99)
+
+
+def run_latency(label, orchestrator, prompts):
+    latencies = []
+    for prompt in prompts:
+        start = time.perf_counter()
+        orchestrator.generate(prompt)
+        latencies.append((time.perf_counter() - start) * 1000)
+    p50, p95, p99 = percentiles(latencies)
+    print(f"\n{label}:")
+    print(f"  p50: {p50:.1f}ms  p95: {p95:.1f}ms  p99: {p99:.1f}ms")
+    return p99
+
+
+def benchmark():
+    print("\n" + "="*60)
+    print("LLM ORCHESTRATOR BENCHMARK (offline, simulated providers)")
+    print("="*60)
+
+    unique_prompts = [f"explain module {i}" for i in range(REQUESTS)]
+
+    sequential = make_orchestrator()
+    seq_p99 = run_latency("Sequential fallback", sequential, unique_prompts)
+
+    hedged = make_orchestrator(hedge=True, hedge_min_samples=20, hedge_default_ms=60)
+    hedged_p99 = run_latency("Hedged (p95 delay)", hedged, unique_prompts)
+    print(f"  Hedges launched: {hedged.hedges_launched}")
+    hedged.close()
+
+    # Repeated prompts: 20 distinct questions asked 10 times each, with
+    # whitespace variations that normalize to the same key
+    repeated = [f"what does   module {i % 20} do" if i % 2 else f"what does module {i % 20} do"
+                for i in range(REQUESTS)]
+    cached = make_orchestrator(cache=ResponseCache(max_entries=256, ttl_seconds=600))
+    run_latency("Cached (repeated prompts)", cached, repeated)
+    print(f"  Hit rate: {cached.cache.stats.hit_rate * 100:.1f}%")
+
+    streaming = LLMOrchestrator("primary", ["fallback"], adapters={
+        "primary": SimulatedAdapter(config={"latency_ms": 20, "chunk_delay_ms": 5, "seed": 3}),
+        "fallback": SimulatedAdapter(config={"latency_ms": 25, "seed": 4}),
+    })
+    start = time.perf_counter()
+    first_chunk_ms = None
+    for chunk in streaming.stream("stream a long answer about the knowledge graph tiers"):
+        if first_chunk_ms is None:
+            first_chunk_ms = (time.perf_counter() - start) * 1000
+    total_ms = (time.perf_counter() - start) * 1000
+    print("\nStreaming:")
+    print(f"  First chunk: {first_chunk_ms:.1f}ms  Complete: {total_ms:.1f}ms")
+
+    print("\nValidation:")
+    if hedged_p99 < seq_p99:
+        print(f"  ✅ Hedging cut p99 from {seq_p99:.1f}ms to {hedged_p99:.1f}ms")
+    else:
+        print(f"  ❌ Hedging did not improve p99 ({seq_p99:.1f}ms → {hedged_p99:.1f}ms)")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,37 @@
+"""
+CORTEX Benchmarks
+
+Cross-tier performance benchmarks against a synthetic brain, with JSON
+results and baseline comparison. Run via scripts/benchmark_brain.py.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+from .synthetic_brain import BrainScale, SyntheticBrain
+from .harness import (
+    BenchmarkRunner,
+    Comparison,
+    ComparisonReport,
+    Scenario,
+    ScenarioResult,
+    compare_results,
+    load_results,
+    save_results,
+)
+from .scenarios import SCENARIOS, select_scenarios
+
+__all__ = [
+    "BrainScale",
+    "SyntheticBrain",
+    "BenchmarkRunner",
+    "Comparison",
+    "ComparisonReport",
+    "Scenario",
+    "ScenarioResult",
+    "compare_results",
+    "load_results",
+    "save_results",
+    "SCENARIOS",
+    "select_scenarios",
+]
@@ -0,0 +1,288 @@
+"""
+CORTEX Benchmark Harness
+
+Runs benchmark scenarios against a synthetic brain, summarizes latency
+percentiles and compares runs against a stored baseline.
+
+A scenario's setup() receives the brain and returns an operation taking
+the iteration number; only the operation is timed. Scenarios that need
+fresh state per iteration return (prepare, operation) instead, and
+prepare(i) runs untimed before each call. Scenarios that change
+process-wide state (tracing, background threads) return
+(prepare, operation, teardown); teardown() runs after the last call,
+even if the scenario fails. Setup failures (e.g.
+an optional dependency missing) mark the scenario as skipped instead of
+failing the whole run.
+
+Result JSON:
+    {"version": 1, "created_at": ..., "environment": {...}, "scale": {...},
+     "results": {"tier2.pattern_search": {"p50_ms": ..., "p95_ms": ..., ...}}}
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import gc
+import json
+import logging
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .synthetic_brain import SyntheticBrain
+
+logger = logging.getLogger(__name__)
+
+RESULT_VERSION = 1
+
+
+@dataclass
+class Scenario:
+    """One benchmarked operation"""
+    name: str
+    description: str
+    setup: Callable[[SyntheticBrain], Callable[[int], Any]]
+    target_ms: Optional[float] = None  # Documented latency target (p95), if any
+    iterations: Optional[int] = None  # Override for slow scenarios
+
+
+@dataclass
+class ScenarioResult:
+    """Latency summary of one scenario"""
+    name: str
+    status: str  # "ok", "skipped", "error"
+    iterations: int = 0
+    mean_ms: float = 0.0
+    stdev_ms: float = 0.0
+    min_ms: float = 0.0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    target_ms: Optional[float] = None
+    meets_target: Optional[bool] = None
+    error: Optional[str] = None
+
+    @classmethod
+    def from_timings(cls, name: str, timings_ms: Sequence[float],
+                     target_ms: Optional[float] = None) -> "ScenarioResult":
+        ordered = sorted(timings_ms)
+        p95 = percentile(ordered, 95)
+        return cls(
+            name=name,
+            status="ok",
+            iterations=len(ordered),
+            mean_ms=statistics.fmean(ordered),
+            stdev_ms=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+            min_ms=ordered[0],
+            p50_ms=percentile(ordered, 50),
+            p90_ms=percentile(ordered, 90),
+            p95_ms=p95,
+            p99_ms=percentile(ordered, 99),
+            max_ms=ordered[-1],
+            target_ms=target_ms,
+            meets_target=None if target_ms is None else p95 <= target_ms
+        )
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """Linearly interpolated percentile of ascending values"""
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def environment_info() -> Dict[str, Any]:
+    """Machine details stored with results (comparisons across machines are not meaningful)"""
+    try:
+        git_version = subprocess.run(
+            ["git", "--version"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        git_version = None
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "sqlite": sqlite3.sqlite_version,
+        "git": git_version,
+    }
+
+
+class BenchmarkRunner:
+    """
+    Runs scenarios and produces a result document.
+
+    Each scenario gets `warmup` untimed calls, then `iterations` timed
+    calls (garbage collection disabled while timing to reduce noise).
+    """
+
+    def __init__(self, brain: SyntheticBrain, iterations: int = 30, warmup: int = 3):
+        self.brain = brain
+        self.iterations = iterations
+        self.warmup = warmup
+
+    def run_scenario(self, scenario: Scenario) -> ScenarioResult:
+        try:
+            operation = scenario.setup(self.brain)
+            prepare = teardown = None
+            if isinstance(operation, tuple) and len(operation) == 3:
+                prepare, operation, teardown = operation
+            elif isinstance(operation, tuple):
+                prepare, operation = operation
+        except Exception as e:
+            logger.warning(f"Skipping {scenario.name}: {e}")
+            return ScenarioResult(scenario.name, "skipped", target_ms=scenario.target_ms, error=str(e))
+
+        iterations = scenario.iterations or self.iterations
+        timings = []
+        try:
+            for i in range(self.warmup):
+                if prepare:
+                    prepare(i)
+                operation(i)
+            for i in range(self.warmup, self.warmup + iterations):
+                if prepare:
+                    prepare(i)
+                gc.collect()
+                gc.disable()
+                try:
+                    start = time.perf_counter()
+                    operation(i)
+                    timings.append((time.perf_counter() - start) * 1000)
+                finally:
+                    gc.enable()
+        except Exception as e:
+            logger.warning(f"Scenario {scenario.name} failed: {e}")
+            return ScenarioResult(scenario.name, "error", target_ms=scenario.target_ms, error=str(e))
+        finally:
+            if teardown:
+                teardown()
+
+        return ScenarioResult.from_timings(scenario.name, timings, scenario.target_ms)
+
+    def run(self, scenarios: Sequence[Scenario],
+            progress: Optional[Callable[[ScenarioResult], None]] = None) -> Dict[str, Any]:
+        results = {}
+        for scenario in scenarios:
+            result = self.run_scenario(scenario)
+            results[scenario.name] = asdict(result)
+            if progress:
+                progress(result)
+        return {
+            "version": RESULT_VERSION,
+            "created_at": datetime.now().isoformat(),
+            "environment": environment_info(),
+            "scale": asdict(self.brain.scale),
+            "seed": self.brain.seed,
+            "iterations": self.iterations,
+            "warmup": self.warmup,
+            "results": results,
+        }
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("version") != RESULT_VERSION:
+        raise ValueError(f"Unsupported benchmark result version: {results.get('version')}")
+    return results
+
+
+@dataclass
+class Comparison:
+    """Change of one scenario between a baseline and a current run"""
+    name: str
+    status: str  # "regression", "improvement", "unchanged", "new", "missing", "skipped"
+    metric: str
+    baseline_ms: Optional[float] = None
+    current_ms: Optional[float] = None
+    change_pct: Optional[float] = None
+
+
+@dataclass
+class ComparisonReport:
+    comparisons: List[Comparison]
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> List[Comparison]:
+        return [c for c in self.comparisons if c.status == "regression"]
+
+    def format(self) -> str:
+        lines = [f"{'Scenario':<34} {'Baseline':>11} {'Current':>11} {'Change':>9}  Status"]
+        for c in self.comparisons:
+            baseline = f"{c.baseline_ms:9.2f}ms" if c.baseline_ms is not None else f"{'-':>11}"
+            current = f"{c.current_ms:9.2f}ms" if c.current_ms is not None else f"{'-':>11}"
+            change = f"{c.change_pct:+8.1f}%" if c.change_pct is not None else f"{'':>9}"
+            lines.append(f"{c.name:<34} {baseline} {current} {change}  {c.status.upper()}")
+        lines.extend(f"WARNING: {warning}" for warning in self.warnings)
+        lines.append(f"\n{len(self.regressions)} regression(s)")
+        return "\n".join(lines)
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.15, min_delta_ms: float = 1.0,
+                    metric: str = "p50_ms") -> ComparisonReport:
+    """
+    Compare a run against a baseline.
+
+    A scenario regresses when `metric` grows by more than `threshold`
+    (fraction) and by more than `min_delta_ms`, so sub-millisecond jitter
+    on fast scenarios is not flagged.
+    """
+    warnings = []
+    if baseline.get("scale") != current.get("scale"):
+        warnings.append("Baseline and current run use different brain scales")
+    if baseline.get("environment", {}).get("platform") != current.get("environment", {}).get("platform"):
+        warnings.append("Baseline was recorded on a different platform")
+
+    comparisons = []
+    base_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+    for name in sorted(base_results.keys() | current_results.keys()):
+        base = base_results.get(name)
+        now = current_results.get(name)
+        if base is None or base.get("status") != "ok":
+            if now and now.get("status") == "ok":
+                comparisons.append(Comparison(name, "new", metric, current_ms=now[metric]))
+            else:
+                comparisons.append(Comparison(name, "skipped", metric))
+            continue
+        if now is None or now.get("status") != "ok":
+            comparisons.append(Comparison(name, "missing", metric, baseline_ms=base[metric]))
+            continue
+
+        base_ms = base[metric]
+        now_ms = now[metric]
+        change = (now_ms - base_ms) / base_ms if base_ms > 0 else 0.0
+        if change > threshold and now_ms - base_ms > min_delta_ms:
+            status = "regression"
+        elif change < -threshold and base_ms - now_ms > min_delta_ms:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        comparisons.append(Comparison(name, status, metric, base_ms, now_ms, change * 100))
+
+    return ComparisonReport(comparisons, warnings)
@@ -0,0 +1,298 @@
+"""
+CORTEX Benchmark Scenarios
+
+Each scenario exercises a production code path against the synthetic
+brain. Targets are the latency targets documented by the code itself:
+
+- Tier 1/2/3 queries: TierPerformanceMonitor (50 / 150 / 200 ms)
+- Graph traversal: KnowledgeGraph.traverse_graph (<150 ms)
+- Batch decay of 1000 patterns: PatternDecay (<500 ms)
+- Idea capture: IdeaQueue (<5 ms)
+
+The memory.* scenarios run the same context-building workload untraced,
+under the sampled MemoryObserver and under always-on tracemalloc, so
+the observer's overhead (budget: <2% over untraced) reads directly off
+the comparison.
+
+Scenarios that write (routing logs patterns, decay materializes
+confidence) run against scratch copies so the brain can be reused.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from .harness import Scenario
+from .synthetic_brain import ACTIONS, TOPICS, SyntheticBrain
+
+Operation = Callable[[int], Any]
+
+
+def _requests(count: int = 64, seed: int = 7) -> List[str]:
+    """Varied user requests, so caches keyed on the request text do not hide work"""
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(ACTIONS)} the {rng.choice(TOPICS)} {rng.choice(TOPICS)} module"
+        for _ in range(count)
+    ]
+
+
+# ============ Tier 1 ============
+
+def routing(brain: SyntheticBrain) -> Operation:
+    """Parse a request and route it through the IntentRouter"""
+    from src.entry_point.request_parser import RequestParser
+    from src.cortex_agents.intent_router import IntentRouter
+    from src.tier1.tier1_api import Tier1API
+    from src.tier2.knowledge_graph import KnowledgeGraph
+
+    tier1 = Tier1API(brain.scratch_copy(brain.tier1_db, "routing"), brain.root / "scratch" / "requests.log")
+    tier2 = KnowledgeGraph(brain.scratch_copy(brain.tier2_db, "routing"))
+    parser = RequestParser()
+    router = IntentRouter(name="IntentRouter", tier1_api=tier1, tier2_kg=tier2)
+    requests = _requests()
+
+    def run(i: int):
+        request = parser.parse(requests[i % len(requests)])
+        return router.execute(request)
+    return run
+
+
+def context_building(brain: SyntheticBrain) -> Operation:
+    """Build a token-budgeted context from all three tiers (cache disabled)"""
+    from src.core.context_management.unified_context_manager import UnifiedContextManager
+    from src.tier1.working_memory import WorkingMemory
+    from src.tier2.knowledge_graph import KnowledgeGraph
+    from src.tier3.context_intelligence import ContextIntelligence
+
+    manager = UnifiedContextManager(
+        tier1=WorkingMemory(brain.tier1_db),
+        tier2=KnowledgeGraph(brain.tier2_db),
+        tier3=ContextIntelligence(brain.tier3_db),
+        cache_ttl=0
+    )
+    requests = _requests()
+    conversations = brain.conversation_ids or [None]
+    files = brain.file_paths
+
+    def run(i: int):
+        return manager.build_context(
+            conversation_id=conversations[i % len(conversations)],
+            user_request=requests[i % len(requests)],
+            current_files=files[i % len(files):i % len(files) + 3]
+        )
+    return run
+
+
+def recent_conversations(brain: SyntheticBrain) -> Operation:
+    """Load the most recent conversations from working memory"""
+    from src.tier1.working_memory import WorkingMemory
+
+    memory = WorkingMemory(brain.tier1_db)
+    return lambda i: memory.get_recent_conversations(limit=10)
+
+
+# ============ Tier 2 ============
+
+def pattern_search(brain: SyntheticBrain) -> Operation:
+    """Full-text pattern search"""
+    from src.tier2.knowledge_graph import KnowledgeGraph
+
+    kg = KnowledgeGraph(brain.tier2_db)
+    return lambda i: kg.search_patterns(TOPICS[i % len(TOPICS)], limit=10)
+
+
+def graph_traversal(brain: SyntheticBrain) -> Operation:
+    """Relationship traversal to depth 3 from varying start patterns"""
+    from src.tier2.knowledge_graph import KnowledgeGraph
+
+    if not brain.pattern_ids:
+        raise RuntimeError("Synthetic brain has no patterns")
+    kg = KnowledgeGraph(brain.tier2_db)
+    step = max(1, len(brain.pattern_ids) // 97)
+    starts = brain.pattern_ids[::step]
+    return lambda i: kg.traverse_graph(starts[i % len(starts)], max_depth=3)
+
+
+def pattern_decay(brain: SyntheticBrain):
+    """Batch decay over 1000 stale patterns (each iteration on a fresh copy)"""
+    import sqlite3
+    from src.tier2.knowledge_graph import KnowledgeGraph
+
+    stale = (datetime.now() - timedelta(days=90)).isoformat()
+    state: Dict[str, Any] = {}
+
+    def prepare(i: int):
+        if state.get("kg"):
+            state["kg"].close()
+        path = brain.scratch_copy(brain.tier2_db, "decay")
+        conn = sqlite3.connect(path)
+        with conn:
+            conn.execute(
+                "UPDATE patterns SET last_accessed = ?, decay_days_applied = 0, is_pinned = 0 "
+                "WHERE rowid IN (SELECT rowid FROM patterns ORDER BY rowid LIMIT 1000)",
+                (stale,)
+            )
+        conn.close()
+        state["kg"] = KnowledgeGraph(path)
+
+    return prepare, lambda i: state["kg"].apply_decay()
+
+
+# ============ Tier 3 ============
+
+def git_metrics(brain: SyntheticBrain) -> Operation:
+    """Collect git activity metrics from the repository history"""
+    from src.tier3.context_intelligence import ContextIntelligence
+
+    context = ContextIntelligence(brain.tier3_db)
+    return lambda i: context.collect_git_metrics(brain.repo_path, days=60)
+
+
+def file_walk(brain: SyntheticBrain) -> Operation:
+    """Crawler traversal of the repository tree"""
+    from src.crawlers.file_system_walker import FileSystemWalker
+
+    walker = FileSystemWalker()
+    walker.set_exclusions([".git"])
+    return lambda i: walker.walk(str(brain.repo_path))
+
+
+def file_hotspots(brain: SyntheticBrain) -> Operation:
+    """Uncached file churn analysis"""
+    from src.tier3.context_intelligence import ContextIntelligence
+
+    context = ContextIntelligence(brain.tier3_db)
+
+    def run(i: int):
+        # Vary the window so the 60 minute hotspot cache never answers
+        return context.analyze_file_hotspots(brain.repo_path, days=30 + i)
+    return run
+
+
+# ============ Entry point ============
+
+def template_rendering(brain: SyntheticBrain) -> Operation:
+    """Trigger lookup plus template formatting"""
+    from src.entry_point.response_formatter import ResponseFormatter
+    from src.response_templates.template_loader import TemplateLoader
+
+    if not brain.templates_file.exists():
+        raise RuntimeError(f"Templates not found: {brain.templates_file}")
+    loader = TemplateLoader(brain.templates_file)
+    loader.load_templates()
+    formatter = ResponseFormatter(template_file=brain.templates_file)
+    triggers = loader.get_triggers()
+    template_ids = loader.get_template_ids()
+    if not template_ids:
+        raise RuntimeError("No templates loaded")
+    context: Dict[str, Any] = {"files_count": 3, "next_action": "Run tests"}
+
+    def run(i: int):
+        if triggers:
+            loader.find_by_trigger(triggers[i % len(triggers)])
+        return formatter.format_from_template(template_ids[i % len(template_ids)], context)
+    return run
+
+
+def _idea_queue(brain: SyntheticBrain, label: str):
+    from src.operations.modules.ideas.idea_queue import IdeaQueue
+
+    path = brain.root / "scratch" / f"{label}-idea-queue.db"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in path.parent.glob(f"{path.name}*"):
+        stale.unlink()
+    return IdeaQueue(str(path))
+
+
+def idea_capture(brain: SyntheticBrain) -> Operation:
+    """One IdeaQueue.capture (the caller-visible latency; persistence is asynchronous)"""
+    queue = _idea_queue(brain, "capture")
+    requests = _requests()
+    context = {"project": "benchmark", "active_file": "src/api/routes.py"}
+    return lambda i: queue.capture(requests[i % len(requests)], context)
+
+
+def idea_capture_burst(brain: SyntheticBrain) -> Operation:
+    """Burst of 200 captures, then flush until all are committed and enriched"""
+    queue = _idea_queue(brain, "burst")
+    requests = _requests()
+
+    def run(i: int):
+        for n in range(200):
+            queue.capture(requests[(i + n) % len(requests)], {"project": "benchmark"})
+        queue.flush()
+    return run
+
+
+# ============ Memory observability ============
+
+def memory_sampled(brain: SyntheticBrain):
+    """Context building while the sampled MemoryObserver runs"""
+    from src.utils.memory_observer import MemoryObserver
+
+    run = context_building(brain)
+    # Production cadence compressed so trace windows land inside the run;
+    # the 1% tracing duty cap is the production default
+    observer = MemoryObserver(interval_seconds=0.2, trace_every=5, max_trace_duty=0.01)
+    observer.start()
+    return None, run, observer.stop
+
+
+def memory_tracemalloc(brain: SyntheticBrain):
+    """Context building under always-on tracemalloc (the previous BrainMemoryManager behaviour)"""
+    import tracemalloc
+
+    run = context_building(brain)
+    tracemalloc.start()
+    return None, run, tracemalloc.stop
+
+
+def healthcheck(brain: SyntheticBrain) -> Operation:
+    """Brain analytics collection across all tiers"""
+    from src.operations.modules.healthcheck.brain_analytics_collector import BrainAnalyticsCollector
+
+    collector = BrainAnalyticsCollector(brain.root)
+    collector.collect_all_analytics()  # First collection installs the stat triggers
+    return lambda i: collector.collect_all_analytics()
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("entry.routing", "Parse + IntentRouter.execute", routing),
+    Scenario("entry.template_rendering", "TemplateLoader trigger lookup + format", template_rendering),
+    Scenario("tier1.recent_conversations", "WorkingMemory.get_recent_conversations", recent_conversations,
+             target_ms=50),
+    Scenario("context.build", "UnifiedContextManager.build_context", context_building),
+    Scenario("tier2.pattern_search", "KnowledgeGraph.search_patterns", pattern_search, target_ms=150),
+    Scenario("tier2.graph_traversal", "KnowledgeGraph.traverse_graph (depth 3)", graph_traversal,
+             target_ms=150),
+    Scenario("tier2.pattern_decay", "PatternDecay.apply_decay on 1000 stale patterns", pattern_decay,
+             target_ms=500, iterations=10),
+    Scenario("tier3.git_metrics", "ContextIntelligence.collect_git_metrics", git_metrics, iterations=10),
+    Scenario("crawler.file_walk", "FileSystemWalker.walk over the repository", file_walk),
+    Scenario("tier3.file_hotspots", "ContextIntelligence.analyze_file_hotspots", file_hotspots,
+             target_ms=200, iterations=10),
+    Scenario("ops.healthcheck", "BrainAnalyticsCollector.collect_all_analytics", healthcheck),
+    Scenario("ops.idea_capture", "IdeaQueue.capture", idea_capture, target_ms=5),
+    Scenario("ops.idea_capture_burst", "200 x IdeaQueue.capture + flush (group commit, enrichment)",
+             idea_capture_burst, iterations=10),
+    Scenario("memory.untraced", "UnifiedContextManager.build_context, no memory tracking", context_building,
+             iterations=1000),
+    Scenario("memory.sampled", "UnifiedContextManager.build_context under MemoryObserver sampling",
+             memory_sampled, iterations=1000),
+    Scenario("memory.tracemalloc", "UnifiedContextManager.build_context under always-on tracemalloc",
+             memory_tracemalloc, iterations=1000),
+]
+
+
+def select_scenarios(patterns: Optional[List[str]] = None) -> List[Scenario]:
+    """Scenarios whose name contains any of the given substrings (all if none)"""
+    if not patterns:
+        return list(SCENARIOS)
+    selected = [s for s in SCENARIOS if any(p in s.name for p in patterns)]
+    if not selected:
+        raise ValueError(f"No scenarios match: {', '.join(patterns)}")
+    return selected
@@ -0,0 +1,321 @@
+"""
+CORTEX Synthetic Brain Generator
+
+Builds a reproducible brain at a chosen scale for benchmarking:
+
+- Tier 1: working_memory.db with conversations, messages and entities
+- Tier 2: knowledge_graph.db with patterns (FTS-indexed) and relationships
+- Tier 3: context.db plus a git repository with dated commits
+
+Schemas are created by the real tier classes, then rows are bulk inserted,
+so benchmarks exercise production code paths against realistic volumes.
+Everything is generated locally from a seed (the git history is written
+with `git fast-import`), so runs are offline and repeatable.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import json
+import random
+import shutil
+import sqlite3
+import subprocess
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+TEMPLATES_FILE = PROJECT_ROOT / "cortex-brain" / "response-templates.yaml"
+
+TOPICS = [
+    "authentication", "login", "session", "cache", "database", "migration", "router",
+    "dashboard", "payment", "invoice", "search", "index", "logging", "metrics", "upload",
+    "notification", "permissions", "profile", "settings", "export", "import", "queue",
+    "scheduler", "webhook", "api", "token", "config", "deployment", "pipeline", "testing"
+]
+ACTIONS = [
+    "add", "fix", "refactor", "test", "optimize", "document", "debug", "review",
+    "implement", "validate", "migrate", "remove", "rename", "extract", "cache"
+]
+PATTERN_TYPES = ["workflow", "principle", "anti_pattern", "solution", "context"]
+RELATIONSHIP_TYPES = ["extends", "relates_to", "contradicts", "supersedes"]
+ENTITY_TYPES = ["file", "class", "function", "variable", "module"]
+AUTHORS = ["Ada", "Brian", "Chen", "Dana", "Eli", "Farah"]
+EXTENSIONS = [".py", ".py", ".py", ".ts", ".js", ".md", ".yaml"]
+
+
+@dataclass
+class BrainScale:
+    """Volume of synthetic data per tier"""
+    name: str = "custom"
+    conversations: int = 100
+    messages_per_conversation: int = 10
+    entities: int = 500
+    patterns: int = 1000
+    relationships_per_pattern: int = 2
+    commits: int = 200
+    files: int = 100
+    history_days: int = 90
+
+    @classmethod
+    def preset(cls, name: str) -> "BrainScale":
+        presets = {
+            "tiny": cls("tiny", 20, 5, 100, 200, 1, 30, 30),
+            "small": cls("small", 100, 10, 500, 1000, 2, 200, 100),
+            "medium": cls("medium", 1000, 20, 5000, 10000, 3, 1000, 500),
+            "large": cls("large", 10000, 20, 20000, 100000, 3, 5000, 2000),
+        }
+        if name not in presets:
+            raise ValueError(f"Unknown scale '{name}' (choose from: {', '.join(presets)})")
+        return presets[name]
+
+
+class SyntheticBrain:
+    """
+    A generated brain directory.
+
+    Usage:
+        brain = SyntheticBrain(Path("/tmp/bench-brain"), BrainScale.preset("small"))
+        brain.generate()
+        brain.tier2_db      # Path to knowledge_graph.db
+    """
+
+    def __init__(self, root: Path, scale: BrainScale, seed: int = 42):
+        self.root = Path(root)
+        self.scale = scale
+        self.seed = seed
+        self.now = datetime.now().replace(microsecond=0)
+
+        self.tier1_db = self.root / "tier1" / "working_memory.db"
+        self.tier2_db = self.root / "tier2" / "knowledge_graph.db"
+        self.tier3_db = self.root / "tier3" / "context.db"
+        self.repo_path = self.root / "repo"
+        self.templates_file = self.root / "response-templates.yaml"
+
+        # Filled by generate(); used by scenarios to build realistic inputs
+        self.conversation_ids: List[str] = []
+        self.pattern_ids: List[str] = []
+        self.file_paths: List[str] = []
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / "synthetic-brain.json"
+
+    def generate(self, force: bool = False) -> "SyntheticBrain":
+        """Generate all tiers (reuses an existing brain of the same scale and seed)"""
+        if not force and self._load_manifest():
+            return self
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        for tier in ("tier1", "tier2", "tier3"):
+            (self.root / tier).mkdir(parents=True, exist_ok=True)
+
+        rng = random.Random(self.seed)
+        self.file_paths = self._make_file_paths(rng)
+        self._generate_tier1(rng)
+        self._generate_tier2(rng)
+        self._generate_tier3(rng)
+        if TEMPLATES_FILE.exists():
+            shutil.copyfile(TEMPLATES_FILE, self.templates_file)
+
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "scale": asdict(self.scale),
+                "seed": self.seed,
+                "generated_at": self.now.isoformat(),
+                "conversation_ids": self.conversation_ids,
+                "pattern_ids": self.pattern_ids[:1000],
+                "file_paths": self.file_paths,
+            }, f)
+        return self
+
+    def _load_manifest(self) -> bool:
+        if not self.manifest_path.exists():
+            return False
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("scale") != asdict(self.scale) or manifest.get("seed") != self.seed:
+            return False
+        self.conversation_ids = manifest["conversation_ids"]
+        self.pattern_ids = manifest["pattern_ids"]
+        self.file_paths = manifest["file_paths"]
+        return True
+
+    def scratch_copy(self, db_path: Path, label: str) -> Path:
+        """Fresh copy of a tier database for scenarios that write (keeps the brain reusable)"""
+        scratch = self.root / "scratch" / f"{label}-{Path(db_path).name}"
+        scratch.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(db_path, scratch)
+        return scratch
+
+    # ============ Helpers ============
+
+    def _timestamp(self, rng: random.Random, days: Optional[int] = None) -> datetime:
+        seconds = rng.randint(0, (days or self.scale.history_days) * 86400)
+        return self.now - timedelta(seconds=seconds)
+
+    @staticmethod
+    def _sentence(rng: random.Random, words: int = 8) -> str:
+        parts = []
+        for _ in range(words):
+            parts.append(rng.choice(ACTIONS) if rng.random() < 0.3 else rng.choice(TOPICS))
+        return " ".join(parts)
+
+    def _make_file_paths(self, rng: random.Random) -> List[str]:
+        paths = set()
+        while len(paths) < self.scale.files:
+            package = rng.choice(TOPICS)
+            module = f"{rng.choice(TOPICS)}_{rng.choice(['service', 'model', 'utils', 'handler', 'test'])}"
+            paths.add(f"src/{package}/{module}{rng.choice(EXTENSIONS)}")
+        return sorted(paths)
+
+    # ============ Tier 1 ============
+
+    def _generate_tier1(self, rng: random.Random) -> None:
+        from src.tier1.working_memory import WorkingMemory
+        WorkingMemory(self.tier1_db).close()
+
+        conversations = []
+        messages = []
+        for i in range(self.scale.conversations):
+            conversation_id = f"conv-{i:06d}"
+            created = self._timestamp(rng)
+            last = created + timedelta(minutes=rng.randint(1, 240))
+            topic = rng.choice(TOPICS)
+            conversations.append((
+                conversation_id, f"{rng.choice(ACTIONS).title()} {topic}",
+                created.isoformat(" "), last.isoformat(" "),
+                self.scale.messages_per_conversation, 0,
+                self._sentence(rng, 12), json.dumps([topic]), last.isoformat(" ")
+            ))
+            for m in range(self.scale.messages_per_conversation):
+                role = "user" if m % 2 == 0 else "assistant"
+                content = f"{self._sentence(rng, 16)} in {rng.choice(self.file_paths)}"
+                messages.append((
+                    conversation_id, role, content,
+                    (created + timedelta(seconds=m * 30)).isoformat(" ")
+                ))
+            self.conversation_ids.append(conversation_id)
+
+        entities = set()
+        while len(entities) < self.scale.entities:
+            entity_type = rng.choice(ENTITY_TYPES)
+            entities.add((entity_type, f"{rng.choice(TOPICS)}_{rng.randint(0, 9999)}", rng.choice(self.file_paths)))
+
+        conn = sqlite3.connect(self.tier1_db)
+        with conn:
+            conn.executemany("""
+                INSERT INTO conversations
+                (conversation_id, title, created_at, updated_at, message_count, is_active,
+                 summary, tags, last_activity)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, conversations)
+            conn.executemany(
+                "INSERT INTO messages (conversation_id, role, content, timestamp) VALUES (?, ?, ?, ?)",
+                messages
+            )
+            conn.executemany("""
+                INSERT INTO entities (entity_type, entity_name, file_path, first_seen, last_accessed, access_count)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [
+                (entity_type, name, path, self._timestamp(rng).isoformat(" "),
+                 self._timestamp(rng, 7).isoformat(" "), rng.randint(1, 50))
+                for entity_type, name, path in sorted(entities)
+            ])
+        conn.close()
+
+    # ============ Tier 2 ============
+
+    def _generate_tier2(self, rng: random.Random) -> None:
+        from src.tier2.knowledge_graph import KnowledgeGraph
+        KnowledgeGraph(self.tier2_db).close()
+
+        patterns = []
+        for i in range(self.scale.patterns):
+            pattern_id = f"pattern-{i:07d}"
+            created = self._timestamp(rng)
+            accessed = created + (self.now - created) * rng.random()
+            topic = rng.choice(TOPICS)
+            patterns.append((
+                pattern_id,
+                f"{rng.choice(ACTIONS).title()} {topic} {rng.choice(TOPICS)}",
+                f"When working on {topic}: {self._sentence(rng, 20)}",
+                rng.choice(PATTERN_TYPES),
+                round(rng.uniform(0.3, 1.0), 3),
+                created.isoformat(), accessed.isoformat(),
+                rng.randint(0, 100),
+                "synthetic",
+                int(rng.random() < 0.05),
+                rng.choice(["cortex", "application"]),
+                json.dumps([rng.choice(["CORTEX-core", "workspace.app", "workspace.api"])])
+            ))
+            self.pattern_ids.append(pattern_id)
+
+        relationships = set()
+        for i, pattern_id in enumerate(self.pattern_ids):
+            for _ in range(self.scale.relationships_per_pattern):
+                # Mostly local edges so traversals have realistic depth
+                j = min(len(self.pattern_ids) - 1, max(0, i + rng.randint(-50, 50)))
+                if j != i:
+                    relationships.add((pattern_id, self.pattern_ids[j], rng.choice(RELATIONSHIP_TYPES)))
+
+        conn = sqlite3.connect(self.tier2_db)
+        with conn:
+            conn.executemany("""
+                INSERT INTO patterns
+                (pattern_id, title, content, pattern_type, confidence, created_at, last_accessed,
+                 access_count, source, is_pinned, scope, namespaces)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, patterns)
+            conn.executemany("""
+                INSERT INTO pattern_relationships (from_pattern, to_pattern, relationship_type, strength)
+                VALUES (?, ?, ?, ?)
+            """, [(a, b, kind, round(rng.uniform(0.2, 1.0), 2)) for a, b, kind in sorted(relationships)])
+        conn.close()
+
+    # ============ Tier 3 ============
+
+    def _generate_tier3(self, rng: random.Random) -> None:
+        from src.tier3.context_intelligence import ContextIntelligence
+        ContextIntelligence(self.tier3_db)
+        self._generate_repo(rng)
+
+    def _generate_repo(self, rng: random.Random) -> None:
+        """Write a dated commit history with git fast-import (no network, no hooks)"""
+        self.repo_path.mkdir(parents=True, exist_ok=True)
+        git = ["git", "-C", str(self.repo_path)]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["symbolic-ref", "HEAD", "refs/heads/main"], check=True)
+
+        # Commits spread over the last 60 days, oldest first
+        times = sorted(self._timestamp(rng, 60) for _ in range(self.scale.commits))
+        contents: Dict[str, int] = {}
+        stream: List[bytes] = []
+
+        def data(payload: str) -> None:
+            raw = payload.encode("utf-8")
+            stream.append(f"data {len(raw)}\n".encode("ascii") + raw + b"\n")
+
+        for mark, when in enumerate(times, 1):
+            author = rng.choice(AUTHORS)
+            epoch = int(when.timestamp())
+            stream.append(f"commit refs/heads/main\nmark :{mark}\n".encode("ascii"))
+            stream.append(f"author {author} <{author.lower()}@example.com> {epoch} +0000\n".encode("utf-8"))
+            stream.append(f"committer {author} <{author.lower()}@example.com> {epoch} +0000\n".encode("utf-8"))
+            data(f"{rng.choice(ACTIONS)} {rng.choice(TOPICS)}")
+            if mark > 1:
+                stream.append(f"from :{mark - 1}\n".encode("ascii"))
+            # Skewed file choice so some files become hotspots
+            for _ in range(rng.randint(1, 4)):
+                path = self.file_paths[int(len(self.file_paths) * rng.random() ** 2)]
+                lines = contents.get(path, 0) + rng.randint(1, 20)
+                contents[path] = lines
+                stream.append(f"M 100644 inline {path}\n".encode("utf-8"))
+                data("".join(f"# {path} line {n}\n" for n in range(lines)))
+
+        subprocess.run(
+            git + ["fast-import", "--quiet"], input=b"".join(stream) + b"done\n", check=True
+        )
+        subprocess.run(git + ["checkout", "-q", "-f", "main"], check=True)
@@ -6,6 +6,7 @@ with intelligent conflict resolution.
 
 Features:
 - Export brain to YAML (human-readable, git-trackable)
+- Streaming export/import for large brains (chunked, checksummed, incremental)
 - Import brain with intelligent conflict resolution
 - Namespace-aware merging (cortex.* vs workspace.*)
 - Weighted confidence averaging for similar patterns
@@ -31,6 +32,7 @@ Copyright: © 2024-2025 Asif Hussain. All rights reserved.
 
 from .brain_exporter import BrainExporter
 from .brain_importer import BrainImporter
+from .brain_stream import BrainStreamReader, BrainStreamWriter, StreamIntegrityError
 from .cli import (
     execute_brain_export,
     execute_brain_import,
@@ -42,6 +44,9 @@ from .plugin import BrainTransferPlugin, register_plugin
 __all__ = [
     "BrainExporter",
     "BrainImporter",
+    "BrainStreamReader",
+    "BrainStreamWriter",
+    "StreamIntegrityError",
     "execute_brain_export",
     "execute_brain_import",
     "handle_export_brain_request",
@@ -14,9 +14,19 @@ import yaml
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 import json
 
+from src.tier2.knowledge_graph.patterns.pattern_decay import PatternDecay
+
+from .brain_stream import (
+    BrainStreamWriter,
+    COMPRESSION_SUFFIXES,
+    DEFAULT_CHUNK_SIZE,
+    default_compression,
+    resolve_since
+)
+
 
 class BrainExporter:
     """Export CORTEX brain patterns to YAML for knowledge sharing."""
@@ -151,6 +161,192 @@ class BrainExporter:
         
         return output_path
     
+    def export_brain_stream(
+        self,
+        scope: str = "workspace",
+        min_confidence: float = 0.5,
+        output_path: Optional[Path] = None,
+        compression: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        since: Optional[Union[str, Path]] = None
+    ) -> Dict[str, Any]:
+        """
+        Export brain patterns to the streaming format (see brain_stream).
+
+        Rows are read from a cursor and written one at a time, so memory
+        use does not depend on brain size.
+
+        Args:
+            scope: Pattern scope ("workspace", "cortex", or "all")
+            min_confidence: Minimum confidence threshold (0.0-1.0)
+            output_path: Custom output path (auto-generated if None)
+            compression: "zstd", "gzip" or "none" (best available if None)
+            chunk_size: Patterns per checksummed chunk
+            since: Incremental base - a previous stream/manifest path, its
+                   export ID, or an ISO timestamp. Only patterns changed
+                   after that export started are written, plus tombstones
+                   for patterns deleted or decayed below min_confidence.
+
+        Returns:
+            Export manifest (includes export_path and export_id)
+        """
+        compression = compression or default_compression()
+        watermark, base_export_id = resolve_since(since, self.export_dir)
+
+        started = datetime.now()
+        export_id = started.strftime("%Y%m%d_%H%M%S_%f")
+        if output_path is None:
+            output_path = self.export_dir / f"brain-export-{export_id}{COMPRESSION_SUFFIXES[compression]}"
+        output_path = Path(output_path)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(patterns)")}
+        has_tombstones = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pattern_tombstones'"
+        ).fetchone() is not None
+
+        # Export the confidence the source brain ranks with (decay pending
+        # since the last materialization applied), not the stored value
+        if {"is_pinned", "decay_days_applied"} <= columns:
+            confidence_sql = PatternDecay.effective_confidence_sql()
+        else:
+            confidence_sql = "confidence"
+
+        query = f"""
+            SELECT
+                pattern_id,
+                title,
+                pattern_type,
+                {confidence_sql} AS confidence,
+                content,
+                scope,
+                namespaces,
+                created_at,
+                last_accessed,
+                access_count,
+                {confidence_sql} >= :min_confidence AS wanted
+            FROM patterns
+        """
+        params: Dict[str, Any] = {"min_confidence": min_confidence, "scope": scope, "since": watermark}
+        conditions: List[str] = []
+
+        if scope != "all":
+            conditions.append("scope = :scope")
+
+        # Watermarks are ISO ('T'); stored timestamps may use ' ' (SQLite
+        # CURRENT_TIMESTAMP) - compare as julian days, not as text
+        if watermark and "updated_at" in columns:
+            # updated_at is bumped by every write (see DatabaseSchema change
+            # triggers); decay that accrued without a write shows up as a
+            # different effective confidence now than at the watermark.
+            # Changed rows that no longer qualify are sent as tombstones.
+            changed = "julianday(updated_at) > julianday(:since)"
+            if confidence_sql != "confidence":
+                at_watermark = PatternDecay.effective_confidence_sql(now_sql="julianday(:since)")
+                changed += f" OR {confidence_sql} <> {at_watermark}"
+            conditions.append(f"({changed})")
+        else:
+            conditions.append(f"{confidence_sql} >= :min_confidence")
+            if watermark:
+                # Untracked (pre-updated_at) schema: creations and accesses only
+                conditions.append(
+                    "(julianday(created_at) > julianday(:since) OR julianday(last_accessed) > julianday(:since))"
+                )
+
+        query += " WHERE " + " AND ".join(conditions)
+
+        tombstone_query = None
+        if watermark and has_tombstones:
+            tombstone_query = (
+                "SELECT pattern_id FROM pattern_tombstones"
+                " WHERE julianday(deleted_at) > julianday(:since)"
+            )
+            if scope != "all":
+                tombstone_query += " AND scope = :scope"
+            tombstone_query += " ORDER BY pattern_id"
+
+        # Stable order for reproducible chunks; no sort buffer over the whole table
+        query += " ORDER BY id"
+
+        header = {
+            "export_id": export_id,
+            "export_date": started.isoformat(),
+            "source_machine_id": self.machine_id,
+            "cortex_version": self._get_cortex_version(),
+            "scope": scope,
+            "min_confidence": min_confidence,
+            "incremental": watermark is not None,
+            "since": watermark,
+            "base_export_id": base_export_id,
+            # Next incremental export picks up changes from here
+            "high_water_mark": started.isoformat()
+        }
+
+        namespaces_set = set()
+        pattern_types_set = set()
+        oldest_date = None
+        newest_date = None
+        max_confidence = 0.0
+
+        try:
+            with BrainStreamWriter(output_path, header, compression, chunk_size) as writer:
+                for row in conn.execute(query, params):
+                    if not row["wanted"]:
+                        writer.write_tombstone(row["pattern_id"], "below_min_confidence")
+                        continue
+                    try:
+                        namespaces = json.loads(row["namespaces"]) if row["namespaces"] else []
+                    except json.JSONDecodeError:
+                        namespaces = []
+
+                    namespaces_set.update(namespaces)
+                    pattern_types_set.add(row["pattern_type"])
+                    created = row["created_at"]
+                    if oldest_date is None or created < oldest_date:
+                        oldest_date = created
+                    if newest_date is None or created > newest_date:
+                        newest_date = created
+                    max_confidence = max(max_confidence, float(row["confidence"]))
+
+                    writer.write_pattern({
+                        "pattern_id": row["pattern_id"],
+                        "title": row["title"],
+                        "pattern_type": row["pattern_type"],
+                        "confidence": float(row["confidence"]),
+                        "access_count": row["access_count"],
+                        "last_accessed": row["last_accessed"],
+                        "created_at": created,
+                        "scope": row["scope"],
+                        "namespaces": namespaces,
+                        "source": self.machine_id,
+                        "content": row["content"]
+                    })
+
+                if tombstone_query:
+                    for row in conn.execute(tombstone_query, params):
+                        writer.write_tombstone(row["pattern_id"], "deleted")
+
+                manifest = writer.close({
+                    "statistics": {
+                        "confidence_range": [min_confidence, max_confidence],
+                        "namespaces": sorted(namespaces_set),
+                        "pattern_types": sorted(pattern_types_set),
+                        "oldest_pattern": oldest_date,
+                        "newest_pattern": newest_date
+                    }
+                })
+        finally:
+            conn.close()
+
+        return {
+            **manifest,
+            "export_path": output_path,
+            "patterns_exported": manifest["total_patterns"],
+            "tombstones_exported": manifest["total_tombstones"],
+            "total_size_bytes": output_path.stat().st_size
+        }
+
     def _build_export_structure(
         self,
         rows: List[sqlite3.Row],
@@ -284,16 +480,40 @@ def main():
         type=Path,
         help="Output file path (auto-generated if not specified)"
     )
+    parser.add_argument(
+        "--format",
+        choices=["yaml", "stream"],
+        default="yaml",
+        help="Export format (default: yaml; stream for large brains)"
+    )
+    parser.add_argument(
+        "--compression",
+        choices=sorted(COMPRESSION_SUFFIXES),
+        help="Stream compression (default: zstd if available, else gzip)"
+    )
+    parser.add_argument(
+        "--since",
+        help="Stream only: export changes since a previous export (path, export ID or ISO time)"
+    )
     
     args = parser.parse_args()
     
     # Export brain
     exporter = BrainExporter()
-    output_path = exporter.export_brain(
-        scope=args.scope,
-        min_confidence=args.min_confidence,
-        output_path=args.output
-    )
+    if args.format == "stream":
+        output_path = exporter.export_brain_stream(
+            scope=args.scope,
+            min_confidence=args.min_confidence,
+            output_path=args.output,
+            compression=args.compression,
+            since=args.since
+        )["export_path"]
+    else:
+        output_path = exporter.export_brain(
+            scope=args.scope,
+            min_confidence=args.min_confidence,
+            output_path=args.output
+        )
     
     print(f"✅ Brain exported successfully!")
     print(f"📁 Location: {output_path}")
@@ -18,6 +18,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
+from .brain_stream import BrainStreamReader, StreamIntegrityError, is_stream_file
+
+# Stay under SQLite's default host-parameter limit (999) in IN (...) lookups
+LOOKUP_BATCH = 500
+# Conflict details kept in a stream dry-run report
+DRY_RUN_DETAIL_LIMIT = 100
+
 
 @dataclass
 class MergeDecision:
@@ -86,6 +93,9 @@ class BrainImporter:
         Returns:
             Import report with statistics and merge decisions
         """
+        if is_stream_file(yaml_path):
+            return self.import_brain_stream(yaml_path, dry_run=dry_run, strategy=strategy)
+        
         # Load YAML file
         print(f"📖 Loading {yaml_path.name}...")
         with open(yaml_path, 'r', encoding='utf-8') as f:
@@ -132,6 +142,254 @@ class BrainImporter:
         
         return import_result
     
+    def import_brain_stream(
+        self,
+        stream_path: Path,
+        dry_run: bool = False,
+        strategy: str = "auto"
+    ) -> Dict[str, Any]:
+        """
+        Import a brain stream (see brain_stream) chunk by chunk.
+
+        Each verified chunk is resolved against existing patterns with one
+        lookup and applied with batched upserts; all chunks share a single
+        transaction, so a checksum failure anywhere leaves the brain
+        untouched. Merge decisions are streamed to the audit log instead of
+        being held in memory.
+
+        Args:
+            stream_path: Path to stream export file
+            dry_run: Preview conflicts without applying changes
+            strategy: Merge strategy ("auto", "replace", "skip")
+
+        Returns:
+            Import report with statistics (and audit log path)
+        """
+        stream_path = Path(stream_path)
+        print(f"📖 Streaming {stream_path.name}...")
+
+        reader = BrainStreamReader(stream_path)
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(patterns)")
+        reset_decay = any(col[1] == "decay_days_applied" for col in cursor.fetchall())
+
+        stats = {
+            "total_patterns": 0,
+            "new_patterns": 0,
+            "merged_patterns": 0,
+            "replaced_patterns": 0,
+            "skipped_patterns": 0,
+            "deleted_patterns": 0
+        }
+        conflict_details: List[Dict[str, Any]] = []
+        conflict_count = 0
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_path = self.applied_dir / f"{stream_path.name}-{timestamp}.log"
+        log = None if dry_run else open(log_path, "w", encoding="utf-8")
+        committed = False
+
+        try:
+            for chunk in reader.iter_chunks():
+                existing = self._lookup_existing(cursor, [p["pattern_id"] for p in chunk])
+                upserts = []
+                merges = []
+                deletes = []
+
+                for record in chunk:
+                    pattern_id = record["pattern_id"]
+                    if record.get("deleted"):
+                        # Tombstone from an incremental export
+                        if pattern_id in existing:
+                            stats["deleted_patterns"] += 1
+                            if not dry_run:
+                                deletes.append((pattern_id,))
+                                log.write(f"  {pattern_id}: deleted - {record.get('reason')}\n")
+                        continue
+
+                    imported = {**record, "context": self._parse_content(record.get("content"))}
+                    stats["total_patterns"] += 1
+
+                    if pattern_id not in existing:
+                        stats["new_patterns"] += 1
+                        decision = MergeDecision(
+                            pattern_id=pattern_id,
+                            strategy="new",
+                            reason="No conflict - new pattern",
+                            confidence_before=None,
+                            confidence_after=imported["confidence"],
+                            timestamp=datetime.now().isoformat()
+                        )
+                    else:
+                        conflict = {"existing": existing[pattern_id], "imported": imported}
+                        conflict_count += 1
+                        decision = self._resolve_conflict(pattern_id, conflict, strategy)
+
+                        if dry_run:
+                            if len(conflict_details) < DRY_RUN_DETAIL_LIMIT:
+                                conflict_details.append({
+                                    "pattern_id": pattern_id,
+                                    "existing_confidence": conflict["existing"]["confidence"],
+                                    "imported_confidence": imported["confidence"],
+                                    "recommendation": decision.strategy
+                                })
+                            continue
+
+                        if decision.strategy == "weighted_merge":
+                            merges.append(self._weighted_merge_params(pattern_id, conflict))
+                            stats["merged_patterns"] += 1
+                        elif decision.strategy == "keep_imported":
+                            stats["replaced_patterns"] += 1
+                        else:
+                            stats["skipped_patterns"] += 1
+
+                    if dry_run:
+                        continue
+                    if decision.strategy in ("new", "keep_imported"):
+                        upserts.append(self._upsert_params(imported))
+                    log.write(f"  {decision.pattern_id}: {decision.strategy} - {decision.reason}\n")
+
+                if upserts:
+                    cursor.executemany(self._upsert_sql(reset_decay), upserts)
+                if merges:
+                    cursor.executemany(
+                        """
+                        UPDATE patterns
+                        SET confidence = ?,
+                            access_count = ?,
+                            content = ?,
+                            last_accessed = ?
+                        WHERE pattern_id = ?
+                        """,
+                        merges
+                    )
+                if deletes:
+                    cursor.executemany("DELETE FROM patterns WHERE pattern_id = ?", deletes)
+
+            if dry_run:
+                conn.rollback()
+                return {
+                    "dry_run": True,
+                    "total_patterns": stats["total_patterns"],
+                    "new_patterns": stats["new_patterns"],
+                    "deleted_patterns": stats["deleted_patterns"],
+                    "conflicts": conflict_count,
+                    "conflict_details": conflict_details,
+                    "conflict_details_truncated": conflict_count > len(conflict_details)
+                }
+
+            conn.commit()
+            committed = True
+        except (StreamIntegrityError, ValueError, OSError) as e:
+            conn.rollback()
+            self._move_to_rejected(stream_path, [str(e)])
+            return {
+                "success": False,
+                "errors": [str(e)],
+                "yaml_path": str(stream_path)
+            }
+        finally:
+            conn.close()
+            if log is not None and not committed:
+                # Nothing was applied: drop the partial audit log
+                log.close()
+                log_path.unlink(missing_ok=True)
+
+        try:
+            log.write(f"\nImport completed: {datetime.now().isoformat()}\n")
+            log.write(f"Statistics: {stats}\n")
+        finally:
+            log.close()
+        stream_path.rename(self.applied_dir / f"{stream_path.name}-{timestamp}")
+
+        print(f"📊 Imported {stats['total_patterns']} patterns, {conflict_count} conflicts")
+        return {
+            "success": True,
+            "statistics": stats,
+            "export_id": reader.manifest.get("export_id"),
+            "incremental": reader.manifest.get("incremental", False),
+            "audit_log": str(log_path)
+        }
+
+    @staticmethod
+    def _parse_content(content: Optional[str]) -> Dict[str, Any]:
+        """Context dict from a pattern's content (JSON or plain text)."""
+        if not content:
+            return {}
+        try:
+            parsed = json.loads(content)
+        except json.JSONDecodeError:
+            return {"content": content}
+        return parsed if isinstance(parsed, dict) else {"content": content}
+
+    def _lookup_existing(
+        self,
+        cursor: sqlite3.Cursor,
+        pattern_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Existing patterns for a batch of IDs, keyed by pattern_id."""
+        existing = {}
+        for start in range(0, len(pattern_ids), LOOKUP_BATCH):
+            batch = pattern_ids[start:start + LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"SELECT pattern_id, confidence, access_count, content FROM patterns "
+                f"WHERE pattern_id IN ({placeholders})",
+                batch
+            )
+            for pattern_id, confidence, access_count, content in cursor.fetchall():
+                existing[pattern_id] = {
+                    "confidence": confidence,
+                    "usage_count": access_count or 0,
+                    "context": self._parse_content(content)
+                }
+        return existing
+
+    @staticmethod
+    def _upsert_sql(reset_decay: bool) -> str:
+        return f"""
+            INSERT INTO patterns (
+                pattern_id, title, content, pattern_type, confidence,
+                created_at, last_accessed, access_count, source, scope, namespaces
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(pattern_id) DO UPDATE SET
+                confidence = excluded.confidence,
+                access_count = excluded.access_count,
+                content = excluded.content,
+                last_accessed = excluded.last_accessed
+                {", decay_days_applied = 0" if reset_decay else ""}
+        """
+
+    @staticmethod
+    def _upsert_params(imported: Dict[str, Any]) -> Tuple:
+        now = datetime.now().isoformat()
+        return (
+            imported["pattern_id"],
+            imported.get("title") or imported["pattern_id"],
+            imported.get("content") or json.dumps(imported.get("context", {})),
+            imported.get("pattern_type", "unknown"),
+            imported["confidence"],
+            imported.get("created_at", now),
+            now,
+            imported.get("access_count", 0),
+            imported.get("source"),
+            imported.get("scope", "workspace"),
+            json.dumps(imported.get("namespaces", []))
+        )
+
+    def _weighted_merge_params(self, pattern_id: str, conflict: Dict[str, Any]) -> Tuple:
+        existing = conflict["existing"]
+        imported = conflict["imported"]
+        merged_context = {**existing.get("context", {}), **imported.get("context", {})}
+        return (
+            self._calculate_weighted_confidence(existing, imported),
+            existing["usage_count"] + imported.get("access_count", 1),
+            json.dumps(merged_context),
+            datetime.now().isoformat(),
+            pattern_id
+        )
+    
     def _validate_export_file(self, export_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate YAML export file structure."""
         errors = []
@@ -557,7 +815,7 @@ def main():
     parser.add_argument(
         "yaml_file",
         type=Path,
-        help="YAML export file to import"
+        help="YAML or stream (.ndjson[.gz|.zst]) export file to import"
     )
     parser.add_argument(
         "--strategy",
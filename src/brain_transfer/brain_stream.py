@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+CORTEX Brain Stream Format
+
+Streaming transfer format for large brains. Unlike the YAML export, a
+stream is written and read one record at a time, so exporting or
+importing any number of patterns uses constant memory.
+
+Layout (newline-delimited JSON, optionally gzip/zstd compressed):
+
+    {"type": "header", "format": "cortex-brain-stream", "version": "2.0", ...}
+    {"type": "pattern", "pattern_id": ..., ...}       x chunk_size
+    {"type": "tombstone", "pattern_id": ..., "reason": ...}
+    {"type": "chunk", "index": 0, "count": N, "sha256": ..., "rolling": ...}
+    ...
+    {"type": "manifest", "total_patterns": ..., "chunks": ..., "signature": ...}
+
+Each chunk record carries the SHA256 of the pattern lines it closes and a
+rolling signature (SHA256 of the previous rolling value + chunk digest,
+seeded from the header line), so corruption is detected at the chunk where
+it occurs and truncation or reordering is caught by the final signature.
+Tombstones (incremental exports only) mark patterns deleted on the source
+or decayed below the export threshold; they share chunks and checksums
+with pattern records.
+The manifest is also written as a sidecar file (<export>.manifest.json)
+so incremental exports can find the previous high-water mark cheaply.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+STREAM_FORMAT = "cortex-brain-stream"
+STREAM_VERSION = "2.0"
+DEFAULT_CHUNK_SIZE = 1000
+
+COMPRESSION_SUFFIXES = {"none": ".ndjson", "gzip": ".ndjson.gz", "zstd": ".ndjson.zst"}
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class StreamIntegrityError(ValueError):
+    """Raised when a brain stream fails a checksum or structure check."""
+
+
+def default_compression() -> str:
+    """Best compression available in this environment."""
+    return "zstd" if ZSTD_AVAILABLE else "gzip"
+
+
+def manifest_path_for(stream_path: Path) -> Path:
+    """Sidecar manifest path for a stream file."""
+    return stream_path.with_name(stream_path.name + ".manifest.json")
+
+
+def is_stream_file(path: Path) -> bool:
+    """True if path names a brain stream (by suffix)."""
+    name = Path(path).name
+    return any(name.endswith(suffix) for suffix in COMPRESSION_SUFFIXES.values())
+
+
+def _chain(rolling: str, digest: str) -> str:
+    return hashlib.sha256((rolling + digest).encode("ascii")).hexdigest()
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _open_write(path: Path, compression: str) -> IO[bytes]:
+    if compression == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    if compression == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"), closefd=True)
+    if compression == "none":
+        return open(path, "wb")
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def _open_read(path: Path) -> IO[bytes]:
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(path, "rb")
+    if magic.startswith(_ZSTD_MAGIC):
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Stream is zstd compressed but 'zstandard' is not installed")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.BufferedReader(reader)
+    return open(path, "rb")
+
+
+class BrainStreamWriter:
+    """
+    Writes a brain stream record by record.
+
+    Usage:
+        with BrainStreamWriter(path, header) as writer:
+            for pattern in patterns:
+                writer.write_pattern(pattern)
+        manifest = writer.manifest
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        header: Dict[str, Any],
+        compression: str = "gzip",
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        self.path = Path(path)
+        self.compression = compression
+        self.chunk_size = max(1, chunk_size)
+        self.header = {
+            "type": "header",
+            "format": STREAM_FORMAT,
+            "version": STREAM_VERSION,
+            "compression": compression,
+            "chunk_size": self.chunk_size,
+            **header
+        }
+        self.manifest: Optional[Dict[str, Any]] = None
+
+        self._file = _open_write(self.path, compression)
+        header_line = _encode(self.header)
+        self._file.write(header_line)
+        self._rolling = hashlib.sha256(header_line).hexdigest()
+        self._chunk_hash = hashlib.sha256()
+        self._chunk_count = 0
+        self._chunks = 0
+        self._total = 0
+        self._tombstones = 0
+
+    def write_pattern(self, pattern: Dict[str, Any]) -> None:
+        self._write_record({"type": "pattern", **pattern})
+        self._total += 1
+
+    def write_tombstone(self, pattern_id: str, reason: str) -> None:
+        """Record that pattern_id should no longer exist on the receiving side."""
+        self._write_record({"type": "tombstone", "pattern_id": pattern_id, "reason": reason})
+        self._tombstones += 1
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        line = _encode(record)
+        self._file.write(line)
+        self._chunk_hash.update(line)
+        self._chunk_count += 1
+        if self._chunk_count >= self.chunk_size:
+            self._close_chunk()
+
+    def _close_chunk(self) -> None:
+        if self._chunk_count == 0:
+            return
+        digest = self._chunk_hash.hexdigest()
+        self._rolling = _chain(self._rolling, digest)
+        self._file.write(_encode({
+            "type": "chunk",
+            "index": self._chunks,
+            "count": self._chunk_count,
+            "sha256": digest,
+            "rolling": self._rolling
+        }))
+        self._chunks += 1
+        self._chunk_hash = hashlib.sha256()
+        self._chunk_count = 0
+
+    def close(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Close the last chunk, write the manifest record and sidecar."""
+        if self.manifest is not None:
+            return self.manifest
+        self._close_chunk()
+        self.manifest = {
+            "type": "manifest",
+            "total_patterns": self._total,
+            "total_tombstones": self._tombstones,
+            "chunks": self._chunks,
+            "signature": self._rolling,
+            **{k: v for k, v in self.header.items() if k != "type"},
+            **(extra or {})
+        }
+        self._file.write(_encode(self.manifest))
+        self._file.close()
+
+        with open(manifest_path_for(self.path), "w", encoding="utf-8") as f:
+            json.dump({**self.manifest, "file": self.path.name}, f, indent=2)
+        return self.manifest
+
+    def abort(self) -> None:
+        """Close and remove a partially written stream."""
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "BrainStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class BrainStreamReader:
+    """
+    Reads a brain stream as verified chunks.
+
+    iter_chunks() yields lists of at most chunk_size records, each only
+    after its checksum and rolling signature check out. Tombstone records
+    carry "deleted": True. The manifest is available once iteration
+    completes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.header: Optional[Dict[str, Any]] = None
+        self.manifest: Optional[Dict[str, Any]] = None
+
+    def iter_chunks(self) -> Iterator[List[Dict[str, Any]]]:
+        with _open_read(self.path) as f:
+            header_line = f.readline()
+            self.header = self._parse(header_line, "header")
+            if self.header.get("format") != STREAM_FORMAT:
+                raise StreamIntegrityError("Not a CORTEX brain stream")
+            if self.header.get("version") != STREAM_VERSION:
+                raise StreamIntegrityError(f"Unsupported stream version: {self.header.get('version')}")
+
+            rolling = hashlib.sha256(header_line).hexdigest()
+            chunk_hash = hashlib.sha256()
+            chunk: List[Dict[str, Any]] = []
+            chunks = 0
+            total = 0
+            tombstones = 0
+
+            for line in f:
+                record = self._parse(line)
+                kind = record.pop("type")
+                if kind == "pattern":
+                    chunk_hash.update(line)
+                    chunk.append(record)
+                    total += 1
+                elif kind == "tombstone":
+                    chunk_hash.update(line)
+                    chunk.append({**record, "deleted": True})
+                    tombstones += 1
+                elif kind == "chunk":
+                    digest = chunk_hash.hexdigest()
+                    rolling = _chain(rolling, digest)
+                    if (record.get("index") != chunks or record.get("count") != len(chunk)
+                            or record.get("sha256") != digest or record.get("rolling") != rolling):
+                        raise StreamIntegrityError(f"Checksum mismatch in chunk {chunks}")
+                    chunks += 1
+                    yield chunk
+                    chunk = []
+                    chunk_hash = hashlib.sha256()
+                elif kind == "manifest":
+                    if chunk:
+                        raise StreamIntegrityError("Patterns after last chunk record")
+                    if (record.get("signature") != rolling or record.get("chunks") != chunks
+                            or record.get("total_patterns") != total
+                            or record.get("total_tombstones", 0) != tombstones):
+                        raise StreamIntegrityError("Signature verification failed")
+                    self.manifest = record
+                    return
+                else:
+                    raise StreamIntegrityError(f"Unknown record type: {kind}")
+
+        raise StreamIntegrityError("Stream truncated (no manifest)")
+
+    @staticmethod
+    def _parse(line: bytes, expected: Optional[str] = None) -> Dict[str, Any]:
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise StreamIntegrityError(f"Malformed record: {e}") from e
+        if not isinstance(record, dict) or "type" not in record:
+            raise StreamIntegrityError("Malformed record")
+        if expected and record["type"] != expected:
+            raise StreamIntegrityError(f"Expected {expected} record, got {record['type']}")
+        return record
+
+
+def read_manifest(stream_path: Path) -> Dict[str, Any]:
+    """Manifest of a stream, from its sidecar or (slower) the stream itself."""
+    sidecar = manifest_path_for(Path(stream_path))
+    if sidecar.exists():
+        with open(sidecar, "r", encoding="utf-8") as f:
+            return json.load(f)
+    reader = BrainStreamReader(stream_path)
+    for _ in reader.iter_chunks():
+        pass
+    return reader.manifest
+
+
+def resolve_since(since: Any, search_dir: Optional[Path] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolve an incremental-export base to (watermark, base_export_id).
+
+    since may be a previous stream/manifest path, an export_id whose
+    manifest lives in search_dir, or an ISO timestamp. The watermark is
+    always ISO; callers compare it with julianday() in SQL because stored
+    timestamps may be ' '-separated.
+    """
+    if since is None:
+        return None, None
+
+    candidate = Path(str(since))
+    if not candidate.exists() and manifest_path_for(candidate).exists():
+        # Stream was moved (e.g. imported) but its sidecar manifest remains
+        candidate = manifest_path_for(candidate)
+    if not candidate.exists() and search_dir is not None:
+        matches = [
+            path for path in Path(search_dir).glob("*.manifest.json")
+            if path.name.startswith(f"brain-export-{since}")
+        ]
+        if matches:
+            candidate = matches[0]
+
+    if candidate.exists():
+        if candidate.name.endswith(".manifest.json"):
+            with open(candidate, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        else:
+            manifest = read_manifest(candidate)
+        return manifest["high_water_mark"], manifest.get("export_id")
+
+    # Treat as a timestamp, normalized to ISO ('T') like manifest watermarks
+    try:
+        watermark = datetime.fromisoformat(str(since))
+    except ValueError:
+        raise ValueError(f"Unknown export or timestamp for incremental export: {since}") from None
+    return watermark.isoformat(), None
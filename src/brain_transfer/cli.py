@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from .brain_exporter import BrainExporter
 from .brain_importer import BrainImporter
+from .brain_stream import is_stream_file
 
 logger = logging.getLogger(__name__)
 
@@ -166,7 +167,7 @@ def handle_import_brain_request(user_request: str, context: Optional[Dict[str, A
         # Try to extract .yaml filename from request
         words = user_request.split()
         for word in words:
-            if word.endswith(".yaml") or word.endswith(".yml"):
+            if word.endswith(".yaml") or word.endswith(".yml") or is_stream_file(Path(word)):
                 import_path = word
                 break
     
@@ -174,7 +175,11 @@ def handle_import_brain_request(user_request: str, context: Optional[Dict[str, A
         # Check for most recent export in exports directory
         try:
             exporter = BrainExporter()
-            exports = sorted(exporter.export_dir.glob("brain-export-*.yaml"), reverse=True)
+            exports = sorted(
+                (path for path in exporter.export_dir.glob("brain-export-*")
+                 if path.suffix in (".yaml", ".yml") or is_stream_file(path)),
+                reverse=True
+            )
             if exports:
                 import_path = str(exports[0])
         except Exception:
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 import re
 import ast
 
+from src.utils.graph_analysis import DirectedGraph
+
 
 class CrawlStrategy(Enum):
     """
@@ -329,6 +331,17 @@ class DependencyCrawler:
         
         return test_files
     
+    def _record_imports(self, file_path: Path, import_graph: DirectedGraph, scanned: Set[str]) -> None:
+        """Add a file's resolved import edges to the import graph (each file scanned once)"""
+        source = str(file_path)
+        if source in scanned:
+            return
+        scanned.add(source)
+        for import_stmt in self.extract_imports(file_path):
+            resolved = self.resolve_import(import_stmt)
+            if resolved:
+                import_graph.add_edge(source, str(resolved))
+    
     def build_dependency_graph(
         self,
         changed_files: List[str],
@@ -347,8 +360,10 @@ class DependencyCrawler:
             DependencyGraph with all discovered dependencies
         """
         graph = DependencyGraph()
-        visited = set()
-        circular_deps = set()
+        
+        # Import edges between crawled files; cycles are the graph's cyclic SCCs
+        import_graph = DirectedGraph()
+        scanned = set()
         
         # Add changed files
         for file_path in changed_files:
@@ -366,21 +381,11 @@ class DependencyCrawler:
                     resolved = self.resolve_import(import_stmt)
                     if resolved:
                         resolved_str = str(resolved)
+                        import_graph.add_edge(file_path, resolved_str)
                         
-                        # Check for circular dependencies (if we've seen this before)
-                        if resolved_str in visited and resolved_str in graph.changed_files:
-                            circular_deps.add(resolved_str)
-                            graph.has_circular_dependencies = True
-                        
-                        visited.add(resolved_str)
-                        
-                        # Also check if the resolved file imports back to our changed files
-                        if resolved:
-                            reverse_imports = self.extract_imports(resolved)
-                            for rev_import in reverse_imports:
-                                rev_resolved = self.resolve_import(rev_import)
-                                if rev_resolved and str(rev_resolved) == file_path:
-                                    graph.has_circular_dependencies = True
+                        # Also record what the resolved file imports, so cycles
+                        # back into the changed files are visible
+                        self._record_imports(resolved, import_graph, scanned)
                         
                         graph.add_direct_import(resolved_str)
                         
@@ -415,6 +420,8 @@ class DependencyCrawler:
                 for import_stmt in imports:
                     resolved = self.resolve_import(import_stmt)
                     if resolved:
+                        import_graph.add_edge(file_path, str(resolved))
+                        self._record_imports(resolved, import_graph, scanned)
                         graph.add_indirect_dep(str(resolved))
                         
                         if graph.total_files >= max_files:
@@ -423,4 +430,6 @@ class DependencyCrawler:
                 if graph.total_files >= max_files:
                     break
         
+        graph.has_circular_dependencies = not import_graph.is_acyclic()
+        
         return graph
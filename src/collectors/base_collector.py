@@ -17,11 +17,12 @@ from typing import Dict, Any, Optional, List, Protocol
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from abc import ABC, abstractmethod
-import json
 import logging
 from pathlib import Path
 from enum import Enum
 
+from ..infrastructure.persistence.event_log import EventLog, RetentionPolicy
+
 
 class CollectorStatus(Enum):
     """Collector operational status"""
@@ -105,6 +106,9 @@ class BaseCollector(ABC):
     - Status management
     """
     
+    # Persisted metrics older than this are dropped segment by segment
+    metrics_retention = RetentionPolicy(max_age_seconds=30 * 24 * 3600)
+    
     def __init__(self, 
                  collector_id: str,
                  name: str,
@@ -134,6 +138,9 @@ class BaseCollector(ABC):
         # Storage for recent metrics (in-memory cache)
         self._recent_metrics: List[CollectorMetric] = []
         self._max_recent_metrics = 1000
+        
+        # Persistent metrics log (opened on first persist)
+        self._metrics_log: Optional[EventLog] = None
     
     def start(self) -> bool:
         """
@@ -179,6 +186,10 @@ class BaseCollector(ABC):
             # Cleanup collector-specific resources
             self._cleanup()
             
+            if self._metrics_log is not None:
+                self._metrics_log.close()
+                self._metrics_log = None
+            
             self.status = CollectorStatus.STOPPED
             self.logger.info(f"Collector {self.name} stopped successfully")
             return True
@@ -294,22 +305,28 @@ class BaseCollector(ABC):
             if not self.brain_path:
                 return
             
-            # Create metrics directory if it doesn't exist
-            metrics_dir = self.brain_path / "metrics-history"
-            metrics_dir.mkdir(exist_ok=True)
+            # One segmented log per collector, kept open between collections
+            if self._metrics_log is None:
+                self._metrics_log = EventLog(
+                    self.brain_path / "metrics-history" / self.collector_id,
+                    retention=self.metrics_retention
+                )
             
-            # Create daily metrics file
-            today = datetime.now().strftime("%Y-%m-%d")
-            metrics_file = metrics_dir / f"{self.collector_id}-{today}.jsonl"
-            
-            # Append metrics to file (JSONL format)
-            with open(metrics_file, "a") as f:
-                for metric in metrics:
-                    metric_data = metric.to_dict()
-                    f.write(json.dumps(metric_data) + "\n")
+            self._metrics_log.extend(metric.to_dict() for metric in metrics)
                     
         except Exception as e:
             self.logger.warning(f"Failed to persist metrics to brain: {e}")
+    
+    def get_persisted_metrics(self, since: datetime, until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Read persisted metrics in a time range from the brain metrics log"""
+        if not self.brain_path:
+            return []
+        if self._metrics_log is None:
+            log_dir = self.brain_path / "metrics-history" / self.collector_id
+            if not log_dir.exists():
+                return []
+            self._metrics_log = EventLog(log_dir, retention=self.metrics_retention)
+        return list(self._metrics_log.since(since, until))
 
 
 class CollectorRegistry:
@@ -9,6 +9,11 @@ Machine Detection:
 - Falls back to environment variables if cortex.config.json not found
 - Uses relative paths as final fallback
 
+Snapshots:
+- cortex.config.json is parsed once per change into an immutable
+  CortexSettings snapshot shared by every CortexConfig instance
+- Edits to the file are picked up by the background config watcher
+
 Usage:
     from src.config import config
     
@@ -26,8 +31,19 @@ Usage:
 import os
 import json
 import socket
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping
+
+from src.utils.config_snapshots import freeze, get_config_runtime
+
+
+@dataclass(frozen=True)
+class CortexSettings:
+    """Immutable, resolved view of cortex.config.json for the current machine."""
+    data: Mapping[str, Any]
+    root_path: Path
+    brain_path: Path
 
 
 class CortexConfig:
@@ -43,34 +59,50 @@ class CortexConfig:
     
     def __init__(self):
         """Initialize configuration manager."""
-        self._config: Optional[Dict[str, Any]] = None
-        self._root_path: Optional[Path] = None
-        self._brain_path: Optional[Path] = None
         self._hostname = socket.gethostname()
+        self._config_file = self._find_config_file()
         
-        # Load configuration
-        self._load_config()
+        # Parsed once per change and shared by every CortexConfig instance;
+        # the watcher republishes when cortex.config.json is edited
+        self._settings = get_config_runtime().register(
+            self._source_name(),
+            [self._config_file] if self._config_file else [],
+            self._load_config
+        )
+    
+    def _source_name(self) -> str:
+        """Snapshot key: config file plus the environment overrides it depends on."""
+        return "cortex.config:{}:{}:{}".format(
+            self._config_file,
+            os.getenv("CORTEX_ROOT", ""),
+            os.getenv("CORTEX_BRAIN_PATH", "")
+        )
     
-    def _load_config(self) -> None:
+    def _load_config(self) -> CortexSettings:
         """Load cortex.config.json with machine-specific overrides."""
-        # Find config file (search up from current file)
-        config_file = self._find_config_file()
+        config_file = self._config_file
+        config: Dict[str, Any] = {}
         
         if config_file and config_file.exists():
             try:
                 with open(config_file, 'r', encoding='utf-8') as f:
-                    self._config = json.load(f)
+                    config = json.load(f)
             except Exception as e:
+                if getattr(self, '_settings', None) is not None:
+                    raise  # Reload: keep the last good snapshot
                 print(f"Warning: Could not load cortex.config.json: {e}")
-                self._config = {}
-        else:
-            self._config = {}
+                config = {}
         
-        # Determine root path
-        self._root_path = self._determine_root_path()
+        # Determine root and brain paths
+        root_path = self._determine_root_path(config)
+        brain_path = self._determine_brain_path(config, root_path)
         
-        # Determine brain path
-        self._brain_path = self._determine_brain_path()
+        return CortexSettings(data=freeze(config), root_path=root_path, brain_path=brain_path)
+    
+    @property
+    def settings(self) -> CortexSettings:
+        """Current configuration snapshot (lock-free)."""
+        return self._settings.current.value
     
     def _find_config_file(self) -> Optional[Path]:
         """
@@ -102,7 +134,7 @@ class CortexConfig:
         
         return None
     
-    def _determine_root_path(self) -> Path:
+    def _determine_root_path(self, config: Dict[str, Any]) -> Path:
         """
         Determine CORTEX root path for current machine.
         
@@ -121,14 +153,14 @@ class CortexConfig:
             return Path(env_root)
         
         # 2. Machine-specific path in config
-        if self._config:
-            machine_paths = self._config.get("machines", {})
+        if config:
+            machine_paths = config.get("machines", {})
             hostname_path = machine_paths.get(self._hostname, {}).get("rootPath")
             if hostname_path:
                 return Path(hostname_path)
             
             # 3. Default rootPath
-            default_path = self._config.get("application", {}).get("rootPath")
+            default_path = config.get("application", {}).get("rootPath")
             if default_path:
                 path = Path(default_path)
                 # Convert macOS path to Windows if needed
@@ -160,7 +192,7 @@ class CortexConfig:
         # CORTEX/src/config.py -> go up to project root
         return Path(__file__).parent.parent.parent
     
-    def _determine_brain_path(self) -> Path:
+    def _determine_brain_path(self, config: Dict[str, Any], root_path: Path) -> Path:
         """
         Determine cortex-brain directory path.
         
@@ -178,34 +210,34 @@ class CortexConfig:
             return Path(env_brain)
         
         # 2. Machine-specific path
-        if self._config:
-            machine_paths = self._config.get("machines", {}).get(self._hostname, {})
+        if config:
+            machine_paths = config.get("machines", {}).get(self._hostname, {})
             brain_path = machine_paths.get("brainPath")
             if brain_path:
                 return Path(brain_path)
         
         # 3. Default: {root}/cortex-brain
-        return self._root_path / "cortex-brain"
+        return root_path / "cortex-brain"
     
     @property
     def root_path(self) -> Path:
         """Get CORTEX root directory path."""
-        return self._root_path
+        return self.settings.root_path
     
     @property
     def brain_path(self) -> Path:
         """Get cortex-brain directory path."""
-        return self._brain_path
+        return self.settings.brain_path
     
     @property
     def src_path(self) -> Path:
         """Get CORTEX/src directory path."""
-        return self._root_path / "CORTEX" / "src"
+        return self.settings.root_path / "CORTEX" / "src"
     
     @property
     def tests_path(self) -> Path:
         """Get CORTEX/tests directory path."""
-        return self._root_path / "CORTEX" / "tests"
+        return self.settings.root_path / "CORTEX" / "tests"
     
     @property
     def hostname(self) -> str:
@@ -215,22 +247,22 @@ class CortexConfig:
     @property
     def tier1_db_path(self) -> Path:
         """Get Tier 1 (Working Memory) database path."""
-        return self._brain_path / "tier1-working-memory.db"
+        return self.settings.brain_path / "tier1-working-memory.db"
     
     @property
     def tier2_db_path(self) -> Path:
         """Get Tier 2 (Knowledge Graph) database path."""
-        return self._brain_path / "tier2-knowledge-graph.db"
+        return self.settings.brain_path / "tier2-knowledge-graph.db"
     
     @property
     def tier3_db_path(self) -> Path:
         """Get Tier 3 (Development Context) database path."""
-        return self._brain_path / "tier3-development-context.db"
+        return self.settings.brain_path / "tier3-development-context.db"
     
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
-        return not self._config.get("portability", {}).get("setupCompleted", False)
+        return not self.settings.data.get("portability", {}).get("setupCompleted", False)
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -247,20 +279,18 @@ class CortexConfig:
             name = config.get("application.name")  # "CORTEX"
             threshold = config.get("governance.testQualityThreshold", 70)
         """
-        if not self._config:
+        value = self.settings.data
+        if not value:
             return default
-        
-        keys = key_path.split('.')
-        value = self._config
-        
-        for key in keys:
-            if isinstance(value, dict):
+
+        for key in key_path.split('.'):
+            if isinstance(value, Mapping):
                 value = value.get(key)
                 if value is None:
                     return default
             else:
                 return default
-        
+
         return value
     
     def ensure_paths_exist(self) -> None:
@@ -293,11 +323,12 @@ class CortexConfig:
         return {
             "hostname": self._hostname,
             "platform": os.name,
-            "root_path": str(self._root_path),
-            "brain_path": str(self._brain_path),
+            "root_path": str(self.root_path),
+            "brain_path": str(self.brain_path),
             "src_path": str(self.src_path),
             "tests_path": str(self.tests_path),
-            "config_loaded": self._config is not None,
+            "config_loaded": self._settings.current is not None,
+            "config_version": self._settings.current.version,
             "is_development": self.is_development,
         }
 
@@ -18,6 +18,8 @@ from pathlib import Path
 import json
 import hashlib
 
+from src.utils.memory_observer import track_cache
+
 
 class ContextRelevanceScorer:
     """Scores relevance of each tier's context to current request"""
@@ -207,6 +209,7 @@ class UnifiedContextManager:
         self.cache = {}
         self.cache_ttl = cache_ttl
         self.scorer = ContextRelevanceScorer()
+        track_cache("context_cache", self, attr="cache")
     
     def _cache_key(self, user_request: str, token_budget: int, current_files: List[str]) -> str:
         """Generate cache key for request"""
@@ -20,7 +20,11 @@ import json
 import logging
 from pathlib import Path
 
+import numpy as np
+
 from ..tier1.working_memory import WorkingMemory
+from ..tier1.temporal_join import MICROSECONDS, to_microseconds, window_join
+from ..infrastructure.persistence.event_log import EventLog
 from ..track_a.integrations.conversational_channel_adapter import ConversationalChannelAdapter
 
 
@@ -244,6 +248,12 @@ class TraditionalChannel:
         # Ensure storage directory exists
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
+        # Segmented log; the old single JSONL file becomes its first segment
+        self.event_log = EventLog(
+            self.storage_path / "traditional_events",
+            legacy_file=self.events_file
+        )
+        
     def store_execution(self, operation: str, parameters: Dict[str, Any],
                        result: Dict[str, Any], execution_time_ms: int,
                        success: bool, session_id: str = None) -> str:
@@ -270,43 +280,38 @@ class TraditionalChannel:
         # Generate unique ID
         event_id = f"trad_{int(event.timestamp.timestamp() * 1000)}"
         
-        # Store as JSONL
-        with open(self.events_file, "a", encoding="utf-8") as f:
-            event_data = {
-                "id": event_id,
-                "timestamp": event.timestamp.isoformat(),
-                "channel": event.channel.value,
-                "operation": operation,
-                "parameters": parameters,
-                "result": result,
-                "execution_time_ms": execution_time_ms,
-                "success": success,
-                "session_id": session_id
-            }
-            f.write(json.dumps(event_data) + "\n")
-            
+        self.event_log.append({
+            "id": event_id,
+            "timestamp": event.timestamp.isoformat(),
+            "channel": event.channel.value,
+            "operation": operation,
+            "parameters": parameters,
+            "result": result,
+            "execution_time_ms": execution_time_ms,
+            "success": success,
+            "session_id": session_id
+        })
+        
         self.logger.info(f"Stored traditional event: {event_id}")
         return event_id
         
     def get_recent_executions(self, limit: int = 20) -> List[Dict]:
-        """Get recent execution events"""
+        """Get recent execution events (newest first)"""
         events = []
-        
-        if not self.events_file.exists():
-            return events
-            
-        with open(self.events_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            
-        # Get most recent events
-        for line in reversed(lines[-limit:]):
-            try:
-                event = json.loads(line.strip())
-                events.append(event)
-            except json.JSONDecodeError:
-                continue
-                
+        for event in self.event_log.iter_reverse():
+            events.append(event)
+            if len(events) >= limit:
+                break
         return events
+    
+    def get_executions_since(self, start: Union[datetime, float, str],
+                             end: Union[datetime, float, str, None] = None) -> List[Dict]:
+        """Get execution events in a time range (oldest first)"""
+        return list(self.event_log.since(start, end))
+
+    def close(self) -> None:
+        """Flush buffered events and release the event log's file handles"""
+        self.event_log.close()
 
 
 class IntelligentFusion:
@@ -324,65 +329,79 @@ class IntelligentFusion:
         # Get recent events from both channels (ORM objects)
         conversations_orm = self.conversational_channel.working_memory.get_recent_conversations(20)
         executions = self.traditional_channel.get_recent_executions(20)
+        if not conversations_orm or not executions:
+            return []
+        
+        # Parse each timestamp once, then window-join the two streams
+        conv_timestamps = [
+            conv_orm.created_at.isoformat() if hasattr(conv_orm.created_at, 'isoformat') else str(conv_orm.created_at)
+            for conv_orm in conversations_orm
+        ]
+        conv_times = [datetime.fromisoformat(ts) for ts in conv_timestamps]
+        exec_times = [datetime.fromisoformat(execution["timestamp"]) for execution in executions]
+        
+        origin = min(conv_times + exec_times)
+        exec_us = to_microseconds(exec_times, origin)
+        exec_order = np.argsort(exec_us, kind='stable')
+        conv_idx, exec_pos = window_join(
+            to_microseconds(conv_times, origin),
+            exec_us[exec_order],
+            time_window_minutes * 60 * MICROSECONDS
+        )
         
-        correlated_narratives = []
+        related: Dict[int, List[int]] = {}
+        for i, pos in zip(conv_idx.tolist(), exec_pos.tolist()):
+            related.setdefault(i, []).append(int(exec_order[pos]))
         
-        for conv_orm in conversations_orm:
-            # Convert ORM object to dict for processing
-            # Use getattr with defaults for optional fields
-            
-            # Fetch first user message for user_request
-            messages = self.conversational_channel.working_memory.get_messages(conv_orm.conversation_id)
-            user_message = ""
-            assistant_response = ""
-            if messages:
-                for msg in messages:
-                    if msg["role"] == "user" and not user_message:
-                        user_message = msg["content"]
-                    elif msg["role"] == "assistant" and not assistant_response:
-                        assistant_response = msg["content"]
-            
-            # Extract intent from semantic_elements JSON if available
-            intent = ''
-            semantic_elements_str = getattr(conv_orm, 'semantic_elements', None)
-            if semantic_elements_str:
-                try:
-                    semantic_data = json.loads(semantic_elements_str)
-                    intent = semantic_data.get('intent', '')
-                    self.logger.debug(f"Extracted intent '{intent}' from semantic_data: {semantic_data}")
-                except (json.JSONDecodeError, TypeError) as e:
-                    self.logger.warning(f"Failed to parse semantic_elements: {e}")
-                    intent = ''
-            else:
-                self.logger.debug(f"No semantic_elements found for conversation {conv_orm.conversation_id}")
-            
-            conversation = {
-                "conversation_id": conv_orm.conversation_id,
-                "timestamp": conv_orm.created_at.isoformat() if hasattr(conv_orm.created_at, 'isoformat') else str(conv_orm.created_at),
-                "title": getattr(conv_orm, 'title', 'Untitled'),
-                "intent": intent,
-                "user_message": user_message,
-                "assistant_response": assistant_response,
-                "workflow_state": getattr(conv_orm, 'workflow_state', '')
-            }
-            
-            # Find executions within time window
-            conv_time = datetime.fromisoformat(conversation["timestamp"])
-            related_executions = []
-            
-            for execution in executions:
-                exec_time = datetime.fromisoformat(execution["timestamp"])
-                time_diff = abs((conv_time - exec_time).total_seconds() / 60)
-                
-                if time_diff <= time_window_minutes:
-                    related_executions.append(execution)
-                    
-            # Create unified narrative
-            if related_executions:
-                narrative = self._create_unified_narrative(conversation, related_executions)
-                correlated_narratives.append(narrative)
+        correlated_narratives = []
+        for i, conv_orm in enumerate(conversations_orm):
+            if i not in related:
+                continue
+            # Executions keep their channel order (newest first)
+            related_executions = [executions[j] for j in sorted(related[i])]
+            conversation = self._conversation_summary(conv_orm, conv_timestamps[i])
+            narrative = self._create_unified_narrative(conversation, related_executions)
+            correlated_narratives.append(narrative)
                 
         return correlated_narratives
+    
+    def _conversation_summary(self, conv_orm: Any, timestamp: str) -> Dict:
+        """Build the conversation dict for a narrative (fetches its messages)"""
+        
+        # Fetch first user message for user_request
+        messages = self.conversational_channel.working_memory.get_messages(conv_orm.conversation_id)
+        user_message = ""
+        assistant_response = ""
+        if messages:
+            for msg in messages:
+                if msg["role"] == "user" and not user_message:
+                    user_message = msg["content"]
+                elif msg["role"] == "assistant" and not assistant_response:
+                    assistant_response = msg["content"]
+        
+        # Extract intent from semantic_elements JSON if available
+        intent = ''
+        semantic_elements_str = getattr(conv_orm, 'semantic_elements', None)
+        if semantic_elements_str:
+            try:
+                semantic_data = json.loads(semantic_elements_str)
+                intent = semantic_data.get('intent', '')
+                self.logger.debug(f"Extracted intent '{intent}' from semantic_data: {semantic_data}")
+            except (json.JSONDecodeError, TypeError) as e:
+                self.logger.warning(f"Failed to parse semantic_elements: {e}")
+                intent = ''
+        else:
+            self.logger.debug(f"No semantic_elements found for conversation {conv_orm.conversation_id}")
+        
+        return {
+            "conversation_id": conv_orm.conversation_id,
+            "timestamp": timestamp,
+            "title": getattr(conv_orm, 'title', 'Untitled'),
+            "intent": intent,
+            "user_message": user_message,
+            "assistant_response": assistant_response,
+            "workflow_state": getattr(conv_orm, 'workflow_state', '')
+        }
         
     def _create_unified_narrative(self, conversation: Dict, 
                                 executions: List[Dict]) -> Dict:
@@ -511,4 +530,13 @@ class DualChannelMemory:
         if conversation_id:
             context["current_conversation"] = self.conversational_channel.get_conversation_context(conversation_id)
             
-        return context
\ No newline at end of file
+        return context
+    
+    def close(self) -> None:
+        """Release the storage owned by both channels"""
+        self.traditional_channel.close()
+        self.conversational_channel.working_memory.close()
+        
+    async def cleanup(self) -> None:
+        """Async shutdown hook (UnifiedInterface.shutdown)"""
+        self.close()
\ No newline at end of file
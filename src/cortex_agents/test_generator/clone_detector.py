@@ -0,0 +1,544 @@
+"""
+Clone Detector - Winnowing-based duplicate code detection
+
+Near-linear cross-file clone detection for CodeSmellDetector:
+1. Tokenize each file once, abstracting identifiers and literals (Type-2 clones)
+2. Hash every k-gram of normalized tokens and winnow to a fingerprint subset
+3. Store fingerprints in an inverted index (fingerprint → locations)
+4. Merge co-located shared fingerprints into clone spans and clone groups
+
+The index is persisted in SQLite and refreshed per changed file, so
+whole-repository duplication analysis only re-tokenizes edited files.
+
+Based on: Schleimer, Wilkerson, Aiken - "Winnowing: Local Algorithms for
+Document Fingerprinting" (SIGMOD 2003)
+
+Author: Asif Hussain
+Date: 2025-11-21
+"""
+
+import hashlib
+import io
+import keyword
+import logging
+import sqlite3
+import tokenize
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Tokens with no structural meaning for clone detection
+_SKIPPED_TOKENS = {
+    tokenize.COMMENT, tokenize.NL, tokenize.NEWLINE, tokenize.INDENT,
+    tokenize.DEDENT, tokenize.ENCODING, tokenize.ENDMARKER,
+}
+
+# Mersenne prime modulus keeps rolling hashes stable across processes,
+# unlike the salted built-in hash()
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = 1_000_003
+
+
+@dataclass(frozen=True)
+class NormalizedToken:
+    """Token reduced to its clone-relevant form"""
+    value: int  # Stable token hash
+    line: int
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Winnowed k-gram hash with the source lines it covers"""
+    hash: int
+    start_line: int
+    end_line: int
+
+
+@dataclass
+class CloneLocation:
+    """One occurrence of a clone"""
+    file_path: str
+    start_line: int
+    end_line: int
+
+    @property
+    def lines(self) -> int:
+        return self.end_line - self.start_line + 1
+
+
+@dataclass
+class ClonePair:
+    """Two spans sharing a run of co-located fingerprints"""
+    first: CloneLocation
+    second: CloneLocation
+    shared_fingerprints: int
+    similarity: float
+
+
+@dataclass
+class CloneGroup:
+    """All locations of one cloned fragment"""
+    locations: List[CloneLocation] = field(default_factory=list)
+    shared_fingerprints: int = 0
+
+    @property
+    def lines(self) -> int:
+        return max((loc.lines for loc in self.locations), default=0)
+
+
+def normalize_tokens(source: str) -> List[NormalizedToken]:
+    """
+    Tokenize Python source with identifier/literal abstraction.
+
+    Identifiers become ID, numbers NUM and strings STR, so renamed
+    copies (Type-2 clones) produce the same token stream. Keywords and
+    operators are kept verbatim.
+    """
+    tokens: List[NormalizedToken] = []
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if tok.type in _SKIPPED_TOKENS:
+                continue
+            if tok.type == tokenize.NAME:
+                text = tok.string if keyword.iskeyword(tok.string) else "ID"
+            elif tok.type == tokenize.NUMBER:
+                text = "NUM"
+            elif tok.type == tokenize.STRING:
+                text = "STR"
+            else:
+                text = tok.string
+            tokens.append(NormalizedToken(zlib.crc32(text.encode("utf-8")), tok.start[0]))
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        # Keep whatever was tokenized before the error
+        pass
+    return tokens
+
+
+def winnow(tokens: Sequence[NormalizedToken], k: int, window: int) -> List[Fingerprint]:
+    """
+    Select fingerprints from k-gram hashes by winnowing.
+
+    Every run of at least k + window - 1 matching tokens is guaranteed to
+    share at least one fingerprint. Uses a monotonic deque so selection
+    is O(n) in the number of tokens.
+    """
+    if len(tokens) < k:
+        return []
+
+    # Rolling polynomial hash over k tokens
+    high = pow(_HASH_BASE, k - 1, _HASH_MOD)
+    grams: List[int] = []
+    h = 0
+    for i, tok in enumerate(tokens):
+        if i >= k:
+            h = (h - tokens[i - k].value * high) % _HASH_MOD
+        h = (h * _HASH_BASE + tok.value) % _HASH_MOD
+        if i >= k - 1:
+            grams.append(h)
+
+    fingerprints: List[Fingerprint] = []
+    candidates: List[int] = []  # Monotonic deque of gram indices (list + head)
+    head = 0
+    last_selected = -1
+    for i, gram in enumerate(grams):
+        # Rightmost minimum wins: pop while the new hash is <= the tail
+        while len(candidates) > head and grams[candidates[-1]] >= gram:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            selected = candidates[head]
+            if selected != last_selected:
+                last_selected = selected
+                fingerprints.append(Fingerprint(
+                    hash=grams[selected],
+                    start_line=tokens[selected].line,
+                    end_line=tokens[selected + k - 1].line,
+                ))
+        # Compact the deque occasionally so it does not grow unbounded
+        if head > 1024:
+            candidates = candidates[head:]
+            head = 0
+    return fingerprints
+
+
+class CloneIndex:
+    """
+    Persistent inverted index of winnowed fingerprints.
+
+    Files are re-fingerprinted only when their size, mtime or content
+    hash changes. Hashes are below 2^61 and fit SQLite's signed INTEGER.
+    """
+
+    def __init__(self, db_path: str = ":memory:", k: int = 30, window: int = 8):
+        self.db_path = db_path
+        self.k = k
+        self.window = window
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self._init_database()
+
+    def _init_database(self):
+        """Initialize SQLite schema"""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS clone_files (
+                file_path TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                file_size INTEGER,
+                modified_time REAL,
+                fingerprint_count INTEGER DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS clone_fingerprints (
+                hash INTEGER NOT NULL,
+                file_path TEXT NOT NULL,
+                start_line INTEGER NOT NULL,
+                end_line INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_clone_fp_hash ON clone_fingerprints(hash);
+            CREATE INDEX IF NOT EXISTS idx_clone_fp_file ON clone_fingerprints(file_path);
+            CREATE TABLE IF NOT EXISTS clone_settings (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+        settings = f"{self.k}:{self.window}"
+        row = self.conn.execute(
+            "SELECT value FROM clone_settings WHERE key = 'kgram'"
+        ).fetchone()
+        if row and row[0] != settings:
+            # Fingerprints from a different k/window are not comparable
+            self.conn.execute("DELETE FROM clone_fingerprints")
+            self.conn.execute("DELETE FROM clone_files")
+        self.conn.execute(
+            "INSERT OR REPLACE INTO clone_settings (key, value) VALUES ('kgram', ?)",
+            (settings,)
+        )
+        self.conn.commit()
+
+    def close(self):
+        """Close the index database"""
+        self.conn.close()
+
+    def update_file(self, file_path: str) -> bool:
+        """
+        Refresh one file's fingerprints if it changed.
+
+        Returns:
+            True if the file was (re)indexed, False if it was unchanged
+        """
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            self.remove_file(file_path)
+            return True
+
+        row = self.conn.execute(
+            "SELECT content_hash, file_size, modified_time FROM clone_files WHERE file_path = ?",
+            (file_path,)
+        ).fetchone()
+        if row and row[1] == stat.st_size and abs(row[2] - stat.st_mtime) < 0.001:
+            return False
+
+        try:
+            raw = path.read_bytes()
+        except OSError as e:
+            # Unreadable (permissions, locked, vanished mid-run): skip it and
+            # drop stale fingerprints rather than abort the whole analysis
+            logger.warning(f"Skipping {file_path} for clone detection: {e}")
+            self.remove_file(file_path)
+            return False
+        content_hash = hashlib.sha256(raw).hexdigest()
+        if row and row[0] == content_hash:
+            self.conn.execute(
+                "UPDATE clone_files SET file_size = ?, modified_time = ? WHERE file_path = ?",
+                (stat.st_size, stat.st_mtime, file_path)
+            )
+            return False
+
+        source = raw.decode("utf-8", errors="replace")
+        fingerprints = winnow(normalize_tokens(source), self.k, self.window)
+
+        self.conn.execute("DELETE FROM clone_fingerprints WHERE file_path = ?", (file_path,))
+        self.conn.executemany(
+            "INSERT INTO clone_fingerprints (hash, file_path, start_line, end_line) VALUES (?, ?, ?, ?)",
+            [(fp.hash, file_path, fp.start_line, fp.end_line) for fp in fingerprints]
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO clone_files "
+            "(file_path, content_hash, file_size, modified_time, fingerprint_count) VALUES (?, ?, ?, ?, ?)",
+            (file_path, content_hash, stat.st_size, stat.st_mtime, len(fingerprints))
+        )
+        return True
+
+    def remove_file(self, file_path: str):
+        """Drop a file from the index"""
+        self.conn.execute("DELETE FROM clone_fingerprints WHERE file_path = ?", (file_path,))
+        self.conn.execute("DELETE FROM clone_files WHERE file_path = ?", (file_path,))
+
+    def update(self, file_paths: Iterable[str], prune_missing: bool = False) -> int:
+        """
+        Bring the index in sync with a set of files.
+
+        Indexed files outside file_paths are kept, so analyzing a subset
+        (e.g. only staged files) does not discard the rest of the index.
+
+        Args:
+            file_paths: Files that make up the analyzed corpus
+            prune_missing: Drop indexed files that no longer exist on disk
+
+        Returns:
+            Number of files that were re-fingerprinted
+        """
+        wanted = [str(p) for p in file_paths]
+        changed = 0
+        for file_path in wanted:
+            if self.update_file(file_path):
+                changed += 1
+        if prune_missing:
+            indexed = [r[0] for r in self.conn.execute("SELECT file_path FROM clone_files")]
+            for file_path in indexed:
+                if not Path(file_path).exists():
+                    self.remove_file(file_path)
+        self.conn.commit()
+        return changed
+
+    def shared_fingerprints(self, max_occurrences: int = 10) -> Dict[int, List[Tuple[str, int, int]]]:
+        """
+        Fingerprints that occur more than once in the corpus.
+
+        Fingerprints with more than max_occurrences hits are boilerplate
+        (imports, common idioms) and are ignored to keep pairing linear.
+        """
+        rows = self.conn.execute("""
+            SELECT f.hash, f.file_path, f.start_line, f.end_line
+            FROM clone_fingerprints f
+            JOIN (
+                SELECT hash FROM clone_fingerprints
+                GROUP BY hash
+                HAVING COUNT(*) > 1 AND COUNT(*) <= ?
+            ) shared ON shared.hash = f.hash
+            ORDER BY f.hash
+        """, (max_occurrences,))
+        postings: Dict[int, List[Tuple[str, int, int]]] = defaultdict(list)
+        for fp_hash, file_path, start_line, end_line in rows:
+            postings[fp_hash].append((file_path, start_line, end_line))
+        return postings
+
+    def fingerprint_lines(self, file_paths: Iterable[str]) -> Dict[str, List[int]]:
+        """Sorted fingerprint start lines per file, for span density lookups"""
+        wanted = list(file_paths)
+        lines: Dict[str, List[int]] = defaultdict(list)
+        for start in range(0, len(wanted), 500):
+            chunk = wanted[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT file_path, start_line FROM clone_fingerprints "
+                f"WHERE file_path IN ({placeholders}) ORDER BY file_path, start_line",
+                chunk
+            )
+            for file_path, start_line in rows:
+                lines[file_path].append(start_line)
+        return lines
+
+
+class CloneDetector:
+    """
+    Detect Type-1/Type-2 clones across a corpus of Python files.
+
+    Usage:
+        detector = CloneDetector(index_path=".cortex/clone-index.db")
+        groups = detector.detect(python_files)
+    """
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        k: int = 30,
+        window: int = 8,
+        max_gap_lines: int = 3,
+        max_occurrences: int = 10
+    ):
+        """
+        Args:
+            index_path: SQLite index location (None = in-memory, no persistence)
+            k: Tokens per k-gram (noise threshold)
+            window: Winnowing window; matches of k + window - 1 tokens are guaranteed
+            max_gap_lines: Hits closer than this many lines merge into one span
+            max_occurrences: Ignore fingerprints that occur more often than this
+        """
+        self.index = CloneIndex(index_path or ":memory:", k=k, window=window)
+        self.max_gap_lines = max_gap_lines
+        self.max_occurrences = max_occurrences
+
+    def close(self):
+        """Close the underlying index"""
+        self.index.close()
+
+    def detect_pairs(self, file_paths: Iterable[str], min_lines: int = 5) -> List[ClonePair]:
+        """
+        Update the index for file_paths and return merged clone pairs.
+
+        Args:
+            file_paths: Corpus of Python files
+            min_lines: Minimum clone span length to report
+        """
+        wanted = [str(p) for p in file_paths]
+        self.index.update(wanted, prune_missing=True)
+        postings = self.index.shared_fingerprints(self.max_occurrences)
+
+        # The index may hold files from earlier runs; only pair files in this corpus
+        corpus = set(wanted)
+
+        # (fileA, fileB) → [(lineA_start, lineA_end, lineB_start, lineB_end)]
+        hits: Dict[Tuple[str, str], List[Tuple[int, int, int, int]]] = defaultdict(list)
+        for locations in postings.values():
+            locations = [loc for loc in locations if loc[0] in corpus]
+            for i, (file_a, start_a, end_a) in enumerate(locations):
+                for file_b, start_b, end_b in locations[i + 1:]:
+                    if (file_a, start_a) > (file_b, start_b):
+                        hits[(file_b, file_a)].append((start_b, end_b, start_a, end_a))
+                    else:
+                        hits[(file_a, file_b)].append((start_a, end_a, start_b, end_b))
+
+        fingerprint_lines = self.index.fingerprint_lines({a for a, _b in hits})
+
+        pairs: List[ClonePair] = []
+        for (file_a, file_b), file_hits in hits.items():
+            for span in self._merge_hits(file_hits):
+                start_a, end_a, start_b, end_b, shared = span
+                if file_a == file_b and start_b <= end_a:
+                    continue  # Overlapping self-match
+                first = CloneLocation(file_a, start_a, end_a)
+                second = CloneLocation(file_b, start_b, end_b)
+                if min(first.lines, second.lines) < min_lines:
+                    continue
+                pairs.append(ClonePair(
+                    first=first,
+                    second=second,
+                    shared_fingerprints=shared,
+                    similarity=self._similarity(shared, first, fingerprint_lines[file_a])
+                ))
+        pairs.sort(key=lambda p: (p.first.file_path, p.first.start_line, p.second.file_path))
+        return pairs
+
+    def detect(self, file_paths: Iterable[str], min_lines: int = 5) -> List[CloneGroup]:
+        """
+        Detect clone groups: pairs that share a location are unioned.
+
+        Args:
+            file_paths: Corpus of Python files
+            min_lines: Minimum clone span length to report
+        """
+        pairs = self.detect_pairs(file_paths, min_lines=min_lines)
+
+        parent: Dict[Tuple[str, int, int], Tuple[str, int, int]] = {}
+
+        def find(node):
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        shared: Dict[Tuple[str, int, int], int] = defaultdict(int)
+        for pair in pairs:
+            a = (pair.first.file_path, pair.first.start_line, pair.first.end_line)
+            b = (pair.second.file_path, pair.second.start_line, pair.second.end_line)
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+            shared[a] = max(shared[a], pair.shared_fingerprints)
+
+        members: Dict[Tuple[str, int, int], List[Tuple[str, int, int]]] = defaultdict(list)
+        for node in list(parent):
+            members[find(node)].append(node)
+
+        groups = []
+        for nodes in members.values():
+            nodes.sort()
+            groups.append(CloneGroup(
+                locations=[CloneLocation(*node) for node in nodes],
+                shared_fingerprints=max(shared.get(node, 0) for node in nodes)
+            ))
+        groups.sort(key=lambda g: (-g.lines, g.locations[0].file_path, g.locations[0].start_line))
+        return groups
+
+    def _merge_hits(
+        self,
+        file_hits: List[Tuple[int, int, int, int]]
+    ) -> List[Tuple[int, int, int, int, int]]:
+        """
+        Merge co-located fingerprint hits into spans.
+
+        Hits are merged when they advance together in both files (same
+        line offset drift within max_gap_lines), which separates distinct
+        clones that happen to share a few fingerprints.
+        """
+        file_hits.sort(key=lambda h: (h[0] - h[2], h[0]))
+        spans: List[Tuple[int, int, int, int, int]] = []
+        current = None
+        for start_a, end_a, start_b, end_b in file_hits:
+            if current is not None:
+                c_start_a, c_end_a, c_start_b, c_end_b, count = current
+                same_diagonal = abs((start_a - start_b) - (c_start_a - c_start_b)) <= self.max_gap_lines
+                if same_diagonal and start_a <= c_end_a + self.max_gap_lines:
+                    current = (c_start_a, max(c_end_a, end_a), c_start_b, max(c_end_b, end_b), count + 1)
+                    continue
+                spans.append(current)
+            current = (start_a, end_a, start_b, end_b, 1)
+        if current is not None:
+            spans.append(current)
+        return spans
+
+    @staticmethod
+    def _similarity(shared: int, location: CloneLocation, lines: List[int]) -> float:
+        """Share of the span's fingerprints that also occur in the other copy"""
+        total = bisect_right(lines, location.end_line) - bisect_left(lines, location.start_line)
+        return round(min(1.0, shared / max(1, total)), 3)
+
+
+def main():
+    """Pre-commit entry point: report clones among the given files"""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Winnowing-based clone detection")
+    parser.add_argument("paths", nargs="+", help="Files or directories to analyze")
+    parser.add_argument("--index", default=None, help="Persistent index path (SQLite)")
+    parser.add_argument("--min-lines", type=int, default=5)
+    parser.add_argument("--fail-on-clones", action="store_true")
+    args = parser.parse_args()
+
+    files: List[str] = []
+    for raw in args.paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(str(p) for p in sorted(path.rglob("*.py")))
+        elif path.suffix == ".py":
+            files.append(str(path))
+
+    detector = CloneDetector(index_path=args.index)
+    groups = detector.detect(files, min_lines=args.min_lines)
+    detector.close()
+
+    for group in groups:
+        print(f"Clone ({group.lines} lines, {len(group.locations)} locations):")
+        for loc in group.locations:
+            print(f"  {loc.file_path}:{loc.start_line}-{loc.end_line}")
+    print(f"{len(groups)} clone groups in {len(files)} files")
+
+    if args.fail_on_clones and groups:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ Code Smell Detector for TDD Mastery Phase 3
 
 Detects common code smells in Python code:
 1. Long methods (>20 lines)
-2. Duplicated code (similar AST structures)
+2. Duplicated code (winnowing-based Type-1/Type-2 clone detection)
 3. Large classes (>200 lines or >10 methods)
 4. Long parameter lists (>5 parameters)
 5. Primitive obsession (excessive basic types)
@@ -14,12 +14,13 @@ Date: 2025-11-21
 """
 
 import ast
-import hashlib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 from enum import Enum
 
+from .clone_detector import CloneDetector
+
 
 class SmellSeverity(Enum):
     """Severity levels for code smells"""
@@ -65,6 +66,9 @@ class SmellDetectionConfig:
     max_primitive_ratio: float = 0.7
     min_duplication_similarity: float = 0.85
     min_duplication_lines: int = 5
+    clone_kgram_tokens: int = 30
+    clone_window: int = 8
+    clone_index_path: Optional[str] = None  # Persist fingerprints between runs
 
 
 class CodeSmellDetector:
@@ -113,55 +117,50 @@ class CodeSmellDetector:
         """
         Detect duplicated code across multiple files
         
+        Uses winnowing fingerprints in an inverted index (see clone_detector),
+        so cost is near-linear in total tokens rather than quadratic in files.
+        Renamed identifiers and changed literals still match (Type-2 clones).
+        
         Args:
             file_paths: List of file paths to analyze
             
         Returns:
             List of duplication smells
         """
-        method_signatures: Dict[str, List[Tuple[str, ast.FunctionDef, str]]] = {}
-        
-        for file_path in file_paths:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    source = f.read()
-                    tree = ast.parse(source, filename=file_path)
-                    
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        sig = self._get_method_signature(node)
-                        if sig not in method_signatures:
-                            method_signatures[sig] = []
-                        method_signatures[sig].append((file_path, node, source))
-                        
-            except (SyntaxError, FileNotFoundError):
-                continue
+        detector = CloneDetector(
+            index_path=self.config.clone_index_path,
+            k=self.config.clone_kgram_tokens,
+            window=self.config.clone_window
+        )
+        try:
+            pairs = detector.detect_pairs(
+                file_paths, min_lines=self.config.min_duplication_lines
+            )
+        finally:
+            detector.close()
         
-        # Find duplicates
         duplication_smells = []
-        for sig, occurrences in method_signatures.items():
-            if len(occurrences) >= 2:
-                # Check if methods are similar enough
-                for i, (file1, node1, src1) in enumerate(occurrences):
-                    for file2, node2, src2 in occurrences[i+1:]:
-                        similarity = self._calculate_similarity(node1, node2)
-                        if similarity >= self.config.min_duplication_similarity:
-                            smell = CodeSmell(
-                                smell_type=SmellType.DUPLICATED_CODE,
-                                severity=SmellSeverity.HIGH,
-                                file_path=file1,
-                                line_number=node1.lineno,
-                                end_line=node1.end_lineno or node1.lineno,
-                                element_name=node1.name,
-                                description=f"Method '{node1.name}' duplicated in {file2}",
-                                suggestion=f"Extract common logic to shared utility function",
-                                metrics={
-                                    "similarity": similarity,
-                                    "duplicate_location": f"{file2}:{node2.lineno}",
-                                    "lines": node1.end_lineno - node1.lineno + 1
-                                }
-                            )
-                            duplication_smells.append(smell)
+        for pair in pairs:
+            if pair.similarity < self.config.min_duplication_similarity:
+                continue
+            first, second = pair.first, pair.second
+            smell = CodeSmell(
+                smell_type=SmellType.DUPLICATED_CODE,
+                severity=SmellSeverity.HIGH,
+                file_path=first.file_path,
+                line_number=first.start_line,
+                end_line=first.end_line,
+                element_name=f"lines {first.start_line}-{first.end_line}",
+                description=f"Code block duplicated in {second.file_path}",
+                suggestion="Extract common logic to shared utility function",
+                metrics={
+                    "similarity": pair.similarity,
+                    "duplicate_location": f"{second.file_path}:{second.start_line}",
+                    "lines": first.lines,
+                    "shared_fingerprints": pair.shared_fingerprints
+                }
+            )
+            duplication_smells.append(smell)
         
         return duplication_smells
     
@@ -392,45 +391,6 @@ class CodeSmellDetector:
         
         return complexity
     
-    def _get_method_signature(self, node: ast.FunctionDef) -> str:
-        """Generate a signature hash for method comparison"""
-        # Use AST structure, not names, for similarity detection
-        sig_parts = [
-            str(len(node.args.args)),
-            str(len(node.body)),
-            str(self._calculate_complexity(node))
-        ]
-        return hashlib.md5("|".join(sig_parts).encode()).hexdigest()[:8]
-    
-    def _calculate_similarity(self, node1: ast.FunctionDef, node2: ast.FunctionDef) -> float:
-        """Calculate structural similarity between two methods"""
-        # Simple similarity based on AST structure
-        features1 = self._extract_features(node1)
-        features2 = self._extract_features(node2)
-        
-        common = sum(min(features1.get(k, 0), features2.get(k, 0)) for k in set(features1) | set(features2))
-        total = sum(max(features1.get(k, 0), features2.get(k, 0)) for k in set(features1) | set(features2))
-        
-        return common / total if total > 0 else 0.0
-    
-    def _extract_features(self, node: ast.FunctionDef) -> Dict[str, int]:
-        """Extract structural features from AST node"""
-        features = {
-            "if": 0,
-            "for": 0,
-            "while": 0,
-            "call": 0,
-            "assign": 0,
-            "return": 0
-        }
-        
-        for child in ast.walk(node):
-            node_type = type(child).__name__.lower()
-            if node_type in features:
-                features[node_type] += 1
-        
-        return features
-    
     def _is_primitive_type(self, annotation: ast.AST) -> bool:
         """Check if type annotation is a primitive type"""
         if isinstance(annotation, ast.Name):
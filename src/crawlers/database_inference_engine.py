@@ -4,6 +4,10 @@ Database Schema Inference Engine for CORTEX
 Infers database schema from application code WITHOUT database access.
 Extracts knowledge from ColdFusion queries, ORM models, and DAO patterns.
 
+Source files are read once by InferenceScanner (single combined-pattern
+pass per file, process pool, content-hash cache); the inference phases
+below only consume its per-file results.
+
 Author: Asif Hussain
 Copyright: © 2024-2025 Asif Hussain. All rights reserved.
 """
@@ -15,6 +19,14 @@ from typing import Dict, List, Any, Optional, Set
 from pathlib import Path
 from dataclasses import dataclass, field
 
+from .inference_scanner import (
+    CONFIG_FILES,
+    DAO_SUFFIXES,
+    PARALLEL_THRESHOLD,
+    FileScan,
+    InferenceScanner,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,19 +86,36 @@ class DatabaseSchemaInferenceEngine:
     INSERT_TABLE_PATTERN = re.compile(r'\bINSERT\s+INTO\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE)
     DELETE_TABLE_PATTERN = re.compile(r'\bDELETE\s+FROM\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE)
     
+    # All of the above in one pass
+    TABLE_PATTERN = re.compile(
+        r'\b(?:FROM|JOIN|UPDATE|INSERT\s+INTO|DELETE\s+FROM)\s+([a-zA-Z_][a-zA-Z0-9_]*)',
+        re.IGNORECASE
+    )
+    
     # Column patterns
     SELECT_COLUMNS_PATTERN = re.compile(r'SELECT\s+(.*?)\s+FROM', re.IGNORECASE | re.DOTALL)
     INSERT_COLUMNS_PATTERN = re.compile(r'\((.*?)\)\s+VALUES', re.IGNORECASE | re.DOTALL)
     
-    def __init__(self, app_path: Path):
+    def __init__(
+        self,
+        app_path: Path,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[Path] = None,
+        parallel_threshold: int = PARALLEL_THRESHOLD
+    ):
         """
         Initialize database schema inference engine.
         
         Args:
             app_path: Path to application root
+            max_workers: Scanner process pool size (None = os.cpu_count(), 1 = in-process)
+            cache_path: SQLite scan cache location (None disables caching)
+            parallel_threshold: Minimum file count before the pool is used
         """
         self.app_path = app_path
         self.tables: Dict[str, TableInfo] = {}
+        self.scanner = InferenceScanner(max_workers, cache_path, parallel_threshold)
+        self._scans: List[FileScan] = []
     
     def infer_schema(self) -> Dict[str, Any]:
         """
@@ -97,6 +126,9 @@ class DatabaseSchemaInferenceEngine:
         """
         logger.info(f"Starting database schema inference for {self.app_path}")
         
+        # Read and scan every source file once
+        self._scans = self.scanner.scan(self.app_path)
+        
         # 1. Parse ColdFusion queries
         self._parse_cfquery_tags()
         
@@ -125,24 +157,18 @@ class DatabaseSchemaInferenceEngine:
     
     def _parse_cfquery_tags(self) -> None:
         """Extract SQL from <cfquery> tags"""
-        cfm_files = list(self.app_path.rglob('*.cfm')) + list(self.app_path.rglob('*.cfc'))
-        
-        logger.info(f"Parsing {len(cfm_files)} ColdFusion files for queries")
-        
-        for cf_file in cfm_files:
-            try:
-                content = cf_file.read_text(encoding='utf-8', errors='ignore')
-                rel_path = str(cf_file.relative_to(self.app_path))
-                
-                # Find <cfquery> blocks
-                query_pattern = r'<cfquery[^>]*>(.*?)</cfquery>'
-                matches = re.findall(query_pattern, content, re.DOTALL | re.IGNORECASE)
-                
-                for sql in matches:
-                    self._analyze_sql_query(sql, rel_path)
-            
-            except Exception as e:
-                logger.debug(f"Error parsing {cf_file}: {e}")
+        # .cfm files first, then .cfc files
+        cf_scans = (
+            [scan for scan in self._scans if scan.rel_path.endswith('.cfm')] +
+            [scan for scan in self._scans if scan.rel_path.endswith('.cfc')]
+        )
+        
+        logger.info(f"Parsing {len(cf_scans)} ColdFusion files for queries")
+        
+        for scan in cf_scans:
+            rel_path = str(Path(scan.rel_path))
+            for sql in scan.result['queries']:
+                self._analyze_sql_query(sql, rel_path)
     
     def _analyze_sql_query(self, sql: str, file_path: str) -> None:
         """
@@ -188,22 +214,8 @@ class DatabaseSchemaInferenceEngine:
     
     def _extract_table_names(self, sql: str) -> List[str]:
         """Extract table names from SQL query"""
-        tables = set()
-        
-        # FROM clauses
-        tables.update(self.FROM_PATTERN.findall(sql))
-        
-        # JOIN clauses
-        tables.update(self.JOIN_PATTERN.findall(sql))
-        
-        # UPDATE statements
-        tables.update(self.UPDATE_TABLE_PATTERN.findall(sql))
-        
-        # INSERT statements
-        tables.update(self.INSERT_TABLE_PATTERN.findall(sql))
-        
-        # DELETE statements
-        tables.update(self.DELETE_TABLE_PATTERN.findall(sql))
+        # FROM, JOIN, UPDATE, INSERT and DELETE clauses
+        tables = set(self.TABLE_PATTERN.findall(sql))
         
         # Filter out SQL keywords
         sql_keywords = {'WHERE', 'AND', 'OR', 'ON', 'AS', 'SELECT', 'FROM', 'JOIN', 'LEFT', 'RIGHT', 'INNER', 'OUTER'}
@@ -254,108 +266,53 @@ class DatabaseSchemaInferenceEngine:
     def _analyze_orm_models(self) -> None:
         """Analyze ORM model definitions"""
         # Look for ColdFusion ORM components
-        cfc_files = list(self.app_path.rglob('*.cfc'))
-        
-        logger.info(f"Analyzing {len(cfc_files)} CFC files for ORM models")
-        
-        for cfc_file in cfc_files:
-            try:
-                content = cfc_file.read_text(encoding='utf-8', errors='ignore')
-                rel_path = str(cfc_file.relative_to(self.app_path))
-                
-                # Check for ORM entity definition
-                if 'persistent="true"' in content or 'persistent=true' in content:
-                    self._parse_orm_entity(content, rel_path)
-            
-            except Exception as e:
-                logger.debug(f"Error analyzing ORM in {cfc_file}: {e}")
+        cfc_scans = [scan for scan in self._scans if scan.rel_path.endswith('.cfc')]
+        
+        logger.info(f"Analyzing {len(cfc_scans)} CFC files for ORM models")
+        
+        for scan in cfc_scans:
+            entity = scan.result['entity']
+            if entity:
+                self._add_orm_entity(entity, str(Path(scan.rel_path)))
     
-    def _parse_orm_entity(self, content: str, file_path: str) -> None:
+    def _add_orm_entity(self, entity: Dict[str, Any], file_path: str) -> None:
         """
-        Parse ColdFusion ORM entity definition.
+        Record a ColdFusion ORM entity definition.
         
-        Extracts:
-        - Table name
-        - Properties (columns)
-        - Primary key
-        - Relationships
+        Args:
+            entity: Scanned entity (table, columns, primary_key, relationships)
+            file_path: Path to the entity's component
         """
-        try:
-            # Extract table name
-            table_match = re.search(r'table="([^"]+)"', content, re.IGNORECASE)
-            table_name = table_match.group(1) if table_match else None
-            
-            if not table_name:
-                # Try component name as table name
-                comp_match = re.search(r'component\s+name="([^"]+)"', content, re.IGNORECASE)
-                if comp_match:
-                    table_name = comp_match.group(1)
-            
-            if not table_name:
-                return
-            
-            # Create or get table info
-            if table_name not in self.tables:
-                self.tables[table_name] = TableInfo(name=table_name, confidence=0.95)  # ORM = high confidence
-            
-            table = self.tables[table_name]
-            table.file_references.append(file_path)
-            
-            # Extract properties (columns)
-            property_pattern = r'property\s+name="([^"]+)"'
-            properties = re.findall(property_pattern, content, re.IGNORECASE)
-            table.columns.update(properties)
-            
-            # Extract primary key
-            pk_pattern = r'property\s+name="([^"]+)"[^;]*fieldtype="id"'
-            pk_match = re.search(pk_pattern, content, re.IGNORECASE)
-            if pk_match:
-                table.primary_key = pk_match.group(1)
-            
-            # Extract relationships
-            rel_patterns = [
-                (r'fieldtype="one-to-many"[^;]*cfc="([^"]+)"', 'one-to-many'),
-                (r'fieldtype="many-to-one"[^;]*cfc="([^"]+)"', 'many-to-one'),
-                (r'fieldtype="many-to-many"[^;]*cfc="([^"]+)"', 'many-to-many')
-            ]
-            
-            for pattern, rel_type in rel_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for target_cfc in matches:
-                    table.relationships.append({
-                        'type': rel_type,
-                        'target': target_cfc
-                    })
-        
-        except Exception as e:
-            logger.debug(f"Error parsing ORM entity: {e}")
+        table_name = entity['table']
+        
+        # Create or get table info
+        if table_name not in self.tables:
+            self.tables[table_name] = TableInfo(name=table_name, confidence=0.95)  # ORM = high confidence
+        
+        table = self.tables[table_name]
+        table.file_references.append(file_path)
+        table.columns.update(entity['columns'])
+        if entity['primary_key']:
+            table.primary_key = entity['primary_key']
+        table.relationships.extend(dict(rel) for rel in entity['relationships'])
     
     def _parse_dao_files(self) -> None:
         """Parse data access object files for query patterns"""
-        # Look for common DAO naming patterns
-        dao_patterns = ['*DAO.cfc', '*Service.cfc', '*Repository.cfc', '*Gateway.cfc']
-        dao_files = []
-        
-        for pattern in dao_patterns:
-            dao_files.extend(self.app_path.rglob(pattern))
-        
-        logger.info(f"Parsing {len(dao_files)} DAO files")
-        
-        for dao_file in dao_files:
-            try:
-                content = dao_file.read_text(encoding='utf-8', errors='ignore')
-                rel_path = str(dao_file.relative_to(self.app_path))
-                
-                # Find SQL queries in DAO methods
-                query_pattern = r'["\'](SELECT|INSERT|UPDATE|DELETE).*?["\']'
-                matches = re.findall(query_pattern, content, re.IGNORECASE | re.DOTALL)
-                
-                for sql in matches:
-                    if len(sql) < 10000:  # Skip massive queries
-                        self._analyze_sql_query(sql, rel_path)
-            
-            except Exception as e:
-                logger.debug(f"Error parsing DAO {dao_file}: {e}")
+        # Common DAO naming patterns, in pattern order
+        dao_scans = [
+            scan
+            for suffix in DAO_SUFFIXES
+            for scan in self._scans
+            if scan.rel_path.rsplit('/', 1)[-1].endswith(suffix)
+        ]
+        
+        logger.info(f"Parsing {len(dao_scans)} DAO files")
+        
+        for scan in dao_scans:
+            rel_path = str(Path(scan.rel_path))
+            for sql in scan.result['dao_queries']:
+                if len(sql) < 10000:  # Skip massive queries
+                    self._analyze_sql_query(sql, rel_path)
     
     def _calculate_confidence_scores(self) -> None:
         """Calculate confidence scores for all tables"""
@@ -407,32 +364,17 @@ class DatabaseSchemaInferenceEngine:
         """Detect datasource configurations"""
         datasources = []
         
-        # Look for common datasource config files
-        config_files = [
-            'Application.cfc',
-            'Application.cfm',
-            'datasource.cfm',
-            'config/datasource.cfm'
-        ]
+        # Common datasource config files, scanned with the rest of the tree
+        scans = {scan.rel_path: scan for scan in self._scans}
         
-        for config_file in config_files:
-            config_path = self.app_path / config_file
-            if config_path.exists():
-                try:
-                    content = config_path.read_text(encoding='utf-8', errors='ignore')
-                    
-                    # Look for datasource definitions
-                    ds_pattern = r'datasource\s*=\s*["\']([^"\']+)["\']'
-                    matches = re.findall(ds_pattern, content, re.IGNORECASE)
-                    
-                    for ds_name in matches:
-                        datasources.append({
-                            'name': ds_name,
-                            'file': config_file
-                        })
-                
-                except Exception as e:
-                    logger.debug(f"Error detecting datasources in {config_file}: {e}")
+        for config_file in CONFIG_FILES:
+            scan = scans.get(config_file)
+            if scan:
+                for ds_name in scan.result['datasources']:
+                    datasources.append({
+                        'name': ds_name,
+                        'file': config_file
+                    })
         
         return datasources
     
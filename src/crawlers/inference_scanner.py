@@ -0,0 +1,425 @@
+"""
+Inference Scanner - Single-Pass Source Scanning for Schema Inference
+
+Feeds DatabaseSchemaInferenceEngine. Every ColdFusion file under the
+application root is read exactly once, no matter how many inference
+categories (cfquery blocks, ORM entities, DAO query strings, datasource
+definitions) apply to it.
+
+Design:
+- One directory walk collects every .cfm/.cfc file and the categories
+  that apply to it (its scan profile)
+- Per profile, the category triggers are compiled into one combined
+  alternation of named groups; a single finditer pass over the
+  (lowercased) content yields candidate positions and dispatches them to
+  per-category collectors
+- Collectors run the exact category pattern anchored at its candidate
+  positions only, so results equal a full findall/search per category
+- Files are scanned in parallel through a process pool above a size
+  threshold
+- Scan results are cached in SQLite per (scanner version, profile,
+  content hash), so re-inference only scans files whose content changed
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction semantics change so stale cache entries are not reused
+SCANNER_VERSION = "1"
+
+# Below this many files the process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Scan categories
+CFQUERY = 'cfquery'
+ORM = 'orm'
+DAO = 'dao'
+DATASOURCE = 'datasource'
+
+CF_EXTENSIONS = ('.cfm', '.cfc')
+DAO_SUFFIXES = ('DAO.cfc', 'Service.cfc', 'Repository.cfc', 'Gateway.cfc')
+CONFIG_FILES = ('Application.cfc', 'Application.cfm', 'datasource.cfm', 'config/datasource.cfm')
+
+# Category triggers as (leading literal, rest). Triggers consume no quote
+# characters, so a trigger never swallows the opening quote of a DAO query
+# string (e.g. property name="SelectedItems"). Every branch of the combined
+# pattern starts with a plain literal followed by an empty named marker
+# group, which keeps the regex engine's first-character prefilter usable.
+_TRIGGERS = {
+    CFQUERY: (('<', r'cfquery'),),
+    ORM: (
+        ('t', r'able=(?=")'),
+        ('c', r'omponent\s+name=(?=")'),
+        ('p', r'roperty\s+name=(?=")'),
+        ('f', r'ieldtype=(?="(?:one-to-many|many-to-one|many-to-many)")'),
+    ),
+    DAO: (
+        ('"', r'(?=select|insert|update|delete)'),
+        ("'", r'(?=select|insert|update|delete)'),
+    ),
+    DATASOURCE: (('d', r'atasource\s*=\s*(?=["\'])'),),
+}
+_TRIGGER_NAMES = {CFQUERY: ('cfquery',), ORM: ('table', 'component', 'property', 'relation'),
+                  DAO: ('dao', 'dao'), DATASOURCE: ('datasource',)}
+_PERSISTENT_MARKERS = ('persistent="true"', 'persistent=true')
+
+# Exact category patterns, matched only at trigger positions
+CFQUERY_PATTERN = re.compile(r'<cfquery[^>]*>(.*?)</cfquery>', re.DOTALL | re.IGNORECASE)
+DAO_QUERY_PATTERN = re.compile(r'["\']((?:SELECT|INSERT|UPDATE|DELETE).*?)["\']', re.DOTALL | re.IGNORECASE)
+TABLE_ATTR_PATTERN = re.compile(r'table="([^"]+)"', re.IGNORECASE)
+COMPONENT_NAME_PATTERN = re.compile(r'component\s+name="([^"]+)"', re.IGNORECASE)
+PROPERTY_PATTERN = re.compile(r'property\s+name="([^"]+)"', re.IGNORECASE)
+PRIMARY_KEY_PATTERN = re.compile(r'property\s+name="([^"]+)"[^;]*fieldtype="id"', re.IGNORECASE)
+RELATIONSHIP_PATTERNS = (
+    ('one-to-many', re.compile(r'fieldtype="one-to-many"[^;]*cfc="([^"]+)"', re.IGNORECASE)),
+    ('many-to-one', re.compile(r'fieldtype="many-to-one"[^;]*cfc="([^"]+)"', re.IGNORECASE)),
+    ('many-to-many', re.compile(r'fieldtype="many-to-many"[^;]*cfc="([^"]+)"', re.IGNORECASE)),
+)
+DATASOURCE_PATTERN = re.compile(r'datasource\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+
+def scan_profile(rel_path: str) -> Tuple[str, ...]:
+    """Categories that apply to a file, given its path relative to the app root"""
+    name = rel_path.rsplit('/', 1)[-1]
+    categories = [CFQUERY]
+    if name.endswith('.cfc'):
+        categories.append(ORM)
+        if name.endswith(DAO_SUFFIXES):
+            categories.append(DAO)
+    if rel_path in CONFIG_FILES:
+        categories.append(DATASOURCE)
+    return tuple(categories)
+
+
+@lru_cache(maxsize=None)
+def combined_pattern(profile: Tuple[str, ...], ignore_case: bool = False) -> Tuple[Pattern, Dict[str, str]]:
+    """
+    One alternation over the triggers of every category in the profile.
+
+    Returns the pattern and a map from marker group to trigger name. The
+    pattern matches lowercase text; ignore_case builds the (slower) variant
+    for text whose lowercase form is not position-preserving.
+    """
+    branches = []
+    names = {}
+    for category in profile:
+        for (literal, rest), name in zip(_TRIGGERS[category], _TRIGGER_NAMES[category]):
+            marker = f"{name}_{len(branches)}"
+            names[marker] = name
+            branches.append(f"{re.escape(literal)}(?P<{marker}>){rest}")
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile('|'.join(branches), flags), names
+
+
+def trigger_positions(content: str, profile: Tuple[str, ...]) -> Dict[str, List[int]]:
+    """Start offsets of every trigger in content, by trigger name"""
+    if content.isascii():
+        pattern, names = combined_pattern(profile)
+        text = content.lower()
+    else:
+        pattern, names = combined_pattern(profile, ignore_case=True)
+        text = content
+    starts: Dict[str, List[int]] = {}
+    for match in pattern.finditer(text):
+        starts.setdefault(names[match.lastgroup], []).append(match.start())
+    return starts
+
+
+def _findall_at(pattern: Pattern, content: str, starts: Sequence[int]) -> List[str]:
+    """pattern.findall(content) for a pattern whose matches can only begin at starts"""
+    found = []
+    end = 0
+    for start in starts:
+        if start < end:
+            continue
+        match = pattern.match(content, start)
+        if match:
+            found.append(match.group(1))
+            end = max(match.end(), start + 1)
+    return found
+
+
+def _search_at(pattern: Pattern, content: str, starts: Sequence[int]) -> Optional[str]:
+    """pattern.search(content).group(1) for a pattern whose matches can only begin at starts"""
+    for start in starts:
+        match = pattern.match(content, start)
+        if match:
+            return match.group(1)
+    return None
+
+
+def scan_content(content: str, profile: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Extract everything the inference engine needs from one file.
+
+    Returns a JSON-serializable dict:
+        queries:     SQL bodies of <cfquery> blocks
+        dao_queries: quoted SQL strings (DAO files)
+        entity:      ORM entity (table, columns, primary_key, relationships)
+                     or None
+        datasources: datasource names (config files)
+    """
+    starts = trigger_positions(content, profile)
+
+    result: Dict[str, Any] = {
+        'queries': _findall_at(CFQUERY_PATTERN, content, starts.get('cfquery', ())),
+        'dao_queries': [],
+        'entity': None,
+        'datasources': [],
+    }
+
+    if DAO in profile:
+        result['dao_queries'] = _findall_at(DAO_QUERY_PATTERN, content, starts.get('dao', ()))
+
+    if ORM in profile and any(marker in content for marker in _PERSISTENT_MARKERS):
+        table_name = (
+            _search_at(TABLE_ATTR_PATTERN, content, starts.get('table', ()))
+            or _search_at(COMPONENT_NAME_PATTERN, content, starts.get('component', ()))
+        )
+        if table_name:
+            properties = starts.get('property', ())
+            relations = starts.get('relation', ())
+            result['entity'] = {
+                'table': table_name,
+                'columns': _findall_at(PROPERTY_PATTERN, content, properties),
+                'primary_key': _search_at(PRIMARY_KEY_PATTERN, content, properties),
+                'relationships': [
+                    {'type': rel_type, 'target': target}
+                    for rel_type, pattern in RELATIONSHIP_PATTERNS
+                    for target in _findall_at(pattern, content, relations)
+                ],
+            }
+
+    if DATASOURCE in profile:
+        result['datasources'] = _findall_at(DATASOURCE_PATTERN, content, starts.get('datasource', ()))
+
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Process-pool worker side. The known content keys are installed once per
+# worker by the initializer rather than pickled per task.
+# ---------------------------------------------------------------------------
+
+_worker_cached_keys: Set[str] = set()
+
+
+def _init_worker(cached_keys: Set[str]) -> None:
+    global _worker_cached_keys
+    _worker_cached_keys = cached_keys
+
+
+def cache_key(content_hash: str, profile: Tuple[str, ...]) -> str:
+    return f"{SCANNER_VERSION}:{'+'.join(profile)}:{content_hash}"
+
+
+def _scan_file(task: Tuple[str, Tuple[str, ...]]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Read one file, hash it and scan it unless cached.
+
+    Returns (cache_key, result). Result is None when the key is already
+    cached; the key is None if the file is unreadable.
+    """
+    file_path, profile = task
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except OSError as e:
+        logger.debug(f"Error reading {file_path}: {e}")
+        return None, None
+
+    key = cache_key(hashlib.sha256(raw).hexdigest(), profile)
+    if key in _worker_cached_keys:
+        return key, None
+    return key, scan_content(raw.decode('utf-8', errors='ignore'), profile)
+
+
+class InferenceScanCache:
+    """SQLite cache of per-file scan results keyed by cache_key()"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS inference_scans (
+                    scan_key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    cached_at REAL NOT NULL
+                )
+            """)
+
+    def known_keys(self) -> Set[str]:
+        prefix = f"{SCANNER_VERSION}:"
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT scan_key FROM inference_scans WHERE scan_key >= ? AND scan_key < ?",
+                (prefix, prefix + "\U0010ffff")
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def load(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        wanted = list(set(keys))
+        results: Dict[str, Dict[str, Any]] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT scan_key, result FROM inference_scans WHERE scan_key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for key, payload in rows:
+                    results[key] = json.loads(payload)
+        return results
+
+    def store(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        if not entries:
+            return
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO inference_scans (scan_key, result, cached_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(result), now) for key, result in entries.items()]
+            )
+
+    def prune(self) -> int:
+        """Drop entries produced by other scanner versions"""
+        prefix = f"{SCANNER_VERSION}:"
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM inference_scans WHERE scan_key < ? OR scan_key >= ?",
+                (prefix, prefix + "\U0010ffff")
+            )
+            return cursor.rowcount
+
+
+@dataclass
+class FileScan:
+    """Scan result of one source file"""
+    rel_path: str
+    profile: Tuple[str, ...]
+    result: Dict[str, Any]
+
+
+@dataclass
+class InferenceScanStats:
+    """Counters describing one scan"""
+    files: int = 0
+    files_scanned: int = 0
+    cache_hits: int = 0
+    workers: int = 1
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'files': self.files,
+            'files_scanned': self.files_scanned,
+            'cache_hits': self.cache_hits,
+            'workers': self.workers,
+            'duration_seconds': round(self.duration_seconds, 4),
+        }
+
+
+class InferenceScanner:
+    """
+    Walks an application once and scans every ColdFusion file once.
+
+    Usage:
+        scanner = InferenceScanner(cache_path=Path("cortex-brain/cache/inference_scans.db"))
+        scans = scanner.scan(app_path)
+        print(scanner.last_scan.to_dict())
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[Path] = None,
+        parallel_threshold: int = PARALLEL_THRESHOLD
+    ):
+        """
+        Args:
+            max_workers: Process pool size (None = os.cpu_count(), 1 = in-process)
+            cache_path: SQLite cache location (None disables caching)
+            parallel_threshold: Minimum file count before the pool is used
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = InferenceScanCache(cache_path) if cache_path else None
+        self.parallel_threshold = parallel_threshold
+        self.last_scan = InferenceScanStats()
+
+    @staticmethod
+    def discover_files(app_path: Path) -> List[Tuple[str, str]]:
+        """(absolute path, posix path relative to app_path) of every .cfm/.cfc file, in walk order"""
+        files = []
+        root = str(app_path)
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith(CF_EXTENSIONS):
+                    path = os.path.join(dirpath, filename)
+                    files.append((path, Path(os.path.relpath(path, root)).as_posix()))
+        return files
+
+    def scan(self, app_path: Path) -> List[FileScan]:
+        """Scan every ColdFusion file under app_path; unreadable files are omitted"""
+        start = time.perf_counter()
+        files = self.discover_files(Path(app_path))
+        tasks = [(path, scan_profile(rel_path)) for path, rel_path in files]
+
+        known = self.cache.known_keys() if self.cache else set()
+        use_pool = self.max_workers > 1 and len(tasks) >= self.parallel_threshold
+
+        if use_pool:
+            # Large chunks amortize per-task pickling of paths and results
+            chunksize = max(1, len(tasks) // (self.max_workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(known,)
+            ) as pool:
+                scanned = list(pool.map(_scan_file, tasks, chunksize=chunksize))
+        else:
+            _init_worker(known)
+            scanned = [_scan_file(task) for task in tasks]
+
+        fresh = {key: result for key, result in scanned if key is not None and result is not None}
+        hits = [key for key, result in scanned if key is not None and result is None]
+        files_scanned = sum(1 for key, result in scanned if result is not None)
+        results: Dict[str, Dict[str, Any]] = {}
+        if self.cache:
+            results.update(self.cache.load(hits))
+            self.cache.store(fresh)
+        results.update(fresh)
+
+        scans = [
+            FileScan(rel_path, profile, results[key])
+            for (_, rel_path), (_, profile), (key, _) in zip(files, tasks, scanned)
+            if key in results
+        ]
+
+        self.last_scan = InferenceScanStats(
+            files=len(files),
+            files_scanned=files_scanned,
+            cache_hits=len(hits),
+            workers=self.max_workers if use_pool else 1,
+            duration_seconds=time.perf_counter() - start,
+        )
+        logger.info(f"Scanned {len(files)} ColdFusion files "
+                    f"({files_scanned} scanned, {len(hits)} cached, {self.last_scan.workers} workers)")
+        return scans
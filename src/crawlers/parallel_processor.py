@@ -1,21 +1,41 @@
 """
 Parallel File Processor
 
-Multi-threaded file analysis using ThreadPoolExecutor with progress tracking,
+File analysis on a thread pool or a process pool with progress tracking,
 error handling, and adaptive worker pool sizing.
 
+Threads suit I/O-bound work and remain the default. AST analysis, regex
+scanning and hashing are CPU-bound and serialize on the GIL; callers opt in
+to PROCESS mode for those, or to AUTO mode to choose per task type from a
+measured CPU/wall-time ratio.
+
+Process mode:
+- Files are submitted in chunks sized to amortize pickling overhead
+- A worker initializer runs once per process (preload analyzers there)
+- Shared read-only inputs are shipped once per worker, not per task;
+  processor functions read them with get_shared()
+
 Author: CORTEX Application Health Dashboard
 """
 
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Callable, Optional
+import pickle
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from enum import Enum
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from dataclasses import dataclass, field
 import threading
 import time
 from pathlib import Path
 
 
+class ExecutionMode(Enum):
+    """Worker pool backend"""
+    THREAD = "thread"
+    PROCESS = "process"
+    AUTO = "auto"
+
+
 @dataclass
 class ProcessingResult:
     """Result from parallel processing operation"""
@@ -26,53 +46,208 @@ class ProcessingResult:
     errors: List[Dict[str, Any]] = field(default_factory=list)
     elapsed_time: float = 0.0
     throughput: float = 0.0  # files per second
+    mode: str = ExecutionMode.THREAD.value
+    worker_utilization: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Process worker side
+# ---------------------------------------------------------------------------
+
+# Process workers: one processor per process, set by the pool initializer
+_WORKER_SHARED: Dict[str, Any] = {}
+
+# Thread workers: each thread is bound to the inputs of the processor that
+# owns its pool, so processors in one process never see each other's values
+_THREAD_SHARED = threading.local()
+
+
+def _shared_values() -> Dict[str, Any]:
+    shared = getattr(_THREAD_SHARED, 'values', None)
+    return _WORKER_SHARED if shared is None else shared
+
+
+def get_shared(name: str, default: Any = None) -> Any:
+    """
+    Read a shared read-only input inside a processor function.
+
+    Works in both modes: process workers receive the values once through
+    the pool initializer, thread workers are bound to their processor's
+    inputs when the thread starts.
+    """
+    return _shared_values().get(name, default)
+
+
+def set_shared(name: str, value: Any) -> None:
+    """Store per-worker state (e.g. a preloaded analyzer) from an initializer"""
+    _shared_values()[name] = value
+
+
+def _init_thread_worker(shared: Dict[str, Any]) -> None:
+    _THREAD_SHARED.values = dict(shared)
+
+
+def _init_process_worker(
+    shared: Dict[str, Any],
+    initializer: Optional[Callable[..., None]],
+    initargs: Tuple
+) -> None:
+    _WORKER_SHARED.clear()
+    _WORKER_SHARED.update(shared)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _process_chunk(func: Callable[[str], Any], chunk: List[str]) -> Tuple[str, float, List[Tuple[str, bool, Any]]]:
+    """Run func over a chunk of paths; errors are returned as strings (always picklable)"""
+    outcomes = []
+    busy_start = time.perf_counter()
+    for file_path in chunk:
+        try:
+            outcomes.append((file_path, True, func(file_path)))
+        except Exception as e:
+            outcomes.append((file_path, False, str(e)))
+    return f"pid-{os.getpid()}", time.perf_counter() - busy_start, outcomes
+
+
+class WorkloadProfiler:
+    """
+    Classify task types as CPU- or IO-bound from a measured sample.
+
+    Runs the processor on a few files in the calling thread and compares
+    thread CPU time with wall time. Decisions are cached per task type.
+    """
+
+    def __init__(self, sample_size: int = 3, cpu_bound_ratio: float = 0.6):
+        self.sample_size = sample_size
+        self.cpu_bound_ratio = cpu_bound_ratio
+        self.ratios: Dict[str, float] = {}
+
+    def measure(
+        self,
+        task_type: str,
+        func: Callable[[str], Any],
+        sample: List[str]
+    ) -> Tuple[float, List[Tuple[str, bool, Any]]]:
+        """Return (cpu/wall ratio, sample outcomes) so sampled work is not redone"""
+        outcomes = []
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        for file_path in sample:
+            try:
+                outcomes.append((file_path, True, func(file_path)))
+            except Exception as e:
+                outcomes.append((file_path, False, e))
+        cpu = time.thread_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        ratio = cpu / wall if wall > 0 else 0.0
+        self.ratios[task_type] = ratio
+        return ratio, outcomes
+
+    def is_cpu_bound(self, task_type: str) -> Optional[bool]:
+        ratio = self.ratios.get(task_type)
+        return None if ratio is None else ratio >= self.cpu_bound_ratio
 
 
 class ParallelProcessor:
     """
-    Multi-threaded file processor with adaptive worker pool
+    Parallel file processor with thread and process backends
     
     Features:
-    - Auto-detect CPU cores (default: min(100, cpu_count * 4))
+    - Auto-detect CPU cores (threads: min(100, cpu_count * 4),
+      processes: cpu_count)
+    - Automatic thread/process choice per task type (measured CPU/IO ratio)
+    - Chunked process submission, once-per-worker initializer and shared inputs
     - Progress tracking with callbacks
     - Error handling with detailed error reporting
     - Thread-safe result aggregation
-    - Performance metrics (throughput, timing)
+    - Performance metrics (throughput, timing, per-worker utilization)
     """
     
-    def __init__(self, max_workers: Optional[int] = None):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        mode: ExecutionMode = ExecutionMode.THREAD,
+        process_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple = (),
+        shared: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize parallel processor
         
         Args:
             max_workers: Maximum worker threads. If None, auto-detect
                         (min(100, cpu_count * 4))
+            mode: THREAD (default), PROCESS, or AUTO (choose per task type)
+            process_workers: Worker processes. If None, cpu_count
+            chunk_size: Files per process task. If None, sized so each
+                        worker receives ~4 chunks
+            initializer: Called once in each worker process (e.g. to
+                        preload analyzers via set_shared)
+            initargs: Arguments for initializer
+            shared: Read-only inputs (file lists, compiled configs) sent
+                    once per worker; read with get_shared(name)
         """
+        cpu_count = os.cpu_count() or 4
         if max_workers is None:
-            cpu_count = os.cpu_count() or 4
             max_workers = min(100, cpu_count * 4)
         
         self.max_workers = max_workers
+        self.mode = ExecutionMode(mode)
+        self.process_workers = process_workers or cpu_count
+        self.chunk_size = chunk_size
+        self.initializer = initializer
+        self.initargs = initargs
+        self.shared = dict(shared or {})
+        self.profiler = WorkloadProfiler()
         self._lock = threading.Lock()
         self._progress_callback: Optional[Callable] = None
+        self._worker_busy: Dict[str, List[float]] = {}
     
     def process_files(
         self,
         file_paths: List[str],
         processor_func: Callable[[str], Any],
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        task_type: Optional[str] = None,
+        mode: Optional[ExecutionMode] = None
     ) -> ProcessingResult:
         """
-        Process files in parallel using thread pool
+        Process files in parallel
         
         Args:
             file_paths: List of file paths to process
-            processor_func: Function to call for each file (takes file_path, returns result)
+            processor_func: Function to call for each file (takes file_path, returns result).
+                           Must be a module-level function for process mode.
             progress_callback: Optional callback(current, total) for progress updates
+            task_type: Key for caching the AUTO mode decision (default: function name)
+            mode: Override the processor's execution mode for this call
             
         Returns:
             ProcessingResult with aggregated results and metrics
         """
+        pools: Dict[ExecutionMode, Any] = {}
+        self._worker_busy = {}
+        try:
+            return self._process(
+                file_paths, processor_func, progress_callback, task_type, mode, pools, len(file_paths)
+            )
+        finally:
+            self._shutdown(pools)
+    
+    def _process(
+        self,
+        file_paths: List[str],
+        processor_func: Callable[[str], Any],
+        progress_callback: Optional[Callable[[int, int], None]],
+        task_type: Optional[str],
+        mode: Optional[ExecutionMode],
+        pools: Dict[ExecutionMode, Any],
+        total_files: int
+    ) -> ProcessingResult:
+        """Process one set of files on pools owned by the caller"""
         result = ProcessingResult(total_files=len(file_paths))
         start_time = time.time()
         
@@ -82,52 +257,176 @@ class ParallelProcessor:
             result.elapsed_time = time.time() - start_time
             return result
         
-        # Process files in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_path = {
-                executor.submit(self._safe_process, processor_func, path): path
-                for path in file_paths
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_path):
-                file_path = future_to_path[future]
-                
+        mode = ExecutionMode(mode) if mode is not None else self.mode
+        remaining = list(file_paths)
+        
+        if mode == ExecutionMode.AUTO:
+            task_type = task_type or getattr(processor_func, '__qualname__', repr(processor_func))
+            cpu_bound = self.profiler.is_cpu_bound(task_type)
+            if cpu_bound is None:
+                sample, remaining = remaining[:self.profiler.sample_size], remaining[self.profiler.sample_size:]
+                sample_start = time.perf_counter()
+                previous = getattr(_THREAD_SHARED, 'values', None)
+                _init_thread_worker(self.shared)
                 try:
-                    success, data = future.result()
-                    
-                    with self._lock:
-                        if success:
-                            result.results.append(data)
-                            result.processed_files += 1
-                        else:
-                            result.errors.append({
-                                'file': file_path,
-                                'error': str(data)
-                            })
-                            result.failed_files += 1
-                        
-                        # Progress callback
-                        if self._progress_callback:
-                            completed = result.processed_files + result.failed_files
-                            self._progress_callback(completed, result.total_files)
-                
-                except Exception as e:
-                    with self._lock:
-                        result.errors.append({
-                            'file': file_path,
-                            'error': f"Future exception: {str(e)}"
-                        })
-                        result.failed_files += 1
+                    _ratio, outcomes = self.profiler.measure(task_type, processor_func, sample)
+                finally:
+                    _THREAD_SHARED.values = previous
+                self._record_busy(threading.current_thread().name, time.perf_counter() - sample_start)
+                for file_path, success, data in outcomes:
+                    self._record_outcome(result, file_path, success, data)
+                cpu_bound = self.profiler.is_cpu_bound(task_type)
+            mode = ExecutionMode.PROCESS if cpu_bound else ExecutionMode.THREAD
+        
+        if mode == ExecutionMode.PROCESS and not self._picklable(processor_func):
+            # Lambdas and closures cannot be sent to worker processes
+            mode = ExecutionMode.THREAD
+        
+        result.mode = mode.value
+        if remaining:
+            executor = self._executor(pools, mode, total_files)
+            if mode == ExecutionMode.PROCESS:
+                self._run_processes(executor, remaining, processor_func, result)
+            else:
+                self._run_threads(executor, remaining, processor_func, result)
         
         # Calculate metrics
         result.elapsed_time = time.time() - start_time
         if result.elapsed_time > 0:
             result.throughput = result.processed_files / result.elapsed_time
+        result.worker_utilization = self._utilization(result.elapsed_time)
         
         return result
     
+    def _executor(self, pools: Dict[ExecutionMode, Any], mode: ExecutionMode, total_files: int):
+        """Pool for mode, created on first use and reused until _shutdown"""
+        executor = pools.get(mode)
+        if executor is None:
+            if mode == ExecutionMode.PROCESS:
+                executor = ProcessPoolExecutor(
+                    max_workers=max(1, min(self.process_workers, total_files)),
+                    initializer=_init_process_worker,
+                    initargs=(self.shared, self.initializer, self.initargs)
+                )
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_thread_worker,
+                    initargs=(self.shared,)
+                )
+            pools[mode] = executor
+        return executor
+    
+    @staticmethod
+    def _shutdown(pools: Dict[ExecutionMode, Any]) -> None:
+        for executor in pools.values():
+            executor.shutdown(wait=True)
+        pools.clear()
+    
+    def _run_threads(
+        self,
+        executor: ThreadPoolExecutor,
+        file_paths: List[str],
+        processor_func: Callable[[str], Any],
+        result: ProcessingResult
+    ) -> None:
+        """Process files on the thread pool"""
+        # Submit all tasks
+        future_to_path = {
+            executor.submit(self._safe_process, processor_func, path): path
+            for path in file_paths
+        }
+        
+        # Collect results as they complete
+        for future in as_completed(future_to_path):
+            file_path = future_to_path[future]
+            
+            try:
+                success, data = future.result()
+                self._record_outcome(result, file_path, success, data)
+            
+            except Exception as e:
+                self._record_outcome(result, file_path, False, f"Future exception: {str(e)}")
+    
+    def _run_processes(
+        self,
+        executor: ProcessPoolExecutor,
+        file_paths: List[str],
+        processor_func: Callable[[str], Any],
+        result: ProcessingResult
+    ) -> None:
+        """Process files on the process pool in chunks"""
+        workers = max(1, min(self.process_workers, len(file_paths)))
+        chunk_size = self.chunk_size or max(1, -(-len(file_paths) // (workers * 4)))
+        chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+        
+        future_to_chunk = {
+            executor.submit(_process_chunk, processor_func, chunk): chunk
+            for chunk in chunks
+        }
+        
+        for future in as_completed(future_to_chunk):
+            chunk = future_to_chunk[future]
+            try:
+                worker, busy, outcomes = future.result()
+            except Exception as e:
+                # Worker crashed or result could not be unpickled
+                for file_path in chunk:
+                    self._record_outcome(result, file_path, False, f"Future exception: {str(e)}")
+                continue
+            
+            self._record_busy(worker, busy)
+            for file_path, success, data in outcomes:
+                self._record_outcome(result, file_path, success, data)
+    
+    def _record_outcome(self, result: ProcessingResult, file_path: str, success: bool, data: Any) -> None:
+        """Aggregate one file's outcome and report progress"""
+        with self._lock:
+            if success:
+                result.results.append(data)
+                result.processed_files += 1
+            else:
+                result.errors.append({
+                    'file': file_path,
+                    'error': str(data)
+                })
+                result.failed_files += 1
+            
+            # Progress callback
+            if self._progress_callback:
+                completed = result.processed_files + result.failed_files
+                self._progress_callback(completed, result.total_files)
+    
+    def _record_busy(self, worker: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._worker_busy.setdefault(worker, [0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+    
+    def _utilization(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        """
+        Busy time per worker as a share of the run's wall time.
+        
+        Busy time comes from perf_counter and wall time from time.time(),
+        so very short runs can overshoot; the share is capped at 1.0.
+        """
+        return {
+            worker: {
+                'tasks': tasks,
+                'busy_seconds': round(busy, 4),
+                'utilization': round(min(busy / elapsed, 1.0), 3) if elapsed > 0 else 0.0
+            }
+            for worker, (tasks, busy) in sorted(self._worker_busy.items())
+        }
+    
+    @staticmethod
+    def _picklable(func: Callable) -> bool:
+        try:
+            pickle.dumps(func)
+            return True
+        except Exception:
+            return False
+    
     def _safe_process(self, func: Callable, file_path: str) -> tuple:
         """
         Safely process a file with error handling
@@ -139,56 +438,74 @@ class ParallelProcessor:
         Returns:
             Tuple of (success: bool, result/error)
         """
+        start = time.perf_counter()
         try:
             result = func(file_path)
             return (True, result)
         except Exception as e:
             return (False, e)
+        finally:
+            self._record_busy(threading.current_thread().name, time.perf_counter() - start)
     
     def process_in_batches(
         self,
         file_paths: List[str],
         processor_func: Callable[[str], Any],
         batch_size: int = 1000,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        task_type: Optional[str] = None
     ) -> ProcessingResult:
         """
         Process files in batches (useful for very large file sets)
         
+        All batches run on the same worker pool, so process workers and
+        their initializer start once per call, not once per batch.
+        
         Args:
             file_paths: List of file paths
             processor_func: Processing function
             batch_size: Number of files per batch
             progress_callback: Progress callback
+            task_type: Key for caching the AUTO mode decision
             
         Returns:
             Aggregated ProcessingResult
         """
         combined_result = ProcessingResult(total_files=len(file_paths))
         start_time = time.time()
+        pools: Dict[ExecutionMode, Any] = {}
+        # Busy time accumulates across batches: utilization covers the whole run
+        self._worker_busy = {}
         
-        # Process in batches
-        for i in range(0, len(file_paths), batch_size):
-            batch = file_paths[i:i + batch_size]
-            
-            # Adjust progress callback for batch offset
-            def batch_progress(current, total):
-                overall_current = i + current
-                if progress_callback:
-                    progress_callback(overall_current, len(file_paths))
-            
-            # Process batch
-            batch_result = self.process_files(batch, processor_func, batch_progress)
-            
-            # Aggregate results
-            combined_result.processed_files += batch_result.processed_files
-            combined_result.failed_files += batch_result.failed_files
-            combined_result.results.extend(batch_result.results)
-            combined_result.errors.extend(batch_result.errors)
+        try:
+            # Process in batches
+            for i in range(0, len(file_paths), batch_size):
+                batch = file_paths[i:i + batch_size]
+                
+                # Adjust progress callback for batch offset
+                def batch_progress(current, total):
+                    overall_current = i + current
+                    if progress_callback:
+                        progress_callback(overall_current, len(file_paths))
+                
+                # Process batch
+                batch_result = self._process(
+                    batch, processor_func, batch_progress, task_type, None, pools, len(file_paths)
+                )
+                
+                # Aggregate results
+                combined_result.mode = batch_result.mode
+                combined_result.processed_files += batch_result.processed_files
+                combined_result.failed_files += batch_result.failed_files
+                combined_result.results.extend(batch_result.results)
+                combined_result.errors.extend(batch_result.errors)
+        finally:
+            self._shutdown(pools)
         
         # Calculate metrics
         combined_result.elapsed_time = time.time() - start_time
         if combined_result.elapsed_time > 0:
             combined_result.throughput = combined_result.processed_files / combined_result.elapsed_time
+        combined_result.worker_utilization = self._utilization(combined_result.elapsed_time)
         
         return combined_result
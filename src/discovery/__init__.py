@@ -7,6 +7,7 @@ Auto-discovers CORTEX features without hardcoded lists:
 - Entry points (response templates)
 - Documentation (prompts, modules)
 - Tests (coverage, validation)
+- Symbols (persisted class/function index for validators)
 
 Enhancement Discovery:
 - Git history scanning
@@ -23,6 +24,7 @@ from src.discovery.agent_scanner import AgentScanner
 from src.discovery.entry_point_scanner import EntryPointScanner
 from src.discovery.documentation_scanner import DocumentationScanner
 from src.discovery.enhancement_discovery import EnhancementDiscoveryEngine, DiscoveredFeature
+from src.discovery.symbol_index import SymbolIndex, Symbol, ImportRef
 
 __all__ = [
     "OrchestratorScanner",
@@ -31,4 +33,7 @@ __all__ = [
     "DocumentationScanner",
     "EnhancementDiscoveryEngine",
     "DiscoveredFeature",
+    "SymbolIndex",
+    "Symbol",
+    "ImportRef",
 ]
@@ -0,0 +1,308 @@
+"""
+Symbol Index - Persisted Workspace Symbol Lookup
+
+One-pass AST index of the classes, functions and imports under src/,
+stored in SQLite and refreshed incrementally: only files whose mtime or
+size changed since the last refresh are re-parsed, and deleted files are
+dropped. Validators query the index instead of re-walking and re-reading
+the source tree for every lookup.
+
+Lookups:
+- Exact name:       index.find("PlanAdoOrchestrator")
+- Prefix:           index.find_prefix("PlanAdo")
+- Normalized name:  index.find_normalized("plan_ado orchestrator")
+  (case, underscores, spaces and punctuation ignored)
+- Name suffix:      index.classes(suffixes=("Orchestrator", "Agent"))
+- Imports:          index.imports(prefix="src.")
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import ast
+import json
+import logging
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Directories never indexed
+SKIP_DIRS = {"__pycache__", ".git", ".venv", "venv", "node_modules"}
+
+
+def normalize_symbol(name: str) -> str:
+    """Case- and separator-insensitive form: 'Plan_ADO orchestrator' -> 'planadoorchestrator'"""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+@dataclass
+class Symbol:
+    """A class, function or method definition"""
+    name: str
+    kind: str  # 'class', 'function', 'method'
+    file_path: Path
+    line: int
+    bases: List[str] = field(default_factory=list)
+    parent: Optional[str] = None  # Enclosing class for methods
+
+
+@dataclass
+class ImportRef:
+    """An import statement (module as written, e.g. 'src.tier1.working_memory')"""
+    module: str
+    file_path: Path
+    line: int
+    level: int = 0  # Relative import depth (0 = absolute)
+
+
+class SymbolIndex:
+    """
+    Persisted symbol index for a source tree.
+
+    Paths are stored relative to the project root so the index survives
+    moving the checkout. If the database cannot be opened (read-only
+    checkout), the index is kept in memory for the lifetime of the object.
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        source_root: Optional[Path] = None,
+        db_path: Optional[Path] = None
+    ):
+        """
+        Initialize symbol index.
+
+        Args:
+            project_root: Root directory of CORTEX project
+            source_root: Tree to index (default: project_root/src)
+            db_path: SQLite file (default: cortex-brain/cache/symbol_index.db)
+        """
+        self.project_root = Path(project_root)
+        self.source_root = Path(source_root) if source_root else self.project_root / "src"
+        self.db_path = Path(db_path) if db_path else self.project_root / "cortex-brain" / "cache" / "symbol_index.db"
+        self.conn = self._connect()
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            logger.debug(f"Symbol index not persisted ({e}); using in-memory index")
+            return sqlite3.connect(":memory:")
+
+    def _init_schema(self) -> None:
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        with self.conn:
+            if version != SCHEMA_VERSION:
+                for table in ("indexed_files", "symbols", "imports"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+                self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS indexed_files (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    parse_error TEXT
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS symbols (
+                    name TEXT NOT NULL,
+                    normalized TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    line INTEGER NOT NULL,
+                    bases TEXT NOT NULL DEFAULT '[]',
+                    parent TEXT
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS imports (
+                    module TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    line INTEGER NOT NULL,
+                    level INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_symbols_normalized ON symbols(normalized)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols(path)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_imports_module ON imports(module)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_imports_path ON imports(path)")
+
+    # ============ Refresh ============
+
+    def _source_files(self) -> Iterator[Tuple[str, os.stat_result]]:
+        for dirpath, dirnames, filenames in os.walk(self.source_root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for filename in filenames:
+                if filename.endswith(".py"):
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        yield self._relative(Path(path)), os.stat(path)
+                    except OSError:
+                        continue
+
+    def _relative(self, path: Path) -> str:
+        return path.relative_to(self.project_root).as_posix()
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the source tree.
+
+        Returns:
+            Counts of files scanned, (re)parsed and removed
+        """
+        known = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self.conn.execute("SELECT path, mtime_ns, size FROM indexed_files")
+        }
+        seen = set()
+        parsed = 0
+
+        with self.conn:
+            for path, stat in self._source_files():
+                seen.add(path)
+                if known.get(path) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                self._index_file(path, stat)
+                parsed += 1
+
+            removed = known.keys() - seen
+            for path in removed:
+                self._forget(path)
+                self.conn.execute("DELETE FROM indexed_files WHERE path = ?", (path,))
+
+        if parsed or removed:
+            logger.debug(f"Symbol index: {parsed} files parsed, {len(removed)} removed")
+        return {"scanned": len(seen), "parsed": parsed, "removed": len(removed)}
+
+    def _forget(self, path: str) -> None:
+        self.conn.execute("DELETE FROM symbols WHERE path = ?", (path,))
+        self.conn.execute("DELETE FROM imports WHERE path = ?", (path,))
+
+    def _index_file(self, path: str, stat: os.stat_result) -> None:
+        self._forget(path)
+        error = None
+        try:
+            source = (self.project_root / path).read_text(encoding="utf-8")
+            tree = ast.parse(source, filename=path)
+        except (OSError, SyntaxError, UnicodeDecodeError, ValueError) as e:
+            error = str(e)
+            tree = None
+
+        if tree is not None:
+            symbols, imports = _collect(tree)
+            self.conn.executemany(
+                "INSERT INTO symbols (name, normalized, kind, path, line, bases, parent) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (name, normalize_symbol(name), kind, path, line, json.dumps(bases), parent)
+                    for name, kind, line, bases, parent in symbols
+                ]
+            )
+            self.conn.executemany(
+                "INSERT INTO imports (module, path, line, level) VALUES (?, ?, ?, ?)",
+                [(module, path, line, level) for module, line, level in imports]
+            )
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO indexed_files (path, mtime_ns, size, parse_error) VALUES (?, ?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size, error)
+        )
+
+    # ============ Queries ============
+
+    def _symbols(self, where: str, params: Sequence = (), kind: Optional[str] = None) -> List[Symbol]:
+        if kind:
+            where += " AND kind = ?"
+            params = tuple(params) + (kind,)
+        rows = self.conn.execute(
+            f"SELECT name, kind, path, line, bases, parent FROM symbols WHERE {where} ORDER BY path, line",
+            params
+        )
+        return [
+            Symbol(name, kind, self.project_root / path, line, json.loads(bases), parent)
+            for name, kind, path, line, bases, parent in rows
+        ]
+
+    def find(self, name: str, kind: Optional[str] = None) -> List[Symbol]:
+        """Symbols with exactly this name"""
+        return self._symbols("name = ?", (name,), kind)
+
+    def find_prefix(self, prefix: str, kind: Optional[str] = None) -> List[Symbol]:
+        """Symbols whose name starts with prefix (case-sensitive)"""
+        # Range scan on the name index (LIKE would be case-insensitive and unindexed)
+        return self._symbols("name >= ? AND name < ?", (prefix, prefix + "\U0010ffff"), kind)
+
+    def find_normalized(self, name: str, kind: Optional[str] = None) -> List[Symbol]:
+        """Symbols whose normalized name equals the normalized query"""
+        return self._symbols("normalized = ?", (normalize_symbol(name),), kind)
+
+    def classes(self, suffixes: Iterable[str] = ()) -> List[Symbol]:
+        """All classes, optionally only those whose name ends with one of suffixes"""
+        suffixes = list(suffixes)
+        if not suffixes:
+            return self._symbols("1", kind="class")
+        where = "(" + " OR ".join("name GLOB ?" for _ in suffixes) + ")"
+        return self._symbols(where, [f"*{_glob_escape(s)}" for s in suffixes], kind="class")
+
+    def imports(self, prefix: str = "") -> List[ImportRef]:
+        """Import statements whose module starts with prefix"""
+        rows = self.conn.execute(
+            "SELECT module, path, line, level FROM imports "
+            "WHERE module >= ? AND module < ? ORDER BY path, line",
+            (prefix, prefix + "\U0010ffff")
+        )
+        return [ImportRef(module, self.project_root / path, line, level) for module, path, line, level in rows]
+
+    def unparsable_files(self) -> Dict[Path, str]:
+        """Files that failed to parse, with the error"""
+        rows = self.conn.execute("SELECT path, parse_error FROM indexed_files WHERE parse_error IS NOT NULL")
+        return {self.project_root / path: error for path, error in rows}
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def _glob_escape(text: str) -> str:
+    return re.sub(r"([*?\[])", r"[\1]", text)
+
+
+def _collect(tree: ast.AST) -> Tuple[List[tuple], List[tuple]]:
+    """(name, kind, line, bases, parent) symbols and (module, line, level) imports of a module"""
+    symbols: List[tuple] = []
+    imports: List[tuple] = []
+
+    def visit(node: ast.AST, parent_class: Optional[str], in_function: bool) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                bases = [ast.unparse(base) for base in child.bases]
+                symbols.append((child.name, "class", child.lineno, bases, parent_class))
+                visit(child, child.name, False)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if not in_function:
+                    kind = "method" if parent_class else "function"
+                    symbols.append((child.name, kind, child.lineno, [], parent_class))
+                visit(child, None, True)
+            elif isinstance(child, ast.Import):
+                imports.extend((alias.name, child.lineno, 0) for alias in child.names)
+            elif isinstance(child, ast.ImportFrom):
+                if child.module:
+                    imports.append((child.module, child.lineno, child.level))
+            else:
+                visit(child, parent_class, in_function)
+
+    visit(tree, None, False)
+    return symbols, imports
@@ -7,6 +7,7 @@ Main Components:
 - CortexEntry: Main entry point coordinator
 - RequestParser: Natural language → AgentRequest
 - ResponseFormatter: AgentResponse → user-friendly output
+- ComponentGraph / StartupProfiler: lazy component construction and startup profiling
 
 Usage:
     from src.entry_point import CortexEntry
@@ -17,11 +18,14 @@ Usage:
 """
 
 from .cortex_entry import CortexEntry
+from .component_graph import ComponentGraph, StartupProfiler
 from .request_parser import RequestParser
 from .response_formatter import ResponseFormatter
 
 __all__ = [
     "CortexEntry",
+    "ComponentGraph",
+    "StartupProfiler",
     "RequestParser",
     "ResponseFormatter",
 ]
@@ -0,0 +1,214 @@
+"""
+CORTEX Component Graph
+
+Lazily constructed components with declared dependencies, used by
+CortexEntry so a request only builds (and imports) what it touches.
+
+Each component is a provider: a factory, the components it depends on
+and the modules it imports. get() resolves dependencies first, imports
+the provider's modules, calls the factory once and caches the instance.
+
+An optional StartupProfiler records every resolution as a nested frame
+with import and construction time kept apart, and renders the result as
+an indented flame-style tree or as folded stacks (flamegraph.pl input).
+
+Usage:
+    graph = ComponentGraph(profiler=StartupProfiler())
+    graph.register("tier2", lambda: KnowledgeGraph(db), imports=("src.tier2.knowledge_graph",))
+    graph.register("router", lambda tier2: IntentRouter(tier2_kg=tier2), deps=("tier2",))
+    router = graph.get("router")        # builds tier2, then router
+    print(graph.profiler.render())
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class ProfileFrame:
+    """One timed step of startup (component, import or construction)"""
+    name: str
+    kind: str  # "phase", "component", "import", "construct"
+    duration_ms: float = 0.0
+    children: List["ProfileFrame"] = field(default_factory=list)
+
+    @property
+    def self_ms(self) -> float:
+        return max(0.0, self.duration_ms - sum(child.duration_ms for child in self.children))
+
+
+class StartupProfiler:
+    """
+    Nested timing of component resolution.
+
+    Frames nest by call order, so a component's frame contains its
+    dependencies, its imports and its own construction.
+    """
+
+    def __init__(self):
+        self.roots: List[ProfileFrame] = []
+        self._stack: List[ProfileFrame] = []
+
+    @contextmanager
+    def frame(self, name: str, kind: str = "phase") -> Iterator[ProfileFrame]:
+        node = ProfileFrame(name, kind)
+        (self._stack[-1].children if self._stack else self.roots).append(node)
+        self._stack.append(node)
+        start = time.perf_counter()
+        try:
+            yield node
+        finally:
+            node.duration_ms = (time.perf_counter() - start) * 1000
+            self._stack.pop()
+
+    def add(self, name: str, kind: str, duration_ms: float) -> ProfileFrame:
+        """Record a step timed elsewhere (e.g. before the profiler existed)"""
+        node = ProfileFrame(name, kind, duration_ms)
+        (self._stack[-1].children if self._stack else self.roots).append(node)
+        return node
+
+    @property
+    def total_ms(self) -> float:
+        return sum(root.duration_ms for root in self.roots)
+
+    def totals_by_kind(self) -> Dict[str, float]:
+        """Self time per frame kind (e.g. total import vs construction cost)"""
+        totals: Dict[str, float] = {}
+        for _, node in self._walk():
+            totals[node.kind] = totals.get(node.kind, 0.0) + node.self_ms
+        return totals
+
+    def _walk(self, nodes: Optional[List[ProfileFrame]] = None,
+              path: Tuple[str, ...] = ()) -> Iterator[Tuple[Tuple[str, ...], ProfileFrame]]:
+        for node in self.roots if nodes is None else nodes:
+            label = node.name if node.kind in ("phase", "component") else f"{node.kind}:{node.name}"
+            yield path + (label,), node
+            yield from self._walk(node.children, path + (label,))
+
+    def folded(self) -> List[str]:
+        """Folded stacks ("a;b;c <self microseconds>") for flamegraph tools"""
+        return [
+            f"{';'.join(path)} {int(node.self_ms * 1000)}"
+            for path, node in self._walk()
+            if node.self_ms > 0
+        ]
+
+    def render(self, width: int = 30, min_ms: float = 0.0) -> str:
+        """Indented tree with inclusive times and bars scaled to the total"""
+        total = self.total_ms or 1.0
+        lines = [f"Startup profile: {self.total_ms:.1f} ms total"]
+        for kind, ms in sorted(self.totals_by_kind().items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {kind:<10} {ms:9.1f} ms")
+        lines.append("")
+
+        for path, node in self._walk():
+            if node.duration_ms < min_ms:
+                continue
+            label = "  " * (len(path) - 1) + path[-1]
+            bar = "█" * max(1, round(node.duration_ms / total * width)) if node.duration_ms else ""
+            lines.append(f"{label:<56} {node.duration_ms:9.1f} ms  {bar}")
+        return "\n".join(lines)
+
+
+@dataclass
+class Provider:
+    """How to build one component"""
+    name: str
+    factory: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    imports: Tuple[str, ...] = ()
+
+
+class ComponentGraph:
+    """
+    Registry of lazily constructed, cached components.
+
+    Factories receive their dependencies as keyword arguments named after
+    the dependency. Instances can be replaced with override() (tests,
+    alternative implementations); later resolutions use the override.
+    """
+
+    def __init__(self, profiler: Optional[StartupProfiler] = None):
+        self.profiler = profiler
+        self._providers: Dict[str, Provider] = {}
+        self._instances: Dict[str, Any] = {}
+        self._resolving: List[str] = []
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[..., Any],
+                 deps: Sequence[str] = (), imports: Sequence[str] = ()) -> None:
+        """Declare a component (replaces an earlier provider of the same name)"""
+        with self._lock:
+            self._providers[name] = Provider(name, factory, tuple(deps), tuple(imports))
+            self._instances.pop(name, None)
+
+    def override(self, name: str, instance: Any) -> None:
+        """Use an existing instance for a component"""
+        with self._lock:
+            self._instances[name] = instance
+
+    def is_instantiated(self, name: str) -> bool:
+        return name in self._instances
+
+    def instantiated(self) -> Dict[str, Any]:
+        """Components built so far, in construction order"""
+        return dict(self._instances)
+
+    def get(self, name: str) -> Any:
+        """Resolve a component, building it and its dependencies on first use"""
+        if name in self._instances:
+            return self._instances[name]
+
+        with self._lock:
+            if name in self._instances:
+                return self._instances[name]
+            if name not in self._providers:
+                raise KeyError(f"Unknown component: {name}")
+            if name in self._resolving:
+                cycle = " -> ".join(self._resolving[self._resolving.index(name):] + [name])
+                raise ValueError(f"Component dependency cycle: {cycle}")
+
+            provider = self._providers[name]
+            self._resolving.append(name)
+            try:
+                with self._frame(name, "component"):
+                    deps = {dep: self.get(dep) for dep in provider.deps}
+                    for module in provider.imports:
+                        if module not in sys.modules:
+                            with self._frame(module, "import"):
+                                importlib.import_module(module)
+                    with self._frame(name, "construct"):
+                        instance = provider.factory(**deps)
+            finally:
+                self._resolving.pop()
+
+            self._instances[name] = instance
+            return instance
+
+    def resolve_all(self) -> Dict[str, Any]:
+        """Build every registered component"""
+        return {name: self.get(name) for name in list(self._providers)}
+
+    def _frame(self, name: str, kind: str):
+        if self.profiler is None:
+            return _NULL_FRAME
+        return self.profiler.frame(name, kind)
+
+
+class _NullFrame:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_FRAME = _NullFrame()
@@ -18,25 +18,28 @@ CORTEX 2.0 Implementation Requirement:
     This is tracked automatically via _remind_checklist_update() method.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 from datetime import datetime
 import logging
 from pathlib import Path
 
-from src.cortex_agents.base_agent import AgentRequest, AgentResponse
-from src.cortex_agents.intent_router import IntentRouter
-from .request_parser import RequestParser
-from .response_formatter import ResponseFormatter
-from .setup_command import CortexSetup
-from .agent_executor import AgentExecutor
-from src.session_manager import SessionManager
-from src.tier1.tier1_api import Tier1API
-from src.tier2.knowledge_graph import KnowledgeGraph
-from src.tier3.context_intelligence import ContextIntelligence
 from src.config import config
-from src.core.context_management.unified_context_manager import UnifiedContextManager
-from src.response_templates import TemplateLoader
-from src.tier0.brain_protector import BrainProtector, ModificationRequest, Severity
+from .component_graph import ComponentGraph, StartupProfiler
+
+if TYPE_CHECKING:
+    from src.cortex_agents.base_agent import AgentRequest, AgentResponse
+    from src.tier0.brain_protector import ModificationRequest
+
+
+def _component(name: str):
+    """CortexEntry attribute backed by the component graph (built on first access)"""
+    def getter(self):
+        return self.components.get(name)
+    
+    def setter(self, value):
+        self.components.override(name, value)
+    
+    return property(getter, setter, doc=f"'{name}' component (lazily constructed)")
 
 
 class CortexEntry:
@@ -62,13 +65,31 @@ class CortexEntry:
             "Make the button purple",
             resume_session=True  # References previous conversation
         )
+    
+    Components (tiers, router, session manager, ...) live in a ComponentGraph and
+    are constructed on first use, so e.g. template-answered requests never open
+    the tier databases. Pass a StartupProfiler to time construction and imports.
     """
     
+    # Lazily constructed components (see _build_component_graph)
+    tier1 = _component("tier1")
+    tier2 = _component("tier2")
+    tier3 = _component("tier3")
+    parser = _component("parser")
+    formatter = _component("formatter")
+    session_manager = _component("session_manager")
+    template_loader = _component("template_loader")
+    router = _component("router")
+    agent_executor = _component("agent_executor")
+    context_manager = _component("context_manager")
+    brain_protector = _component("brain_protector")
+    
     def __init__(
         self,
         brain_path: Optional[str] = None,
         enable_logging: bool = True,
-        skip_setup_check: bool = False
+        skip_setup_check: bool = False,
+        profiler: Optional[StartupProfiler] = None
     ):
         """
         Initialize CORTEX entry point.
@@ -78,7 +99,11 @@ class CortexEntry:
                        (default: auto-detected from config)
             enable_logging: Whether to enable detailed logging
             skip_setup_check: Skip first-time setup check (for setup command itself)
+            profiler: Optional startup profiler recording component construction
         """
+        self.profiler = profiler
+        self.components = ComponentGraph(profiler=profiler)
+        
         # Set brain path (use config if not provided)
         if brain_path is None:
             brain_path = config.brain_path
@@ -94,60 +119,100 @@ class CortexEntry:
         # Ensure brain directory structure exists
         config.ensure_paths_exist()
         
-        # Initialize tier APIs
-        self.tier1 = Tier1API(
-            self.brain_path / "tier1" / "conversations.db",
-            self.brain_path / "tier1" / "requests.log"
-        )
-        self.tier2 = KnowledgeGraph(str(self.brain_path / "tier2" / "knowledge_graph.db"))
-        self.tier3 = ContextIntelligence(str(self.brain_path / "tier3" / "context.db"))
-        
-        # Initialize components
-        self.parser = RequestParser()
-        self.formatter = ResponseFormatter()
-        self.session_manager = SessionManager(db_path=str(self.brain_path / "tier1" / "conversations.db"))
-        
-        # Initialize template system for instant responses
-        template_file = self.brain_path / "response-templates.yaml"
-        self.template_loader = None
-        if template_file.exists():
+        self._build_component_graph()
+        self.default_token_budget = 500  # Store as instance variable
+        
+        self.logger.info("CORTEX entry point initialized (components are constructed on first use)")
+    
+    def _build_component_graph(self) -> None:
+        """Register component providers; nothing is constructed here."""
+        brain_path = self.brain_path
+        graph = self.components
+        tiers = ("tier1", "tier2", "tier3")
+        
+        def tier1():
+            from src.tier1.tier1_api import Tier1API
+            return Tier1API(
+                brain_path / "tier1" / "conversations.db",
+                brain_path / "tier1" / "requests.log"
+            )
+        
+        def tier2():
+            from src.tier2.knowledge_graph import KnowledgeGraph
+            return KnowledgeGraph(str(brain_path / "tier2" / "knowledge_graph.db"))
+        
+        def tier3():
+            from src.tier3.context_intelligence import ContextIntelligence
+            return ContextIntelligence(str(brain_path / "tier3" / "context.db"))
+        
+        def parser():
+            from .request_parser import RequestParser
+            return RequestParser()
+        
+        def formatter():
+            from .response_formatter import ResponseFormatter
+            return ResponseFormatter()
+        
+        def session_manager():
+            from src.session_manager import SessionManager
+            return SessionManager(db_path=str(brain_path / "tier1" / "conversations.db"))
+        
+        def template_loader():
+            # Template system for instant responses (None if unavailable)
+            template_file = brain_path / "response-templates.yaml"
+            if not template_file.exists():
+                return None
             try:
-                self.template_loader = TemplateLoader(template_file)
-                self.template_loader.load_templates()
+                from src.response_templates import TemplateLoader
+                loader = TemplateLoader(template_file)
+                loader.load_templates()
                 self.logger.info("Template system initialized successfully")
+                return loader
             except Exception as e:
                 self.logger.warning(f"Template system initialization failed: {e}")
+                return None
+        
+        def router(tier1, tier2, tier3):
+            from src.cortex_agents.intent_router import IntentRouter
+            return IntentRouter(
+                name="IntentRouter",
+                tier1_api=tier1,
+                tier2_kg=tier2,
+                tier3_context=tier3
+            )
         
-        # Initialize router with tier APIs
-        self.router = IntentRouter(
-            name="IntentRouter",
-            tier1_api=self.tier1,
-            tier2_kg=self.tier2,
-            tier3_context=self.tier3
-        )
-        
-        # Initialize agent executor for CORTEX-BRAIN-001 fix
-        self.agent_executor = AgentExecutor(
-            tier1_api=self.tier1,
-            tier2_kg=self.tier2,
-            tier3_context=self.tier3
-        )
-        
-        # Initialize unified context manager (Phase 2: Context Management)
-        self.context_manager = UnifiedContextManager(
-            tier1=self.tier1,
-            tier2=self.tier2,
-            tier3=self.tier3
-        )
-        self.default_token_budget = 500  # Store as instance variable
+        def agent_executor(tier1, tier2, tier3):
+            # Agent executor for CORTEX-BRAIN-001 fix
+            from .agent_executor import AgentExecutor
+            return AgentExecutor(tier1_api=tier1, tier2_kg=tier2, tier3_context=tier3)
+        
+        def context_manager(tier1, tier2, tier3):
+            # Unified context manager (Phase 2: Context Management)
+            from src.core.context_management.unified_context_manager import UnifiedContextManager
+            return UnifiedContextManager(tier1=tier1, tier2=tier2, tier3=tier3)
+        
+        def brain_protector():
+            # Brain Protector for Tier 0 governance enforcement
+            from src.tier0.brain_protector import BrainProtector
+            return BrainProtector(
+                log_path=brain_path / "corpus-callosum" / "protection-events.jsonl",
+                rules_path=brain_path / "brain-protection-rules.yaml"
+            )
         
-        # Initialize Brain Protector for Tier 0 governance enforcement
-        self.brain_protector = BrainProtector(
-            log_path=self.brain_path / "corpus-callosum" / "protection-events.jsonl",
-            rules_path=self.brain_path / "brain-protection-rules.yaml"
+        graph.register("tier1", tier1, imports=("src.tier1.tier1_api",))
+        graph.register("tier2", tier2, imports=("src.tier2.knowledge_graph",))
+        graph.register("tier3", tier3, imports=("src.tier3.context_intelligence",))
+        graph.register("parser", parser, imports=("src.entry_point.request_parser",))
+        graph.register("formatter", formatter, imports=("src.entry_point.response_formatter",))
+        graph.register("session_manager", session_manager, imports=("src.session_manager",))
+        graph.register("template_loader", template_loader, imports=("src.response_templates",))
+        graph.register("router", router, deps=tiers, imports=("src.cortex_agents.intent_router",))
+        graph.register("agent_executor", agent_executor, deps=tiers, imports=("src.entry_point.agent_executor",))
+        graph.register(
+            "context_manager", context_manager, deps=tiers,
+            imports=("src.core.context_management.unified_context_manager",)
         )
-        
-        self.logger.info("CORTEX entry point initialized with unified context manager and brain protector")
+        graph.register("brain_protector", brain_protector, imports=("src.tier0.brain_protector",))
     
     def process(
         self,
@@ -414,6 +479,7 @@ class CortexEntry:
                 
             except Exception as e:
                 # Create error response
+                from src.cortex_agents.base_agent import AgentResponse
                 error_response = AgentResponse(
                     success=False,
                     result=None,
@@ -573,7 +639,7 @@ class CortexEntry:
     def _remind_checklist_update(
         self,
         user_message: str,
-        response: AgentResponse
+        response: "AgentResponse"
     ) -> None:
         """
         Log reminder to update CORTEX 2.0 Implementation Status Checklist.
@@ -691,6 +757,7 @@ The setup process will:
             # Or in a different repo
             results = entry.setup(repo_path="/path/to/project")
         """
+        from .setup_command import CortexSetup
         setup = CortexSetup(
             repo_path=repo_path,
             brain_path=str(self.brain_path) if repo_path is None else None,
@@ -890,7 +957,7 @@ Ready to continue! What would you like to do next?
         
         return logger
     
-    def _validate_with_brain_protector(self, request: AgentRequest) -> Optional[str]:
+    def _validate_with_brain_protector(self, request: "AgentRequest") -> Optional[str]:
         """
         Validate request against brain protection rules (Tier 0 governance).
         
@@ -954,7 +1021,7 @@ Ready to continue! What would you like to do next?
             self.logger.error(f"Brain protector validation failed: {e}", exc_info=True)
             return None
     
-    def _create_modification_request(self, agent_request: AgentRequest) -> ModificationRequest:
+    def _create_modification_request(self, agent_request: "AgentRequest") -> "ModificationRequest":
         """
         Convert AgentRequest to ModificationRequest for brain protector.
         
@@ -966,6 +1033,7 @@ Ready to continue! What would you like to do next?
         """
         # Extract file paths from user message
         from src.cortex_agents.utils import extract_file_paths
+        from src.tier0.brain_protector import ModificationRequest
         files = extract_file_paths(agent_request.user_message)
         
         # Build modification request
@@ -988,23 +1056,24 @@ Ready to continue! What would you like to do next?
         This ensures database files are not locked during cleanup operations
         (particularly important on Windows during test teardown).
         
-        Safe to call multiple times (idempotent).
+        Safe to call multiple times (idempotent). Components that were never
+        constructed are not built just to be closed.
         """
         try:
             # Close Tier 2 Knowledge Graph connection
-            if hasattr(self, 'tier2') and self.tier2:
+            if self.components.is_instantiated('tier2') and self.tier2:
                 if hasattr(self.tier2, 'connection_manager'):
                     self.tier2.connection_manager.close()
                     self.logger.info("Tier 2 database connection closed")
             
             # Close Tier 1 connection (if connection manager exists)
-            if hasattr(self, 'tier1') and self.tier1:
+            if self.components.is_instantiated('tier1') and self.tier1:
                 if hasattr(self.tier1, 'close'):
                     self.tier1.close()
                     self.logger.info("Tier 1 database connection closed")
             
             # Close Tier 3 connection (if connection manager exists)
-            if hasattr(self, 'tier3') and self.tier3:
+            if self.components.is_instantiated('tier3') and self.tier3:
                 if hasattr(self.tier3, 'close'):
                     self.tier3.close()
                     self.logger.info("Tier 3 database connection closed")
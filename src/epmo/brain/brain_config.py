@@ -8,7 +8,7 @@ team preferences, historical patterns, and quality metrics from CORTEX Brain.
 
 import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
@@ -16,6 +16,7 @@ from datetime import datetime
 from .brain_connector import BrainConnector
 from .pattern_learning import PatternLearningEngine
 from .adaptive_templates import AdaptiveTemplateSystem, TemplateRecommendation
+from src.utils.config_snapshots import freeze, thaw
 
 
 @dataclass
@@ -61,6 +62,47 @@ class ConfigurationLearning:
     adjustments_made: List[str]
 
 
+# Base configuration templates for different contexts (immutable, shared by
+# all instances; callers receive thawed copies)
+BASE_CONFIGS = freeze({
+    'minimal_fast': {
+        'sections': ['overview', 'usage'],
+        'include_diagrams': False,
+        'include_health': False,
+        'detail_level': 'basic',
+        'visual_content': False,
+        'processing_speed': 'fast'
+    },
+    'balanced_standard': {
+        'sections': ['overview', 'architecture', 'usage', 'health'],
+        'include_diagrams': True,
+        'include_health': True,
+        'detail_level': 'standard',
+        'visual_content': True,
+        'processing_speed': 'moderate'
+    },
+    'comprehensive_quality': {
+        'sections': ['overview', 'architecture', 'components', 'dependencies', 'usage', 'health', 'metrics'],
+        'include_diagrams': True,
+        'include_health': True,
+        'detail_level': 'comprehensive',
+        'visual_content': True,
+        'processing_speed': 'thorough',
+        'include_code_samples': True,
+        'quality_focus': True
+    },
+    'stakeholder_presentation': {
+        'sections': ['overview', 'architecture', 'benefits', 'metrics'],
+        'include_diagrams': True,
+        'include_health': True,
+        'detail_level': 'executive',
+        'visual_content': True,
+        'visual_priority': True,
+        'business_focus': True
+    }
+})
+
+
 class BrainEnhancedConfig:
     """
     Intelligent configuration system that learns from CORTEX Brain patterns
@@ -95,45 +137,9 @@ class BrainEnhancedConfig:
         
         self.logger.info("BrainEnhancedConfig initialized")
 
-    def _initialize_base_configs(self) -> Dict[str, Dict]:
+    def _initialize_base_configs(self) -> Mapping[str, Mapping[str, Any]]:
         """Initialize base configuration templates for different contexts"""
-        return {
-            'minimal_fast': {
-                'sections': ['overview', 'usage'],
-                'include_diagrams': False,
-                'include_health': False,
-                'detail_level': 'basic',
-                'visual_content': False,
-                'processing_speed': 'fast'
-            },
-            'balanced_standard': {
-                'sections': ['overview', 'architecture', 'usage', 'health'],
-                'include_diagrams': True,
-                'include_health': True,
-                'detail_level': 'standard',
-                'visual_content': True,
-                'processing_speed': 'moderate'
-            },
-            'comprehensive_quality': {
-                'sections': ['overview', 'architecture', 'components', 'dependencies', 'usage', 'health', 'metrics'],
-                'include_diagrams': True,
-                'include_health': True,
-                'detail_level': 'comprehensive',
-                'visual_content': True,
-                'processing_speed': 'thorough',
-                'include_code_samples': True,
-                'quality_focus': True
-            },
-            'stakeholder_presentation': {
-                'sections': ['overview', 'architecture', 'benefits', 'metrics'],
-                'include_diagrams': True,
-                'include_health': True,
-                'detail_level': 'executive',
-                'visual_content': True,
-                'visual_priority': True,
-                'business_focus': True
-            }
-        }
+        return BASE_CONFIGS
 
     def generate_intelligent_config(
         self,
@@ -270,19 +276,19 @@ class BrainEnhancedConfig:
         
         # Time-constrained scenarios
         if context.time_constraints == 'tight':
-            return self.base_configs['minimal_fast'].copy()
+            return thaw(self.base_configs['minimal_fast'])
         
         # Stakeholder-focused scenarios  
         if context.target_audience == 'stakeholders':
-            return self.base_configs['stakeholder_presentation'].copy()
+            return thaw(self.base_configs['stakeholder_presentation'])
         
         # High-quality scenarios
         if (context.documentation_maturity in ['good', 'excellent'] and 
             context.time_constraints != 'tight'):
-            return self.base_configs['comprehensive_quality'].copy()
+            return thaw(self.base_configs['comprehensive_quality'])
         
         # Default to balanced approach
-        return self.base_configs['balanced_standard'].copy()
+        return thaw(self.base_configs['balanced_standard'])
 
     def _get_template_recommendation(
         self, 
@@ -18,6 +18,8 @@ from typing import Dict, List, Any, Set, Tuple, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
 
+from src.utils.graph_analysis import DirectedGraph
+
 from .parser import EPMASTParser, EPMAnalysis
 
 
@@ -90,14 +92,17 @@ class DependencyMapper:
         # Calculate reverse dependencies (imported_by)
         self._calculate_reverse_dependencies(graph)
         
-        # Detect circular dependencies
-        self._detect_circular_dependencies(graph)
+        # Internal import graph shared by cycle detection and layering
+        module_graph = self._build_module_graph(graph)
+        
+        # Detect circular dependencies (Tarjan SCC over the internal import graph)
+        self._detect_circular_dependencies(graph, module_graph)
         
         # Calculate coupling scores
         self._calculate_coupling_scores(graph)
         
         # Determine dependency layers (topological sort)
-        self._calculate_dependency_layers(graph)
+        self._calculate_dependency_layers(graph, module_graph)
         
         return graph
     
@@ -241,50 +246,25 @@ class DependencyMapper:
                     if source not in graph.modules[target].imported_by:
                         graph.modules[target].imported_by.append(source)
     
-    def _detect_circular_dependencies(self, graph: DependencyGraph) -> None:
-        """Detect circular dependency chains."""
-        # Build adjacency list for internal dependencies only
-        adj_list = defaultdict(list)
+    def _build_module_graph(self, graph: DependencyGraph) -> DirectedGraph:
+        """Build the internal import graph (edges from importer to imported module)."""
+        module_graph = DirectedGraph(nodes=graph.modules)
         for relationship in graph.relationships:
-            if not relationship.is_external:
-                adj_list[relationship.source_module].append(relationship.target_module)
-        
-        # Find strongly connected components (circular chains)
-        visited = set()
-        rec_stack = set()
-        
-        def dfs_cycle_detect(node: str, path: List[str]) -> None:
-            if node in rec_stack:
-                # Found a cycle - extract the cycle
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                graph.circular_chains.append(cycle)
-                
-                # Mark all nodes in cycle as having circular dependencies
-                for cycle_node in cycle[:-1]:  # Exclude duplicate end node
-                    if cycle_node in graph.modules:
-                        graph.modules[cycle_node].circular_dependencies.extend(
-                            [n for n in cycle[:-1] if n != cycle_node]
-                        )
-                return
-            
-            if node in visited:
-                return
-            
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-            
-            for neighbor in adj_list[node]:
-                dfs_cycle_detect(neighbor, path)
+            if not relationship.is_external and relationship.target_module in graph.modules:
+                module_graph.add_edge(relationship.source_module, relationship.target_module)
+        return module_graph
+    
+    def _detect_circular_dependencies(self, graph: DependencyGraph, module_graph: DirectedGraph) -> None:
+        """Detect circular dependency chains (one per strongly connected component)."""
+        for component in module_graph.cycles():
+            # Report a concrete import cycle through the component's first module
+            graph.circular_chains.append(module_graph.cycle_path(component[0]))
             
-            path.pop()
-            rec_stack.remove(node)
-        
-        # Check all nodes for cycles
-        for module in graph.modules:
-            if module not in visited:
-                dfs_cycle_detect(module, [])
+            # Every module in the component depends circularly on all the others
+            for module in component:
+                graph.modules[module].circular_dependencies.extend(
+                    other for other in component if other != module
+                )
     
     def _calculate_coupling_scores(self, graph: DependencyGraph) -> None:
         """Calculate coupling scores for each module."""
@@ -304,51 +284,10 @@ class DependencyMapper:
             else:
                 module_deps.coupling_score = 0.0
     
-    def _calculate_dependency_layers(self, graph: DependencyGraph) -> None:
-        """Calculate dependency layers using topological sorting."""
-        # Build adjacency list for internal dependencies only
-        adj_list = defaultdict(list)
-        in_degree = defaultdict(int)
-        
-        # Initialize all modules with in-degree 0
-        for module in graph.modules:
-            in_degree[module] = 0
-        
-        # Count incoming edges
-        for relationship in graph.relationships:
-            if not relationship.is_external:
-                source = relationship.source_module
-                target = relationship.target_module
-                if target in graph.modules:  # Only count internal targets
-                    adj_list[source].append(target)
-                    in_degree[target] += 1
-        
-        # Topological sort by layers
-        current_layer = []
-        remaining_modules = set(graph.modules.keys())
-        
-        while remaining_modules:
-            # Find modules with no incoming dependencies in this iteration
-            layer_modules = [
-                module for module in remaining_modules 
-                if in_degree[module] == 0
-            ]
-            
-            if not layer_modules:
-                # If no modules with in-degree 0, we have cycles
-                # Add remaining modules to final layer
-                graph.dependency_layers.append(list(remaining_modules))
-                break
-            
-            # Add this layer
-            graph.dependency_layers.append(layer_modules)
-            
-            # Remove these modules and update in-degrees
-            for module in layer_modules:
-                remaining_modules.remove(module)
-                for neighbor in adj_list[module]:
-                    if neighbor in remaining_modules:
-                        in_degree[neighbor] -= 1
+    def _calculate_dependency_layers(self, graph: DependencyGraph, module_graph: DirectedGraph) -> None:
+        """Calculate dependency layers (longest-path layering of the condensation DAG)."""
+        # Cycles collapse into one node, so modules below a cycle are still layered
+        graph.dependency_layers.extend(module_graph.layers())
     
     def _get_stdlib_modules(self) -> Set[str]:
         """Get set of Python standard library module names."""
@@ -4,6 +4,10 @@ CORTEX 3.0 Error Analytics
 
 Advanced error analytics and pattern detection for proactive
 error management and system improvement insights.
+
+Events feed a streaming ErrorStream (see error_stream.py): expiry and all
+detector state are maintained per event in amortized O(1), so analysis
+reads aggregates instead of refiltering the whole history.
 """
 
 import time
@@ -16,6 +20,8 @@ from collections import defaultdict, Counter
 import logging
 import json
 
+from .error_stream import ErrorStream
+
 
 logger = logging.getLogger(__name__)
 
@@ -129,9 +135,22 @@ class ErrorAnalytics:
         self.trend_analysis_intervals = trend_analysis_intervals
         self.enable_real_time_analysis = enable_real_time_analysis
         
-        # Error data storage
-        self._error_history: List[Dict[str, Any]] = []
+        # Thresholds for pattern detection
+        self._thresholds = {
+            'frequency_spike_multiplier': 3.0,  # 3x normal rate
+            'recurring_error_count': 5,
+            'temporal_cluster_window': 300,  # 5 minutes
+            'cascade_correlation_threshold': 0.8,
+            'performance_degradation_threshold': 2.0  # 2x normal response time
+        }
+        
+        # Error data storage (sliding window with incremental aggregates)
+        self._stream = ErrorStream(
+            window_seconds=analysis_window_hours * 3600,
+            cluster_window=self._thresholds['temporal_cluster_window']
+        )
         self._lock = threading.RLock()
+        self._realtime_spike = False
         
         # Pattern tracking
         self._detected_patterns: Dict[str, ErrorPattern] = {}
@@ -143,15 +162,6 @@ class ErrorAnalytics:
         
         # Component tracking
         self._component_metrics: Dict[str, Dict[str, Any]] = defaultdict(dict)
-        
-        # Thresholds for pattern detection
-        self._thresholds = {
-            'frequency_spike_multiplier': 3.0,  # 3x normal rate
-            'recurring_error_count': 5,
-            'temporal_cluster_window': 300,  # 5 minutes
-            'cascade_correlation_threshold': 0.8,
-            'performance_degradation_threshold': 2.0  # 2x normal response time
-        }
     
     def add_error_event(
         self,
@@ -185,21 +195,17 @@ class ErrorAnalytics:
         }
         
         with self._lock:
-            self._error_history.append(error_event)
+            self._stream.add(error_event)
             
-            # Maintain window size
-            cutoff_time = time.time() - (self.analysis_window_hours * 3600)
-            self._error_history = [
-                event for event in self._error_history
-                if event['timestamp'] > cutoff_time
-            ]
+            # Maintain window size (amortized O(1): expired events leave from the front)
+            self._stream.expire(time.time())
             
             # Update component metrics
             self._update_component_metrics(error_event)
-        
-        # Real-time analysis
-        if self.enable_real_time_analysis:
-            self._check_real_time_patterns(error_event)
+            
+            # Real-time analysis
+            if self.enable_real_time_analysis:
+                self._check_real_time_patterns(error_event)
     
     def analyze_patterns(self) -> List[ErrorPattern]:
         """
@@ -211,40 +217,36 @@ class ErrorAnalytics:
         with self._lock:
             current_time = time.time()
             
-            # Get recent errors for analysis
-            analysis_window = current_time - (self.analysis_window_hours * 3600)
-            recent_errors = [
-                error for error in self._error_history
-                if error['timestamp'] > analysis_window
-            ]
+            # Drop errors that left the analysis window
+            self._stream.expire(current_time)
             
-            if not recent_errors:
+            if not len(self._stream):
                 return []
             
             new_patterns = []
             
             # Frequency spike detection
-            frequency_patterns = self._detect_frequency_spikes(recent_errors)
+            frequency_patterns = self._detect_frequency_spikes()
             new_patterns.extend(frequency_patterns)
             
             # Recurring error detection
-            recurring_patterns = self._detect_recurring_errors(recent_errors)
+            recurring_patterns = self._detect_recurring_errors()
             new_patterns.extend(recurring_patterns)
             
             # Temporal clustering
-            temporal_patterns = self._detect_temporal_clusters(recent_errors)
+            temporal_patterns = self._detect_temporal_clusters()
             new_patterns.extend(temporal_patterns)
             
             # Component hotspot detection
-            hotspot_patterns = self._detect_component_hotspots(recent_errors)
+            hotspot_patterns = self._detect_component_hotspots()
             new_patterns.extend(hotspot_patterns)
             
             # Cascading failure detection
-            cascade_patterns = self._detect_cascading_failures(recent_errors)
+            cascade_patterns = self._detect_cascading_failures()
             new_patterns.extend(cascade_patterns)
             
             # Performance degradation patterns
-            performance_patterns = self._detect_performance_degradation(recent_errors)
+            performance_patterns = self._detect_performance_degradation()
             new_patterns.extend(performance_patterns)
             
             # Update pattern registry
@@ -272,10 +274,12 @@ class ErrorAnalytics:
         
         trends = []
         
-        for period in time_periods:
-            trend = self._analyze_trend_for_period(period)
-            if trend:
-                trends.append(trend)
+        with self._lock:
+            self._stream.expire(time.time())
+            for period in time_periods:
+                trend = self._analyze_trend_for_period(period)
+                if trend:
+                    trends.append(trend)
         
         return trends
     
@@ -287,6 +291,7 @@ class ErrorAnalytics:
             List of component health analyses
         """
         with self._lock:
+            self._stream.expire(time.time())
             health_analyses = []
             
             for component, metrics in self._component_metrics.items():
@@ -305,18 +310,20 @@ class ErrorAnalytics:
             trends = self.get_error_trends()
             component_health = self.get_component_health()
             
-            # Calculate overall metrics
-            total_errors = len(self._error_history)
-            unique_error_codes = len(set(error['error_code'] for error in self._error_history))
-            affected_components = len(set(error['component'] for error in self._error_history))
+            # Calculate overall metrics (rolling counters)
+            stream = self._stream
+            total_errors = len(stream)
+            unique_error_codes = len(stream.by_code)
+            affected_components = len(stream.by_component)
             
             # Error distribution
-            error_by_severity = Counter(error['severity'] for error in self._error_history)
-            error_by_component = Counter(error['component'] for error in self._error_history)
-            error_by_code = Counter(error['error_code'] for error in self._error_history)
+            error_by_severity = stream.by_severity
+            error_by_component = stream.by_component
+            error_by_code = stream.by_code
+            now = time.time()
             
             return {
-                'analysis_timestamp': time.time(),
+                'analysis_timestamp': now,
                 'analysis_window_hours': self.analysis_window_hours,
                 'summary': {
                     'total_errors': total_errors,
@@ -330,6 +337,7 @@ class ErrorAnalytics:
                     'by_component': dict(error_by_component.most_common(10)),
                     'by_error_code': dict(error_by_code.most_common(10))
                 },
+                'rates': stream.rates(now),
                 'patterns': [pattern.to_dict() for pattern in patterns],
                 'trends': [trend.to_dict() for trend in trends],
                 'component_health': [health.to_dict() for health in component_health],
@@ -359,27 +367,23 @@ class ErrorAnalytics:
             logger.error(f"Failed to export analytics: {e}")
             return False
     
-    def _detect_frequency_spikes(self, errors: List[Dict[str, Any]]) -> List[ErrorPattern]:
+    def _detect_frequency_spikes(self) -> List[ErrorPattern]:
         """Detect frequency spike patterns."""
         patterns = []
         
-        # Group errors by hour
-        hourly_counts = defaultdict(int)
-        for error in errors:
-            hour_bucket = int(error['timestamp'] // 3600)
-            hourly_counts[hour_bucket] += 1
+        # Hourly buckets are maintained per event
+        hourly_counts = self._stream.hourly
         
         if len(hourly_counts) < 2:
             return patterns
         
-        # Calculate baseline and detect spikes
-        counts = list(hourly_counts.values())
-        baseline = statistics.mean(counts)
-        std_dev = statistics.stdev(counts) if len(counts) > 1 else 0
+        # Calculate baseline and detect spikes (running sum / sum of squares)
+        baseline, std_dev = self._stream.hourly_stats()
         
         spike_threshold = baseline + (2 * std_dev)  # 2 standard deviations above mean
         
-        for hour, count in hourly_counts.items():
+        for hour in sorted(hourly_counts):
+            count = hourly_counts[hour]
             if count > spike_threshold and count > baseline * self._thresholds['frequency_spike_multiplier']:
                 pattern = ErrorPattern(
                     pattern_id=f"freq_spike_{hour}",
@@ -400,41 +404,30 @@ class ErrorAnalytics:
         
         return patterns
     
-    def _detect_recurring_errors(self, errors: List[Dict[str, Any]]) -> List[ErrorPattern]:
+    def _detect_recurring_errors(self) -> List[ErrorPattern]:
         """Detect recurring error patterns."""
         patterns = []
         
-        # Count error codes
-        error_counts = Counter(error['error_code'] for error in errors)
-        
-        for error_code, count in error_counts.items():
+        for error_code, count in self._stream.by_code.items():
             if count >= self._thresholds['recurring_error_count']:
-                # Calculate time distribution
-                error_times = [
-                    error['timestamp'] for error in errors
-                    if error['error_code'] == error_code
-                ]
-                
-                time_intervals = []
-                if len(error_times) > 1:
-                    sorted_times = sorted(error_times)
-                    time_intervals = [
-                        sorted_times[i+1] - sorted_times[i]
-                        for i in range(len(sorted_times) - 1)
-                    ]
+                # Time distribution from the code's ordered timestamps
+                error_times = self._stream.code_times[error_code]
+                first_time = error_times[0]
+                last_time = error_times[-1]
                 
                 pattern = ErrorPattern(
                     pattern_id=f"recurring_{error_code}",
                     pattern_type=PatternType.RECURRING_ERROR,
                     description=f"Recurring error detected: {error_code} occurred {count} times",
                     confidence_score=min(1.0, count / 10.0),  # Scale with frequency
-                    first_detected=min(error_times),
-                    last_updated=max(error_times),
+                    first_detected=first_time,
+                    last_updated=last_time,
                     occurrences=count,
                     error_codes=[error_code],
                     metadata={
-                        'avg_interval': statistics.mean(time_intervals) if time_intervals else None,
-                        'total_timespan': max(error_times) - min(error_times) if len(error_times) > 1 else 0
+                        # Mean of consecutive intervals telescopes to span / (n - 1)
+                        'avg_interval': (last_time - first_time) / (count - 1) if count > 1 else None,
+                        'total_timespan': last_time - first_time if count > 1 else 0
                     },
                     recommendations=[
                         f"Investigate root cause of {error_code}",
@@ -446,52 +439,34 @@ class ErrorAnalytics:
         
         return patterns
     
-    def _detect_temporal_clusters(self, errors: List[Dict[str, Any]]) -> List[ErrorPattern]:
+    def _detect_temporal_clusters(self) -> List[ErrorPattern]:
         """Detect temporal clustering patterns."""
         patterns = []
         
-        if len(errors) < 3:
+        if len(self._stream) < 3:
             return patterns
         
-        # Sort errors by timestamp
-        sorted_errors = sorted(errors, key=lambda e: e['timestamp'])
-        
-        # Find clusters of errors within time window
+        # Clusters of errors within the time window are extended and
+        # trimmed as errors arrive and expire
         cluster_window = self._thresholds['temporal_cluster_window']
-        clusters = []
-        current_cluster = [sorted_errors[0]]
-        
-        for error in sorted_errors[1:]:
-            if error['timestamp'] - current_cluster[-1]['timestamp'] <= cluster_window:
-                current_cluster.append(error)
-            else:
-                if len(current_cluster) >= 3:  # Minimum cluster size
-                    clusters.append(current_cluster)
-                current_cluster = [error]
-        
-        # Check final cluster
-        if len(current_cluster) >= 3:
-            clusters.append(current_cluster)
+        clusters = [cluster for cluster in self._stream.clusters() if cluster.count >= 3]  # Minimum cluster size
         
         # Create patterns for significant clusters
         for i, cluster in enumerate(clusters):
-            if len(cluster) >= 5:  # Significant cluster threshold
-                error_codes = [error['error_code'] for error in cluster]
-                components = [error['component'] for error in cluster]
-                
+            if cluster.count >= 5:  # Significant cluster threshold
                 pattern = ErrorPattern(
-                    pattern_id=f"temporal_cluster_{i}_{int(cluster[0]['timestamp'])}",
+                    pattern_id=f"temporal_cluster_{i}_{int(cluster.start)}",
                     pattern_type=PatternType.TEMPORAL_CLUSTER,
-                    description=f"Temporal cluster: {len(cluster)} errors in {cluster_window}s",
-                    confidence_score=min(1.0, len(cluster) / 10.0),
-                    first_detected=cluster[0]['timestamp'],
-                    last_updated=cluster[-1]['timestamp'],
-                    occurrences=len(cluster),
-                    affected_components=list(set(components)),
-                    error_codes=list(set(error_codes)),
+                    description=f"Temporal cluster: {cluster.count} errors in {cluster_window}s",
+                    confidence_score=min(1.0, cluster.count / 10.0),
+                    first_detected=cluster.start,
+                    last_updated=cluster.end,
+                    occurrences=cluster.count,
+                    affected_components=list(cluster.components),
+                    error_codes=list(cluster.error_codes),
                     metadata={
-                        'cluster_duration': cluster[-1]['timestamp'] - cluster[0]['timestamp'],
-                        'error_density': len(cluster) / cluster_window
+                        'cluster_duration': cluster.end - cluster.start,
+                        'error_density': cluster.count / cluster_window
                     },
                     recommendations=[
                         "Investigate system events during cluster period",
@@ -503,13 +478,13 @@ class ErrorAnalytics:
         
         return patterns
     
-    def _detect_component_hotspots(self, errors: List[Dict[str, Any]]) -> List[ErrorPattern]:
+    def _detect_component_hotspots(self) -> List[ErrorPattern]:
         """Detect component hotspot patterns."""
         patterns = []
         
-        # Count errors by component
-        component_counts = Counter(error['component'] for error in errors)
-        total_errors = len(errors)
+        # Rolling per-component and per-(component, error_code) counters
+        component_counts = self._stream.by_component
+        total_errors = len(self._stream)
         
         for component, count in component_counts.items():
             # Calculate component error rate
@@ -517,22 +492,22 @@ class ErrorAnalytics:
             
             # Detect if component has unusually high error rate
             if error_rate > 0.3 and count >= 5:  # Component contributes >30% of errors
-                component_errors = [e for e in errors if e['component'] == component]
-                error_codes = [e['error_code'] for e in component_errors]
+                component_times = self._stream.component_times[component]
+                error_codes = self._stream.component_codes[component]
                 
                 pattern = ErrorPattern(
                     pattern_id=f"hotspot_{component}",
                     pattern_type=PatternType.COMPONENT_HOTSPOT,
                     description=f"Component hotspot: {component} generated {count} errors ({error_rate:.1%})",
                     confidence_score=min(1.0, error_rate * 2),  # Scale with error rate
-                    first_detected=min(e['timestamp'] for e in component_errors),
-                    last_updated=max(e['timestamp'] for e in component_errors),
+                    first_detected=component_times[0],
+                    last_updated=component_times[-1],
                     occurrences=count,
                     affected_components=[component],
-                    error_codes=list(set(error_codes)),
+                    error_codes=list(error_codes),
                     metadata={
                         'error_rate': error_rate,
-                        'unique_error_types': len(set(error_codes))
+                        'unique_error_types': len(error_codes)
                     },
                     recommendations=[
                         f"Focus debugging efforts on {component}",
@@ -544,31 +519,21 @@ class ErrorAnalytics:
         
         return patterns
     
-    def _detect_cascading_failures(self, errors: List[Dict[str, Any]]) -> List[ErrorPattern]:
+    def _detect_cascading_failures(self) -> List[ErrorPattern]:
         """Detect cascading failure patterns."""
         patterns = []
         
-        # Group errors by time windows and analyze component sequences
-        window_size = 60  # 1 minute windows
-        time_windows = defaultdict(list)
-        
-        for error in errors:
-            window_key = int(error['timestamp'] // window_size)
-            time_windows[window_key].append(error)
+        # Per-minute windows keep their component sequence as runs, so
+        # consecutive repeats are already collapsed
+        window_size = self._stream.cascade_window
         
-        for window_key, window_errors in time_windows.items():
-            if len(window_errors) < 3:
+        for window_key, window in self._stream.minute_sequences().items():
+            if window.count < 3:
                 continue
             
-            # Check for component sequence patterns
-            components = [error['component'] for error in sorted(window_errors, key=lambda e: e['timestamp'])]
-            
             # Look for patterns where one component failure leads to others
-            if len(set(components)) >= 2:
-                component_sequence = []
-                for component in components:
-                    if not component_sequence or component != component_sequence[-1]:
-                        component_sequence.append(component)
+            if len(window.components) >= 2:
+                component_sequence = window.sequence
                 
                 if len(component_sequence) >= 3:  # Cascade involving 3+ components
                     pattern = ErrorPattern(
@@ -576,9 +541,9 @@ class ErrorAnalytics:
                         pattern_type=PatternType.CASCADING_FAILURE,
                         description=f"Cascading failure: {' -> '.join(component_sequence)}",
                         confidence_score=min(1.0, len(component_sequence) / 5.0),
-                        first_detected=min(e['timestamp'] for e in window_errors),
-                        last_updated=max(e['timestamp'] for e in window_errors),
-                        occurrences=len(window_errors),
+                        first_detected=window.first,
+                        last_updated=window.last,
+                        occurrences=window.count,
                         affected_components=component_sequence,
                         metadata={
                             'cascade_sequence': component_sequence,
@@ -594,25 +559,32 @@ class ErrorAnalytics:
         
         return patterns
     
-    def _detect_performance_degradation(self, errors: List[Dict[str, Any]]) -> List[ErrorPattern]:
-        """Detect performance degradation patterns."""
+    def _detect_performance_degradation(self) -> List[ErrorPattern]:
+        """
+        Detect performance degradation patterns.
+        
+        The baseline is the median response time of the earlier half of
+        the window by event timestamp. Late-arriving events are placed by
+        their timestamp, not by arrival order, so a delayed report of an
+        old slow response does not skew which half counts as baseline.
+        """
         patterns = []
         
-        # Filter errors with response time data
-        timed_errors = [error for error in errors if error.get('response_time')]
+        # Errors with response time data (timestamp order)
+        timed_errors = self._stream.timed
         
         if len(timed_errors) < 10:
             return patterns
         
         # Calculate baseline response time
-        response_times = [error['response_time'] for error in timed_errors]
+        response_times = [response_time for _, response_time, _ in timed_errors]
         baseline_response_time = statistics.median(response_times[:len(response_times)//2])  # First half as baseline
         
         # Detect degradation periods
         degradation_threshold = baseline_response_time * self._thresholds['performance_degradation_threshold']
         degraded_errors = [
             error for error in timed_errors
-            if error['response_time'] > degradation_threshold
+            if error[1] > degradation_threshold
         ]
         
         if len(degraded_errors) >= 5:
@@ -621,13 +593,13 @@ class ErrorAnalytics:
                 pattern_type=PatternType.PERFORMANCE_DEGRADATION,
                 description=f"Performance degradation: {len(degraded_errors)} slow responses detected",
                 confidence_score=min(1.0, len(degraded_errors) / len(timed_errors)),
-                first_detected=min(e['timestamp'] for e in degraded_errors),
-                last_updated=max(e['timestamp'] for e in degraded_errors),
+                first_detected=min(timestamp for timestamp, _, _ in degraded_errors),
+                last_updated=max(timestamp for timestamp, _, _ in degraded_errors),
                 occurrences=len(degraded_errors),
-                affected_components=list(set(e['component'] for e in degraded_errors)),
+                affected_components=list(set(component for _, _, component in degraded_errors)),
                 metadata={
                     'baseline_response_time': baseline_response_time,
-                    'avg_degraded_response_time': statistics.mean(e['response_time'] for e in degraded_errors),
+                    'avg_degraded_response_time': statistics.mean(rt for _, rt, _ in degraded_errors),
                     'degradation_ratio': len(degraded_errors) / len(timed_errors)
                 },
                 recommendations=[
@@ -656,31 +628,23 @@ class ErrorAnalytics:
         current_time = time.time()
         period_start = current_time - period_seconds
         
-        # Get errors in period
-        period_errors = [
-            error for error in self._error_history
-            if error['timestamp'] > period_start
-        ]
+        # Count errors in period (bisect on the ordered window)
+        total_errors = self._stream.count_after(period_start)
         
-        if not period_errors:
+        if not total_errors:
             return None
         
         # Calculate trend
-        total_errors = len(period_errors)
         error_rate = total_errors / (period_seconds / 3600)  # Errors per hour
         
         # Compare with previous period for trend direction
         previous_period_start = period_start - period_seconds
-        previous_errors = [
-            error for error in self._error_history
-            if previous_period_start < error['timestamp'] <= period_start
-        ]
+        previous_count = self._stream.count_after(previous_period_start) - total_errors
         
         trend_direction = "stable"
         change_percentage = 0.0
         
-        if previous_errors:
-            previous_count = len(previous_errors)
+        if previous_count:
             if total_errors > previous_count * 1.2:
                 trend_direction = "increasing"
                 change_percentage = ((total_errors - previous_count) / previous_count) * 100
@@ -688,16 +652,14 @@ class ErrorAnalytics:
                 trend_direction = "decreasing"
                 change_percentage = ((previous_count - total_errors) / previous_count) * 100
         
+        # Hourly buckets and error codes of the period (whole hours from
+        # the maintained buckets, only the partial first hour is scanned)
+        hourly_buckets, error_counter = self._stream.hourly_after(period_start)
+        
         # Find dominant error types
-        error_counter = Counter(error['error_code'] for error in period_errors)
         dominant_error_types = [code for code, count in error_counter.most_common(5)]
         
         # Find peak error times
-        hourly_buckets = defaultdict(int)
-        for error in period_errors:
-            hour_bucket = int(error['timestamp'] // 3600)
-            hourly_buckets[hour_bucket] += 1
-        
         peak_hours = sorted(hourly_buckets.items(), key=lambda x: x[1], reverse=True)[:3]
         peak_error_times = [hour * 3600 for hour, count in peak_hours]
         
@@ -719,29 +681,23 @@ class ErrorAnalytics:
             self._component_metrics[component] = {
                 'error_count': 0,
                 'error_codes': Counter(),
-                'last_error_time': None,
-                'error_times': []
+                'last_error_time': None
             }
         
+        # Windowed error times live in the stream (expired with the window)
         metrics = self._component_metrics[component]
         metrics['error_count'] += 1
         metrics['error_codes'][error_event['error_code']] += 1
         metrics['last_error_time'] = error_event['timestamp']
-        metrics['error_times'].append(error_event['timestamp'])
-        
-        # Maintain sliding window
-        cutoff_time = time.time() - (self.analysis_window_hours * 3600)
-        metrics['error_times'] = [
-            t for t in metrics['error_times'] if t > cutoff_time
-        ]
     
     def _calculate_component_health(self, component: str, metrics: Dict[str, Any]) -> ComponentHealth:
         """Calculate health score for a component."""
-        error_count = len(metrics['error_times'])
+        error_times = self._stream.component_times.get(component, ())
+        error_count = len(error_times)
         
         # Calculate error rate (errors per hour)
-        if metrics['error_times']:
-            time_span = max(metrics['error_times']) - min(metrics['error_times'])
+        if error_times:
+            time_span = error_times[-1] - error_times[0]
             if time_span > 0:
                 error_rate = error_count / (time_span / 3600)
             else:
@@ -754,13 +710,13 @@ class ErrorAnalytics:
         reliability_score = max(0, 1 - (error_rate / max_error_rate))
         
         # Determine trend
-        if len(metrics['error_times']) >= 4:
-            mid_point = len(metrics['error_times']) // 2
-            first_half = metrics['error_times'][:mid_point]
-            second_half = metrics['error_times'][mid_point:]
+        if error_count >= 4:
+            mid_point = error_count // 2
+            first_half = mid_point
+            second_half = error_count - mid_point
             
-            first_half_rate = len(first_half) / max(1, len(first_half))
-            second_half_rate = len(second_half) / max(1, len(second_half))
+            first_half_rate = first_half / max(1, first_half)
+            second_half_rate = second_half / max(1, second_half)
             
             if second_half_rate > first_half_rate * 1.5:
                 trend = "degrading"
@@ -788,20 +744,20 @@ class ErrorAnalytics:
     
     def _check_real_time_patterns(self, error_event: Dict[str, Any]) -> None:
         """Check for real-time pattern detection."""
-        # This is a simplified real-time check
-        # In production, you might want more sophisticated streaming analysis
-        
         current_time = time.time()
-        recent_window = current_time - 300  # Last 5 minutes
-        
-        recent_errors = [
-            error for error in self._error_history
-            if error['timestamp'] > recent_window
-        ]
-        
-        # Check for immediate frequency spikes
-        if len(recent_errors) > 10:  # More than 10 errors in 5 minutes
-            logger.warning(f"Real-time frequency spike detected: {len(recent_errors)} errors in 5 minutes")
+        recent_errors = self._stream.count_after(current_time - 300)  # Last 5 minutes
+        
+        # Check for immediate frequency spikes; warn once per spike, not per event
+        spiking = recent_errors > 10  # More than 10 errors in 5 minutes
+        if spiking and not self._realtime_spike:
+            rates = self._stream.rates(current_time)
+            logger.warning(
+                f"Real-time frequency spike detected: {recent_errors} errors in 5 minutes "
+                f"({rates['fast_per_minute']:.1f}/min vs {rates['slow_per_minute']:.1f}/min baseline)"
+            )
+        elif not spiking and self._realtime_spike:
+            logger.info("Real-time frequency spike subsided")
+        self._realtime_spike = spiking
     
     def _generate_recommendations(
         self,
@@ -0,0 +1,397 @@
+"""
+CORTEX 3.0 Error Stream
+========================
+
+Streaming aggregation core for error analytics. Every structure is
+updated per event in O(1) (amortized), and events leave the sliding
+window in time order, so ingestion stays cheap during error storms:
+
+- Time-ordered event window with amortized O(1) expiry
+- Rolling counters per error code, component, severity and
+  (component, error_code) pair
+- Hourly buckets with running sum / sum of squares (spike statistics)
+- Temporal clusters and per-minute component sequences maintained
+  as events arrive and expire
+- Exponentially weighted error rates (fast vs slow) for spike detection
+
+Out-of-order events are inserted at their sorted position; the few
+order-dependent structures (clusters, cascades) are then rebuilt lazily
+on the next read instead of per event.
+"""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+class SlidingWindow:
+    """
+    Events ordered by timestamp with amortized O(1) expiry.
+
+    Backed by a list plus a head offset (compacted once half the list is
+    expired), so expiry is a pointer bump and range counts are bisects.
+    """
+
+    def __init__(self):
+        self._events: List[Dict[str, Any]] = []
+        self._times: List[float] = []
+        self._head = 0
+
+    def __len__(self) -> int:
+        return len(self._times) - self._head
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._head, len(self._events)):
+            yield self._events[i]
+
+    def append(self, event: Dict[str, Any]) -> bool:
+        """Add an event; returns False if it arrived out of time order"""
+        timestamp = event['timestamp']
+        if not self._times or timestamp >= self._times[-1]:
+            self._events.append(event)
+            self._times.append(timestamp)
+            return True
+        index = bisect_right(self._times, timestamp, lo=self._head)
+        self._events.insert(index, event)
+        self._times.insert(index, timestamp)
+        return False
+
+    def first(self) -> Optional[Dict[str, Any]]:
+        return self._events[self._head] if len(self) else None
+
+    def last(self) -> Optional[Dict[str, Any]]:
+        return self._events[-1] if len(self) else None
+
+    def pop_expired(self, cutoff: float) -> Iterator[Dict[str, Any]]:
+        """Remove and yield events with timestamp <= cutoff, oldest first"""
+        while self._head < len(self._times) and self._times[self._head] <= cutoff:
+            event = self._events[self._head]
+            self._events[self._head] = None
+            self._head += 1
+            yield event
+        if self._head > 1024 and self._head * 2 > len(self._times):
+            del self._events[:self._head]
+            del self._times[:self._head]
+            self._head = 0
+
+    def count_after(self, timestamp: float) -> int:
+        """Events with timestamp > given time"""
+        return len(self._times) - bisect_right(self._times, timestamp, lo=self._head)
+
+    def between(self, start: float, end: float) -> Iterator[Dict[str, Any]]:
+        """Events with start < timestamp < end"""
+        lo = bisect_right(self._times, start, lo=self._head)
+        hi = bisect_left(self._times, end, lo=lo)
+        for i in range(lo, hi):
+            yield self._events[i]
+
+
+class EwmaRate:
+    """Exponentially weighted event rate (events per second)"""
+
+    def __init__(self, half_life_seconds: float):
+        self.tau = half_life_seconds / math.log(2)
+        self._rate = 0.0
+        self._updated: Optional[float] = None
+
+    def add(self, timestamp: float, weight: float = 1.0) -> None:
+        if self._updated is None:
+            self._updated = timestamp
+        if timestamp >= self._updated:
+            self._rate = self._rate * math.exp((self._updated - timestamp) / self.tau)
+            self._rate += weight / self.tau
+            self._updated = timestamp
+        else:
+            # Late event: add its contribution as already decayed
+            self._rate += weight / self.tau * math.exp((timestamp - self._updated) / self.tau)
+
+    def value(self, now: float) -> float:
+        if self._updated is None:
+            return 0.0
+        return self._rate * math.exp(min(0.0, self._updated - now) / self.tau)
+
+
+@dataclass
+class Cluster:
+    """Run of events with gaps no larger than the cluster window"""
+    start: float
+    end: float
+    count: int = 0
+    error_codes: Counter = field(default_factory=Counter)
+    components: Counter = field(default_factory=Counter)
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self.count += 1
+        self.end = max(self.end, event['timestamp'])
+        self.error_codes[event['error_code']] += 1
+        self.components[event['component']] += 1
+
+    def remove(self, event: Dict[str, Any]) -> None:
+        self.count -= 1
+        _decrement(self.error_codes, event['error_code'])
+        _decrement(self.components, event['component'])
+
+
+@dataclass
+class MinuteSequence:
+    """Errors of one cascade window, with the component sequence as runs"""
+    count: int = 0
+    first: float = 0.0
+    last: float = 0.0
+    runs: Deque[List[Any]] = field(default_factory=deque)  # [component, run length]
+    components: Counter = field(default_factory=Counter)
+
+    def add(self, event: Dict[str, Any]) -> None:
+        component = event['component']
+        if not self.count:
+            self.first = event['timestamp']
+        self.count += 1
+        self.last = event['timestamp']
+        self.components[component] += 1
+        if self.runs and self.runs[-1][0] == component:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([component, 1])
+
+    def remove_first(self, event: Dict[str, Any], next_timestamp: Optional[float]) -> None:
+        self.count -= 1
+        _decrement(self.components, event['component'])
+        self.runs[0][1] -= 1
+        if not self.runs[0][1]:
+            self.runs.popleft()
+        if next_timestamp is not None:
+            self.first = next_timestamp
+
+    @property
+    def sequence(self) -> List[str]:
+        return [component for component, _ in self.runs]
+
+
+def _decrement(counter: Counter, key: Any) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+
+class ErrorStream:
+    """
+    Incrementally maintained error statistics over a sliding time window.
+
+    Not thread-safe on its own; ErrorAnalytics guards it with its lock.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        cluster_window: float = 300,
+        cascade_window: float = 60,
+        fast_half_life: float = 300,
+        slow_half_life: float = 3600
+    ):
+        self.window_seconds = window_seconds
+        self.cluster_window = cluster_window
+        self.cascade_window = cascade_window
+
+        self.window = SlidingWindow()
+
+        # Rolling counters
+        self.by_code: Counter = Counter()
+        self.by_component: Counter = Counter()
+        self.by_severity: Counter = Counter()
+        self.component_codes: Dict[str, Counter] = {}  # (component, error_code) counts
+        self.code_times: Dict[str, Deque[float]] = {}
+        self.component_times: Dict[str, Deque[float]] = {}
+
+        # Hourly buckets for spike statistics and trends
+        self.hourly: Dict[int, int] = {}
+        self.hourly_codes: Dict[int, Counter] = {}
+        self._hour_sum = 0
+        self._hour_sumsq = 0
+
+        # Events carrying a response time, ordered by timestamp like the window
+        # (out-of-order arrivals are inserted in place, so expiry pops the front)
+        self.timed: Deque[Tuple[float, float, str]] = deque()
+
+        # Order-dependent detectors
+        self._clusters: Deque[Cluster] = deque()
+        self._minutes: Dict[int, MinuteSequence] = {}
+        self._ordered = True  # False after an out-of-order event until rebuilt
+
+        # Exponentially weighted rates
+        self.fast_rate = EwmaRate(fast_half_life)
+        self.slow_rate = EwmaRate(slow_half_life)
+
+    # ============ Updates ============
+
+    def add(self, event: Dict[str, Any]) -> None:
+        timestamp = event['timestamp']
+        in_order = self.window.append(event)
+        self._ordered = self._ordered and in_order
+
+        code = event['error_code']
+        component = event['component']
+        self.by_code[code] += 1
+        self.by_component[component] += 1
+        self.by_severity[event['severity']] += 1
+        self.component_codes.setdefault(component, Counter())[code] += 1
+        _ordered_append(self.code_times.setdefault(code, deque()), timestamp)
+        _ordered_append(self.component_times.setdefault(component, deque()), timestamp)
+
+        hour = int(timestamp // 3600)
+        count = self.hourly.get(hour, 0)
+        self.hourly[hour] = count + 1
+        self._hour_sum += 1
+        self._hour_sumsq += 2 * count + 1
+        self.hourly_codes.setdefault(hour, Counter())[code] += 1
+
+        if event.get('response_time'):
+            if in_order:
+                self.timed.append((timestamp, event['response_time'], component))
+            else:
+                insort(self.timed, (timestamp, event['response_time'], component))
+
+        if self._ordered:
+            if self._clusters and timestamp - self._clusters[-1].end <= self.cluster_window:
+                self._clusters[-1].add(event)
+            else:
+                cluster = Cluster(start=timestamp, end=timestamp)
+                cluster.add(event)
+                self._clusters.append(cluster)
+            minute = int(timestamp // self.cascade_window)
+            self._minutes.setdefault(minute, MinuteSequence()).add(event)
+
+        self.fast_rate.add(timestamp)
+        self.slow_rate.add(timestamp)
+
+    def expire(self, now: float) -> int:
+        """Drop events older than the window; returns the number removed"""
+        removed = 0
+        for event in self.window.pop_expired(now - self.window_seconds):
+            removed += 1
+            self._remove(event)
+        return removed
+
+    def _remove(self, event: Dict[str, Any]) -> None:
+        timestamp = event['timestamp']
+        code = event['error_code']
+        component = event['component']
+        _decrement(self.by_code, code)
+        _decrement(self.by_component, component)
+        _decrement(self.by_severity, event['severity'])
+        _decrement(self.component_codes[component], code)
+        if not self.component_codes[component]:
+            del self.component_codes[component]
+        for times, key in ((self.code_times, code), (self.component_times, component)):
+            times[key].popleft()
+            if not times[key]:
+                del times[key]
+
+        hour = int(timestamp // 3600)
+        count = self.hourly[hour]
+        self._hour_sum -= 1
+        self._hour_sumsq -= 2 * count - 1
+        if count == 1:
+            del self.hourly[hour]
+            del self.hourly_codes[hour]
+        else:
+            self.hourly[hour] = count - 1
+            _decrement(self.hourly_codes[hour], code)
+
+        if event.get('response_time') and self.timed:
+            self.timed.popleft()
+
+        if self._ordered:
+            following = self.window.first()
+            cluster = self._clusters[0]
+            cluster.remove(event)
+            if not cluster.count:
+                self._clusters.popleft()
+            elif following is not None:
+                cluster.start = following['timestamp']
+
+            minute = int(timestamp // self.cascade_window)
+            sequence = self._minutes[minute]
+            next_timestamp = None
+            if following is not None and int(following['timestamp'] // self.cascade_window) == minute:
+                next_timestamp = following['timestamp']
+            sequence.remove_first(event, next_timestamp)
+            if not sequence.count:
+                del self._minutes[minute]
+
+    def _rebuild_ordered(self) -> None:
+        """Recompute order-dependent detectors after out-of-order events"""
+        self._clusters.clear()
+        self._minutes.clear()
+        self._ordered = True
+        for event in self.window:
+            timestamp = event['timestamp']
+            if self._clusters and timestamp - self._clusters[-1].end <= self.cluster_window:
+                self._clusters[-1].add(event)
+            else:
+                cluster = Cluster(start=timestamp, end=timestamp)
+                cluster.add(event)
+                self._clusters.append(cluster)
+            minute = int(timestamp // self.cascade_window)
+            self._minutes.setdefault(minute, MinuteSequence()).add(event)
+
+    # ============ Reads ============
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    def clusters(self) -> List[Cluster]:
+        if not self._ordered:
+            self._rebuild_ordered()
+        return list(self._clusters)
+
+    def minute_sequences(self) -> Dict[int, MinuteSequence]:
+        if not self._ordered:
+            self._rebuild_ordered()
+        return self._minutes
+
+    def hourly_stats(self) -> Tuple[float, float]:
+        """(mean, sample stdev) of the non-empty hourly bucket counts"""
+        n = len(self.hourly)
+        if not n:
+            return 0.0, 0.0
+        mean = self._hour_sum / n
+        if n < 2:
+            return mean, 0.0
+        variance = max(0.0, (self._hour_sumsq - n * mean * mean) / (n - 1))
+        return mean, math.sqrt(variance)
+
+    def count_after(self, timestamp: float) -> int:
+        return self.window.count_after(timestamp)
+
+    def hourly_after(self, timestamp: float) -> Tuple[Dict[int, int], Counter]:
+        """Hourly counts and error code counts of events newer than timestamp"""
+        boundary_hour = int(timestamp // 3600)
+        hours: Dict[int, int] = {}
+        codes: Counter = Counter()
+        for event in self.window.between(timestamp, (boundary_hour + 1) * 3600):
+            hours[boundary_hour] = hours.get(boundary_hour, 0) + 1
+            codes[event['error_code']] += 1
+        for hour in sorted(self.hourly):
+            if hour > boundary_hour:
+                hours[hour] = self.hourly[hour]
+                codes.update(self.hourly_codes[hour])
+        return hours, codes
+
+    def rates(self, now: float) -> Dict[str, float]:
+        """Fast and slow exponentially weighted error rates (per minute)"""
+        fast = self.fast_rate.value(now) * 60
+        slow = self.slow_rate.value(now) * 60
+        return {
+            'fast_per_minute': fast,
+            'slow_per_minute': slow,
+            'spike_ratio': fast / slow if slow > 0 else 0.0
+        }
+
+
+def _ordered_append(times: Deque[float], timestamp: float) -> None:
+    if not times or timestamp >= times[-1]:
+        times.append(timestamp)
+    else:
+        insort(times, timestamp)
@@ -4,11 +4,19 @@ CORTEX 3.0 Alert System
 
 Comprehensive alerting system with multiple channels, escalation policies,
 and intelligent alert management for production monitoring.
+
+Processing is event-driven: new alerts wake the processing thread
+immediately, and pending escalations sit in a min-heap of deadlines, so the
+thread sleeps exactly until the next escalation is due (indefinitely when
+none is). Repeated alerts are deduplicated by fingerprint and suppression
+rules are looked up through a (source, severity) / fingerprint index.
 """
 
 import time
 import threading
 import asyncio
+import hashlib
+import heapq
 from typing import Dict, List, Optional, Any, Callable, Union
 from dataclasses import dataclass, field
 from enum import Enum
@@ -43,6 +51,12 @@ class AlertSeverity(Enum):
     EMERGENCY = "emergency"
 
 
+def alert_fingerprint(source: str, title: str, tags: Optional[Dict[str, str]] = None) -> str:
+    """Identity of an alert condition: same source, title and tags => same fingerprint."""
+    key = json.dumps([source, title, sorted((tags or {}).items())], default=str)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
 class AlertStatus(Enum):
     """Alert status."""
     ACTIVE = "active"
@@ -150,6 +164,9 @@ class Alert:
     escalation_step: int = 0
     last_escalation_time: Optional[float] = None
     
+    # Deduplication key (see alert_fingerprint)
+    fingerprint: Optional[str] = None
+    
     # Notification tracking
     notifications_sent: List[Dict[str, Any]] = field(default_factory=list)
     
@@ -169,6 +186,7 @@ class Alert:
             'acknowledged_at': self.acknowledged_at,
             'resolved_at': self.resolved_at,
             'escalation_step': self.escalation_step,
+            'fingerprint': self.fingerprint,
             'notifications_sent': self.notifications_sent
         }
     
@@ -208,19 +226,25 @@ class AlertSystem:
         # Alert storage
         self._alerts: Dict[str, Alert] = {}
         self._alerts_lock = threading.RLock()
+        self._active_by_fingerprint: Dict[str, Alert] = {}
         
         # Notification channels
         self._channels: Dict[str, AlertChannel] = {}
         self._escalation_policies: Dict[str, EscalationPolicy] = {}
         
-        # Alert processing
+        # Alert processing: new alerts plus a min-heap of
+        # (due time, sequence, alert, escalation step) deadlines, both
+        # guarded by a condition the processing thread sleeps on
         self._processing_active = False
         self._processing_thread: Optional[threading.Thread] = None
         self._alert_queue: List[Alert] = []
-        self._queue_lock = threading.Lock()
+        self._deadlines: List[tuple] = []
+        self._deadline_seq = 0
+        self._schedule = threading.Condition()
         
         # Suppression and grouping
         self._suppression_rules: List[Dict[str, Any]] = []
+        self._suppression_index: Dict[tuple, List[Dict[str, Any]]] = {}
         self._grouped_alerts: Dict[str, List[str]] = {}  # group_key -> alert_ids
         
         # Alert callbacks
@@ -249,7 +273,9 @@ class AlertSystem:
     
     def stop_processing(self) -> None:
         """Stop alert processing."""
-        self._processing_active = False
+        with self._schedule:
+            self._processing_active = False
+            self._schedule.notify_all()
         if self._processing_thread:
             self._processing_thread.join(timeout=5.0)
         
@@ -278,14 +304,17 @@ class AlertSystem:
             alert_id: Optional custom alert ID
             
         Returns:
-            Created alert
+            Created alert (the existing one if an active alert has the same
+            ID, or - without an explicit ID - the same fingerprint)
         """
-        if alert_id is None:
-            alert_id = f"{source}_{int(time.time() * 1000)}"
+        fingerprint = alert_fingerprint(source, title, tags)
         
-        # Check for existing active alert with same ID
+        # Check for existing active alert with same ID or fingerprint
         with self._alerts_lock:
-            existing_alert = self._alerts.get(alert_id)
+            if alert_id is not None:
+                existing_alert = self._alerts.get(alert_id)
+            else:
+                existing_alert = self._active_by_fingerprint.get(fingerprint)
             if existing_alert and existing_alert.status == AlertStatus.ACTIVE:
                 # Update existing alert
                 existing_alert.message = message
@@ -296,6 +325,9 @@ class AlertSystem:
                 if metadata:
                     existing_alert.metadata.update(metadata)
                 return existing_alert
+            
+            if alert_id is None:
+                alert_id = self._new_alert_id(source)
         
         # Create new alert
         alert = Alert(
@@ -305,7 +337,8 @@ class AlertSystem:
             severity=severity,
             source=source,
             tags=tags or {},
-            metadata=metadata or {}
+            metadata=metadata or {},
+            fingerprint=fingerprint
         )
         
         # Check suppression rules
@@ -316,10 +349,12 @@ class AlertSystem:
         # Store alert
         with self._alerts_lock:
             self._alerts[alert.id] = alert
+            self._active_by_fingerprint[fingerprint] = alert
         
-        # Queue for processing
-        with self._queue_lock:
+        # Queue for processing (wakes the processing thread)
+        with self._schedule:
             self._alert_queue.append(alert)
+            self._schedule.notify()
         
         # Notify callbacks
         for callback in self._alert_callbacks:
@@ -346,6 +381,7 @@ class AlertSystem:
             alert = self._alerts.get(alert_id)
             if alert:
                 alert.acknowledge(acknowledged_by)
+                self._forget_fingerprint(alert)
                 logger.info(f"Alert acknowledged: {alert_id} by {acknowledged_by}")
                 return True
             return False
@@ -365,6 +401,7 @@ class AlertSystem:
             alert = self._alerts.get(alert_id)
             if alert:
                 alert.resolve(resolved_by)
+                self._forget_fingerprint(alert)
                 logger.info(f"Alert resolved: {alert_id} by {resolved_by}")
                 return True
             return False
@@ -397,7 +434,8 @@ class AlertSystem:
             'severity_distribution': severity_counts,
             'top_sources': dict(sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:10]),
             'active_channels': len([ch for ch in self._channels.values() if ch.enabled]),
-            'escalation_policies': len(self._escalation_policies)
+            'escalation_policies': len(self._escalation_policies),
+            'pending_escalations': len(self._deadlines)
         }
     
     def register_channel(self, channel: AlertChannel) -> None:
@@ -421,7 +459,7 @@ class AlertSystem:
         
         Args:
             rule_name: Name of suppression rule
-            condition: Condition to match alerts (tags, source, etc.)
+            condition: Condition to match alerts (fingerprint, source, severity, tags)
             duration_minutes: How long to suppress matching alerts
         """
         rule = {
@@ -431,7 +469,9 @@ class AlertSystem:
             'created_at': time.time()
         }
         
-        self._suppression_rules.append(rule)
+        with self._alerts_lock:
+            self._suppression_rules.append(rule)
+            self._suppression_index.setdefault(self._suppression_key(condition), []).append(rule)
         logger.info(f"Added suppression rule: {rule_name}")
     
     def add_alert_callback(self, callback: Callable[[Alert], None]) -> None:
@@ -539,42 +579,108 @@ class AlertSystem:
         
         self.register_channel(channel)
     
+    def _new_alert_id(self, source: str) -> str:
+        """Timestamp-based alert ID, unique among stored alerts."""
+        base = f"{source}_{int(time.time() * 1000)}"
+        alert_id = base
+        suffix = 1
+        while alert_id in self._alerts:
+            alert_id = f"{base}_{suffix}"
+            suffix += 1
+        return alert_id
+    
+    def _forget_fingerprint(self, alert: Alert) -> None:
+        """Drop a no longer active alert from the fingerprint index."""
+        if alert.fingerprint and self._active_by_fingerprint.get(alert.fingerprint) is alert:
+            del self._active_by_fingerprint[alert.fingerprint]
+    
+    @staticmethod
+    def _suppression_key(condition: Dict[str, Any]) -> tuple:
+        """Index bucket of a suppression condition."""
+        if 'fingerprint' in condition:
+            return ('fingerprint', condition['fingerprint'])
+        return ('match', condition.get('source'), condition.get('severity'))
+    
     def _is_alert_suppressed(self, alert: Alert) -> bool:
         """Check if alert matches any suppression rules."""
         current_time = time.time()
         
-        for rule in self._suppression_rules:
-            # Check if rule has expired
-            rule_age_minutes = (current_time - rule['created_at']) / 60
-            if rule_age_minutes > rule['duration_minutes']:
-                continue
-            
-            # Check if alert matches rule condition
-            condition = rule['condition']
-            matches = True
-            
-            if 'source' in condition and alert.source != condition['source']:
-                matches = False
-            
-            if 'severity' in condition and alert.severity.value != condition['severity']:
-                matches = False
-            
-            if 'tags' in condition:
-                for key, value in condition['tags'].items():
-                    if alert.tags.get(key) != value:
-                        matches = False
-                        break
-            
-            if matches:
-                return True
+        # Only rules whose source/severity are unset or equal to the alert's can match
+        buckets = [
+            ('fingerprint', alert.fingerprint),
+            ('match', alert.source, alert.severity.value),
+            ('match', alert.source, None),
+            ('match', None, alert.severity.value),
+            ('match', None, None),
+        ]
+        
+        with self._alerts_lock:
+            for bucket in buckets:
+                rules = self._suppression_index.get(bucket)
+                if not rules:
+                    continue
+                
+                for rule in list(rules):
+                    # Drop expired rules
+                    rule_age_minutes = (current_time - rule['created_at']) / 60
+                    if rule_age_minutes > rule['duration_minutes']:
+                        rules.remove(rule)
+                        self._suppression_rules.remove(rule)
+                        continue
+                    
+                    if self._rule_matches(rule['condition'], alert):
+                        return True
         
         return False
     
+    @staticmethod
+    def _rule_matches(condition: Dict[str, Any], alert: Alert) -> bool:
+        """Check if alert matches a suppression rule condition."""
+        if 'fingerprint' in condition and alert.fingerprint != condition['fingerprint']:
+            return False
+        
+        if 'source' in condition and alert.source != condition['source']:
+            return False
+        
+        if 'severity' in condition and alert.severity.value != condition['severity']:
+            return False
+        
+        if 'tags' in condition:
+            for key, value in condition['tags'].items():
+                if alert.tags.get(key) != value:
+                    return False
+        
+        return True
+    
+    def _policy_for(self, alert: Alert) -> Optional[EscalationPolicy]:
+        """Escalation policy governing an alert."""
+        policy_name = alert.metadata.get('escalation_policy', self.default_escalation_policy or 'default')
+        return self._escalation_policies.get(policy_name)
+    
+    def _next_escalation_time(self, alert: Alert) -> Optional[float]:
+        """When the alert's next escalation step is due (None if it has no further step)."""
+        if alert.status != AlertStatus.ACTIVE:
+            return None
+        
+        policy = self._policy_for(alert)
+        if not policy or not policy.enabled or alert.escalation_step >= len(policy.escalation_steps):
+            return None
+        
+        if alert.last_escalation_time is None:
+            return alert.created_at  # First escalation is immediate
+        return alert.last_escalation_time + policy.get_delay_for_step(alert.escalation_step) * 60
+    
+    def _schedule_escalation(self, alert: Alert) -> None:
+        """Push the alert's next escalation deadline (caller holds self._schedule)."""
+        due = self._next_escalation_time(alert)
+        if due is not None:
+            self._deadline_seq += 1
+            heapq.heappush(self._deadlines, (due, self._deadline_seq, alert, alert.escalation_step))
+    
     def _process_alert(self, alert: Alert) -> None:
         """Process a single alert through escalation."""
         # Determine escalation policy
-        policy_name = alert.metadata.get('escalation_policy', self.default_escalation_policy or 'default')
-        policy = self._escalation_policies.get(policy_name)
+        policy = self._policy_for(alert)
         
         if not policy or not policy.enabled:
             logger.warning(f"No escalation policy found for alert {alert.id}")
@@ -821,32 +927,40 @@ Alert ID: {alert.id}
             logger.error(f"Failed to initialize alert storage: {e}")
     
     def _processing_loop(self) -> None:
-        """Main alert processing loop."""
+        """Main alert processing loop: sleeps until a new alert arrives or an escalation is due."""
         logger.info("Alert processing loop started")
         
-        while self._processing_active:
-            try:
-                # Process queued alerts
-                alerts_to_process = []
-                with self._queue_lock:
-                    alerts_to_process = self._alert_queue[:]
-                    self._alert_queue.clear()
+        while True:
+            with self._schedule:
+                while self._processing_active and not self._alert_queue:
+                    if self._deadlines and self._deadlines[0][0] <= time.time():
+                        break
+                    timeout = self._deadlines[0][0] - time.time() if self._deadlines else None
+                    self._schedule.wait(timeout)
                 
-                # Process new alerts
-                for alert in alerts_to_process:
-                    self._process_alert(alert)
+                if not self._processing_active:
+                    break
                 
-                # Check existing active alerts for escalation
-                active_alerts = self.get_active_alerts()
-                for alert in active_alerts:
-                    self._process_alert(alert)
+                # New alerts first, then every escalation that is due
+                alerts_to_process = self._alert_queue[:]
+                self._alert_queue.clear()
                 
-                # Wait before next check
-                time.sleep(60)  # Check every minute
+                now = time.time()
+                while self._deadlines and self._deadlines[0][0] <= now:
+                    _, _, alert, step = heapq.heappop(self._deadlines)
+                    # Skip deadlines made stale by acknowledgement, resolution,
+                    # replacement or an escalation that already happened
+                    if alert.escalation_step == step and self._alerts.get(alert.id) is alert:
+                        alerts_to_process.append(alert)
             
-            except Exception as e:
-                logger.error(f"Alert processing loop error: {e}")
-                time.sleep(60)
+            for alert in alerts_to_process:
+                try:
+                    self._process_alert(alert)
+                except Exception as e:
+                    logger.error(f"Alert processing loop error: {e}")
+                
+                with self._schedule:
+                    self._schedule_escalation(alert)
         
         logger.info("Alert processing loop stopped")
 
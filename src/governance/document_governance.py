@@ -11,12 +11,13 @@ License: Source-Available (Use Allowed, No Contributions)
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-import yaml
 import hashlib
 
+from src.utils.config_snapshots import ConfigSource, get_config_runtime
+
 
 @dataclass
 class DocumentMetadata:
@@ -65,8 +66,8 @@ class DocumentGovernance:
         self.documents_path = self.brain_path / "documents"
         self.modules_path = self.cortex_root / ".github" / "prompts" / "modules"
         
-        # Load governance rules
-        self.rules = self._load_governance_rules()
+        # Load governance rules (shared snapshot, rebuilt by the config watcher)
+        self._rules = self._load_governance_rules()
         
         # Document index (cached)
         self._document_index: Optional[Dict[str, DocumentMetadata]] = None
@@ -83,26 +84,31 @@ class DocumentGovernance:
         
         raise RuntimeError("Could not detect CORTEX root directory")
     
-    def _load_governance_rules(self) -> Dict:
+    @property
+    def rules(self) -> Mapping[str, Any]:
+        """Current governance rules snapshot (read-only, lock-free)"""
+        return self._rules.value
+    
+    def _load_governance_rules(self) -> ConfigSource:
         """Load governance rules from YAML configuration"""
         governance_file = self.brain_path / "documents" / "governance" / "documentation-governance.yaml"
         
-        if not governance_file.exists():
-            # Return minimal defaults if file doesn't exist
-            return {
-                'governance_rules': {
-                    'search_before_create': {
-                        'enabled': True,
-                        'similarity_threshold': 0.70
-                    }
-                },
-                'documentation_structure': {
-                    'fixed_categories': {}
+        return get_config_runtime().yaml_file(governance_file, default=self._default_governance_rules)
+    
+    @staticmethod
+    def _default_governance_rules() -> Dict:
+        """Minimal defaults used while the governance file doesn't exist"""
+        return {
+            'governance_rules': {
+                'search_before_create': {
+                    'enabled': True,
+                    'similarity_threshold': 0.70
                 }
+            },
+            'documentation_structure': {
+                'fixed_categories': {}
             }
-        
-        with open(governance_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        }
     
     def validate_document_creation(
         self, 
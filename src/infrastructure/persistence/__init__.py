@@ -4,5 +4,10 @@ Persistence layer: repositories, database context, connection management
 
 from .repository import IRepository
 from .unit_of_work import IUnitOfWork
+from .event_log import EventLog, RetentionPolicy, SegmentInfo, tail_jsonl
+from .materialized_stats import MaterializedStats, Stat, TableStats, day_key
+from .sqlite_maintenance import SQLiteMaintenanceEngine, MaintenancePolicy, MaintenanceReport, DatabaseHealth
 
-__all__ = ['IRepository', 'IUnitOfWork']
+__all__ = ['IRepository', 'IUnitOfWork', 'EventLog', 'RetentionPolicy', 'SegmentInfo', 'tail_jsonl',
+           'MaterializedStats', 'Stat', 'TableStats', 'day_key',
+           'SQLiteMaintenanceEngine', 'MaintenancePolicy', 'MaintenanceReport', 'DatabaseHealth']
@@ -0,0 +1,630 @@
+"""
+Segmented append-only event log
+
+JSONL event storage whose reads do not grow with history:
+- Fixed-size segments (NNNNNNNN.jsonl), rotated when full
+- Sparse time index per segment (NNNNNNNN.idx: "<epoch> <byte offset>"
+  every `index_interval_bytes`), so "since T" seeks instead of scanning
+- Buffered writer with group commit (one write/flush per batch, optional
+  fsync), flushed by size, by a short timer, on read and at exit
+- Reverse block reads for "last N" (touches only the tail blocks)
+- Retention (segment count, total bytes, age) and compaction of sealed
+  segments
+
+One writer per directory. Timestamps are read from `timestamp_field`
+(ISO string, epoch number or datetime); events without one are stamped on
+append. Time-range scans assume timestamps are non-decreasing in append
+order, which holds for logs written through this class.
+
+Legacy single-file JSONL logs can be adopted as the first segment.
+"""
+
+import atexit
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+TimeLike = Union[float, int, str, datetime]
+
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+READ_BLOCK_SIZE = 64 * 1024
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """Convert an ISO string, epoch number or datetime to epoch seconds"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def iter_lines_reversed(path: Union[str, Path], block_size: int = READ_BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield non-empty lines of a file from last to first, reading fixed-size blocks backwards"""
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b"\n")
+            # First piece may be the end of a line that starts in an earlier block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+
+def _decode(line: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def tail_jsonl(path: Union[str, Path], limit: int) -> List[Dict[str, Any]]:
+    """
+    Last `limit` valid records of a JSONL file, oldest first.
+
+    Reads backwards from the end, so cost depends on `limit`, not file size.
+    """
+    path = Path(path)
+    if limit <= 0 or not path.exists():
+        return []
+    records = []
+    for line in iter_lines_reversed(path):
+        record = _decode(line)
+        if record is not None:
+            records.append(record)
+            if len(records) >= limit:
+                break
+    records.reverse()
+    return records
+
+
+@dataclass
+class RetentionPolicy:
+    """Limits applied to sealed segments (the active segment is never removed)"""
+    max_segments: Optional[int] = None
+    max_bytes: Optional[int] = None
+    max_age_seconds: Optional[float] = None
+
+
+@dataclass
+class SegmentInfo:
+    """A segment file and the time range it covers"""
+    seq: int
+    path: Path
+    size: int
+    first_ts: Optional[float]
+    last_ts: Optional[float]
+
+
+class _SegmentIndex:
+    """Sparse (timestamp, offset) index of one segment"""
+
+    def __init__(self):
+        self.timestamps: List[float] = []
+        self.offsets: List[int] = []
+
+    @classmethod
+    def load(cls, path: Path) -> "_SegmentIndex":
+        index = cls()
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) != 2:
+                        continue
+                    try:
+                        index.add(float(parts[0]), int(parts[1]))
+                    except ValueError:
+                        continue
+        return index
+
+    def add(self, ts: float, offset: int) -> None:
+        self.timestamps.append(ts)
+        self.offsets.append(offset)
+
+    def seek_offset(self, start: float) -> int:
+        """Offset of the last indexed record strictly before `start`"""
+        position = bisect.bisect_left(self.timestamps, start) - 1
+        return self.offsets[position] if position >= 0 else 0
+
+
+_OPEN_LOGS: "weakref.WeakSet[EventLog]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_logs() -> None:
+    for event_log in list(_OPEN_LOGS):
+        try:
+            event_log.close()
+        except Exception:
+            pass
+
+
+class EventLog:
+    """
+    Segmented, time-indexed JSONL event log.
+
+    Example:
+        log = EventLog(brain / "events", retention=RetentionPolicy(max_segments=20))
+        log.append({"event": "started"})
+        recent = log.tail(5)                      # oldest first
+        last_hour = list(log.since(time.time() - 3600))
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        segment_bytes: int = 4 * 1024 * 1024,
+        index_interval_bytes: int = 16 * 1024,
+        batch_size: int = 64,
+        max_batch_delay: float = 0.5,
+        retention: Optional[RetentionPolicy] = None,
+        timestamp_field: str = "timestamp",
+        legacy_file: Optional[Union[str, Path]] = None,
+        fsync: bool = False
+    ):
+        """
+        Args:
+            directory: Segment directory (created if missing)
+            segment_bytes: Rotate the active segment once it reaches this size
+            index_interval_bytes: Bytes between sparse index entries
+            batch_size: Buffered records that trigger a group commit
+            max_batch_delay: Seconds a record may wait in the buffer (0 = write-through)
+            retention: Limits enforced on rotation and by enforce_retention()
+            timestamp_field: Event field holding the event time
+            legacy_file: Single-file JSONL log to adopt as the first segment
+            fsync: fsync after each group commit
+        """
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.index_interval_bytes = index_interval_bytes
+        self.batch_size = max(1, batch_size)
+        self.max_batch_delay = max_batch_delay
+        self.retention = retention
+        self.timestamp_field = timestamp_field
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._buffer: List[Tuple[float, bytes]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._segment_file = None
+        self._index_file = None
+        self._indexes: Dict[int, _SegmentIndex] = {}
+        self._last_ts: Dict[int, Optional[float]] = {}
+        self._closed = False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if legacy_file is not None:
+            self._adopt_legacy(Path(legacy_file))
+        self._open_active()
+        _OPEN_LOGS.add(self)
+
+    # ------------------------------------------------------------------ layout
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.directory / f"{seq:08d}{SEGMENT_SUFFIX}"
+
+    def _index_path(self, seq: int) -> Path:
+        return self.directory / f"{seq:08d}{INDEX_SUFFIX}"
+
+    def _segment_seqs(self) -> List[int]:
+        seqs = []
+        for path in self.directory.glob(f"*{SEGMENT_SUFFIX}"):
+            if path.stem.isdigit():
+                seqs.append(int(path.stem))
+        return sorted(seqs)
+
+    def _adopt_legacy(self, legacy_file: Path) -> None:
+        if not legacy_file.exists() or self._segment_seqs():
+            return
+        seq = 1
+        os.replace(legacy_file, self._segment_path(seq))
+        self._rebuild_index(seq)
+        logger.info(f"Adopted {legacy_file} as segment {seq} of {self.directory}")
+
+    def _rebuild_index(self, seq: int) -> _SegmentIndex:
+        """Scan a segment once to recreate its sparse index"""
+        index = _SegmentIndex()
+        offset = 0
+        last_indexed = None
+        last_ts = None
+        with open(self._segment_path(seq), "rb") as f:
+            for line in f:
+                record = _decode(line)
+                ts = to_epoch(record.get(self.timestamp_field)) if record else None
+                if ts is not None:
+                    if last_indexed is None or offset - last_indexed >= self.index_interval_bytes:
+                        index.add(ts, offset)
+                        last_indexed = offset
+                    last_ts = ts
+                offset += len(line)
+        with open(self._index_path(seq), "w", encoding="utf-8") as f:
+            for ts, entry_offset in zip(index.timestamps, index.offsets):
+                f.write(f"{ts} {entry_offset}\n")
+        self._indexes[seq] = index
+        self._last_ts[seq] = last_ts
+        return index
+
+    def _index(self, seq: int) -> _SegmentIndex:
+        if seq not in self._indexes:
+            if self._index_path(seq).exists() or not self._segment_path(seq).exists():
+                self._indexes[seq] = _SegmentIndex.load(self._index_path(seq))
+            else:
+                self._rebuild_index(seq)
+        return self._indexes[seq]
+
+    def _open_active(self) -> None:
+        seqs = self._segment_seqs()
+        self._active_seq = seqs[-1] if seqs else 1
+        path = self._segment_path(self._active_seq)
+        if path.exists():
+            self._truncate_torn_tail(path)
+            if not self._index_path(self._active_seq).exists():
+                self._rebuild_index(self._active_seq)
+        index = self._index(self._active_seq)
+        self._active_size = path.stat().st_size if path.exists() else 0
+        self._last_indexed_offset = index.offsets[-1] if index.offsets else None
+        self._segment_file = open(path, "ab")
+        self._index_file = open(self._index_path(self._active_seq), "a", encoding="utf-8")
+
+    @staticmethod
+    def _truncate_torn_tail(path: Path) -> None:
+        """Drop a partial last line left by an interrupted write"""
+        with open(path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            position = size
+            while position > 0:
+                step = min(READ_BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                newline = f.read(step).rfind(b"\n")
+                if newline >= 0:
+                    f.truncate(position + newline + 1)
+                    return
+            f.truncate(0)
+
+    def _rotate(self) -> None:
+        self._segment_file.close()
+        self._index_file.close()
+        self._active_seq += 1
+        self._active_size = 0
+        self._last_indexed_offset = None
+        self._indexes[self._active_seq] = _SegmentIndex()
+        self._segment_file = open(self._segment_path(self._active_seq), "ab")
+        self._index_file = open(self._index_path(self._active_seq), "a", encoding="utf-8")
+        if self.retention is not None:
+            self.enforce_retention()
+
+    # ------------------------------------------------------------------ write
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Buffer one event; it is written with the next group commit"""
+        ts = to_epoch(event.get(self.timestamp_field))
+        if ts is None:
+            now = datetime.now()
+            event = {**event, self.timestamp_field: now.isoformat()}
+            ts = now.timestamp()
+        line = (json.dumps(event, default=str) + "\n").encode("utf-8")
+
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"Event log {self.directory} is closed")
+            self._buffer.append((ts, line))
+            if len(self._buffer) >= self.batch_size or self.max_batch_delay <= 0:
+                self._commit()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_batch_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def extend(self, events: Iterable[Dict[str, Any]]) -> None:
+        for event in events:
+            self.append(event)
+
+    def flush(self) -> None:
+        """Write all buffered events now"""
+        with self._lock:
+            if not self._closed:
+                self._commit()
+
+    def _commit(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+        pending: List[bytes] = []
+        index_lines: List[str] = []
+        index = self._indexes[self._active_seq]
+
+        for ts, line in batch:
+            if self._active_size >= self.segment_bytes:
+                self._write(pending, index_lines)
+                pending, index_lines = [], []
+                self._rotate()
+                index = self._indexes[self._active_seq]
+            if (self._last_indexed_offset is None
+                    or self._active_size - self._last_indexed_offset >= self.index_interval_bytes):
+                index.add(ts, self._active_size)
+                index_lines.append(f"{ts} {self._active_size}\n")
+                self._last_indexed_offset = self._active_size
+            pending.append(line)
+            self._active_size += len(line)
+            self._last_ts[self._active_seq] = ts
+
+        self._write(pending, index_lines)
+
+    def _write(self, lines: List[bytes], index_lines: List[str]) -> None:
+        if lines:
+            self._segment_file.write(b"".join(lines))
+            self._segment_file.flush()
+            if self.fsync:
+                os.fsync(self._segment_file.fileno())
+        if index_lines:
+            self._index_file.write("".join(index_lines))
+            self._index_file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._commit()
+            self._segment_file.close()
+            self._index_file.close()
+            self._closed = True
+        _OPEN_LOGS.discard(self)
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------ read
+
+    def _segment_last_ts(self, seq: int) -> Optional[float]:
+        if seq not in self._last_ts:
+            last_ts = None
+            for line in iter_lines_reversed(self._segment_path(seq)):
+                record = _decode(line)
+                last_ts = to_epoch(record.get(self.timestamp_field)) if record else None
+                if last_ts is not None:
+                    break
+            self._last_ts[seq] = last_ts
+        return self._last_ts[seq]
+
+    def segments(self) -> List[SegmentInfo]:
+        """Segments oldest first, with their time ranges"""
+        self.flush()
+        infos = []
+        for seq in self._segment_seqs():
+            path = self._segment_path(seq)
+            index = self._index(seq)
+            infos.append(SegmentInfo(
+                seq=seq,
+                path=path,
+                size=path.stat().st_size,
+                first_ts=index.timestamps[0] if index.timestamps else None,
+                last_ts=self._segment_last_ts(seq)
+            ))
+        return infos
+
+    def iter_reverse(self) -> Iterator[Dict[str, Any]]:
+        """Events newest first; reads only as many tail blocks as consumed"""
+        self.flush()
+        for seq in reversed(self._segment_seqs()):
+            for line in iter_lines_reversed(self._segment_path(seq)):
+                record = _decode(line)
+                if record is not None:
+                    yield record
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Last `limit` events, oldest first"""
+        if limit <= 0:
+            return []
+        records = []
+        for record in self.iter_reverse():
+            records.append(record)
+            if len(records) >= limit:
+                break
+        records.reverse()
+        return records
+
+    def since(self, start: TimeLike, end: Optional[TimeLike] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Events with start <= timestamp <= end, oldest first.
+
+        Segments ending before `start` are skipped; inside a segment the
+        sparse index gives the byte offset to start reading from.
+        """
+        start_ts = to_epoch(start)
+        end_ts = to_epoch(end) if end is not None else None
+        if start_ts is None:
+            raise ValueError(f"Invalid start time: {start!r}")
+        self.flush()
+
+        for seq in self._segment_seqs():
+            last_ts = self._segment_last_ts(seq)
+            if last_ts is not None and last_ts < start_ts:
+                continue
+            index = self._index(seq)
+            if end_ts is not None and index.timestamps and index.timestamps[0] > end_ts:
+                return
+            with open(self._segment_path(seq), "rb") as f:
+                f.seek(index.seek_offset(start_ts))
+                for line in f:
+                    record = _decode(line)
+                    if record is None:
+                        continue
+                    ts = to_epoch(record.get(self.timestamp_field))
+                    if ts is None or ts < start_ts:
+                        continue
+                    if end_ts is not None and ts > end_ts:
+                        return
+                    yield record
+
+    # ------------------------------------------------------------------ maintenance
+
+    def enforce_retention(self, policy: Optional[RetentionPolicy] = None) -> List[Path]:
+        """Delete the oldest sealed segments until the policy holds"""
+        policy = policy or self.retention
+        if policy is None:
+            return []
+        with self._lock:
+            sealed = [seq for seq in self._segment_seqs() if seq != self._active_seq]
+            sizes = {seq: self._segment_path(seq).stat().st_size for seq in sealed}
+            total = sum(sizes.values()) + self._active_size
+            cutoff = time.time() - policy.max_age_seconds if policy.max_age_seconds is not None else None
+
+            removed = []
+            for seq in sealed:
+                remaining = len(sealed) - len(removed) + 1
+                over_count = policy.max_segments is not None and remaining > policy.max_segments
+                over_bytes = policy.max_bytes is not None and total > policy.max_bytes
+                last_ts = self._segment_last_ts(seq) if cutoff is not None else None
+                expired = cutoff is not None and last_ts is not None and last_ts < cutoff
+                if not (over_count or over_bytes or expired):
+                    break
+                removed.append(self._segment_path(seq))
+                total -= sizes[seq]
+                self._drop_segment(seq)
+            return removed
+
+    def _drop_segment(self, seq: int) -> None:
+        self._segment_path(seq).unlink(missing_ok=True)
+        self._index_path(seq).unlink(missing_ok=True)
+        self._indexes.pop(seq, None)
+        self._last_ts.pop(seq, None)
+
+    def compact(self, keep: Optional[Callable[[Dict[str, Any]], bool]] = None) -> int:
+        """
+        Rewrite sealed segments into as few full segments as possible.
+
+        Compacted segments are written to temporary files in the log
+        directory and fsynced. They are moved in with os.replace under
+        fresh sequence numbers past the active segment, which is renumbered
+        behind them to keep time order; the originals are removed last.
+        An interrupted compaction can leave events duplicated, never lost.
+
+        Args:
+            keep: Predicate; events for which it returns False are dropped
+
+        Returns:
+            Number of events dropped
+        """
+        with self._lock:
+            self._commit()
+            sealed = [seq for seq in self._segment_seqs() if seq != self._active_seq]
+            if not sealed:
+                return 0
+
+            # Temp files of an interrupted compaction are never live data
+            for stale in self.directory.glob("*.compact"):
+                stale.unlink(missing_ok=True)
+
+            dropped = 0
+            staged: List[Path] = []
+            out = None
+            out_size = 0
+            for seq in sealed:
+                with open(self._segment_path(seq), "rb") as f:
+                    for line in f:
+                        record = _decode(line)
+                        if record is None or (keep is not None and not keep(record)):
+                            dropped += 1
+                            continue
+                        if out is None or out_size >= self.segment_bytes:
+                            if out is not None:
+                                self._close_durable(out)
+                            # Final numbers are assigned once the output count is known
+                            staged.append(self.directory / f"{len(staged):08d}.compact")
+                            out = open(staged[-1], "wb")
+                            out_size = 0
+                        if not line.endswith(b"\n"):
+                            line += b"\n"
+                        out.write(line)
+                        out_size += len(line)
+            if out is not None:
+                self._close_durable(out)
+
+            if staged:
+                # Output can outnumber input (e.g. segment_bytes was lowered),
+                # so sealed numbers are not reused: compacted segments go
+                # after the current maximum and the active segment behind them
+                first = self._active_seq + 1
+                self._move_active(first + len(staged))
+                for offset, path in enumerate(staged):
+                    seq = first + offset
+                    os.replace(path, self._segment_path(seq))
+                    self._rebuild_index(seq)
+            for seq in sealed:
+                self._drop_segment(seq)
+            self._fsync_directory()
+            return dropped
+
+    def _move_active(self, seq: int) -> None:
+        """Renumber the active segment and its index to `seq`"""
+        self._segment_file.close()
+        self._index_file.close()
+        old_seq = self._active_seq
+        try:
+            os.replace(self._segment_path(old_seq), self._segment_path(seq))
+            self._indexes.pop(old_seq, None)
+            self._last_ts.pop(old_seq, None)
+            # If this fails the index is rebuilt from the moved segment
+            os.replace(self._index_path(old_seq), self._index_path(seq))
+        finally:
+            # Reopens whichever segment is now the highest numbered
+            self._open_active()
+
+    @staticmethod
+    def _close_durable(f) -> None:
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+
+    def _fsync_directory(self) -> None:
+        """Persist renames and unlinks in the log directory (POSIX only)"""
+        try:
+            fd = os.open(self.directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
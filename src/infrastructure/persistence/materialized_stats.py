@@ -0,0 +1,507 @@
+"""
+CORTEX Materialized Statistics
+
+Summary rows (counts, sums, group and bucket counts) for brain tables,
+maintained by SQLite triggers so dashboards and healthchecks read a
+handful of rows instead of scanning whole tables.
+
+All statistics live in one table per database:
+
+    brain_stats(source, stat, key, count, total)
+
+Each Stat contributes one row per distinct key: `count` is the number of
+source rows with that key and `total` the sum of an expression over them.
+Triggers add a row's contribution on INSERT, remove it on DELETE and do
+both on UPDATE, inside the writer's own transaction. reconcile()
+recomputes everything with GROUP BY queries and repairs drift (rows
+written before the triggers existed, bulk loads with triggers disabled).
+
+Stat SQL uses `{row}` for the row being counted, e.g. "{row}.pattern_type".
+A Stat with distinct=True also keeps the number of keys with a non-zero
+count in one extra row ("<stat>:keys"), so "how many conversations have
+messages" is a single-row read rather than one row per key.
+
+Example:
+    specs = [TableStats("patterns", (
+        Stat("rows"),
+        Stat("by_type", key="{row}.pattern_type"),
+        Stat("pinned", where="{row}.is_pinned = 1"),
+    ))]
+    stats = MaterializedStats(conn, specs)
+    stats.install()                       # explicit opt-in; load() never writes
+    stats.count("patterns")               # O(1)
+    stats.groups("patterns", "by_type")   # {'workflow': 12, ...}
+    stats.distinct("patterns", "by_type") # O(1) with distinct=True
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+License: Proprietary - See LICENSE file for terms
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATS_TABLE = "brain_stats"
+META_TABLE = "brain_stats_meta"
+
+_ROW_COLUMN = re.compile(r"\{row\}\.(\w+)")
+
+
+def day_key(column: str) -> str:
+    """Stat key SQL bucketing a timestamp column (ISO text or epoch seconds) by day"""
+    return (
+        f"date(CASE WHEN typeof({{row}}.{column}) IN ('integer', 'real') "
+        f"THEN datetime({{row}}.{column}, 'unixepoch') ELSE {{row}}.{column} END)"
+    )
+
+
+@dataclass(frozen=True)
+class Stat:
+    """One statistic over a table: rows grouped by `key`, filtered by `where`"""
+    name: str
+    key: str = "''"
+    where: Optional[str] = None
+    total: str = "0"
+    distinct: bool = False
+
+    @property
+    def keys_name(self) -> str:
+        """Name of the row counting this stat's non-empty keys (distinct=True)"""
+        return f"{self.name}:keys"
+
+    def render(self, row: str) -> Tuple[str, str, str]:
+        """(key, where, total) SQL for a row alias (NEW, OLD or a table alias)"""
+        key = f"COALESCE(CAST(({self.key.format(row=row)}) AS TEXT), '')"
+        where = self.where.format(row=row) if self.where else "1"
+        total = f"COALESCE(({self.total.format(row=row)}), 0)"
+        return key, where, total
+
+
+@dataclass(frozen=True)
+class TableStats:
+    """Statistics maintained for one table"""
+    table: str
+    stats: Tuple[Stat, ...]
+
+    @property
+    def columns(self) -> FrozenSet[str]:
+        """Source columns referenced as {row}.<column> by the stats"""
+        return frozenset(
+            column
+            for stat in self.stats
+            for sql in (stat.key, stat.where or "", stat.total)
+            for column in _ROW_COLUMN.findall(sql)
+        )
+
+    @property
+    def signature(self) -> str:
+        text = repr((self.table, self.stats))
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class MaterializedStats:
+    """
+    Trigger-maintained statistics for one SQLite database.
+
+    load() never writes: tables whose triggers are installed and current are
+    read from the stats rows, every other table from a snapshot computed
+    with the reconcile queries. install() is the explicit opt-in that
+    creates the triggers; it skips specs naming columns the source table
+    doesn't have, and creates each table's triggers and backfill in one
+    transaction, so a failure leaves the table untouched.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        specs: Sequence[TableStats],
+        reconcile_interval: timedelta = timedelta(hours=24)
+    ):
+        self.conn = conn
+        self.specs = {spec.table: spec for spec in specs}
+        self.reconcile_interval = reconcile_interval
+        self.installed = False
+        self.skipped: Dict[str, List[str]] = {}
+        self._present: set = set()
+        self._live: set = set()
+        self._available: set = set()
+        self._snapshot: Dict[Tuple[str, str, str], Tuple[int, float]] = {}
+
+    # ============ Setup ============
+
+    def load(self) -> bool:
+        """
+        Open the statistics without writing to the database.
+
+        Returns:
+            True if every usable table is trigger-maintained
+        """
+        self._discover()
+        usable = self._usable()
+        meta = self._read_meta()
+        triggers = self._existing_triggers()
+
+        self._live = {
+            table for table in usable
+            if meta.get(table, (None, None))[0] == self.specs[table].signature
+            and all(name in triggers for name in self._trigger_names(table))
+        }
+        self._snapshot = {}
+        self._available = set(self._live)
+        for table in sorted(usable - self._live):
+            try:
+                self._snapshot.update(self._compute([table]))
+                self._available.add(table)
+            except sqlite3.Error as e:
+                logger.warning(f"Statistics for {table} unavailable: {e}")
+
+        self.installed = bool(usable) and self._live == usable
+        return self.installed
+
+    def install(self) -> bool:
+        """
+        Create the stats tables and triggers for every usable source table.
+
+        New or changed specs are backfilled in the same transaction as their
+        triggers; the rest are reconciled when reconcile_interval has
+        elapsed. Specs referencing missing columns are skipped (and stale
+        triggers for them dropped).
+
+        Returns:
+            True if statistics are trigger-maintained, False if using a snapshot
+        """
+        self._discover()
+        try:
+            with self._transaction():
+                self.conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+                        source TEXT NOT NULL,
+                        stat TEXT NOT NULL,
+                        key TEXT NOT NULL DEFAULT '',
+                        count INTEGER NOT NULL DEFAULT 0,
+                        total REAL NOT NULL DEFAULT 0,
+                        PRIMARY KEY (source, stat, key)
+                    )
+                """)
+                self.conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {META_TABLE} (
+                        source TEXT PRIMARY KEY,
+                        signature TEXT NOT NULL,
+                        reconciled_at TEXT
+                    )
+                """)
+        except sqlite3.Error as e:
+            logger.debug(f"Materialized stats unavailable ({e}); using snapshot")
+            return self.load()
+
+        meta = self._read_meta()
+        triggers = self._existing_triggers()
+        now = datetime.now().isoformat()
+        due_before = (datetime.now() - self.reconcile_interval).isoformat()
+
+        for table, spec in self.specs.items():
+            if table not in self._present:
+                continue
+            try:
+                if table in self.skipped:
+                    if table in meta or any(name in triggers for name in self._trigger_names(table)):
+                        with self._transaction():
+                            self._drop_triggers(table)
+                            self.conn.execute(f"DELETE FROM {STATS_TABLE} WHERE source = ?", (table,))
+                            self.conn.execute(f"DELETE FROM {META_TABLE} WHERE source = ?", (table,))
+                    logger.warning(
+                        f"Materialized stats for {table} skipped; missing columns: "
+                        f"{', '.join(self.skipped[table])}"
+                    )
+                    continue
+
+                signature, reconciled_at = meta.get(table, (None, None))
+                if signature != spec.signature:
+                    with self._transaction():
+                        self._create_triggers(spec)
+                        self._reconcile_table(spec, now)
+                elif not reconciled_at or reconciled_at < due_before:
+                    with self._transaction():
+                        self._reconcile_table(spec, now)
+            except sqlite3.Error as e:
+                logger.warning(f"Materialized stats for {table} not installed: {e}")
+
+        return self.load()
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Savepoint covering DDL too (the sqlite3 module runs CREATE TRIGGER
+        in autocommit), rolled back on any error.
+        """
+        self.conn.execute("SAVEPOINT brain_stats")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK TO brain_stats")
+            self.conn.execute("RELEASE brain_stats")
+            raise
+        self.conn.execute("RELEASE brain_stats")
+
+    def _discover(self) -> None:
+        self._present = self._existing_tables()
+        self.skipped = {}
+        for table, spec in self.specs.items():
+            if table not in self._present:
+                continue
+            columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            missing = sorted(spec.columns - columns)
+            if missing:
+                self.skipped[table] = missing
+
+    def _usable(self) -> set:
+        return {table for table in self.specs if table in self._present and table not in self.skipped}
+
+    def _existing_tables(self) -> set:
+        rows = self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        return {row[0] for row in rows}
+
+    def _existing_triggers(self) -> set:
+        rows = self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        return {row[0] for row in rows}
+
+    def _read_meta(self) -> Dict[str, Tuple[str, Optional[str]]]:
+        if META_TABLE not in self._existing_tables():
+            return {}
+        return {
+            source: (signature, reconciled_at)
+            for source, signature, reconciled_at
+            in self.conn.execute(f"SELECT source, signature, reconciled_at FROM {META_TABLE}")
+        }
+
+    @staticmethod
+    def _trigger_names(table: str) -> Tuple[str, ...]:
+        return tuple(f"{STATS_TABLE}_{table}_{event}" for event in ("insert", "delete", "update"))
+
+    def _drop_triggers(self, table: str) -> None:
+        for name in self._trigger_names(table):
+            self.conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    def _create_triggers(self, spec: TableStats) -> None:
+        table = spec.table
+        self._drop_triggers(table)
+
+        def upsert(stat: Stat, row: str, sign: str) -> str:
+            key, where, total = stat.render(row)
+            return (
+                f"INSERT INTO {STATS_TABLE} (source, stat, key, count, total) "
+                f"SELECT '{table}', '{stat.name}', {key}, {sign}1, {sign}{total} WHERE {where} "
+                f"ON CONFLICT(source, stat, key) DO UPDATE SET "
+                f"count = count + excluded.count, total = total + excluded.total;"
+            )
+
+        def track_key(stat: Stat, row: str, sign: str, present: int) -> str:
+            # After the upsert, a key whose count became 1 (added) or 0
+            # (removed) changed the number of distinct keys
+            if not stat.distinct:
+                return ""
+            key, where, _total = stat.render(row)
+            return (
+                f"INSERT INTO {STATS_TABLE} (source, stat, key, count, total) "
+                f"SELECT '{table}', '{stat.keys_name}', '', {sign}1, 0 WHERE {where} "
+                f"AND (SELECT count FROM {STATS_TABLE} WHERE source = '{table}' "
+                f"AND stat = '{stat.name}' AND key = {key}) = {present} "
+                f"ON CONFLICT(source, stat, key) DO UPDATE SET count = count + excluded.count;"
+            )
+
+        add = "\n".join(
+            upsert(stat, "NEW", "") + track_key(stat, "NEW", "", 1) for stat in spec.stats
+        )
+        remove = "\n".join(
+            upsert(stat, "OLD", "-") + track_key(stat, "OLD", "-", 0) for stat in spec.stats
+        )
+
+        self.conn.execute(f"""
+            CREATE TRIGGER {STATS_TABLE}_{table}_insert AFTER INSERT ON {table} BEGIN
+            {add}
+            END
+        """)
+        self.conn.execute(f"""
+            CREATE TRIGGER {STATS_TABLE}_{table}_delete AFTER DELETE ON {table} BEGIN
+            {remove}
+            END
+        """)
+        self.conn.execute(f"""
+            CREATE TRIGGER {STATS_TABLE}_{table}_update AFTER UPDATE ON {table} BEGIN
+            {remove}
+            {add}
+            END
+        """)
+
+    # ============ Reconcile ============
+
+    def _aggregate(self, spec: TableStats) -> Iterable[Tuple[str, str, int, float]]:
+        for stat in spec.stats:
+            key, where, total = stat.render("r")
+            rows = self.conn.execute(
+                f"SELECT {key}, COUNT(*), SUM({total}) FROM {spec.table} AS r "
+                f"WHERE {where} GROUP BY 1"
+            )
+            keys = 0
+            for key_value, count, total_value in rows:
+                keys += 1
+                yield stat.name, key_value, count, total_value or 0.0
+            if stat.distinct and keys:
+                yield stat.keys_name, "", keys, 0.0
+
+    def _compute(self, tables: Iterable[str]) -> Dict[Tuple[str, str, str], Tuple[int, float]]:
+        return {
+            (table, stat, key): (count, total)
+            for table in tables
+            for stat, key, count, total in self._aggregate(self.specs[table])
+        }
+
+    def reconcile(self, tables: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Recompute statistics from the source tables and repair drift.
+
+        Args:
+            tables: Tables to reconcile (default: all usable)
+
+        Returns:
+            Number of drifted stat rows per table (0 = triggers were exact)
+        """
+        usable = self._usable()
+        tables = [t for t in (tables or self.specs) if t in usable]
+        drift: Dict[str, int] = {}
+        now = datetime.now().isoformat()
+
+        for table in tables:
+            with self._transaction():
+                drift[table] = self._reconcile_table(self.specs[table], now)
+
+        return drift
+
+    def _reconcile_table(self, spec: TableStats, now: str) -> int:
+        table = spec.table
+        actual = {
+            (stat, key): (count, total)
+            for stat, key, count, total in self._aggregate(spec)
+        }
+        stored = {
+            (stat, key): (count, total)
+            for stat, key, count, total in self.conn.execute(
+                f"SELECT stat, key, count, total FROM {STATS_TABLE} "
+                f"WHERE source = ? AND count != 0",
+                (table,)
+            )
+        }
+        drifted = {
+            item for item in actual.keys() | stored.keys()
+            if not self._same(actual.get(item), stored.get(item))
+        }
+
+        if drifted:
+            self.conn.execute(f"DELETE FROM {STATS_TABLE} WHERE source = ?", (table,))
+            self.conn.executemany(
+                f"INSERT INTO {STATS_TABLE} (source, stat, key, count, total) "
+                f"VALUES (?, ?, ?, ?, ?)",
+                [(table, stat, key, count, total) for (stat, key), (count, total) in actual.items()]
+            )
+            logger.info(f"Reconciled {len(drifted)} drifted stats for {table}")
+        else:
+            # Groups that dropped to zero are dead weight
+            self.conn.execute(
+                f"DELETE FROM {STATS_TABLE} WHERE source = ? AND count = 0", (table,)
+            )
+
+        self.conn.execute(
+            f"INSERT INTO {META_TABLE} (source, signature, reconciled_at) VALUES (?, ?, ?) "
+            f"ON CONFLICT(source) DO UPDATE SET signature = excluded.signature, "
+            f"reconciled_at = excluded.reconciled_at",
+            (table, spec.signature, now)
+        )
+        return len(drifted)
+
+    @staticmethod
+    def _same(a: Optional[Tuple[int, float]], b: Optional[Tuple[int, float]]) -> bool:
+        a = a or (0, 0.0)
+        b = b or (0, 0.0)
+        return a[0] == b[0] and abs(a[1] - b[1]) <= 1e-6 * max(1.0, abs(a[1]))
+
+    # ============ Readers ============
+
+    def has(self, table: str) -> bool:
+        """True if statistics for the source table can be read"""
+        return table in self._available
+
+    def require(self, table: str) -> None:
+        """Raise like a query on a missing table (or column) would"""
+        if table in self.skipped:
+            raise sqlite3.OperationalError(f"no such column: {table}.{self.skipped[table][0]}")
+        if not self.has(table):
+            raise sqlite3.OperationalError(f"no such table: {table}")
+
+    def _rows(self, table: str, stat: str) -> Dict[str, Tuple[int, float]]:
+        if table not in self._live:
+            return {
+                key: value for (source, name, key), value in self._snapshot.items()
+                if source == table and name == stat and value[0]
+            }
+        return {
+            key: (count, total)
+            for key, count, total in self.conn.execute(
+                f"SELECT key, count, total FROM {STATS_TABLE} "
+                f"WHERE source = ? AND stat = ? AND count != 0",
+                (table, stat)
+            )
+        }
+
+    def _row(self, table: str, stat: str, key: str) -> Tuple[int, float]:
+        if table not in self._live:
+            return self._snapshot.get((table, stat, key), (0, 0.0))
+        row = self.conn.execute(
+            f"SELECT count, total FROM {STATS_TABLE} WHERE source = ? AND stat = ? AND key = ?",
+            (table, stat, key)
+        ).fetchone()
+        return (row[0], row[1]) if row else (0, 0.0)
+
+    def count(self, table: str, stat: str = "rows", key: str = "") -> int:
+        return self._row(table, stat, key)[0]
+
+    def total(self, table: str, stat: str, key: str = "") -> float:
+        return self._row(table, stat, key)[1]
+
+    def distinct(self, table: str, stat: str) -> int:
+        """Number of keys with a non-zero count (O(1) for distinct=True stats)"""
+        spec = self.specs.get(table)
+        if spec and any(s.name == stat and s.distinct for s in spec.stats):
+            return self.count(table, f"{stat}:keys")
+        return len(self._rows(table, stat))
+
+    def groups(self, table: str, stat: str) -> Dict[str, int]:
+        """Count per key, largest first"""
+        rows = self._rows(table, stat)
+        return dict(sorted(((key, value[0]) for key, value in rows.items()), key=lambda kv: -kv[1]))
+
+    def since(self, table: str, stat: str, days: int) -> Tuple[int, float]:
+        """(count, total) of a day-keyed stat over the last `days` days"""
+        start = (date.today() - timedelta(days=days)).isoformat()
+        if table in self._live:
+            # Range over the (source, stat, key) primary key: one row per day in the window
+            count, total = self.conn.execute(
+                f"SELECT COALESCE(SUM(count), 0), COALESCE(SUM(total), 0) FROM {STATS_TABLE} "
+                f"WHERE source = ? AND stat = ? AND key >= ?",
+                (table, stat, start)
+            ).fetchone()
+            return count, total
+        count = 0
+        total = 0.0
+        for key, (key_count, key_total) in self._rows(table, stat).items():
+            if key and key >= start:
+                count += key_count
+                total += key_total
+        return count, total
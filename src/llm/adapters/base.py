@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 from ..types import LLMCaps, LLMGenerationSettings, LLMResponse
 
@@ -28,3 +28,34 @@ class LLMProviderAdapter(ABC):
     ) -> LLMResponse:
         """Generate a response for the given prompt and settings."""
         raise NotImplementedError
+
+    def stream(
+        self,
+        prompt_text: str,
+        generation: Optional[LLMGenerationSettings] = None,
+        tools_schema: Optional[Dict] = None,
+        system_text: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield response text incrementally.
+
+        Default implementation generates the full response and re-chunks it
+        word by word; providers with native streaming should override.
+        """
+        response = self.generate(
+            prompt_text=prompt_text,
+            generation=generation,
+            tools_schema=tools_schema,
+            system_text=system_text,
+        )
+        yield from split_stream_chunks(response.text)
+
+
+def split_stream_chunks(text: str) -> Iterator[str]:
+    """Split text into word chunks that concatenate back to the original."""
+    start = 0
+    for index, char in enumerate(text):
+        if char == " " and index > start:
+            yield text[start:index + 1]
+            start = index + 1
+    if start < len(text):
+        yield text[start:]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+from .base import LLMProviderAdapter, split_stream_chunks
+from ..types import LLMCaps, LLMGenerationSettings, LLMResponse, TransportFailure
+
+
+class SimulatedAdapter(LLMProviderAdapter):
+    """Deterministic offline stand-in with configurable latency and failure rate.
+
+    Config keys:
+        latency_ms: base latency per request (default 50)
+        jitter_ms: uniform jitter added on top of latency (default 0)
+        tail_ms / tail_rate: extra latency applied to a fraction of requests,
+            to simulate slow p95/p99 tails (default 0 / 0.0)
+        failure_rate: probability a request raises TransportFailure (default 0.0)
+        chunk_delay_ms: delay between streamed chunks (default 0)
+        seed: RNG seed; identical seeds replay identical latency/failure sequences
+        sleep: set False to report latency without actually sleeping
+    """
+
+    PROVIDER_NAME = "simulated"
+
+    def __init__(self, model: Optional[str] = None, config: Optional[Dict] = None):
+        super().__init__(model=model, config=config)
+        self._rng = random.Random(self.config.get("seed", 0))
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def detect_capabilities(self) -> LLMCaps:
+        return LLMCaps(
+            max_context_tokens=32768,
+            max_output_tokens=2048,
+            tool_call_support=self.config.get("tool_call_support", "basic"),
+            function_call_format="json-in-text",
+            streaming=True,
+            json_mode=False,
+            reasoning=False,
+            availability="variable",
+        )
+
+    def _plan_request(self) -> tuple[float, bool]:
+        """Draw (latency_ms, fails) from the seeded RNG."""
+        cfg = self.config
+        with self._lock:
+            self.calls += 1
+            latency = float(cfg.get("latency_ms", 50.0))
+            latency += self._rng.uniform(0.0, float(cfg.get("jitter_ms", 0.0)))
+            if self._rng.random() < float(cfg.get("tail_rate", 0.0)):
+                latency += float(cfg.get("tail_ms", 0.0))
+            fails = self._rng.random() < float(cfg.get("failure_rate", 0.0))
+        return latency, fails
+
+    def _wait(self, latency_ms: float) -> None:
+        if self.config.get("sleep", True) and latency_ms > 0:
+            time.sleep(latency_ms / 1000.0)
+
+    def generate(
+        self,
+        prompt_text: str,
+        generation: Optional[LLMGenerationSettings] = None,
+        tools_schema: Optional[Dict] = None,
+        system_text: Optional[str] = None,
+    ) -> LLMResponse:
+        latency, fails = self._plan_request()
+        self._wait(latency)
+        if fails:
+            raise TransportFailure(f"simulated failure after {latency:.1f}ms")
+        text = f"[simulated:{self.model or 'stand-in'}] {prompt_text[:200]}"
+        return LLMResponse(
+            text=text,
+            token_usage={"prompt": len(prompt_text.split()), "completion": len(text.split())},
+            latency_ms={"total": latency},
+            confidence_state="high",
+        )
+
+    def stream(
+        self,
+        prompt_text: str,
+        generation: Optional[LLMGenerationSettings] = None,
+        tools_schema: Optional[Dict] = None,
+        system_text: Optional[str] = None,
+    ) -> Iterator[str]:
+        latency, fails = self._plan_request()
+        # Time to first token, then per-chunk pacing
+        self._wait(latency)
+        if fails:
+            raise TransportFailure(f"simulated failure after {latency:.1f}ms")
+        text = f"[simulated:{self.model or 'stand-in'}] {prompt_text[:200]}"
+        chunk_delay = float(self.config.get("chunk_delay_ms", 0.0))
+        for chunk in split_stream_chunks(text):
+            self._wait(chunk_delay)
+            yield chunk
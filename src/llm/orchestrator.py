@@ -1,35 +1,107 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Type
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, Type
 
-from .types import LLMGenerationSettings, LLMResponse, LLMCaps
+from .types import (
+    LLMGenerationSettings,
+    LLMResponse,
+    LLMCaps,
+    LLMStreamChunk,
+    RateLimitExceeded,
+)
 from .adapters.base import LLMProviderAdapter
 from .adapters.openai_adapter import OpenAIAdapter
 from .adapters.anthropic_adapter import AnthropicAdapter
 from .adapters.local_adapter import LocalAdapter
+from .adapters.simulated_adapter import SimulatedAdapter
+from .rate_limiter import TokenBucket
+from .response_cache import ResponseCache, cache_key
 
 
 ADAPTER_REGISTRY: Dict[str, Type[LLMProviderAdapter]] = {
     OpenAIAdapter.PROVIDER_NAME: OpenAIAdapter,
     AnthropicAdapter.PROVIDER_NAME: AnthropicAdapter,
     LocalAdapter.PROVIDER_NAME: LocalAdapter,
+    SimulatedAdapter.PROVIDER_NAME: SimulatedAdapter,
 }
 
 
+class LatencyTracker:
+    """Rolling per-provider latency window used to derive the hedge delay."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, latency_ms: float) -> None:
+        with self._lock:
+            self._samples.setdefault(provider, deque(maxlen=self.window)).append(latency_ms)
+
+    def count(self, provider: str) -> int:
+        return len(self._samples.get(provider, ()))
+
+    def percentile(self, provider: str, pct: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(pct * (len(samples) - 1)))))
+        return samples[index]
+
+
 class LLMOrchestrator:
-    """Selects appropriate adapter and applies fallback strategy."""
+    """Selects appropriate adapter and applies fallback strategy.
+
+    Optional layers, all off unless configured:
+    - response cache keyed by (normalized prompt, model, settings)
+    - hedged requests: the next provider starts once the current one has
+      run longer than its observed p95 (or `hedge_delay_ms`)
+    - per-provider token-bucket rate limits; a limited provider is skipped
+    """
 
-    def __init__(self, primary_provider: str, fallback_chain: Optional[List[str]] = None):
-        if primary_provider not in ADAPTER_REGISTRY:
+    def __init__(
+        self,
+        primary_provider: str,
+        fallback_chain: Optional[List[str]] = None,
+        adapters: Optional[Dict[str, LLMProviderAdapter]] = None,
+        cache: Optional[ResponseCache] = None,
+        hedge: bool = False,
+        hedge_delay_ms: Optional[float] = None,
+        hedge_percentile: float = 0.95,
+        hedge_min_samples: int = 20,
+        hedge_default_ms: float = 500.0,
+        rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        max_workers: int = 4,
+    ):
+        self._adapters: Dict[str, LLMProviderAdapter] = dict(adapters or {})
+        if primary_provider not in ADAPTER_REGISTRY and primary_provider not in self._adapters:
             raise ValueError(f"Unknown provider: {primary_provider}")
         self.primary_provider = primary_provider
         self.fallback_chain = fallback_chain or ["local"]
-        self._adapters: Dict[str, LLMProviderAdapter] = {}
+        self.cache = cache
+        self.hedge = hedge
+        self.hedge_delay_ms = hedge_delay_ms
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_default_ms = hedge_default_ms
+        # provider -> (tokens per second, burst capacity)
+        self.rate_limiters: Dict[str, TokenBucket] = {
+            provider: TokenBucket(rate, burst) for provider, (rate, burst) in (rate_limits or {}).items()
+        }
+        self.latency = LatencyTracker()
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hedges_launched = 0
 
     def _get_adapter(self, provider: str) -> LLMProviderAdapter:
-        if provider not in ADAPTER_REGISTRY:
-            raise ValueError(f"Unknown provider: {provider}")
         if provider not in self._adapters:
+            if provider not in ADAPTER_REGISTRY:
+                raise ValueError(f"Unknown provider: {provider}")
             adapter_cls = ADAPTER_REGISTRY[provider]
             self._adapters[provider] = adapter_cls()
         return self._adapters[provider]
@@ -39,6 +111,64 @@ class LLMOrchestrator:
         adapter = self._get_adapter(provider)
         return adapter.detect_capabilities()
 
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    # ------------------------------------------------------------------ helpers
+
+    def _providers(self, tools_schema: Optional[Dict]) -> List[str]:
+        providers = [self.primary_provider] + [p for p in self.fallback_chain if p != self.primary_provider]
+        eligible = []
+        for provider in providers:
+            caps = self._get_adapter(provider).detect_capabilities()
+            # Basic compatibility guard: tool schema requested but provider cannot handle
+            if tools_schema and caps.tool_call_support == "none":
+                continue
+            eligible.append(provider)
+        return eligible
+
+    def _admit(self, provider: str) -> bool:
+        limiter = self.rate_limiters.get(provider)
+        return limiter is None or limiter.try_acquire()
+
+    def _cache_key(self, prompt_text, generation, tools_schema, system_text) -> str:
+        adapter = self._get_adapter(self.primary_provider)
+        model = f"{self.primary_provider}:{adapter.model or 'default'}"
+        return cache_key(prompt_text, model, generation, tools_schema, system_text)
+
+    def _store(self, key: Optional[str], response: LLMResponse) -> None:
+        # Degraded fallback answers are not worth replaying for the whole TTL
+        if key is not None and response.confidence_state == "high":
+            self.cache.put(key, response)
+
+    def _finish(self, provider: str, response: LLMResponse) -> LLMResponse:
+        if provider != self.primary_provider:
+            response.confidence_state = "degraded"
+        return response
+
+    def _call(self, provider: str, prompt_text, generation, tools_schema, system_text) -> LLMResponse:
+        start = time.perf_counter()
+        response = self._get_adapter(provider).generate(
+            prompt_text=prompt_text,
+            generation=generation,
+            tools_schema=tools_schema,
+            system_text=system_text,
+        )
+        self.latency.record(provider, (time.perf_counter() - start) * 1000.0)
+        return response
+
+    def hedge_delay(self, provider: str) -> float:
+        """Milliseconds to wait on `provider` before starting the next one."""
+        if self.hedge_delay_ms is not None:
+            return self.hedge_delay_ms
+        if self.latency.count(provider) >= self.hedge_min_samples:
+            return self.latency.percentile(provider, self.hedge_percentile)
+        return self.hedge_default_ms
+
+    # ------------------------------------------------------------------ generate
+
     def generate(
         self,
         prompt_text: str,
@@ -46,29 +176,146 @@ class LLMOrchestrator:
         tools_schema: Optional[Dict] = None,
         system_text: Optional[str] = None,
     ) -> LLMResponse:
-        providers_to_try = [self.primary_provider] + [p for p in self.fallback_chain if p != self.primary_provider]
-        last_error: Optional[Exception] = None
+        key = None
+        if self.cache is not None:
+            key = self._cache_key(prompt_text, generation, tools_schema, system_text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
 
-        for provider in providers_to_try:
-            adapter = self._get_adapter(provider)
-            caps = adapter.detect_capabilities()
+        providers = self._providers(tools_schema)
+        args = (prompt_text, generation, tools_schema, system_text)
+        if self.hedge:
+            provider, response = self._generate_hedged(providers, args)
+        else:
+            provider, response = self._generate_sequential(providers, args)
 
-            # Basic compatibility guard: tool schema requested but provider cannot handle
-            if tools_schema and caps.tool_call_support == "none":
-                continue  # try next provider
+        response = self._finish(provider, response)
+        if self.cache is not None:
+            self._store(key, response)
+        return response
 
+    def _generate_sequential(self, providers: List[str], args) -> Tuple[str, LLMResponse]:
+        last_error: Optional[Exception] = None
+        for provider in providers:
+            if not self._admit(provider):
+                last_error = RateLimitExceeded(f"{provider} rate limit reached")
+                continue
             try:
-                response = adapter.generate(
-                    prompt_text=prompt_text,
-                    generation=generation,
-                    tools_schema=tools_schema,
-                    system_text=system_text,
-                )
-                if provider != self.primary_provider:
-                    response.confidence_state = "degraded"
-                return response
+                return provider, self._call(provider, *args)
             except Exception as exc:  # broad catch for stub stage
                 last_error = exc
                 continue
+        raise RuntimeError(f"All providers failed. Last error: {last_error}")
+
+    def _generate_hedged(self, providers: List[str], args) -> Tuple[str, LLMResponse]:
+        """Race providers: start the next one when the newest exceeds its hedge delay
+        or fails; return the first success. Losers run to completion in the
+        background and their results are discarded.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="llm-hedge")
+
+        queue = list(providers)
+        pending: Dict[Future, str] = {}
+        last_error: Optional[Exception] = None
+        newest: Optional[str] = None
+
+        def launch() -> bool:
+            nonlocal last_error, newest
+            while queue:
+                provider = queue.pop(0)
+                if not self._admit(provider):
+                    last_error = RateLimitExceeded(f"{provider} rate limit reached")
+                    continue
+                pending[self._executor.submit(self._call, provider, *args)] = provider
+                newest = provider
+                return True
+            return False
+
+        launch()
+        while pending:
+            timeout = self.hedge_delay(newest) / 1000.0 if queue else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if launch():
+                    self.hedges_launched += 1
+                continue
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    return provider, future.result()
+                except Exception as exc:
+                    last_error = exc
+            if not pending:
+                launch()
+
+        raise RuntimeError(f"All providers failed. Last error: {last_error}")
+
+    # ------------------------------------------------------------------ stream
+
+    def stream(
+        self,
+        prompt_text: str,
+        generation: Optional[LLMGenerationSettings] = None,
+        tools_schema: Optional[Dict] = None,
+        system_text: Optional[str] = None,
+    ) -> Iterator[LLMStreamChunk]:
+        """Yield the response incrementally; the last chunk carries the full LLMResponse.
+
+        Falls back to the next provider only if a provider fails before its
+        first chunk; a failure mid-stream is raised to the caller.
+        """
+        key = None
+        if self.cache is not None:
+            key = self._cache_key(prompt_text, generation, tools_schema, system_text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield LLMStreamChunk(delta=cached.text, index=0, provider=self.primary_provider,
+                                     done=True, cached=True, response=cached)
+                return
+
+        last_error: Optional[Exception] = None
+        for provider in self._providers(tools_schema):
+            if not self._admit(provider):
+                last_error = RateLimitExceeded(f"{provider} rate limit reached")
+                continue
+            start = time.perf_counter()
+            chunks = self._get_adapter(provider).stream(
+                prompt_text=prompt_text,
+                generation=generation,
+                tools_schema=tools_schema,
+                system_text=system_text,
+            )
+            try:
+                first = next(chunks)
+            except StopIteration:
+                first = ""
+            except Exception as exc:
+                last_error = exc
+                continue
+
+            first_token_ms = (time.perf_counter() - start) * 1000.0
+            parts = [first]
+            index = 0
+            yield LLMStreamChunk(delta=first, index=index, provider=provider)
+            for delta in chunks:
+                index += 1
+                parts.append(delta)
+                yield LLMStreamChunk(delta=delta, index=index, provider=provider)
+
+            total_ms = (time.perf_counter() - start) * 1000.0
+            self.latency.record(provider, total_ms)
+            text = "".join(parts)
+            response = LLMResponse(
+                text=text,
+                token_usage={"prompt": len(prompt_text.split()), "completion": len(text.split())},
+                latency_ms={"first_token": first_token_ms, "total": total_ms},
+            )
+            response = self._finish(provider, response)
+            if self.cache is not None:
+                self._store(key, response)
+            yield LLMStreamChunk(delta="", index=index + 1, provider=provider, done=True, response=response)
+            return
 
         raise RuntimeError(f"All providers failed. Last error: {last_error}")
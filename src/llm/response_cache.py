@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from typing import Callable, Dict, Optional
+
+from .types import LLMGenerationSettings, LLMResponse
+
+
+def normalize_prompt(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry."""
+    return " ".join(text.split())
+
+
+def cache_key(
+    prompt_text: str,
+    model: str,
+    generation: Optional[LLMGenerationSettings] = None,
+    tools_schema: Optional[Dict] = None,
+    system_text: Optional[str] = None,
+) -> str:
+    """Content address for a request: (normalized prompt, model, settings)."""
+    settings = asdict(generation or LLMGenerationSettings())
+    # Streaming changes delivery, not content
+    settings.pop("streaming", None)
+    payload = {
+        "prompt": normalize_prompt(prompt_text),
+        "system": normalize_prompt(system_text) if system_text else None,
+        "model": model,
+        "settings": settings,
+        "tools": tools_schema,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of responses with TTL and entry-count bounds."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[float, LLMResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            stored_at, response = entry
+            if self._clock() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        # Callers may mutate responses (e.g. confidence_state); hand out copies
+        return replace(response, latency_ms={"total": 0.0, "cache": 0.0})
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -52,6 +52,17 @@ class LLMResponse:
     confidence_state: Literal["high", "degraded", "minimal", "retrieval-only"] = "high"
 
 
+@dataclass
+class LLMStreamChunk:
+    """Incremental piece of a streamed response; `response` is set on the final chunk."""
+    delta: str
+    index: int
+    provider: str
+    done: bool = False
+    cached: bool = False
+    response: Optional[LLMResponse] = None
+
+
 class LLMError(Exception):
     pass
 
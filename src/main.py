@@ -21,18 +21,26 @@ Usage:
     
     # Verbose logging
     python -m src.main "implement feature" --verbose
+    
+    # Startup profile (per-component import and construction time)
+    python -m src.main "help" --profile-startup
+    python -m src.main --profile-startup --profile-format folded > startup.folded
 
 Author: Asif Hussain
 Copyright: © 2024-2025 Asif Hussain. All rights reserved.
 """
 
 import sys
+import time
 import argparse
 from pathlib import Path
 from typing import Optional
 
+_IMPORT_START = time.perf_counter()
 from src.entry_point.cortex_entry import CortexEntry
+from src.entry_point.component_graph import StartupProfiler
 from src.config import config
+_IMPORT_MS = (time.perf_counter() - _IMPORT_START) * 1000
 
 
 def main():
@@ -48,6 +56,7 @@ Examples:
   cortex --setup                      # Run setup wizard
   cortex "status" --format json      # JSON output
   cortex --verbose "implement auth"  # Verbose logging
+  cortex "help" --profile-startup     # Startup cost breakdown
         """
     )
     
@@ -88,8 +97,27 @@ Examples:
         help="Custom brain path (default: auto-detected)"
     )
     
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Profile component imports and construction, then print the breakdown. "
+             "With a message, only the components that request touches are built; "
+             "without one, every component is built."
+    )
+    
+    parser.add_argument(
+        "--profile-format",
+        choices=["text", "folded"],
+        default="text",
+        help="Startup profile output: flame-style tree (text) or folded stacks "
+             "for flamegraph tools (folded) (default: text)"
+    )
+    
     args = parser.parse_args()
     
+    if args.profile_startup:
+        return profile_startup(args)
+    
     # Initialize CORTEX
     try:
         entry = CortexEntry(
@@ -171,5 +199,39 @@ Examples:
     return 0
 
 
+def profile_startup(args) -> int:
+    """Run --profile-startup mode and print the breakdown."""
+    profiler = StartupProfiler()
+    # Module imports of the CLI itself happen before profiling can start
+    profiler.add("src.entry_point.cortex_entry", "import", _IMPORT_MS)
+    
+    entry = None
+    status = 0
+    try:
+        with profiler.frame("CortexEntry.__init__"):
+            entry = CortexEntry(brain_path=args.brain, enable_logging=args.verbose, profiler=profiler)
+        
+        if args.message:
+            with profiler.frame(f"process({args.message!r})"):
+                entry.process(args.message, resume_session=True, format_type=args.format)
+        else:
+            with profiler.frame("resolve_all"):
+                entry.components.resolve_all()
+    except Exception as e:
+        # Still report what was measured up to the failure
+        print(f"[ERROR] {e}", file=sys.stderr)
+        status = 1
+    
+    if args.profile_format == "folded":
+        print("\n".join(profiler.folded()))
+    else:
+        print(profiler.render())
+        built = ", ".join(entry.components.instantiated()) if entry else ""
+        print(f"\nComponents built: {built or 'none'}")
+    if entry:
+        entry.cleanup()
+    return status
+
+
 if __name__ == "__main__":
     sys.exit(main())
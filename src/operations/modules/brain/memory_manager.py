@@ -5,6 +5,11 @@ CORTEX 3.0 Phase 2 - Brain Memory Manager
 Intelligent memory management for optimal brain performance and resource utilization.
 Manages memory allocation, garbage collection, and performance optimization.
 
+Real usage is measured by a sampled MemoryObserver (RSS every interval,
+short tracemalloc windows attributed to components) rather than by
+always-on tracemalloc, and its pressure signals drive cleanup and cache
+shrinking.
+
 Author: Asif Hussain
 Copyright: © 2024-2025 Asif Hussain. All rights reserved.
 
@@ -15,20 +20,20 @@ Integration: Memory Management + Query Cache + Optimization Engine
 import gc
 import os
 import sys
-import psutil
 import threading
 import time
 from typing import Dict, List, Any, Optional, Tuple, NamedTuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 import json
 from enum import Enum
 import weakref
-import tracemalloc
 from collections import defaultdict
 
+from src.utils.memory_observer import MemoryObserver, MemoryPressure, PressureSignal
+
 
 class MemoryZone(Enum):
     """Memory management zones."""
@@ -39,12 +44,14 @@ class MemoryZone(Enum):
     SYSTEM_OVERHEAD = "system_overhead"  # System memory overhead
 
 
-class MemoryPressure(Enum):
-    """Memory pressure levels."""
-    LOW = "low"        # <100MB usage
-    MEDIUM = "medium"  # 100-300MB usage
-    HIGH = "high"      # 300-500MB usage
-    CRITICAL = "critical"  # >500MB usage
+# Observer components (module paths) accounted to each zone; the rest is system overhead
+COMPONENT_ZONES = {
+    'tier1': MemoryZone.TIER1_WORKING,
+    'tier2': MemoryZone.TIER2_KNOWLEDGE,
+    'tier3': MemoryZone.TIER3_CONTEXT,
+    'context': MemoryZone.TIER3_CONTEXT,
+    'query_cache': MemoryZone.QUERY_CACHE,
+}
 
 
 @dataclass
@@ -68,6 +75,8 @@ class MemoryMetrics:
     memory_leaks_detected: int
     optimization_opportunities: List[str]
     last_cleanup: Optional[datetime]
+    cache_objects: Dict[str, int] = field(default_factory=dict)
+    zone_growth_kb_per_sec: Dict[str, float] = field(default_factory=dict)  # Sampled, not declared
 
 
 class MemoryPool:
@@ -246,12 +255,14 @@ class BrainMemoryManager:
     - Performance optimization
     """
     
-    def __init__(self, total_memory_limit_mb: int = 200):
+    def __init__(self, total_memory_limit_mb: int = 200, observer: Optional[MemoryObserver] = None):
         """
         Initialize brain memory manager.
         
         Args:
             total_memory_limit_mb: Total memory limit in MB
+            observer: Sampled memory observer (one is created with the
+                manager's pressure thresholds if omitted)
         """
         self.total_memory_limit_bytes = total_memory_limit_mb * 1024 * 1024
         
@@ -268,7 +279,6 @@ class BrainMemoryManager:
         self.memory_monitor = None
         self.monitoring_active = False
         self.monitoring_thread = None
-        self.stop_monitoring = False
         
         # Metrics tracking
         self.gc_collections = 0
@@ -287,9 +297,10 @@ class BrainMemoryManager:
         # Logger
         self.logger = logging.getLogger(__name__)
         
-        # Initialize memory tracking
-        if not tracemalloc.is_tracing():
-            tracemalloc.start()
+        # Sampled memory tracking (RSS + short tracemalloc windows); its
+        # pressure signals replace the old 30 s polling loop
+        self.observer = observer or MemoryObserver(thresholds=self.pressure_thresholds)
+        self.observer.add_pressure_listener(self._on_pressure)
         
         self.logger.info(f"Brain memory manager initialized: {total_memory_limit_mb}MB limit")
     
@@ -298,21 +309,16 @@ class BrainMemoryManager:
         if self.monitoring_active:
             return
         
-        self.stop_monitoring = False
-        self.monitoring_thread = threading.Thread(
-            target=self._monitoring_loop,
-            daemon=True
-        )
-        self.monitoring_thread.start()
+        self.observer.start()
+        self.monitoring_thread = self.observer.thread
         self.monitoring_active = True
         
         self.logger.info("Memory monitoring started")
     
     def stop_monitoring(self):
         """Stop memory monitoring."""
-        self.stop_monitoring = True
-        if self.monitoring_thread:
-            self.monitoring_thread.join(timeout=5)
+        self.observer.stop(timeout=5)
+        self.monitoring_thread = None
         self.monitoring_active = False
         
         self.logger.info("Memory monitoring stopped")
@@ -373,19 +379,9 @@ class BrainMemoryManager:
         return False
     
     def get_memory_pressure(self) -> MemoryPressure:
-        """Get current memory pressure level."""
+        """Get current memory pressure level (from a sample at most 1 s old)."""
         try:
-            process = psutil.Process()
-            memory_usage = process.memory_info().rss
-            
-            if memory_usage >= self.pressure_thresholds[MemoryPressure.CRITICAL]:
-                return MemoryPressure.CRITICAL
-            elif memory_usage >= self.pressure_thresholds[MemoryPressure.HIGH]:
-                return MemoryPressure.HIGH
-            elif memory_usage >= self.pressure_thresholds[MemoryPressure.MEDIUM]:
-                return MemoryPressure.MEDIUM
-            else:
-                return MemoryPressure.LOW
+            return self.observer.pressure(max_age=1.0)
         
         except Exception as e:
             self.logger.warning(f"Failed to get memory pressure: {e}")
@@ -394,14 +390,20 @@ class BrainMemoryManager:
     def get_memory_metrics(self) -> MemoryMetrics:
         """Get comprehensive memory metrics."""
         try:
-            process = psutil.Process()
-            total_memory_mb = process.memory_info().rss / (1024 * 1024)
+            sample = self.observer.latest(max_age=1.0)
+            total_memory_mb = sample.rss_bytes / (1024 * 1024)
             
-            # Zone allocations
+            # Zone allocations (declared through the pools)
             zone_allocations = {}
             for zone, pool in self.memory_pools.items():
                 zone_allocations[zone.value] = pool.current_size_bytes / (1024 * 1024)
             
+            # Measured allocation growth per zone, from sampled trace windows
+            zone_growth: Dict[str, float] = {}
+            for component, growth in self.observer.attribution.items():
+                zone = COMPONENT_ZONES.get(component, MemoryZone.SYSTEM_OVERHEAD).value
+                zone_growth[zone] = zone_growth.get(zone, 0.0) + growth.rate_bytes_per_sec / 1024
+            
             # Optimization opportunities
             optimization_opportunities = []
             
@@ -421,11 +423,13 @@ class BrainMemoryManager:
             return MemoryMetrics(
                 total_memory_mb=total_memory_mb,
                 zone_allocations=zone_allocations,
-                pressure_level=self.get_memory_pressure(),
+                pressure_level=sample.pressure,
                 gc_collections=self.gc_collections,
                 memory_leaks_detected=memory_leaks_detected,
                 optimization_opportunities=optimization_opportunities,
-                last_cleanup=self.last_cleanup
+                last_cleanup=self.last_cleanup,
+                cache_objects=sample.caches,
+                zone_growth_kb_per_sec={zone: round(rate, 2) for zone, rate in zone_growth.items()}
             )
         
         except Exception as e:
@@ -567,30 +571,23 @@ class BrainMemoryManager:
                     if old_allocations > active_allocations * 0.5:
                         leaks_detected += 1
                         self.logger.warning(f"Potential memory leak detected in {zone.value} pool")
+            
+            # Components whose allocations kept growing across every recent trace window
+            for component in self.observer.sustained_growth():
+                leaks_detected += 1
+                self.logger.warning(f"Sustained memory growth detected in {component}")
         
         except Exception as e:
             self.logger.error(f"Memory leak detection failed: {e}")
         
         return leaks_detected
     
-    def _monitoring_loop(self):
-        """Background memory monitoring loop."""
-        while not self.stop_monitoring:
-            try:
-                pressure = self.get_memory_pressure()
-                
-                # Auto-optimize on high pressure
-                if pressure == MemoryPressure.HIGH:
-                    self.optimize_memory_usage()
-                elif pressure == MemoryPressure.CRITICAL:
-                    self.emergency_cleanup()
-                
-                # Sleep for monitoring interval
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                self.logger.error(f"Memory monitoring error: {e}")
-                time.sleep(10)  # Wait before retrying
+    def _on_pressure(self, signal: PressureSignal):
+        """React to observer pressure signals (caches were already shrunk by the observer)."""
+        if signal.level == MemoryPressure.HIGH:
+            self.optimize_memory_usage()
+        elif signal.level == MemoryPressure.CRITICAL:
+            self.emergency_cleanup()
     
     def get_memory_summary(self) -> Dict[str, Any]:
         """Get comprehensive memory management summary."""
@@ -604,7 +601,9 @@ class BrainMemoryManager:
                 'gc_collections': metrics.gc_collections,
                 'memory_leaks_detected': metrics.memory_leaks_detected,
                 'optimization_opportunities': metrics.optimization_opportunities,
-                'last_cleanup': metrics.last_cleanup.isoformat() if metrics.last_cleanup else None
+                'last_cleanup': metrics.last_cleanup.isoformat() if metrics.last_cleanup else None,
+                'cache_objects': metrics.cache_objects,
+                'zone_growth_kb_per_sec': metrics.zone_growth_kb_per_sec
             },
             'pool_statistics': {
                 zone.value: {
@@ -618,6 +617,7 @@ class BrainMemoryManager:
                 for zone, pool in self.memory_pools.items()
             },
             'optimization_history': self.optimization_history[-5:],  # Last 5 optimizations
+            'observer': self.observer.stats(),
             'monitoring_status': 'active' if self.monitoring_active else 'inactive'
         }
 
@@ -24,6 +24,8 @@ import logging
 import json
 import psutil
 
+from src.infrastructure.persistence.sqlite_maintenance import SQLiteMaintenanceEngine
+
 
 class PerformanceMetric(NamedTuple):
     """Performance metric data structure."""
@@ -163,6 +165,7 @@ class BrainOptimizationEngine:
         
         # Database connections cache
         self.db_connections = {}
+        self.maintenance = SQLiteMaintenanceEngine()
         self.query_cache = {}
         self.cache_hits = 0
         self.cache_misses = 0
@@ -316,9 +319,6 @@ class BrainOptimizationEngine:
             with sqlite3.connect(tier1_db) as conn:
                 cursor = conn.cursor()
                 
-                # Analyze table and create indexes if needed
-                cursor.execute("ANALYZE")
-                
                 # Check for missing indexes
                 cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
                 existing_indexes = [row[0] for row in cursor.fetchall()]
@@ -343,16 +343,17 @@ class BrainOptimizationEngine:
                         recommendations.append("Added timestamp index for messages")
                         improvement += 3.0
                 
-                # Vacuum if beneficial
-                cursor.execute("PRAGMA freelist_count")
-                free_pages = cursor.fetchone()[0]
-                if free_pages > 100:
-                    cursor.execute("VACUUM")
-                    memory_saved = free_pages * 4096  # Approximate page size
-                    recommendations.append("Database vacuumed for space optimization")
-                
                 conn.commit()
             
+            # Reclaim free pages and refresh statistics (new indexes included) when worthwhile
+            maintenance = self.maintenance.run(tier1_db)
+            if not maintenance.success:
+                raise sqlite3.OperationalError(maintenance.error)
+            if maintenance.pages_reclaimed:
+                memory_saved = maintenance.bytes_reclaimed
+                recommendations.append(f"Reclaimed {maintenance.pages_reclaimed} free pages for space optimization")
+            recommendations.extend(maintenance.recommendations)
+            
             return {
                 'success': True,
                 'improvement': improvement,
@@ -414,11 +415,15 @@ class BrainOptimizationEngine:
                     except Exception:
                         pass  # Index might already exist
                 
-                # Analyze for query planner
-                cursor.execute("ANALYZE")
-                
                 conn.commit()
             
+            # Bounded statistics refresh for the query planner
+            maintenance = self.maintenance.run(tier2_db)
+            if not maintenance.success:
+                raise sqlite3.OperationalError(maintenance.error)
+            memory_saved = maintenance.bytes_reclaimed
+            recommendations.extend(maintenance.recommendations)
+            
             return {
                 'success': True,
                 'improvement': improvement,
@@ -15,16 +15,20 @@ Integration: Query Cache + Performance Engine + Brain Tiers
 import time
 import hashlib
 import json
+import math
 import threading
 from typing import Dict, Any, Optional, List, Tuple, NamedTuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from collections import OrderedDict
+from itertools import islice
 import pickle
 import logging
 from enum import Enum
 from pathlib import Path
 
+from src.utils.memory_observer import track_cache
+
 
 class CacheStrategy(Enum):
     """Cache strategy types."""
@@ -123,6 +127,9 @@ class QueryCacheEngine:
         # Logger
         self.logger = logging.getLogger(__name__)
         
+        # Sampled by the memory observer and shrunk under memory pressure
+        track_cache("query_cache", self, attr="cache", shrink="shrink")
+        
         self.logger.info(f"Query cache initialized: {max_size_mb}MB, strategy={strategy.value}")
     
     def get(self, query: str, query_type: QueryType = QueryType.GENERAL) -> Optional[Any]:
@@ -262,6 +269,26 @@ class QueryCacheEngine:
         self.logger.info(f"Invalidated {invalidated} cache entries")
         return invalidated
     
+    def shrink(self, fraction: float) -> int:
+        """
+        Drop a share of the cache, least recently used first.
+        
+        Args:
+            fraction: Share of entries to remove (0.0-1.0)
+            
+        Returns:
+            Number of entries removed
+        """
+        with self.lock:
+            to_remove = list(islice(self.cache, math.ceil(len(self.cache) * fraction)))
+            for key in to_remove:
+                self._remove_entry(key)
+            self.evictions += len(to_remove)
+        
+        if to_remove:
+            self.logger.info(f"Shrank cache by {len(to_remove)} entries under memory pressure")
+        return len(to_remove)
+    
     def cleanup_expired(self) -> int:
         """Remove expired entries."""
         removed = 0
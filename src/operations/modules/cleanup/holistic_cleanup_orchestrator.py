@@ -2,9 +2,9 @@
 Holistic Cleanup Orchestrator for CORTEX 3.2
 
 Performs comprehensive repository analysis and cleanup with:
-- Recursive directory scanning
+- Recursive directory scanning (single walk, incremental via scan state)
 - Production-ready file naming validation
-- Redundancy detection and elimination
+- Redundancy detection and elimination (content hashes, fdupes-style)
 - Detailed reporting before execution
 - Safe execution with backup/rollback
 
@@ -29,6 +29,7 @@ from src.operations.base_operation_module import (
     BaseOperationModule, OperationPhase, OperationResult, 
     OperationModuleMetadata, OperationStatus
 )
+from .workspace_scanner import ScannedFile, WorkspaceScanner, WorkspaceSnapshot
 
 try:
     from .cleanup_validator import CleanupValidator
@@ -139,8 +140,8 @@ class FileCategorizationEngine:
         }
     }
     
-    def categorize_file(self, file_path: Path) -> FileInfo:
-        """Categorize a single file"""
+    def match_categories(self, file_path: Path) -> List[str]:
+        """Categories whose patterns match the file's path or name"""
         categories = []
         
         # Convert path to string for pattern matching (including directory structure)
@@ -157,6 +158,12 @@ class FileCategorizationEngine:
                     categories.append(category)
                     break
         
+        return categories
+    
+    def categorize_file(self, file_path: Path) -> FileInfo:
+        """Categorize a single file"""
+        categories = self.match_categories(file_path)
+        
         return FileInfo(
             path=str(file_path),
             name=file_path.name,
@@ -196,8 +203,8 @@ class ProductionReadinessValidator:
         (r'.*(SUMMARY|STATUS|REPORT|ANALYSIS|UPDATE).*\.md$', 'temporary_report', 'medium')
     ]
     
-    def validate_file(self, file_path: Path) -> FileInfo:
-        """Check if file meets production standards"""
+    def find_violations(self, file_path: Path) -> List[Dict[str, str]]:
+        """Naming violations for a file"""
         violations = []
         
         for pattern, violation_type, severity in self.NON_PRODUCTION_PATTERNS:
@@ -208,6 +215,12 @@ class ProductionReadinessValidator:
                     'severity': severity
                 })
         
+        return violations
+    
+    def validate_file(self, file_path: Path) -> FileInfo:
+        """Check if file meets production standards"""
+        violations = self.find_violations(file_path)
+        
         file_info = FileInfo(
             path=str(file_path),
             name=file_path.name,
@@ -253,23 +266,49 @@ class ProductionReadinessValidator:
 class HolisticRepositoryScanner:
     """Recursively scan entire repository"""
     
-    def __init__(self, project_root: Path, protected_paths: Set[str]):
+    # Normalizes versioned/copied names for name-based duplicate detection
+    NAME_VARIANT_PATTERN = re.compile(r'[-_]?(v\d+|copy|\d{8})')
+    
+    def __init__(
+        self,
+        project_root: Path,
+        protected_paths: Set[str],
+        state_path: Optional[Path] = None,
+        max_workers: Optional[int] = None
+    ):
         self.project_root = Path(project_root) if isinstance(project_root, str) else project_root
         self.protected_paths = protected_paths
         self.categorization_engine = FileCategorizationEngine()
         self.validator = ProductionReadinessValidator()
+        self.workspace_scanner = WorkspaceScanner(
+            self.project_root,
+            is_excluded=self._is_protected_relative,
+            state_path=state_path,
+            max_workers=max_workers
+        )
     
-    def scan_repository(self) -> Dict[str, Any]:
-        """Perform holistic scan"""
+    def scan_repository(self, snapshot: Optional[WorkspaceSnapshot] = None) -> Dict[str, Any]:
+        """
+        Perform holistic scan.
+        
+        Args:
+            snapshot: Walk result shared with other cleanup components; the
+                repository is walked here only when none is supplied
+        """
         logger.info("Starting holistic repository scan...")
         
+        if snapshot is None:
+            snapshot = self.workspace_scanner.walk()
+        else:
+            snapshot = snapshot.subset(self._is_protected_relative)
+        
         results = {
             'scanned_at': datetime.now(),
             'root_path': str(self.project_root),
             'statistics': {
-                'total_files': 0,
-                'total_directories': 0,
-                'total_size_bytes': 0
+                'total_files': len(snapshot.files),
+                'total_directories': snapshot.directory_count,
+                'total_size_bytes': snapshot.total_size
             },
             'categories': defaultdict(list),  # Changed from files_by_category
             'files_by_category': defaultdict(list),  # Keep for backwards compatibility
@@ -279,77 +318,111 @@ class HolisticRepositoryScanner:
             'bloated_files': []
         }
         
-        # Scan all files recursively
-        for file_path in self.project_root.rglob('*'):
-            if self._is_protected(file_path):
-                continue
+        # Classification, naming validation and bloat checks run in the
+        # worker pool; unchanged files reuse results from the previous run
+        analyses = self.workspace_scanner.analyze(snapshot.files, 'holistic', self._analyze_file)
+        
+        for scanned in snapshot.files:
+            analysis = analyses[scanned.relative_path]
+            file_info = FileInfo(
+                path=str(scanned.path),
+                name=scanned.path.name,
+                size=scanned.size,
+                modified=scanned.modified,
+                categories=list(analysis['categories']),
+                production_ready=analysis['production_ready'],
+                violations=list(analysis['violations']),
+                recommended_name=analysis['recommended_name']
+            )
             
-            if file_path.is_file():
-                results['statistics']['total_files'] += 1
-                results['statistics']['total_size_bytes'] += file_path.stat().st_size
-                
-                # Categorize file
-                file_info = self.categorization_engine.categorize_file(file_path)
-                
-                # Validate production readiness
-                if not file_info.production_ready:
-                    validation_info = self.validator.validate_file(file_path)
-                    file_info.violations = validation_info.violations
-                    file_info.recommended_name = validation_info.recommended_name
-                
-                results['all_files'].append(file_info)
-                
-                for category in file_info.categories:
-                    results['files_by_category'][category].append(file_info)
-                    results['categories'][category].append(asdict(file_info))  # Also add to categories
-                
-                # Check for duplicates
-                self._check_duplicates(file_path, results)
-                
-                # Check if bloated
-                if self._is_bloated(file_path):
-                    results['bloated_files'].append(file_info)
+            results['all_files'].append(file_info)
+            
+            for category in file_info.categories:
+                results['files_by_category'][category].append(file_info)
+                results['categories'][category].append(asdict(file_info))  # Also add to categories
             
-            elif file_path.is_dir():
-                results['statistics']['total_directories'] += 1
+            if analysis['bloated']:
+                results['bloated_files'].append(file_info)
+        
+        self._check_duplicates(snapshot, results)
+        self.workspace_scanner.save()
         
         logger.info(f"Scan complete: {results['statistics']['total_files']} files, "
-                   f"{results['statistics']['total_directories']} directories")
+                   f"{results['statistics']['total_directories']} directories "
+                   f"({self.workspace_scanner.stats['reused']} unchanged)")
         
         return results
     
+    def _analyze_file(self, scanned: ScannedFile) -> Dict[str, Any]:
+        """Per-file classification (runs in the scanner's worker pool)"""
+        categories = self.categorization_engine.match_categories(scanned.path)
+        production_ready = len(categories) == 0 or 'production' in categories
+        
+        violations: List[Dict[str, str]] = []
+        recommended_name = None
+        if not production_ready:
+            violations = self.validator.find_violations(scanned.path)
+            if violations:
+                recommended_name = self.validator._suggest_production_name(scanned.path)
+        
+        return {
+            'categories': categories,
+            'production_ready': production_ready,
+            'violations': violations,
+            'recommended_name': recommended_name,
+            'bloated': self._is_bloated(scanned.path)
+        }
+    
     def _is_protected(self, path: Path) -> bool:
         """Check if path is protected"""
         try:
             relative_path = path.relative_to(self.project_root)
-            path_str = str(relative_path).replace('\\', '/')
-            
-            for protected in self.protected_paths:
-                if path_str == protected.rstrip('/'):
-                    return True
-                if path_str.startswith(protected):
-                    return True
-            
-            return False
-            
         except ValueError:
             return True
+        return self._is_protected_relative(str(relative_path).replace('\\', '/'))
+    
+    def _is_protected_relative(self, path_str: str) -> bool:
+        """Check if a POSIX path relative to the project root is protected"""
+        for protected in self.protected_paths:
+            if path_str == protected.rstrip('/'):
+                return True
+            if path_str.startswith(protected):
+                return True
+        
+        return False
     
-    def _check_duplicates(self, file_path: Path, results: Dict[str, Any]) -> None:
-        """Check for duplicate files"""
-        # Simple name-based duplicate detection
-        name_base = re.sub(r'[-_]?(v\d+|copy|\d{8})', '', file_path.stem.lower())
+    def _check_duplicates(self, snapshot: WorkspaceSnapshot, results: Dict[str, Any]) -> None:
+        """
+        Detect duplicate files.
         
-        for existing in results['all_files']:
-            existing_base = re.sub(r'[-_]?(v\d+|copy|\d{8})', '', Path(existing.path).stem.lower())
-            
-            if name_base == existing_base and file_path.suffix == Path(existing.path).suffix:
-                if file_path.name != Path(existing.path).name:
+        Name-based: versioned/copied names of the same file (hash lookup on
+        the normalized name instead of comparing every pair of files).
+        Content-based: byte-identical files, via size → partial hash → full
+        hash bucketing.
+        """
+        seen_names: Dict[Tuple[str, str], List[ScannedFile]] = defaultdict(list)
+        for scanned in snapshot.files:
+            name_base = self.NAME_VARIANT_PATTERN.sub('', scanned.path.stem.lower())
+            key = (name_base, scanned.path.suffix)
+            for existing in seen_names[key]:
+                if existing.path.name != scanned.path.name:
                     results['duplicates'].append({
-                        'original': existing.path,
-                        'duplicate': str(file_path),
-                        'size': file_path.stat().st_size
+                        'original': str(existing.path),
+                        'duplicate': str(scanned.path),
+                        'size': scanned.size,
+                        'match': 'name'
                     })
+            seen_names[key].append(scanned)
+        
+        for group in self.workspace_scanner.find_content_duplicates(snapshot.files):
+            original = group[0]
+            for duplicate in group[1:]:
+                results['duplicates'].append({
+                    'original': str(original.path),
+                    'duplicate': str(duplicate.path),
+                    'size': duplicate.size,
+                    'match': 'content'
+                })
     
     def _is_bloated(self, file_path: Path) -> bool:
         """Check if file is bloated"""
@@ -541,7 +614,13 @@ class HolisticCleanupOrchestrator(BaseOperationModule):
         )
     
     def execute(self, context: Dict[str, Any]) -> OperationResult:
-        """Execute holistic cleanup"""
+        """
+        Execute holistic cleanup.
+        
+        Context keys (besides dry_run/manifest): 'workspace_snapshot' is
+        set to the run's single workspace walk before any consumer runs;
+        'sweep' also runs the file sweeper over it (live runs only).
+        """
         dry_run = context.get('dry_run', True)
         manifest_data = context.get('manifest')
         
@@ -557,16 +636,32 @@ class HolisticCleanupOrchestrator(BaseOperationModule):
             if manifest_data and not dry_run:
                 return self._execute_cleanup_actions(manifest_data)
             
+            # Phase 0: One workspace walk, shared by every cleanup consumer
+            # in this run through context['workspace_snapshot']
+            snapshot = self.prepare_workspace_snapshot(context)
+            
             # Phase 1: Holistic scan
             logger.info("Phase 1: Holistic Repository Scan")
             logger.info("-" * 70)
             
-            scanner = HolisticRepositoryScanner(self.project_root, self.protected_paths)
-            scan_results = scanner.scan_repository()
+            scanner = HolisticRepositoryScanner(
+                self.project_root,
+                self.protected_paths,
+                state_path=self.project_root / 'cortex-brain' / 'cache' / 'holistic-scan-state.db'
+            )
+            scan_results = scanner.scan_repository(snapshot=snapshot)
             
             logger.info(f"✅ Scanned {scan_results['statistics']['total_files']} files")
             logger.info("")
             
+            # Phase 1.5: File sweeper over the same snapshot (opt-in, live runs only)
+            sweep_results = None
+            if context.get('sweep', False) and not dry_run:
+                logger.info("Phase 1.5: File Sweeper")
+                logger.info("-" * 70)
+                sweep_results = self._run_sweeper(context)
+                logger.info("")
+            
             # Phase 2: Generate manifest
             logger.info("Phase 2: Manifest Generation")
             logger.info("-" * 70)
@@ -709,7 +804,8 @@ class HolisticCleanupOrchestrator(BaseOperationModule):
                     'manifest_path': str(manifest_path),
                     'report_path': str(report_path),
                     'dry_run': dry_run,
-                    'statistics': scan_results['statistics']
+                    'statistics': scan_results['statistics'],
+                    'sweep': sweep_results
                 }
             )
             
@@ -722,6 +818,46 @@ class HolisticCleanupOrchestrator(BaseOperationModule):
                 data={'error': str(e)}
             )
     
+    def prepare_workspace_snapshot(self, context: Dict[str, Any]) -> WorkspaceSnapshot:
+        """
+        Walk the workspace once and publish the snapshot in the context.
+        
+        Consumers (HolisticRepositoryScanner, SweeperPlugin) narrow it with
+        their own exclusions, so the shared walk only skips VCS internals.
+        A snapshot already in the context is reused as-is.
+        """
+        snapshot = context.get('workspace_snapshot')
+        if snapshot is None:
+            snapshot = WorkspaceScanner(self.project_root, is_excluded=self._is_vcs_path).walk()
+            context['workspace_snapshot'] = snapshot
+            logger.info(f"Walked workspace once: {len(snapshot.files)} files")
+        context.setdefault('workspace_root', str(self.project_root))
+        return snapshot
+    
+    @staticmethod
+    def _is_vcs_path(relative_path: str) -> bool:
+        return relative_path == '.git' or relative_path.startswith('.git/')
+    
+    def _run_sweeper(self, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run the file sweeper plugin on the shared workspace snapshot"""
+        try:
+            from src.plugins.sweeper_plugin import SweeperPlugin
+        except ImportError as e:
+            logger.warning(f"⚠️  File sweeper not available ({e}) - skipping")
+            return None
+        
+        sweeper = SweeperPlugin()
+        if not sweeper.initialize():
+            logger.warning("⚠️  File sweeper failed to initialize - skipping")
+            return None
+        
+        results = sweeper.execute(context)
+        if results.get('success'):
+            logger.info(f"✅ Swept {results['stats']['files_deleted']} files")
+        else:
+            logger.warning(f"⚠️  File sweeper failed: {results.get('error')}")
+        return results
+    
     def _execute_cleanup_actions(self, manifest_data: Dict[str, Any]) -> OperationResult:
         """Execute actual cleanup actions from manifest with category-level validation"""
         try:
@@ -0,0 +1,402 @@
+"""
+Workspace Scanner for CORTEX Cleanup
+
+Shared scanning pipeline for cleanup components:
+- Single directory walk producing a reusable WorkspaceSnapshot
+- Content duplicate detection the fdupes way: bucket by size, then by a
+  partial hash (first/last 64 KB), and only then by a full hash
+- Per-file analysis (classification, age, reference checks) in a worker pool
+- Persistent scan state so the next run only revisits changed paths
+
+HolisticCleanupOrchestrator and SweeperPlugin both consume snapshots, so a
+combined cleanup run walks the workspace once.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+License: Source-Available (Use Allowed, No Contributions) - See LICENSE
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_HASH_BYTES = 64 * 1024
+FULL_HASH_CHUNK = 1024 * 1024
+
+
+@dataclass
+class ScannedFile:
+    """File discovered by the workspace walk"""
+    path: Path
+    relative_path: str  # POSIX-style, relative to the workspace root
+    size: int
+    mtime: float
+
+    @property
+    def modified(self) -> datetime:
+        return datetime.fromtimestamp(self.mtime)
+
+
+@dataclass
+class WorkspaceSnapshot:
+    """Result of one workspace walk"""
+    root: Path
+    files: List[ScannedFile] = field(default_factory=list)
+    directory_count: int = 0
+    scanned_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def total_size(self) -> int:
+        return sum(f.size for f in self.files)
+
+    def by_relative_path(self) -> Dict[str, ScannedFile]:
+        return {f.relative_path: f for f in self.files}
+
+    def subset(self, is_excluded: Callable[[str], bool]) -> 'WorkspaceSnapshot':
+        """
+        Files of this snapshot not matched by another component's exclusions.
+
+        Lets a second consumer reuse the walk instead of re-walking; the
+        snapshot must have been taken with exclusions no broader than its own.
+        """
+        files = [f for f in self.files if not _excluded_path(f.relative_path, is_excluded)]
+        return WorkspaceSnapshot(
+            root=self.root,
+            files=files,
+            directory_count=self.directory_count,
+            scanned_at=self.scanned_at
+        )
+
+
+def _excluded_path(relative_path: str, is_excluded: Callable[[str], bool]) -> bool:
+    """True if the path or any of its parent directories is excluded"""
+    parts = relative_path.split('/')
+    return any(is_excluded('/'.join(parts[:i])) for i in range(1, len(parts) + 1))
+
+
+class ScanStateStore:
+    """
+    SQLite store of per-file hashes and analysis results.
+
+    Entries are valid only while (size, mtime) match the file on disk,
+    so anything that changed is recomputed and everything else is reused.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._init_database()
+        self._load()
+
+    def _init_database(self):
+        """Initialize SQLite schema"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_state (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    partial_hash TEXT,
+                    full_hash TEXT,
+                    analysis TEXT
+                )
+            """)
+
+    def _load(self):
+        with sqlite3.connect(self.db_path) as conn:
+            for path, size, mtime, partial, full, analysis in conn.execute(
+                "SELECT path, size, mtime, partial_hash, full_hash, analysis FROM file_state"
+            ):
+                self._rows[path] = {
+                    'size': size,
+                    'mtime': mtime,
+                    'partial_hash': partial,
+                    'full_hash': full,
+                    'analysis': json.loads(analysis) if analysis else {},
+                }
+
+    def get(self, scanned: ScannedFile) -> Optional[Dict[str, Any]]:
+        """Stored state for a file, or None if it changed since it was stored"""
+        row = self._rows.get(scanned.relative_path)
+        if row and row['size'] == scanned.size and abs(row['mtime'] - scanned.mtime) < 0.001:
+            return row
+        return None
+
+    def _row_for_update(self, scanned: ScannedFile) -> Dict[str, Any]:
+        row = self.get(scanned)
+        if row is None:
+            row = {
+                'size': scanned.size,
+                'mtime': scanned.mtime,
+                'partial_hash': None,
+                'full_hash': None,
+                'analysis': {},
+            }
+            self._rows[scanned.relative_path] = row
+        self._dirty[scanned.relative_path] = row
+        return row
+
+    def set_hash(self, scanned: ScannedFile, kind: str, value: str):
+        self._row_for_update(scanned)[kind] = value
+
+    def set_analysis(self, scanned: ScannedFile, key: str, value: Dict[str, Any]):
+        self._row_for_update(scanned)['analysis'][key] = value
+
+    def prune(self, live_paths: set):
+        """Forget files that no longer exist in the workspace"""
+        stale = [p for p in self._rows if p not in live_paths]
+        for path in stale:
+            del self._rows[path]
+            self._dirty.pop(path, None)
+        if stale:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany("DELETE FROM file_state WHERE path = ?", [(p,) for p in stale])
+
+    def flush(self):
+        """Write changed entries in a single transaction"""
+        if not self._dirty:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO file_state "
+                "(path, size, mtime, partial_hash, full_hash, analysis) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (path, row['size'], row['mtime'], row['partial_hash'],
+                     row['full_hash'], json.dumps(row['analysis'], default=str))
+                    for path, row in self._dirty.items()
+                ]
+            )
+        self._dirty.clear()
+
+
+class WorkspaceScanner:
+    """
+    Walk a workspace once and answer cleanup questions from the snapshot.
+
+    Usage:
+        scanner = WorkspaceScanner(root, is_excluded=lambda rel: rel.startswith('.git'))
+        snapshot = scanner.walk()
+        groups = scanner.find_content_duplicates(snapshot.files)
+        results = scanner.analyze(snapshot.files, 'categorize', categorize_fn)
+        scanner.save()
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        is_excluded: Optional[Callable[[str], bool]] = None,
+        state_path: Optional[Path] = None,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Args:
+            root: Workspace root
+            is_excluded: Predicate on POSIX relative paths; excluded directories
+                are not descended into
+            state_path: SQLite scan state (None = no persistence between runs)
+            max_workers: Worker threads for hashing and analysis
+        """
+        self.root = Path(root)
+        self.is_excluded = is_excluded or (lambda _rel: False)
+        self.state = ScanStateStore(state_path) if state_path else None
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.stats = {'hashed_partial': 0, 'hashed_full': 0, 'analyzed': 0, 'reused': 0}
+
+    def walk(self) -> WorkspaceSnapshot:
+        """
+        Single iterative os.scandir walk of the workspace.
+
+        Directory symlinks are not followed; file symlinks are reported
+        with their target's size and mtime.
+        """
+        snapshot = WorkspaceSnapshot(root=self.root)
+        stack = [(self.root, "")]
+        while stack:
+            directory, rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory {directory}: {e}")
+                continue
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if self.is_excluded(rel):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        snapshot.directory_count += 1
+                        stack.append((Path(entry.path), rel))
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        snapshot.files.append(ScannedFile(
+                            path=Path(entry.path),
+                            relative_path=rel,
+                            size=stat.st_size,
+                            mtime=stat.st_mtime
+                        ))
+                except OSError:
+                    continue
+        snapshot.files.sort(key=lambda f: f.relative_path)
+        if self.state:
+            self.state.prune({f.relative_path for f in snapshot.files})
+        return snapshot
+
+    def analyze(
+        self,
+        files: List[ScannedFile],
+        key: str,
+        analyzer: Callable[[ScannedFile], Any],
+        persist: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Run a per-file analyzer in the worker pool, reusing stored results.
+
+        Persisted results must be JSON-serializable and depend only on the
+        file itself; analyzers whose result depends on the current time
+        (such as age thresholds) should pass persist=False.
+
+        Returns:
+            relative_path → analyzer result
+        """
+        results: Dict[str, Any] = {}
+        pending: List[ScannedFile] = []
+        for scanned in files:
+            row = self.state.get(scanned) if self.state and persist else None
+            if row and key in row['analysis']:
+                results[scanned.relative_path] = row['analysis'][key]
+            else:
+                pending.append(scanned)
+
+        self.stats['reused'] += len(files) - len(pending)
+        self.stats['analyzed'] += len(pending)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for scanned, result in zip(pending, pool.map(analyzer, pending)):
+                    results[scanned.relative_path] = result
+                    if self.state and persist:
+                        self.state.set_analysis(scanned, key, result)
+        return results
+
+    def find_content_duplicates(
+        self,
+        files: List[ScannedFile],
+        min_size: int = 1
+    ) -> List[List[ScannedFile]]:
+        """
+        Group files with identical content.
+
+        Stage 1 buckets by size (free from the walk), stage 2 by a hash of
+        the first and last 64 KB, stage 3 by a full SHA-256. Only files that
+        still collide after a stage are read further.
+
+        Returns:
+            Groups of two or more identical files, each sorted by path
+        """
+        by_size: Dict[int, List[ScannedFile]] = defaultdict(list)
+        for scanned in files:
+            if scanned.size >= min_size:
+                by_size[scanned.size].append(scanned)
+
+        candidates = [f for group in by_size.values() if len(group) > 1 for f in group]
+        partial = self._hashes(candidates, 'partial_hash', self._partial_hash)
+
+        by_partial: Dict[tuple, List[ScannedFile]] = defaultdict(list)
+        for scanned in candidates:
+            digest = partial.get(scanned.relative_path)
+            if digest:
+                by_partial[(scanned.size, digest)].append(scanned)
+
+        # Files no larger than the partial window were hashed in full already
+        needs_full = [
+            f for group in by_partial.values() if len(group) > 1 for f in group
+            if f.size > 2 * PARTIAL_HASH_BYTES
+        ]
+        full = self._hashes(needs_full, 'full_hash', self._full_hash)
+
+        by_full: Dict[tuple, List[ScannedFile]] = defaultdict(list)
+        for (size, digest), group in by_partial.items():
+            if len(group) < 2:
+                continue
+            for scanned in group:
+                final = full.get(scanned.relative_path) if size > 2 * PARTIAL_HASH_BYTES else digest
+                if final:
+                    by_full[(size, final)].append(scanned)
+
+        duplicates = [
+            sorted(group, key=lambda f: f.relative_path)
+            for group in by_full.values() if len(group) > 1
+        ]
+        duplicates.sort(key=lambda g: g[0].relative_path)
+        return duplicates
+
+    def save(self):
+        """Persist scan state changed during this run"""
+        if self.state:
+            self.state.flush()
+
+    def _hashes(
+        self,
+        files: List[ScannedFile],
+        kind: str,
+        hasher: Callable[[ScannedFile], Optional[str]]
+    ) -> Dict[str, str]:
+        hashes: Dict[str, str] = {}
+        pending: List[ScannedFile] = []
+        for scanned in files:
+            row = self.state.get(scanned) if self.state else None
+            if row and row[kind]:
+                hashes[scanned.relative_path] = row[kind]
+            else:
+                pending.append(scanned)
+
+        stat_key = 'hashed_partial' if kind == 'partial_hash' else 'hashed_full'
+        self.stats[stat_key] += len(pending)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for scanned, digest in zip(pending, pool.map(hasher, pending)):
+                    if digest is None:
+                        continue
+                    hashes[scanned.relative_path] = digest
+                    if self.state:
+                        self.state.set_hash(scanned, kind, digest)
+        return hashes
+
+    @staticmethod
+    def _partial_hash(scanned: ScannedFile) -> Optional[str]:
+        """Hash of the first and last 64 KB (the whole file when small)"""
+        try:
+            with open(scanned.path, 'rb') as f:
+                head = f.read(PARTIAL_HASH_BYTES)
+                if scanned.size > 2 * PARTIAL_HASH_BYTES:
+                    f.seek(-PARTIAL_HASH_BYTES, os.SEEK_END)
+                    tail = f.read(PARTIAL_HASH_BYTES)
+                else:
+                    tail = f.read()
+        except OSError:
+            return None
+        return hashlib.sha256(head + tail).hexdigest()
+
+    @staticmethod
+    def _full_hash(scanned: ScannedFile) -> Optional[str]:
+        sha256 = hashlib.sha256()
+        try:
+            with open(scanned.path, 'rb') as f:
+                for chunk in iter(lambda: f.read(FULL_HASH_CHUNK), b''):
+                    sha256.update(chunk)
+        except OSError:
+            return None
+        return sha256.hexdigest()
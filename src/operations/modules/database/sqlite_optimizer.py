@@ -2,7 +2,9 @@
 SQLite Database Optimization Module
 
 Analyzes and optimizes CORTEX SQLite databases across all tiers.
-Performs VACUUM, integrity checks, index analysis, and query optimization.
+Performs integrity checks and index analysis, and hands space reclaim and
+planner statistics to the policy-driven SQLiteMaintenanceEngine (bounded
+incremental vacuum, PRAGMA optimize) instead of a full VACUUM/ANALYZE.
 
 Copyright © 2024-2025 Asif Hussain. All rights reserved.
 """
@@ -14,13 +16,15 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
 
+from src.infrastructure.persistence.sqlite_maintenance import MaintenancePolicy, SQLiteMaintenanceEngine
+
 
 class SQLiteOptimizer:
     """
     Optimizes SQLite databases for CORTEX tiers.
     
     Features:
-    - VACUUM to reclaim space and optimize storage
+    - Incremental space reclaim, only when the freelist warrants it
     - Integrity check validation
     - Index usage analysis
     - Query performance analysis
@@ -28,14 +32,16 @@ class SQLiteOptimizer:
     - Size reporting with before/after comparison
     """
     
-    def __init__(self, brain_path: Optional[Path] = None):
+    def __init__(self, brain_path: Optional[Path] = None, policy: Optional[MaintenancePolicy] = None):
         """
         Initialize SQLite optimizer.
         
         Args:
             brain_path: Path to cortex-brain directory
+            policy: Maintenance thresholds (defaults to MaintenancePolicy())
         """
         self.logger = logging.getLogger(__name__)
+        self.maintenance = SQLiteMaintenanceEngine(policy)
         
         if brain_path is None:
             # Default to standard location
@@ -137,20 +143,25 @@ class SQLiteOptimizer:
             # Table statistics
             result['table_stats'] = self._get_table_stats(cursor)
             
-            # VACUUM operation
-            self.logger.info(f"Running VACUUM on {tier_name}...")
-            cursor.execute("VACUUM")
-            conn.commit()
-            result['vacuum_completed'] = True
-            
-            # Analyze for query optimizer
-            cursor.execute("ANALYZE")
-            conn.commit()
-            result['analyze_completed'] = True
-            
             # Close connection
             conn.close()
             
+            # Reclaim space and refresh statistics only where worthwhile
+            self.logger.info(f"Running maintenance on {tier_name}...")
+            maintenance = self.maintenance.run(db_path)
+            if not maintenance.success:
+                raise sqlite3.OperationalError(maintenance.error)
+            result['maintenance'] = maintenance.to_dict()
+            reclaim_planned = bool({'incremental_vacuum', 'enable_incremental'} & set(maintenance.actions))
+            result['pages_reclaimed'] = maintenance.pages_reclaimed
+            result['vacuum_completed'] = maintenance.pages_reclaimed > 0
+            result['space_reclaim'] = (
+                'reclaimed' if result['vacuum_completed']
+                else 'incomplete' if reclaim_planned
+                else 'not_needed'
+            )
+            result['analyze_completed'] = 'optimize' in maintenance.actions
+            
             # Get final size
             final_size = db_path.stat().st_size
             result['final_size_bytes'] = final_size
@@ -246,6 +257,16 @@ class SQLiteOptimizer:
             self.logger.error(f"Failed to get table stats: {str(e)}")
             return []
     
+    @staticmethod
+    def _format_space_reclaim(tier_result: Dict[str, Any]) -> str:
+        """Report line for the space reclaim outcome"""
+        status = tier_result.get('space_reclaim')
+        if status == 'reclaimed':
+            return f"✅ {tier_result.get('pages_reclaimed', 0):,} pages reclaimed"
+        if status == 'incomplete':
+            return "⚠️ Planned but no pages reclaimed"
+        return "⏭️ Not needed"
+    
     def generate_report(self, results: Dict[str, Any], output_path: Optional[Path] = None) -> str:
         """
         Generate optimization report.
@@ -291,8 +312,9 @@ class SQLiteOptimizer:
                 f"  Space Reclaimed: {tier_result['space_reclaimed_mb']} MB ({tier_result['space_reclaimed_percent']}%)",
                 "",
                 f"  Integrity Check: {'✅ Passed' if tier_result['integrity_check']['passed'] else '❌ Failed'}",
-                f"  VACUUM: {'✅ Completed' if tier_result.get('vacuum_completed') else '❌ Failed'}",
-                f"  ANALYZE: {'✅ Completed' if tier_result.get('analyze_completed') else '❌ Failed'}",
+                f"  Space Reclaim: {self._format_space_reclaim(tier_result)}",
+                f"  Statistics: {'✅ Completed' if tier_result.get('analyze_completed') else '❌ Failed'}",
+                f"  Maintenance: {', '.join(tier_result.get('maintenance', {}).get('actions', [])) or 'not needed'}",
                 "",
                 f"  Tables: {len(tier_result.get('table_stats', []))}",
                 f"  Indexes: {tier_result.get('index_analysis', {}).get('index_count', 0)}"
@@ -303,6 +325,12 @@ class SQLiteOptimizer:
                 report_lines.append("\n  Table Statistics:")
                 for table in tier_result['table_stats']:
                     report_lines.append(f"    - {table['table']}: {table['rows']:,} rows")
+            
+            recommendations = tier_result.get('maintenance', {}).get('recommendations', [])
+            if recommendations:
+                report_lines.append("\n  Recommendations:")
+                for recommendation in recommendations:
+                    report_lines.append(f"    - {recommendation}")
         
         report_lines.append("\n" + "=" * 80)
         
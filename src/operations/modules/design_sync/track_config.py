@@ -17,6 +17,8 @@ from pathlib import Path
 from datetime import datetime
 import json
 
+from src.utils.config_snapshots import get_config_runtime, thaw
+
 
 # Fun track name components
 TRACK_ATTRIBUTES = [
@@ -312,8 +314,9 @@ class TrackConfigManager:
         if not config_path.exists():
             return MultiTrackConfig()
         
-        with open(config_path) as f:
-            config_data = json.load(f)
+        # Read-only snapshot, parsed once per change of cortex.config.json;
+        # the returned MultiTrackConfig is a fresh mutable copy
+        config_data = get_config_runtime().json_file(config_path).value
         
         design_tracks = config_data.get('design_tracks', {})
         
@@ -328,9 +331,9 @@ class TrackConfigManager:
                 track_name=track_data.get('name', track_id),
                 emoji=track_data.get('emoji', '🎯'),
                 color=track_data.get('color', 'White'),
-                machines=track_data.get('machines', []),
-                phases=track_data.get('phases', []),
-                modules=track_data.get('modules', []),
+                machines=thaw(track_data.get('machines', [])),
+                phases=thaw(track_data.get('phases', [])),
+                modules=thaw(track_data.get('modules', [])),
                 estimated_hours=track_data.get('estimated_hours', 0.0),
                 velocity_target=track_data.get('velocity_target', 4.0)
             )
@@ -383,6 +386,9 @@ class TrackConfigManager:
         # Save back
         with open(config_path, 'w') as f:
             json.dump(config_data, f, indent=2)
+        
+        # Publish the new snapshot now instead of waiting for the watcher
+        get_config_runtime().json_file(config_path).refresh()
     
     @staticmethod
     def create_multi_track_config(
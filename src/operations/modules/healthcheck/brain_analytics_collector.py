@@ -18,9 +18,79 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 
+from src.infrastructure.persistence.materialized_stats import (
+    MaterializedStats,
+    Stat,
+    TableStats,
+    day_key
+)
+
 logger = logging.getLogger(__name__)
 
 
+# Trigger-maintained statistics per tier (see MaterializedStats). Time
+# windows are answered from per-day buckets, so "last N days" has day
+# granularity.
+TIER1_STATS = [
+    TableStats('conversations', (
+        Stat('rows'),
+        Stat('created_day', key=day_key('created_at')),
+        Stat('activity_day', key=day_key('last_activity')),
+    )),
+    TableStats('messages', (
+        Stat('rows'),
+        Stat('by_conversation', key='{row}.conversation_id', distinct=True),
+    )),
+    TableStats('token_metrics', (
+        Stat('tokens', where='{row}.total_tokens IS NOT NULL', total='{row}.total_tokens'),
+    )),
+    TableStats('entities', (
+        Stat('rows'),
+        Stat('by_type', key='{row}.entity_type'),
+        Stat('first_seen_day', key=day_key('first_seen')),
+    )),
+    TableStats('sessions', (
+        Stat('rows'),
+        Stat('active', where='{row}.is_active = 1'),
+    )),
+]
+
+TIER2_STATS = [
+    TableStats('patterns', (
+        Stat('rows'),
+        Stat('by_type', key='{row}.pattern_type'),
+        Stat('created_day', key=day_key('created_at')),
+        Stat('pinned', where='{row}.is_pinned = 1'),
+        Stat(
+            'confidence_band',
+            key="CASE WHEN {row}.confidence > 0.80 THEN 'high' "
+                "WHEN {row}.confidence > 0.50 THEN 'medium' ELSE 'low' END",
+            where='{row}.confidence IS NOT NULL'
+        ),
+    )),
+    TableStats('pattern_decay_history', (
+        Stat('decay_day', key=day_key('decay_timestamp'), total='{row}.confidence_delta'),
+    )),
+    TableStats('relationships', (
+        Stat('rows'),
+        Stat('by_type', key='{row}.relationship_type'),
+    )),
+]
+
+TIER3_STATS = [
+    TableStats('code_metrics', (
+        Stat('files', key='{row}.file_path', where='{row}.file_path IS NOT NULL', distinct=True),
+        Stat('hotspots', where='{row}.churn_rate > 0.1'),
+    )),
+    TableStats('git_activity', (
+        Stat('commit_day', key=day_key('commit_timestamp')),
+    )),
+    TableStats('developer_patterns', (
+        Stat('rows'),
+    )),
+]
+
+
 class BrainAnalyticsCollector:
     """
     Collects comprehensive analytics from all brain tiers.
@@ -31,14 +101,26 @@ class BrainAnalyticsCollector:
     - Tier 3 statistics (code hotspots, git activity, developer patterns)
     - Health scoring algorithm
     - Trend analysis
+    
+    Statistics are read from summary rows maintained by SQLite triggers,
+    so collection cost does not grow with the brain. The first collection
+    installs the triggers (backfilling once); later collections only read
+    summary rows and reconcile them against the source tables when
+    reconcile_interval has elapsed. With install_triggers=False collection
+    never writes and stats are computed from the source tables instead.
     """
     
-    def __init__(self, brain_path: Optional[Path] = None):
+    def __init__(self, brain_path: Optional[Path] = None,
+                 reconcile_interval: timedelta = timedelta(hours=24),
+                 install_triggers: bool = True):
         """
         Initialize brain analytics collector.
         
         Args:
             brain_path: Path to cortex-brain directory
+            reconcile_interval: How often collection reconciles materialized stats
+            install_triggers: Install stat triggers on first collection
+                              (False = read-only, full-scan statistics)
         """
         if brain_path is None:
             brain_path = Path.cwd() / "cortex-brain"
@@ -47,6 +129,8 @@ class BrainAnalyticsCollector:
         self.tier1_db = brain_path / "tier1" / "working_memory.db"
         self.tier2_db = brain_path / "tier2" / "knowledge_graph.db"
         self.tier3_db = brain_path / "tier3" / "development_context.db"
+        self.reconcile_interval = reconcile_interval
+        self.install_triggers = install_triggers
     
     def collect_all_analytics(self) -> Dict[str, Any]:
         """
@@ -88,18 +172,18 @@ class BrainAnalyticsCollector:
         
         try:
             conn = sqlite3.connect(str(self.tier1_db))
-            cursor = conn.cursor()
+            stats = self._materialized_stats(conn, TIER1_STATS)
             
-            stats = {
+            result = {
                 'status': 'healthy',
-                'conversations': self._get_conversation_stats(cursor),
-                'tokens': self._get_token_stats(cursor),
-                'entities': self._get_entity_stats(cursor),
-                'sessions': self._get_session_stats(cursor),
+                'conversations': self._get_conversation_stats(stats),
+                'tokens': self._get_token_stats(stats),
+                'entities': self._get_entity_stats(stats),
+                'sessions': self._get_session_stats(stats),
             }
             
             conn.close()
-            return stats
+            return result
             
         except Exception as e:
             logger.error(f"Failed to collect Tier 1 stats: {e}", exc_info=True)
@@ -123,18 +207,18 @@ class BrainAnalyticsCollector:
         
         try:
             conn = sqlite3.connect(str(self.tier2_db))
-            cursor = conn.cursor()
+            stats = self._materialized_stats(conn, TIER2_STATS)
             
-            stats = {
+            result = {
                 'status': 'healthy',
-                'patterns': self._get_pattern_stats(cursor),
-                'confidence': self._get_confidence_distribution(cursor),
-                'decay': self._get_decay_analysis(cursor),
-                'relationships': self._get_relationship_stats(cursor),
+                'patterns': self._get_pattern_stats(stats),
+                'confidence': self._get_confidence_distribution(stats),
+                'decay': self._get_decay_analysis(stats),
+                'relationships': self._get_relationship_stats(stats),
             }
             
             conn.close()
-            return stats
+            return result
             
         except Exception as e:
             logger.error(f"Failed to collect Tier 2 stats: {e}", exc_info=True)
@@ -158,17 +242,17 @@ class BrainAnalyticsCollector:
         
         try:
             conn = sqlite3.connect(str(self.tier3_db))
-            cursor = conn.cursor()
+            stats = self._materialized_stats(conn, TIER3_STATS)
             
-            stats = {
+            result = {
                 'status': 'healthy',
-                'code_metrics': self._get_code_metrics(cursor),
-                'git_activity': self._get_git_activity(cursor),
-                'developer_patterns': self._get_developer_patterns(cursor),
+                'code_metrics': self._get_code_metrics(stats),
+                'git_activity': self._get_git_activity(stats),
+                'developer_patterns': self._get_developer_patterns(stats),
             }
             
             conn.close()
-            return stats
+            return result
             
         except Exception as e:
             logger.error(f"Failed to collect Tier 3 stats: {e}", exc_info=True)
@@ -177,39 +261,69 @@ class BrainAnalyticsCollector:
                 'error': str(e)
             }
     
+    def _materialized_stats(self, conn: sqlite3.Connection, specs: List[TableStats],
+                            install: Optional[bool] = None) -> MaterializedStats:
+        """
+        Open the tier's trigger-maintained statistics.
+        
+        install() is a no-op for tables whose triggers are current, apart
+        from the scheduled reconcile once reconcile_interval has elapsed.
+        """
+        stats = MaterializedStats(conn, specs, reconcile_interval=self.reconcile_interval)
+        if self.install_triggers if install is None else install:
+            stats.install()
+        else:
+            stats.load()
+        return stats
+    
+    def reconcile(self) -> Dict[str, Dict[str, int]]:
+        """
+        Install stat triggers and verify them against the source tables,
+        repairing drift.
+        
+        Returns:
+            Drifted stat rows per tier and table
+        """
+        drift = {}
+        for tier, db_path, specs in (
+            ('tier1', self.tier1_db, TIER1_STATS),
+            ('tier2', self.tier2_db, TIER2_STATS),
+            ('tier3', self.tier3_db, TIER3_STATS),
+        ):
+            if not db_path.exists():
+                continue
+            conn = sqlite3.connect(str(db_path))
+            try:
+                stats = self._materialized_stats(conn, specs, install=True)
+                drift[tier] = stats.reconcile() if stats.installed else {}
+            finally:
+                conn.close()
+        return drift
+    
     # ============ Tier 1 Helper Methods ============
     
-    def _get_conversation_stats(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_conversation_stats(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get conversation statistics from Tier 1."""
         try:
+            stats.require('conversations')
+            stats.require('messages')
+            
             # Total conversations
-            cursor.execute("SELECT COUNT(*) FROM conversations")
-            total_conversations = cursor.fetchone()[0]
+            total_conversations = stats.count('conversations')
             
             # Active conversations (last 7 days)
-            seven_days_ago = (datetime.now() - timedelta(days=7)).timestamp()
-            cursor.execute(
-                "SELECT COUNT(*) FROM conversations WHERE created_at > ?",
-                (seven_days_ago,)
-            )
-            active_conversations = cursor.fetchone()[0]
+            active_conversations, _ = stats.since('conversations', 'created_day', 7)
             
-            # Average conversation length
-            cursor.execute(
-                "SELECT AVG(message_count) FROM ("
-                "SELECT conversation_id, COUNT(*) as message_count "
-                "FROM messages GROUP BY conversation_id)"
+            # Average conversation length (over conversations with messages)
+            conversations_with_messages = stats.distinct('messages', 'by_conversation')
+            avg_length_result = (
+                stats.count('messages') / conversations_with_messages
+                if conversations_with_messages else None
             )
-            avg_length_result = cursor.fetchone()[0]
             avg_conversation_length = round(avg_length_result, 1) if avg_length_result else 0
             
             # Retention rate (conversations accessed in last 30 days)
-            thirty_days_ago = (datetime.now() - timedelta(days=30)).timestamp()
-            cursor.execute(
-                "SELECT COUNT(*) FROM conversations WHERE last_activity > ?",
-                (thirty_days_ago,)
-            )
-            recent_access = cursor.fetchone()[0]
+            recent_access, _ = stats.since('conversations', 'activity_day', 30)
             retention_rate = (recent_access / total_conversations * 100) if total_conversations > 0 else 0
             
             return {
@@ -223,25 +337,19 @@ class BrainAnalyticsCollector:
             logger.warning(f"Conversation stats collection failed: {e}")
             return {'error': str(e)}
     
-    def _get_token_stats(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_token_stats(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get token usage statistics from Tier 1."""
         try:
             # Check if token_metrics table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='token_metrics'"
-            )
-            if not cursor.fetchone():
+            if not stats.has('token_metrics'):
                 return {'status': 'not_available', 'note': 'Token metrics tracking not initialized'}
             
             # Total tokens used
-            cursor.execute("SELECT SUM(total_tokens) FROM token_metrics")
-            total_tokens_result = cursor.fetchone()[0]
-            total_tokens = total_tokens_result if total_tokens_result else 0
+            total_tokens = int(stats.total('token_metrics', 'tokens'))
             
             # Average tokens per request
-            cursor.execute("SELECT AVG(total_tokens) FROM token_metrics")
-            avg_tokens_result = cursor.fetchone()[0]
-            avg_tokens = round(avg_tokens_result, 0) if avg_tokens_result else 0
+            requests = stats.count('token_metrics', 'tokens')
+            avg_tokens = round(total_tokens / requests, 0) if requests else 0
             
             # Token budget usage (assume 3M limit)
             TOKEN_BUDGET = 3_000_000
@@ -258,27 +366,19 @@ class BrainAnalyticsCollector:
             logger.warning(f"Token stats collection failed: {e}")
             return {'error': str(e)}
     
-    def _get_entity_stats(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_entity_stats(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get entity extraction statistics from Tier 1."""
         try:
+            stats.require('entities')
+            
             # Total entities
-            cursor.execute("SELECT COUNT(*) FROM entities")
-            total_entities = cursor.fetchone()[0]
+            total_entities = stats.count('entities')
             
             # Entities by type
-            cursor.execute(
-                "SELECT entity_type, COUNT(*) as count FROM entities "
-                "GROUP BY entity_type ORDER BY count DESC"
-            )
-            by_type = {row[0]: row[1] for row in cursor.fetchall()}
+            by_type = stats.groups('entities', 'by_type')
             
             # Recent entities (last 7 days)
-            seven_days_ago = (datetime.now() - timedelta(days=7)).timestamp()
-            cursor.execute(
-                "SELECT COUNT(*) FROM entities WHERE first_seen > ?",
-                (seven_days_ago,)
-            )
-            recent_entities = cursor.fetchone()[0]
+            recent_entities, _ = stats.since('entities', 'first_seen_day', 7)
             
             return {
                 'total_entities': total_entities,
@@ -290,27 +390,16 @@ class BrainAnalyticsCollector:
             logger.warning(f"Entity stats collection failed: {e}")
             return {'error': str(e)}
     
-    def _get_session_stats(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_session_stats(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get session statistics from Tier 1."""
         try:
             # Check if sessions table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='sessions'"
-            )
-            if not cursor.fetchone():
+            if not stats.has('sessions'):
                 return {'status': 'not_available'}
             
-            # Total sessions
-            cursor.execute("SELECT COUNT(*) FROM sessions")
-            total_sessions = cursor.fetchone()[0]
-            
-            # Active sessions
-            cursor.execute("SELECT COUNT(*) FROM sessions WHERE is_active = 1")
-            active_sessions = cursor.fetchone()[0]
-            
             return {
-                'total_sessions': total_sessions,
-                'active_sessions': active_sessions,
+                'total_sessions': stats.count('sessions'),
+                'active_sessions': stats.count('sessions', 'active'),
             }
             
         except Exception as e:
@@ -319,63 +408,35 @@ class BrainAnalyticsCollector:
     
     # ============ Tier 2 Helper Methods ============
     
-    def _get_pattern_stats(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_pattern_stats(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get pattern statistics from Tier 2."""
         try:
-            # Total patterns
-            cursor.execute("SELECT COUNT(*) FROM patterns")
-            total_patterns = cursor.fetchone()[0]
-            
-            # Patterns by type
-            cursor.execute(
-                "SELECT pattern_type, COUNT(*) as count FROM patterns "
-                "GROUP BY pattern_type ORDER BY count DESC"
-            )
-            by_type = {row[0]: row[1] for row in cursor.fetchall()}
+            stats.require('patterns')
             
             # Recent patterns (last 30 days)
-            thirty_days_ago = (datetime.now() - timedelta(days=30)).timestamp()
-            cursor.execute(
-                "SELECT COUNT(*) FROM patterns WHERE created_at > ?",
-                (thirty_days_ago,)
-            )
-            recent_patterns = cursor.fetchone()[0]
-            
-            # Pinned patterns
-            cursor.execute("SELECT COUNT(*) FROM patterns WHERE is_pinned = 1")
-            pinned_patterns = cursor.fetchone()[0]
+            recent_patterns, _ = stats.since('patterns', 'created_day', 30)
             
             return {
-                'total_patterns': total_patterns,
-                'by_type': by_type,
+                'total_patterns': stats.count('patterns'),
+                'by_type': stats.groups('patterns', 'by_type'),
                 'recent_patterns': recent_patterns,
-                'pinned_patterns': pinned_patterns,
+                'pinned_patterns': stats.count('patterns', 'pinned'),
             }
             
         except Exception as e:
             logger.warning(f"Pattern stats collection failed: {e}")
             return {'error': str(e)}
     
-    def _get_confidence_distribution(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_confidence_distribution(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get confidence score distribution from Tier 2."""
         try:
-            # High confidence (>0.80)
-            cursor.execute(
-                "SELECT COUNT(*) FROM patterns WHERE confidence > 0.80"
-            )
-            high_confidence = cursor.fetchone()[0]
+            stats.require('patterns')
             
-            # Medium confidence (0.50-0.80)
-            cursor.execute(
-                "SELECT COUNT(*) FROM patterns WHERE confidence > 0.50 AND confidence <= 0.80"
-            )
-            medium_confidence = cursor.fetchone()[0]
-            
-            # Low confidence (<0.50)
-            cursor.execute(
-                "SELECT COUNT(*) FROM patterns WHERE confidence <= 0.50"
-            )
-            low_confidence = cursor.fetchone()[0]
+            # High (>0.80), medium (0.50-0.80) and low (<=0.50) confidence
+            bands = stats.groups('patterns', 'confidence_band')
+            high_confidence = bands.get('high', 0)
+            medium_confidence = bands.get('medium', 0)
+            low_confidence = bands.get('low', 0)
             
             total = high_confidence + medium_confidence + low_confidence
             
@@ -394,30 +455,16 @@ class BrainAnalyticsCollector:
             logger.warning(f"Confidence distribution collection failed: {e}")
             return {'error': str(e)}
     
-    def _get_decay_analysis(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_decay_analysis(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get pattern decay analysis from Tier 2."""
         try:
             # Check if decay tracking exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='pattern_decay_history'"
-            )
-            if not cursor.fetchone():
+            if not stats.has('pattern_decay_history'):
                 return {'status': 'not_available'}
             
-            # Recent decay events (last 30 days)
-            thirty_days_ago = (datetime.now() - timedelta(days=30)).timestamp()
-            cursor.execute(
-                "SELECT COUNT(*) FROM pattern_decay_history WHERE decay_timestamp > ?",
-                (thirty_days_ago,)
-            )
-            recent_decay_events = cursor.fetchone()[0]
-            
-            # Average decay rate
-            cursor.execute(
-                "SELECT AVG(confidence_delta) FROM pattern_decay_history WHERE decay_timestamp > ?",
-                (thirty_days_ago,)
-            )
-            avg_decay_result = cursor.fetchone()[0]
+            # Recent decay events and average decay (last 30 days)
+            recent_decay_events, decay_total = stats.since('pattern_decay_history', 'decay_day', 30)
+            avg_decay_result = decay_total / recent_decay_events if recent_decay_events else None
             avg_decay_rate = abs(round(avg_decay_result, 3)) if avg_decay_result else 0
             
             return {
@@ -430,30 +477,16 @@ class BrainAnalyticsCollector:
             logger.warning(f"Decay analysis collection failed: {e}")
             return {'error': str(e)}
     
-    def _get_relationship_stats(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_relationship_stats(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get relationship statistics from Tier 2."""
         try:
             # Check if relationships table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='relationships'"
-            )
-            if not cursor.fetchone():
+            if not stats.has('relationships'):
                 return {'status': 'not_available'}
             
-            # Total relationships
-            cursor.execute("SELECT COUNT(*) FROM relationships")
-            total_relationships = cursor.fetchone()[0]
-            
-            # Relationships by type
-            cursor.execute(
-                "SELECT relationship_type, COUNT(*) as count FROM relationships "
-                "GROUP BY relationship_type ORDER BY count DESC"
-            )
-            by_type = {row[0]: row[1] for row in cursor.fetchall()}
-            
             return {
-                'total_relationships': total_relationships,
-                'by_type': by_type,
+                'total_relationships': stats.count('relationships'),
+                'by_type': stats.groups('relationships', 'by_type'),
             }
             
         except Exception as e:
@@ -462,52 +495,31 @@ class BrainAnalyticsCollector:
     
     # ============ Tier 3 Helper Methods ============
     
-    def _get_code_metrics(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_code_metrics(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get code metrics from Tier 3."""
         try:
             # Check if code_metrics table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='code_metrics'"
-            )
-            if not cursor.fetchone():
+            if not stats.has('code_metrics'):
                 return {'status': 'not_available'}
             
-            # Total files tracked
-            cursor.execute("SELECT COUNT(DISTINCT file_path) FROM code_metrics")
-            total_files = cursor.fetchone()[0]
-            
-            # Code hotspots (files with high churn)
-            cursor.execute(
-                "SELECT COUNT(*) FROM code_metrics WHERE churn_rate > 0.1"
-            )
-            hotspots = cursor.fetchone()[0]
-            
             return {
-                'total_files_tracked': total_files,
-                'hotspots': hotspots,
+                'total_files_tracked': stats.distinct('code_metrics', 'files'),
+                'hotspots': stats.count('code_metrics', 'hotspots'),
             }
             
         except Exception as e:
             logger.warning(f"Code metrics collection failed: {e}")
             return {'error': str(e)}
     
-    def _get_git_activity(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_git_activity(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get git activity from Tier 3."""
         try:
             # Check if git_activity table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='git_activity'"
-            )
-            if not cursor.fetchone():
+            if not stats.has('git_activity'):
                 return {'status': 'not_available'}
             
             # Recent commits (last 7 days)
-            seven_days_ago = (datetime.now() - timedelta(days=7)).timestamp()
-            cursor.execute(
-                "SELECT COUNT(*) FROM git_activity WHERE commit_timestamp > ?",
-                (seven_days_ago,)
-            )
-            recent_commits = cursor.fetchone()[0]
+            recent_commits, _ = stats.since('git_activity', 'commit_day', 7)
             
             return {
                 'recent_commits': recent_commits,
@@ -517,22 +529,15 @@ class BrainAnalyticsCollector:
             logger.warning(f"Git activity collection failed: {e}")
             return {'error': str(e)}
     
-    def _get_developer_patterns(self, cursor: sqlite3.Cursor) -> Dict[str, Any]:
+    def _get_developer_patterns(self, stats: MaterializedStats) -> Dict[str, Any]:
         """Get developer patterns from Tier 3."""
         try:
             # Check if developer_patterns table exists
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='developer_patterns'"
-            )
-            if not cursor.fetchone():
+            if not stats.has('developer_patterns'):
                 return {'status': 'not_available'}
             
-            # Total patterns learned
-            cursor.execute("SELECT COUNT(*) FROM developer_patterns")
-            total_patterns = cursor.fetchone()[0]
-            
             return {
-                'total_patterns_learned': total_patterns,
+                'total_patterns_learned': stats.count('developer_patterns'),
             }
             
         except Exception as e:
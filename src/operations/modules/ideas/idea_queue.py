@@ -6,9 +6,17 @@ Purpose: Ultra-fast (<5ms) capture of fleeting ideas during active work with
          with async enrichment.
 
 Architecture:
-- Instant capture: <5ms append-only SQLite write
+- Instant capture: <5ms; capture only enqueues onto a bounded in-memory queue
+- Single writer: one long-lived worker thread drains the queue and
+  group-commits inserts plus their enrichment updates in one transaction
+- Single connection: all reads and writes share one SQLite connection
+  (WAL); reads first wait for queued captures, so they see every idea
+  captured before them
 - Zero disruption: Work continues immediately after capture
 - Async enrichment: Component detection, priority inference, clustering
+- Optional read-through cache for list/filter queries, invalidated on commit
+- Durable shutdown: close() (also run at exit or when an unclosed queue is
+  garbage collected) drains and commits the queue
 - Context preservation: Active file, operation, conversation tracking
 - Cross-repository: Projects across multiple repos
 
@@ -25,13 +33,80 @@ from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
+import queue
 import threading
 import time
 import re
+import weakref
 
 
 logger = logging.getLogger(__name__)
 
+_INSERT_IDEA = """
+    INSERT INTO ideas (
+        idea_id, raw_text, timestamp,
+        active_file, active_line, active_operation,
+        conversation_id, project,
+        component, priority, related_ideas, status,
+        created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Queue item telling the writer to stop
+_STOP = object()
+
+
+def _run_writer(
+    queue_ref: "weakref.ReferenceType[IdeaQueue]",
+    pending: "queue.Queue[Any]",
+    conn: sqlite3.Connection,
+    db_lock: threading.RLock,
+    batch_size: int
+) -> None:
+    """
+    Writer thread body: drain the capture queue, one group commit per batch.
+    
+    Holds the IdeaQueue only while committing a batch, so a queue that is
+    never closed can still be garbage collected; its finalizer then stops
+    this thread. Ideas left once the queue is gone are stored unenriched.
+    The writer closes the connection when it stops.
+    """
+    while True:
+        batch = [pending.get()]
+        while len(batch) < batch_size and batch[-1] is not _STOP:
+            try:
+                batch.append(pending.get_nowait())
+            except queue.Empty:
+                break
+        
+        ideas = [item for item in batch if item is not _STOP]
+        idea_queue = queue_ref()
+        try:
+            if ideas and idea_queue is not None:
+                idea_queue._commit_batch(ideas)
+            elif ideas:
+                with db_lock, conn:
+                    conn.executemany(_INSERT_IDEA, [IdeaQueue._idea_to_params(idea) for idea in ideas])
+        except Exception as e:
+            logger.error(f"Idea writer failed to commit {len(ideas)} ideas: {e}")
+        finally:
+            idea_queue = None
+            for _ in batch:
+                pending.task_done()
+        
+        if batch[-1] is _STOP or (queue_ref() is None and pending.empty()):
+            with db_lock:
+                conn.close()
+            return
+
+
+def _stop_writer(pending: "queue.Queue[Any]", writer: threading.Thread) -> None:
+    """Finalizer shared by close(), garbage collection and interpreter exit."""
+    if threading.current_thread() is writer:
+        return  # Dropped by the writer itself: it stops once the queue is drained
+    pending.put(_STOP)
+    writer.join()
+
 
 @dataclass
 class IdeaCapture:
@@ -79,13 +154,21 @@ class IdeaQueue:
     - Append-only for maximum speed
     - Minimal validation during capture
     - Rich functionality in async background processing
+    
+    Captures are persisted by a background writer: call flush() to wait
+    for them, and close() when done (open queues are closed at exit or
+    when garbage collected).
+    A full queue blocks capture until the writer catches up.
     """
     
     def __init__(
         self,
         db_path: Optional[str] = None,
         enable_enrichment: bool = True,
-        max_capture_ms: float = 5.0
+        max_capture_ms: float = 5.0,
+        batch_size: int = 128,
+        max_pending: int = 4096,
+        cache_reads: bool = False
     ):
         """
         Initialize IDEA capture queue.
@@ -94,13 +177,22 @@ class IdeaQueue:
             db_path: SQLite database path (default: cortex-brain/tier1/idea-queue.db)
             enable_enrichment: Enable async enrichment processing
             max_capture_ms: Maximum allowed capture time (performance target)
+            batch_size: Maximum captures per group commit
+            max_pending: Capacity of the capture queue (backpressure bound)
+            cache_reads: Cache list/filter query results until the next write
         """
         self.db_path = db_path or self._get_default_db_path()
         self.enable_enrichment = enable_enrichment
         self.max_capture_ms = max_capture_ms
+        self.batch_size = batch_size
         
-        # Thread safety for concurrent access
+        # One connection shared by the writer and all readers
         self._db_lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        
+        # Read-through cache of query rows, cleared on every commit
+        self._read_cache: Optional[Dict[Tuple, List[sqlite3.Row]]] = {} if cache_reads else None
         
         # Performance monitoring
         self.stats = {
@@ -108,12 +200,27 @@ class IdeaQueue:
             'captures_under_5ms': 0,
             'average_capture_time': 0.0,
             'max_capture_time': 0.0,
-            'enrichments_processed': 0
+            'enrichments_processed': 0,
+            'commits': 0,
+            'largest_batch': 0
         }
         
         # Initialize database
         self._init_database()
         
+        # Single long-lived writer fed by a bounded queue
+        self._pending: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._writer = threading.Thread(
+            target=_run_writer,
+            args=(weakref.ref(self), self._pending, self._conn, self._db_lock, batch_size),
+            name="idea-queue-writer",
+            daemon=True
+        )
+        self._writer.start()
+        # Runs once: on close(), when collected, or at interpreter exit
+        self._finalizer = weakref.finalize(self, _stop_writer, self._pending, self._writer)
+        
         logger.info(f"IdeaQueue initialized: {self.db_path}, enrichment={enable_enrichment}")
     
     def capture(
@@ -133,7 +240,11 @@ class IdeaQueue:
             
         Raises:
             PerformanceError: If capture exceeds max_capture_ms
+            RuntimeError: If the queue has been closed
         """
+        if self._closed:
+            raise RuntimeError("IdeaQueue is closed")
+        
         start_time = time.perf_counter()
         
         try:
@@ -160,8 +271,8 @@ class IdeaQueue:
                 project=project
             )
             
-            # Fast SQLite append (critical path)
-            self._fast_insert(idea)
+            # Hand off to the writer (critical path); it inserts and enriches
+            self._pending.put(idea)
             
             # Performance validation
             capture_time = (time.perf_counter() - start_time) * 1000
@@ -174,14 +285,6 @@ class IdeaQueue:
             
             logger.debug(f"Captured idea {idea_id} in {capture_time:.1f}ms: '{raw_text}'")
             
-            # Trigger async enrichment (zero impact on capture performance)
-            if self.enable_enrichment:
-                threading.Thread(
-                    target=self._enrich_idea,
-                    args=(idea_id,),
-                    daemon=True
-                ).start()
-            
             return idea_id
             
         except Exception as e:
@@ -204,94 +307,61 @@ class IdeaQueue:
         Returns:
             List of IdeaCapture objects
         """
-        with self._db_lock:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            
-            try:
-                query = """
-                    SELECT * FROM ideas 
-                    WHERE 1=1
-                """
-                params = []
-                
-                if status_filter:
-                    query += " AND status = ?"
-                    params.append(status_filter)
-                
-                query += " ORDER BY timestamp DESC"
-                
-                if limit:
-                    query += " LIMIT ?"
-                    params.append(limit)
-                
-                cursor = conn.execute(query, params)
-                rows = cursor.fetchall()
-                
-                return [self._row_to_idea(row) for row in rows]
-                
-            finally:
-                conn.close()
+        query = """
+            SELECT * FROM ideas 
+            WHERE 1=1
+        """
+        params = []
+        
+        if status_filter:
+            query += " AND status = ?"
+            params.append(status_filter)
+        
+        query += " ORDER BY timestamp DESC"
+        
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        rows = self._cached_query(('all', status_filter, limit), query, params)
+        return [self._row_to_idea(row) for row in rows]
     
     def filter_by_component(self, component: str) -> List[IdeaCapture]:
         """Filter ideas by component (auth, api, ui, etc.)."""
-        with self._db_lock:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            
-            try:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM ideas 
-                    WHERE component = ? 
-                    ORDER BY timestamp DESC
-                    """,
-                    (component,)
-                )
-                rows = cursor.fetchall()
-                return [self._row_to_idea(row) for row in rows]
-                
-            finally:
-                conn.close()
+        rows = self._cached_query(
+            ('component', component),
+            """
+            SELECT * FROM ideas 
+            WHERE component = ? 
+            ORDER BY timestamp DESC
+            """,
+            (component,)
+        )
+        return [self._row_to_idea(row) for row in rows]
     
     def filter_by_project(self, project: str) -> List[IdeaCapture]:
         """Filter ideas by project/repository."""
-        with self._db_lock:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            
-            try:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM ideas 
-                    WHERE project = ? 
-                    ORDER BY timestamp DESC
-                    """,
-                    (project,)
-                )
-                rows = cursor.fetchall()
-                return [self._row_to_idea(row) for row in rows]
-                
-            finally:
-                conn.close()
+        rows = self._cached_query(
+            ('project', project),
+            """
+            SELECT * FROM ideas 
+            WHERE project = ? 
+            ORDER BY timestamp DESC
+            """,
+            (project,)
+        )
+        return [self._row_to_idea(row) for row in rows]
     
     def get_idea(self, idea_id: str) -> Optional[IdeaCapture]:
         """Get specific idea by ID."""
+        self.flush()
         with self._db_lock:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            
-            try:
-                cursor = conn.execute(
-                    "SELECT * FROM ideas WHERE idea_id = ?",
-                    (idea_id,)
-                )
-                row = cursor.fetchone()
-                
-                return self._row_to_idea(row) if row else None
-                
-            finally:
-                conn.close()
+            row = self._conn.execute(
+                "SELECT * FROM ideas WHERE idea_id = ?",
+                (idea_id,)
+            ).fetchone()
+        
+        return self._row_to_idea(row) if row else None
     
     def complete_idea(self, idea_id: str) -> bool:
         """Mark idea as completed."""
@@ -306,32 +376,31 @@ class IdeaQueue:
         if priority not in ['high', 'medium', 'low']:
             raise ValueError(f"Invalid priority: {priority}")
         
-        with self._db_lock:
-            conn = sqlite3.connect(self.db_path)
-            
-            try:
-                cursor = conn.execute(
-                    """
-                    UPDATE ideas 
-                    SET priority = ?, updated_at = ? 
-                    WHERE idea_id = ?
-                    """,
-                    (priority, datetime.now().isoformat(), idea_id)
-                )
-                success = cursor.rowcount > 0
-                conn.commit()
-                
-                if success:
-                    logger.info(f"Updated idea {idea_id} priority to {priority}")
-                
-                return success
-                
-            finally:
-                conn.close()
+        return self._update_idea(idea_id, 'priority', priority)
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics."""
-        return dict(self.stats)
+        stats = dict(self.stats)
+        stats['pending'] = self._pending.qsize()
+        return stats
+    
+    def flush(self) -> None:
+        """Block until every idea captured so far is committed and enriched."""
+        if threading.current_thread() is not self._writer:
+            self._pending.join()
+    
+    def close(self) -> None:
+        """Commit all queued captures, stop the writer and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        self._finalizer()
+    
+    def __enter__(self) -> "IdeaQueue":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def _get_default_db_path(self) -> str:
         """Get default database path in CORTEX brain."""
@@ -343,83 +412,109 @@ class IdeaQueue:
     def _init_database(self) -> None:
         """Initialize SQLite database schema."""
         with self._db_lock:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
             
-            try:
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS ideas (
-                        idea_id TEXT PRIMARY KEY,
-                        raw_text TEXT NOT NULL,
-                        timestamp TEXT NOT NULL,
-                        
-                        -- Context (instant capture)
-                        active_file TEXT,
-                        active_line INTEGER,
-                        active_operation TEXT,
-                        conversation_id TEXT,
-                        project TEXT,
-                        
-                        -- Enrichment (async)
-                        component TEXT,
-                        priority TEXT,
-                        related_ideas TEXT, -- JSON array
-                        status TEXT DEFAULT 'pending',
-                        
-                        -- Metadata
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL
-                    )
-                """)
-                
-                # Indexes for performance
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON ideas(timestamp)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON ideas(status)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_component ON ideas(component)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_project ON ideas(project)")
-                
-                conn.commit()
-                
-            finally:
-                conn.close()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ideas (
+                    idea_id TEXT PRIMARY KEY,
+                    raw_text TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    
+                    -- Context (instant capture)
+                    active_file TEXT,
+                    active_line INTEGER,
+                    active_operation TEXT,
+                    conversation_id TEXT,
+                    project TEXT,
+                    
+                    -- Enrichment (async)
+                    component TEXT,
+                    priority TEXT,
+                    related_ideas TEXT, -- JSON array
+                    status TEXT DEFAULT 'pending',
+                    
+                    -- Metadata
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            
+            # Indexes for performance
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON ideas(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON ideas(status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_component ON ideas(component)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_project ON ideas(project)")
+            # Related-idea lookup during enrichment: newest pending ideas of a component
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_component_status_time ON ideas(component, status, timestamp)"
+            )
+            
+            conn.commit()
     
-    def _fast_insert(self, idea: IdeaCapture) -> None:
-        """Ultra-fast SQLite insert optimized for <5ms performance."""
+    def _cached_query(self, key: Tuple, query: str, params) -> List[sqlite3.Row]:
+        """Run a read query after pending captures are committed, through the read cache."""
+        self.flush()
+        with self._db_lock:
+            if self._read_cache is not None and key in self._read_cache:
+                return self._read_cache[key]
+            rows = self._conn.execute(query, params).fetchall()
+            if self._read_cache is not None:
+                self._read_cache[key] = rows
+            return rows
+    
+    def _invalidate_reads(self) -> None:
+        if self._read_cache:
+            self._read_cache.clear()
+    
+    def _commit_batch(self, ideas: List[IdeaCapture]) -> None:
+        """Insert and enrich a batch of captures in one transaction."""
         with self._db_lock:
-            conn = sqlite3.connect(self.db_path)
-            
             try:
-                # Convert related_ideas to JSON
-                related_json = json.dumps(idea.related_ideas) if idea.related_ideas else None
-                
-                conn.execute("""
-                    INSERT INTO ideas (
-                        idea_id, raw_text, timestamp,
-                        active_file, active_line, active_operation,
-                        conversation_id, project,
-                        component, priority, related_ideas, status,
-                        created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    idea.idea_id,
-                    idea.raw_text,
-                    idea.timestamp.isoformat(),
-                    idea.active_file,
-                    idea.active_line,
-                    idea.active_operation,
-                    idea.conversation_id,
-                    idea.project,
-                    idea.component,
-                    idea.priority,
-                    related_json,
-                    idea.status,
-                    idea.created_at.isoformat(),
-                    idea.updated_at.isoformat()
-                ))
-                
-                conn.commit()
-                
-            finally:
-                conn.close()
+                with self._conn:
+                    self._conn.executemany(_INSERT_IDEA, [self._idea_to_params(idea) for idea in ideas])
+                    if self.enable_enrichment:
+                        for idea in ideas:
+                            self._enrich_idea(idea)
+            except sqlite3.Error as e:
+                # Keep the good rows of a failed batch: retry one idea per transaction
+                logger.warning(f"Batch commit failed ({e}); retrying {len(ideas)} ideas individually")
+                for idea in ideas:
+                    try:
+                        with self._conn:
+                            self._conn.execute(_INSERT_IDEA, self._idea_to_params(idea))
+                            if self.enable_enrichment:
+                                self._enrich_idea(idea)
+                    except sqlite3.Error as idea_error:
+                        logger.error(f"Failed to store idea {idea.idea_id}: {idea_error}")
+            
+            self._invalidate_reads()
+            self.stats['commits'] += 1
+            self.stats['largest_batch'] = max(self.stats['largest_batch'], len(ideas))
+    
+    @staticmethod
+    def _idea_to_params(idea: IdeaCapture) -> Tuple:
+        """Insert parameters for an idea."""
+        # Convert related_ideas to JSON
+        related_json = json.dumps(idea.related_ideas) if idea.related_ideas else None
+        
+        return (
+            idea.idea_id,
+            idea.raw_text,
+            idea.timestamp.isoformat(),
+            idea.active_file,
+            idea.active_line,
+            idea.active_operation,
+            idea.conversation_id,
+            idea.project,
+            idea.component,
+            idea.priority,
+            related_json,
+            idea.status,
+            idea.created_at.isoformat(),
+            idea.updated_at.isoformat()
+        )
     
     def _row_to_idea(self, row: sqlite3.Row) -> IdeaCapture:
         """Convert SQLite row to IdeaCapture object."""
@@ -449,28 +544,28 @@ class IdeaQueue:
     
     def _update_idea_status(self, idea_id: str, status: str) -> bool:
         """Update idea status."""
+        return self._update_idea(idea_id, 'status', status)
+    
+    def _update_idea(self, idea_id: str, column: str, value: str) -> bool:
+        """Set one user-editable column (status or priority) of an idea."""
+        self.flush()
         with self._db_lock:
-            conn = sqlite3.connect(self.db_path)
-            
-            try:
-                cursor = conn.execute(
-                    """
+            with self._conn:
+                cursor = self._conn.execute(
+                    f"""
                     UPDATE ideas 
-                    SET status = ?, updated_at = ? 
+                    SET {column} = ?, updated_at = ? 
                     WHERE idea_id = ?
                     """,
-                    (status, datetime.now().isoformat(), idea_id)
+                    (value, datetime.now().isoformat(), idea_id)
                 )
-                success = cursor.rowcount > 0
-                conn.commit()
-                
-                if success:
-                    logger.info(f"Updated idea {idea_id} status to {status}")
-                
-                return success
-                
-            finally:
-                conn.close()
+            success = cursor.rowcount > 0
+            self._invalidate_reads()
+        
+        if success:
+            logger.info(f"Updated idea {idea_id} {column} to {value}")
+        
+        return success
     
     def _update_performance_stats(self, capture_time_ms: float) -> None:
         """Update performance statistics."""
@@ -501,21 +596,19 @@ class IdeaQueue:
         # Use directory name as project name
         return cwd.name
     
-    def _enrich_idea(self, idea_id: str) -> None:
+    def _enrich_idea(self, idea: IdeaCapture) -> None:
         """
-        Async enrichment processing (runs in background thread).
+        Async enrichment processing (runs on the writer thread).
         
         This method adds intelligence to captured ideas:
         - Component detection (auth, api, ui, etc.)
         - Priority inference (security keywords → high priority)
         - Related idea clustering
+        
+        Runs inside the writer's open transaction, so related ideas include
+        those enriched earlier in the same batch.
         """
         try:
-            idea = self.get_idea(idea_id)
-            if not idea:
-                logger.warning(f"Idea {idea_id} not found for enrichment")
-                return
-            
             # Component detection
             component = self._detect_component(idea.raw_text, idea.active_file)
             
@@ -523,42 +616,34 @@ class IdeaQueue:
             priority = self._infer_priority(idea.raw_text)
             
             # Related idea clustering (simple keyword matching for now)
-            related_ideas = self._find_related_ideas(idea.raw_text, idea_id)
+            related_ideas = self._find_related_ideas(idea.raw_text, idea.idea_id)
             
-            # Update database with enrichment
-            with self._db_lock:
-                conn = sqlite3.connect(self.db_path)
-                
-                try:
-                    related_json = json.dumps(related_ideas) if related_ideas else None
-                    
-                    conn.execute("""
-                        UPDATE ideas 
-                        SET component = ?, priority = ?, related_ideas = ?, updated_at = ?
-                        WHERE idea_id = ?
-                    """, (
-                        component,
-                        priority,
-                        related_json,
-                        datetime.now().isoformat(),
-                        idea_id
-                    ))
-                    
-                    conn.commit()
-                    
-                    self.stats['enrichments_processed'] += 1
-                    
-                    logger.debug(
-                        f"Enriched idea {idea_id}: "
-                        f"component={component}, priority={priority}, "
-                        f"related={len(related_ideas) if related_ideas else 0}"
-                    )
-                    
-                finally:
-                    conn.close()
+            related_json = json.dumps(related_ideas) if related_ideas else None
+            
+            self._conn.execute("""
+                UPDATE ideas 
+                SET component = ?, priority = ?, related_ideas = ?, updated_at = ?
+                WHERE idea_id = ?
+            """, (
+                component,
+                priority,
+                related_json,
+                datetime.now().isoformat(),
+                idea.idea_id
+            ))
+            
+            self.stats['enrichments_processed'] += 1
+            
+            logger.debug(
+                f"Enriched idea {idea.idea_id}: "
+                f"component={component}, priority={priority}, "
+                f"related={len(related_ideas) if related_ideas else 0}"
+            )
         
+        except sqlite3.Error:
+            raise
         except Exception as e:
-            logger.error(f"Enrichment failed for idea {idea_id}: {e}")
+            logger.error(f"Enrichment failed for idea {idea.idea_id}: {e}")
     
     def _detect_component(self, text: str, active_file: Optional[str]) -> Optional[str]:
         """Detect component from text and context."""
@@ -630,14 +715,18 @@ class IdeaQueue:
         if not component:
             return []
         
-        # Find other ideas with same component
-        related = self.filter_by_component(component)
-        
-        # Return IDs of related ideas (excluding current)
-        return [
-            idea.idea_id for idea in related 
-            if idea.idea_id != current_id and idea.status == 'pending'
-        ][:5]  # Limit to 5 related ideas
+        # Other pending ideas with same component (writer thread: query the
+        # connection directly, pending captures are this batch)
+        rows = self._conn.execute(
+            """
+            SELECT idea_id FROM ideas 
+            WHERE component = ? AND status = 'pending' AND idea_id != ? 
+            ORDER BY timestamp DESC 
+            LIMIT 5
+            """,
+            (component, current_id)
+        ).fetchall()
+        return [row['idea_id'] for row in rows]  # Limit to 5 related ideas
 
 
 def create_idea_queue(config: Optional[Dict[str, Any]] = None) -> IdeaQueue:
@@ -649,6 +738,9 @@ def create_idea_queue(config: Optional[Dict[str, Any]] = None) -> IdeaQueue:
             - db_path: str (custom database path)
             - enable_enrichment: bool (default: True)
             - max_capture_ms: float (default: 5.0)
+            - batch_size: int (default: 128)
+            - max_pending: int (default: 4096)
+            - cache_reads: bool (default: False)
             
     Returns:
         Configured IdeaQueue instance
@@ -663,5 +755,8 @@ def create_idea_queue(config: Optional[Dict[str, Any]] = None) -> IdeaQueue:
     return IdeaQueue(
         db_path=db_path,
         enable_enrichment=enable_enrichment,
-        max_capture_ms=max_capture_ms
+        max_capture_ms=max_capture_ms,
+        batch_size=config.get('batch_size', 128),
+        max_pending=config.get('max_pending', 4096),
+        cache_reads=config.get('cache_reads', False)
     )
\ No newline at end of file
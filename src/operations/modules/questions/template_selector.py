@@ -20,6 +20,8 @@ from enum import Enum
 import time
 import logging
 
+from src.utils.memory_observer import track_cache
+
 # Import from Feature 2 (Phase 1)
 try:
     from src.agents.namespace_detector import NamespaceDetector, NamespaceType, NamespaceDetectionResult
@@ -87,6 +89,7 @@ class TemplateSelector:
         # Template selection cache for performance
         self._selection_cache = {}
         self._cache_max_size = 1000
+        track_cache("template_cache", self, attr="_selection_cache")
     
     def _load_templates(self) -> Dict[str, Dict[str, Any]]:
         """Load response templates from brain directory."""
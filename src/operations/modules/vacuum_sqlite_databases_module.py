@@ -2,6 +2,10 @@
 Vacuum SQLite Databases Module
 
 Optimizes SQLite databases to recover space and improve performance.
+Each database is inspected first; free pages are reclaimed in bounded
+incremental_vacuum steps and planner statistics refreshed with PRAGMA
+optimize, so a cleanup run never rewrites a whole brain database under
+an exclusive lock.
 
 SOLID Principles:
 - Single Responsibility: Only handles SQLite optimization
@@ -12,11 +16,11 @@ Author: Asif Hussain
 Copyright: © 2024-2025 Asif Hussain. All rights reserved.
 """
 
-import sqlite3
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
 from datetime import datetime
 
+from src.infrastructure.persistence.sqlite_maintenance import SQLiteMaintenanceEngine
 from src.operations.base_operation_module import (
     BaseOperationModule,
     OperationModuleMetadata,
@@ -31,7 +35,7 @@ class VacuumSQLiteDatabasesModule(BaseOperationModule):
     Cleanup module for optimizing SQLite databases.
     
     Responsibilities:
-    1. Vacuum CORTEX brain databases
+    1. Reclaim free pages in CORTEX brain databases when worthwhile
     2. Calculate space recovered
     3. Report optimization results
     """
@@ -77,8 +81,8 @@ class VacuumSQLiteDatabasesModule(BaseOperationModule):
         
         Steps:
         1. Find all SQLite databases in cortex-brain
-        2. Get size before vacuum
-        3. Run VACUUM on each database
+        2. Inspect freelist, fragmentation and statistics of each database
+        3. Run the maintenance the policy deems worthwhile
         4. Calculate space recovered
         """
         start_time = datetime.now()
@@ -106,38 +110,35 @@ class VacuumSQLiteDatabasesModule(BaseOperationModule):
                 'databases_attempted': len(db_files)
             }
             
-            self.log_info(f"Vacuuming {len(db_files)} SQLite databases...")
+            self.log_info(f"Maintaining {len(db_files)} SQLite databases...")
+            engine = SQLiteMaintenanceEngine()
             
             for db_path in db_files:
-                try:
-                    # Get size before vacuum
-                    size_before = db_path.stat().st_size
-                    
-                    # Run VACUUM
-                    conn = sqlite3.connect(str(db_path))
-                    conn.execute("VACUUM")
-                    conn.close()
-                    
-                    # Get size after vacuum
-                    size_after = db_path.stat().st_size
-                    space_recovered = size_before - size_after
-                    
-                    vacuum_results['optimized'].append({
-                        'path': str(db_path.relative_to(project_root)),
-                        'size_before': size_before,
-                        'size_after': size_after,
-                        'space_recovered': space_recovered
-                    })
-                    vacuum_results['space_recovered_bytes'] += space_recovered
-                    
-                    self.log_info(f"  ✓ Vacuumed: {db_path.name} ({self._format_size(space_recovered)} recovered)")
-                    
-                except (sqlite3.Error, OSError) as e:
+                report = engine.run(db_path)
+                
+                if not report.success:
                     vacuum_results['failed'].append({
                         'path': str(db_path.relative_to(project_root)),
-                        'error': str(e)
+                        'error': report.error
                     })
-                    self.log_error(f"  ✗ Failed: {db_path.name} - {e}")
+                    self.log_error(f"  ✗ Failed: {db_path.name} - {report.error}")
+                    continue
+                
+                space_recovered = report.size_before - report.size_after
+                vacuum_results['optimized'].append({
+                    'path': str(db_path.relative_to(project_root)),
+                    'size_before': report.size_before,
+                    'size_after': report.size_after,
+                    'space_recovered': space_recovered,
+                    'actions': report.actions,
+                    'recommendations': report.recommendations
+                })
+                vacuum_results['space_recovered_bytes'] += space_recovered
+                
+                self.log_info(
+                    f"  ✓ {db_path.name}: {', '.join(report.actions) or 'no maintenance needed'} "
+                    f"({self._format_size(space_recovered)} recovered)"
+                )
             
             # Update context
             context['databases_optimized'] = len(vacuum_results['optimized'])
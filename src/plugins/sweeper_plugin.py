@@ -26,10 +26,9 @@ License: Proprietary
 Date: November 12, 2025
 """
 
-import os
 import json
 import logging
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass, field
@@ -43,6 +42,11 @@ from src.plugins.base_plugin import (
     PluginPriority,
     HookPoint
 )
+from src.operations.modules.cleanup.workspace_scanner import (
+    ScannedFile,
+    WorkspaceScanner,
+    WorkspaceSnapshot
+)
 
 logger = logging.getLogger(__name__)
 
@@ -181,7 +185,8 @@ class SweeperPlugin(BasePlugin):
         Execute file sweeping.
         
         Args:
-            context: Must contain 'workspace_root' key
+            context: Must contain 'workspace_root' key; may contain
+                'workspace_snapshot' to reuse an existing walk
         
         Returns:
             Dictionary with execution results
@@ -210,8 +215,8 @@ class SweeperPlugin(BasePlugin):
             self.stats = SweeperStats()
             self.audit_log = []
             
-            # Scan and classify files
-            classifications = self._scan_and_classify()
+            # Scan and classify files (reusing a shared walk if provided)
+            classifications = self._scan_and_classify(context.get('workspace_snapshot'))
             
             # Delete classified files
             self._execute_deletions(classifications)
@@ -319,73 +324,87 @@ class SweeperPlugin(BasePlugin):
         
         return False
     
-    def _scan_and_classify(self) -> List[FileClassification]:
-        """Scan workspace and classify files"""
-        classifications = []
+    def _is_protected_dir(self, relative_path: str) -> bool:
+        """Check if a workspace-relative POSIX path lies in a protected directory"""
+        for protected_dir in self.protected_dirs:
+            protected = protected_dir.as_posix().rstrip('/')
+            if relative_path == protected or relative_path.startswith(protected + '/'):
+                return True
+        return False
+    
+    def _is_candidate(self, scanned: ScannedFile) -> bool:
+        """Check if a scanned file is a sweep target (not protected, target type)"""
+        path = scanned.path
+        relative = PurePosixPath(scanned.relative_path)
+        
+        if any(relative.match(pattern) for pattern in self.protected_patterns):
+            return False
+        
+        if path.suffix.lower() in self.SCAN_EXTENSIONS:
+            return True
+        
+        # Check for extensionless patterns
+        return any(path.match(p) for p in self.BACKUP_PATTERNS + self.SESSION_PATTERNS)
+    
+    def _scan_and_classify(
+        self,
+        snapshot: Optional[WorkspaceSnapshot] = None
+    ) -> List[FileClassification]:
+        """
+        Scan workspace and classify files.
         
+        Args:
+            snapshot: Walk result shared with other cleanup components; the
+                workspace is walked here only when none is supplied
+        """
         logger.info("Scanning workspace...")
         
-        # Walk directory tree
-        for root, dirs, files in os.walk(self.workspace_root):
-            root_path = Path(root)
-            
-            # Skip protected directories
-            if self._is_protected(root_path):
-                dirs[:] = []  # Don't recurse into protected dirs
-                continue
-            
-            # Classify each file
-            for filename in files:
-                file_path = root_path / filename
-                
-                self.stats.files_scanned += 1
-                
-                # Skip if protected
-                if self._is_protected(file_path):
-                    continue
-                
-                # Skip if not a target extension
-                if file_path.suffix.lower() not in self.SCAN_EXTENSIONS:
-                    # Check for extensionless patterns
-                    if not any(file_path.match(p) for p in self.BACKUP_PATTERNS + self.SESSION_PATTERNS):
-                        continue
-                
-                # Classify the file
-                classification = self._classify_file(file_path)
-                classifications.append(classification)
+        scanner = WorkspaceScanner(self.workspace_root, is_excluded=self._is_protected_dir)
+        if snapshot is None:
+            snapshot = scanner.walk()
+        else:
+            snapshot = snapshot.subset(self._is_protected_dir)
+        
+        self.stats.files_scanned += len(snapshot.files)
+        # The walk filters on workspace-relative paths; a symlink can still
+        # point into a protected directory, so targets get the resolved check
+        candidates = [
+            f for f in snapshot.files
+            if self._is_candidate(f) and not self._is_protected(f.path)
+        ]
+        
+        # Classification depends on file age, so results are not persisted
+        results = scanner.analyze(candidates, 'sweeper', self._classify_scanned, persist=False)
+        classifications = [results[f.relative_path] for f in candidates]
         
         logger.info(f"Scanned {self.stats.files_scanned} files")
         logger.info(f"Classified {len(classifications)} files for review")
         
         return classifications
     
-    def _classify_file(self, path: Path) -> FileClassification:
-        """Classify a single file"""
+    def _classify_scanned(self, scanned: ScannedFile) -> FileClassification:
+        """Classify a file using the size and mtime captured by the walk"""
         try:
-            stat = path.stat()
-            size_bytes = stat.st_size
-            age_days = (datetime.now() - datetime.fromtimestamp(stat.st_mtime)).days
-            
-            # Determine category and action
-            category, action, reason = self._determine_category(path, age_days)
+            age_days = (datetime.now() - scanned.modified).days
+            category, action, reason = self._determine_category(scanned.path, age_days)
             
             return FileClassification(
-                path=path,
+                path=scanned.path,
                 category=category,
                 action=action,
                 reason=reason,
-                size_bytes=size_bytes,
+                size_bytes=scanned.size,
                 age_days=age_days,
                 metadata={
-                    "extension": path.suffix,
-                    "location": str(path.parent.relative_to(self.workspace_root))
+                    "extension": scanned.path.suffix,
+                    # Shared snapshots may be rooted at an unresolved path
+                    "location": str(scanned.path.parent.resolve().relative_to(self.workspace_root))
                 }
             )
-            
         except Exception as e:
-            logger.error(f"Error classifying {path}: {e}")
+            logger.error(f"Error classifying {scanned.path}: {e}")
             return FileClassification(
-                path=path,
+                path=scanned.path,
                 category=FileCategory.UNKNOWN,
                 action="keep",
                 reason=f"Error: {e}",
@@ -6,6 +6,7 @@ Purpose: Policy document parsing, compliance validation, and enforcement.
 Components:
 - PolicyAnalyzer: Parse policy documents (PDF/MD/DOCX/TXT)
 - ComplianceValidator: Validate code against policies (3-act WOW workflow)
+- ComplianceValidationEngine: File-major, parallel, cached rule evaluation
 - PolicyTestGenerator: Generate pytest tests from policies
 - PolicyStorage: Per-repo policy tracking with change detection (Tier 3)
 
@@ -32,6 +33,13 @@ from .compliance_validator import (
     ViolationSeverity
 )
 
+from .validation_engine import (
+    ComplianceValidationEngine,
+    CompiledRule,
+    CompiledRuleSet,
+    ValidationResultCache
+)
+
 from .policy_test_generator import (
     PolicyTestGenerator
 )
@@ -56,6 +64,12 @@ __all__ = [
     'RemediationAction',
     'ViolationSeverity',
     
+    # Validation Engine
+    'ComplianceValidationEngine',
+    'CompiledRule',
+    'CompiledRuleSet',
+    'ValidationResultCache',
+    
     # Test Generator
     'PolicyTestGenerator',
     
@@ -17,13 +17,13 @@ Repository: https://github.com/asifhussain60/CORTEX
 
 import os
 import re
-import ast
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
 from .policy_analyzer import PolicyDocument, PolicyRule, PolicyLevel, PolicyCategory
+from .validation_engine import ComplianceValidationEngine, compile_rule, evaluate_rules
 
 
 class ViolationSeverity:
@@ -128,9 +128,25 @@ class ComplianceValidator:
     - Architecture pattern detection
     """
     
-    def __init__(self):
-        """Initialize compliance validator"""
+    def __init__(
+        self,
+        max_workers: Optional[int] = 1,
+        cache_path: Optional[Path] = None
+    ):
+        """
+        Initialize compliance validator
+        
+        Args:
+            max_workers: Worker processes for file scanning. Defaults to 1
+                (in-process) so interactive callers never spawn a pool;
+                batch runs opt in with a count, or None for CPU count
+            cache_path: SQLite result cache; enables incremental re-validation
+        """
         self.violation_patterns = self._build_violation_patterns()
+        self.engine = ComplianceValidationEngine(
+            max_workers=max_workers,
+            cache_path=cache_path
+        )
     
     def validate(
         self,
@@ -201,200 +217,29 @@ class ComplianceValidator:
         """
         Act 1: Recognition - Detect policy violations in codebase.
         
-        Uses pattern matching, AST analysis, and rule-specific validators.
+        Delegates to the file-major validation engine: every file is read
+        once and evaluated against all compiled rules, in parallel, with
+        unchanged files served from the result cache.
         """
-        violations = []
-        
-        # Get all Python files
-        python_files = list(Path(codebase_path).rglob("*.py"))
-        
-        for rule in policy_doc.rules:
-            # Check each file for this rule
-            for py_file in python_files:
-                rule_violations = self._check_rule(rule, py_file)
-                violations.extend(rule_violations)
-        
-        return violations
+        records = self.engine.run(policy_doc, codebase_path)
+        return [PolicyViolation(**record) for record in records]
     
     def _check_rule(self, rule: PolicyRule, file_path: Path) -> List[PolicyViolation]:
-        """Check a specific rule against a file"""
-        violations = []
-        
-        # Determine severity from policy level
-        severity_map = {
-            PolicyLevel.MUST: ViolationSeverity.CRITICAL,
-            PolicyLevel.MUST_NOT: ViolationSeverity.CRITICAL,
-            PolicyLevel.SHOULD: ViolationSeverity.HIGH,
-            PolicyLevel.SHOULD_NOT: ViolationSeverity.MEDIUM,
-            PolicyLevel.MAY: ViolationSeverity.LOW,
-        }
-        severity = severity_map.get(rule.level, ViolationSeverity.INFO)
-        
-        # Category-specific validation
-        if rule.category == PolicyCategory.TESTING:
-            violations.extend(self._check_testing_rule(rule, file_path, severity))
-        elif rule.category == PolicyCategory.SECURITY:
-            violations.extend(self._check_security_rule(rule, file_path, severity))
-        elif rule.category == PolicyCategory.PERFORMANCE:
-            violations.extend(self._check_performance_rule(rule, file_path, severity))
-        elif rule.category == PolicyCategory.DOCUMENTATION:
-            violations.extend(self._check_documentation_rule(rule, file_path, severity))
-        
-        return violations
-    
-    def _check_testing_rule(
-        self,
-        rule: PolicyRule,
-        file_path: Path,
-        severity: str
-    ) -> List[PolicyViolation]:
-        """Check testing-related rules"""
-        violations = []
-        
-        # Example: Check for test coverage threshold
-        if 'coverage' in rule.text.lower() and rule.threshold:
-            # This would integrate with actual coverage tools
-            # For now, create a placeholder violation
-            if 'test' not in str(file_path).lower():
-                violation = PolicyViolation(
-                    rule_id=rule.id,
-                    rule_text=rule.text,
-                    severity=severity,
-                    file_path=str(file_path),
-                    violation_details=f"File may lack test coverage (threshold: {rule.threshold}{rule.unit})",
-                    required_value=f"{rule.threshold}{rule.unit}"
-                )
-                violations.append(violation)
+        """Check a specific rule against a single file"""
+        compiled = compile_rule(rule)
+        if not compiled.checks:
+            return []
         
-        return violations
-    
-    def _check_security_rule(
-        self,
-        rule: PolicyRule,
-        file_path: Path,
-        severity: str
-    ) -> List[PolicyViolation]:
-        """Check security-related rules"""
-        violations = []
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for common security issues
-            if 'password' in rule.text.lower() and 'plain text' in rule.text.lower():
-                # Check for hardcoded passwords
-                password_patterns = [
-                    r'password\s*=\s*["\'][\w]+["\']',
-                    r'PASSWORD\s*=\s*["\'][\w]+["\']',
-                ]
-                
-                for pattern in password_patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        line_num = content[:match.start()].count('\n') + 1
-                        violation = PolicyViolation(
-                            rule_id=rule.id,
-                            rule_text=rule.text,
-                            severity=severity,
-                            file_path=str(file_path),
-                            line_number=line_num,
-                            code_snippet=match.group(0),
-                            violation_details="Hardcoded password detected"
-                        )
-                        violations.append(violation)
-            
-            # Check for input validation
-            if 'input' in rule.text.lower() and 'validat' in rule.text.lower():
-                # Look for input() or request.args without validation
-                if 'input(' in content or 'request.args' in content or 'request.form' in content:
-                    # Check if validation is present (simplified)
-                    if not any(keyword in content for keyword in ['validate', 'sanitize', 'clean', 'escape']):
-                        violation = PolicyViolation(
-                            rule_id=rule.id,
-                            rule_text=rule.text,
-                            severity=severity,
-                            file_path=str(file_path),
-                            violation_details="User input without visible validation"
-                        )
-                        violations.append(violation)
-        
-        except Exception as e:
-            pass  # Skip files that can't be read
-        
-        return violations
-    
-    def _check_performance_rule(
-        self,
-        rule: PolicyRule,
-        file_path: Path,
-        severity: str
-    ) -> List[PolicyViolation]:
-        """Check performance-related rules"""
-        violations = []
-        
-        # This would integrate with profiling tools
-        # For now, check for known performance anti-patterns
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for inefficient patterns
-            if '+=' in content and 'for' in content:
-                # String concatenation in loop (inefficient)
-                if re.search(r'for\s+\w+\s+in.*:\s*\n\s*\w+\s*\+=\s*["\']', content):
-                    violation = PolicyViolation(
-                        rule_id=rule.id,
-                        rule_text=rule.text,
-                        severity=severity,
-                        file_path=str(file_path),
-                        violation_details="String concatenation in loop detected (use join() instead)"
-                    )
-                    violations.append(violation)
-        
-        except Exception:
-            pass
-        
-        return violations
-    
-    def _check_documentation_rule(
-        self,
-        rule: PolicyRule,
-        file_path: Path,
-        severity: str
-    ) -> List[PolicyViolation]:
-        """Check documentation-related rules"""
-        violations = []
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse AST to check for docstrings
+        content = None
+        if not compiled.path_only:
             try:
-                tree = ast.parse(content)
-                
-                # Check functions without docstrings
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                        if not ast.get_docstring(node):
-                            violation = PolicyViolation(
-                                rule_id=rule.id,
-                                rule_text=rule.text,
-                                severity=severity,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                violation_details=f"{node.__class__.__name__} '{node.name}' missing docstring"
-                            )
-                            violations.append(violation)
-            
-            except SyntaxError:
-                pass  # Skip files with syntax errors
-        
-        except Exception:
-            pass
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except Exception:
+                pass  # Skip content checks for files that can't be read
         
-        return violations
+        records = evaluate_rules([compiled], str(file_path), content)
+        return [PolicyViolation(**record) for record in records]
     
     def _analyze_gaps(
         self,
@@ -0,0 +1,548 @@
+"""
+Compliance Validation Engine - File-Major Rule Evaluation
+
+Purpose: Evaluate a whole policy rule set against a codebase with each file
+         read exactly once, instead of re-reading every file for every rule.
+
+Design:
+- Rules are compiled once into CompiledRule objects (regexes precompiled,
+  grouped by the file types they apply to)
+- Each file is read, hashed and parsed at most once; its content is handed
+  to every applicable compiled rule
+- Files are processed in parallel through a process pool whose workers
+  receive the compiled rule set once via an initializer
+- Content findings are cached in SQLite per (rule-set hash, content hash),
+  so re-validation only evaluates files whose content changed
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+License: Source-Available (Use Allowed, No Contributions)
+Repository: https://github.com/asifhussain60/CORTEX
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Sequence, Set, Tuple
+
+from .policy_analyzer import PolicyCategory, PolicyDocument, PolicyLevel, PolicyRule
+
+
+# Bump when check semantics change so stale cache entries are not reused
+ENGINE_VERSION = "1"
+
+SEVERITY_BY_LEVEL = {
+    PolicyLevel.MUST: "critical",
+    PolicyLevel.MUST_NOT: "critical",
+    PolicyLevel.SHOULD: "high",
+    PolicyLevel.SHOULD_NOT: "medium",
+    PolicyLevel.MAY: "low",
+}
+
+PASSWORD_PATTERNS = (
+    r'password\s*=\s*["\'][\w]+["\']',
+    r'PASSWORD\s*=\s*["\'][\w]+["\']',
+)
+INPUT_SOURCES = ('input(', 'request.args', 'request.form')
+VALIDATION_KEYWORDS = ('validate', 'sanitize', 'clean', 'escape')
+STRING_CONCAT_IN_LOOP = r'for\s+\w+\s+in.*:\s*\n\s*\w+\s*\+=\s*["\']'
+
+# Below this many files the process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+
+@dataclass
+class CompiledRule:
+    """
+    Policy rule reduced to the checks it actually performs.
+
+    Checks are names from the engine's check table; patterns are
+    precompiled once so evaluation never touches the re cache.
+    """
+    rule_id: str
+    rule_text: str
+    severity: str
+    checks: Tuple[str, ...]
+    patterns: Tuple[Pattern, ...] = ()
+    file_types: Tuple[str, ...] = ('.py',)
+    threshold: Optional[float] = None
+    unit: Optional[str] = None
+
+    @property
+    def path_only(self) -> bool:
+        """True when the rule never needs file content (result depends on path)"""
+        return all(check in PATH_CHECKS for check in self.checks)
+
+    def signature(self) -> Dict[str, Any]:
+        """Stable description used for rule-set hashing"""
+        return {
+            'id': self.rule_id,
+            'text': self.rule_text,
+            'severity': self.severity,
+            'checks': list(self.checks),
+            'patterns': [(p.pattern, p.flags) for p in self.patterns],
+            'file_types': list(self.file_types),
+            'threshold': self.threshold,
+            'unit': self.unit,
+        }
+
+
+@dataclass
+class CompiledRuleSet:
+    """Compiled rules grouped by file type, with a content-independent hash"""
+    rules: List[CompiledRule] = field(default_factory=list)
+    by_file_type: Dict[str, List[CompiledRule]] = field(default_factory=dict)
+    rule_set_hash: str = ""
+
+    @classmethod
+    def compile(cls, rules: Iterable[PolicyRule]) -> 'CompiledRuleSet':
+        """Compile policy rules, dropping rules that have no applicable check"""
+        compiled = [c for c in (compile_rule(rule) for rule in rules) if c.checks]
+
+        by_file_type: Dict[str, List[CompiledRule]] = {}
+        for rule in compiled:
+            for suffix in rule.file_types:
+                by_file_type.setdefault(suffix, []).append(rule)
+
+        digest = hashlib.sha256(ENGINE_VERSION.encode('utf-8'))
+        digest.update(json.dumps(
+            [rule.signature() for rule in compiled], sort_keys=True
+        ).encode('utf-8'))
+
+        return cls(rules=compiled, by_file_type=by_file_type, rule_set_hash=digest.hexdigest())
+
+    def rules_for(self, file_path: str) -> List[CompiledRule]:
+        """Rules applicable to a file, by suffix"""
+        return self.by_file_type.get(Path(file_path).suffix.lower(), [])
+
+    @property
+    def file_types(self) -> List[str]:
+        return sorted(self.by_file_type)
+
+
+def compile_rule(rule: PolicyRule) -> CompiledRule:
+    """
+    Translate a PolicyRule into the checks ComplianceValidator applies.
+
+    Mirrors the category-specific detection the validator has always used:
+    testing → coverage by path, security → hardcoded passwords and
+    unvalidated input, performance → string concatenation in loops,
+    documentation → missing docstrings.
+    """
+    text = rule.text.lower()
+    checks: List[str] = []
+    patterns: List[Pattern] = []
+
+    if rule.category == PolicyCategory.TESTING:
+        if 'coverage' in text and rule.threshold:
+            checks.append('test_coverage')
+    elif rule.category == PolicyCategory.SECURITY:
+        if 'password' in text and 'plain text' in text:
+            checks.append('hardcoded_password')
+            patterns.extend(re.compile(p, re.IGNORECASE) for p in PASSWORD_PATTERNS)
+        if 'input' in text and 'validat' in text:
+            checks.append('input_validation')
+    elif rule.category == PolicyCategory.PERFORMANCE:
+        checks.append('string_concat_loop')
+        patterns.append(re.compile(STRING_CONCAT_IN_LOOP))
+    elif rule.category == PolicyCategory.DOCUMENTATION:
+        checks.append('missing_docstring')
+
+    return CompiledRule(
+        rule_id=rule.id,
+        rule_text=rule.text,
+        severity=SEVERITY_BY_LEVEL.get(rule.level, "info"),
+        checks=tuple(checks),
+        patterns=tuple(patterns),
+        threshold=rule.threshold,
+        unit=rule.unit,
+    )
+
+
+class _FileContext:
+    """Per-file evaluation state: content is read once, AST parsed on demand"""
+
+    def __init__(self, file_path: str, content: Optional[str]):
+        self.file_path = file_path
+        self.content = content
+        self._tree: Optional[ast.AST] = None
+        self._tree_parsed = False
+
+    @property
+    def tree(self) -> Optional[ast.AST]:
+        if not self._tree_parsed:
+            self._tree_parsed = True
+            try:
+                self._tree = ast.parse(self.content or "")
+            except (SyntaxError, ValueError):
+                self._tree = None
+        return self._tree
+
+    def line_of(self, offset: int) -> int:
+        return self.content.count('\n', 0, offset) + 1
+
+
+def _violation(rule: CompiledRule, ctx: _FileContext, **kwargs) -> Dict[str, Any]:
+    """Build a violation record compatible with PolicyViolation(**record)"""
+    record = {
+        'rule_id': rule.rule_id,
+        'rule_text': rule.rule_text,
+        'severity': rule.severity,
+        'file_path': ctx.file_path,
+    }
+    record.update(kwargs)
+    return record
+
+
+def _check_test_coverage(rule: CompiledRule, ctx: _FileContext) -> List[Dict[str, Any]]:
+    # Placeholder until coverage tooling is integrated: flags non-test files
+    if 'test' in ctx.file_path.lower():
+        return []
+    return [_violation(
+        rule, ctx,
+        violation_details=f"File may lack test coverage (threshold: {rule.threshold}{rule.unit})",
+        required_value=f"{rule.threshold}{rule.unit}"
+    )]
+
+
+def _check_hardcoded_password(rule: CompiledRule, ctx: _FileContext) -> List[Dict[str, Any]]:
+    violations = []
+    for pattern in rule.patterns:
+        for match in pattern.finditer(ctx.content):
+            violations.append(_violation(
+                rule, ctx,
+                line_number=ctx.line_of(match.start()),
+                code_snippet=match.group(0),
+                violation_details="Hardcoded password detected"
+            ))
+    return violations
+
+
+def _check_input_validation(rule: CompiledRule, ctx: _FileContext) -> List[Dict[str, Any]]:
+    content = ctx.content
+    if not any(source in content for source in INPUT_SOURCES):
+        return []
+    if any(keyword in content for keyword in VALIDATION_KEYWORDS):
+        return []
+    return [_violation(rule, ctx, violation_details="User input without visible validation")]
+
+
+def _check_string_concat_loop(rule: CompiledRule, ctx: _FileContext) -> List[Dict[str, Any]]:
+    content = ctx.content
+    if '+=' not in content or 'for' not in content:
+        return []
+    if not any(pattern.search(content) for pattern in rule.patterns):
+        return []
+    return [_violation(
+        rule, ctx,
+        violation_details="String concatenation in loop detected (use join() instead)"
+    )]
+
+
+def _check_missing_docstring(rule: CompiledRule, ctx: _FileContext) -> List[Dict[str, Any]]:
+    tree = ctx.tree
+    if tree is None:
+        return []
+    violations = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and not ast.get_docstring(node):
+            violations.append(_violation(
+                rule, ctx,
+                line_number=node.lineno,
+                violation_details=f"{node.__class__.__name__} '{node.name}' missing docstring"
+            ))
+    return violations
+
+
+CHECKS = {
+    'test_coverage': _check_test_coverage,
+    'hardcoded_password': _check_hardcoded_password,
+    'input_validation': _check_input_validation,
+    'string_concat_loop': _check_string_concat_loop,
+    'missing_docstring': _check_missing_docstring,
+}
+
+# Checks whose outcome depends on the path, never on content; these are
+# always re-evaluated and never stored in the content-addressed cache
+PATH_CHECKS = frozenset({'test_coverage'})
+
+
+def evaluate_rules(
+    rules: Sequence[CompiledRule],
+    file_path: str,
+    content: Optional[str],
+    include_path_checks: bool = True,
+    include_content_checks: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Run every applicable check of every rule against one file's content.
+
+    Content may be None when the file could not be read; content checks are
+    then skipped, matching the validator's skip-unreadable behaviour.
+    """
+    ctx = _FileContext(file_path, content)
+    violations: List[Dict[str, Any]] = []
+    for rule in rules:
+        for check in rule.checks:
+            is_path_check = check in PATH_CHECKS
+            if is_path_check and not include_path_checks:
+                continue
+            if not is_path_check and (not include_content_checks or content is None):
+                continue
+            violations.extend(CHECKS[check](rule, ctx))
+    return violations
+
+
+# ---------------------------------------------------------------------------
+# Process-pool worker side. The rule set and the known content hashes are
+# installed once per worker by the initializer rather than pickled per task.
+# ---------------------------------------------------------------------------
+
+_worker_rule_set: Optional[CompiledRuleSet] = None
+_worker_cached_hashes: Set[str] = set()
+
+
+def _init_worker(rule_set: CompiledRuleSet, cached_hashes: Set[str]) -> None:
+    global _worker_rule_set, _worker_cached_hashes
+    _worker_rule_set = rule_set
+    _worker_cached_hashes = cached_hashes
+
+
+def _scan_file(file_path: str) -> Tuple[str, Optional[str], Optional[List[Dict[str, Any]]]]:
+    """
+    Read one file, hash it and evaluate content checks unless cached.
+
+    Returns (file_path, content_hash, content_violations). Violations are
+    None when the hash is already cached; hash is None if unreadable.
+    """
+    rules = [r for r in _worker_rule_set.rules_for(file_path) if not r.path_only]
+    if not rules:
+        return file_path, None, []
+
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return file_path, None, []
+
+    content_hash = hashlib.sha256(raw).hexdigest()
+    if content_hash in _worker_cached_hashes:
+        return file_path, content_hash, None
+
+    try:
+        content = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return file_path, content_hash, []
+
+    violations = evaluate_rules(rules, file_path, content, include_path_checks=False)
+    for violation in violations:
+        violation.pop('file_path', None)
+    return file_path, content_hash, violations
+
+
+class ValidationResultCache:
+    """
+    SQLite cache of content-check findings keyed by (rule-set hash, content hash).
+
+    Findings are stored without file paths so identical content at
+    different paths shares one entry.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS validation_results (
+                    rule_set_hash TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    violations TEXT NOT NULL,
+                    cached_at REAL NOT NULL,
+                    PRIMARY KEY (rule_set_hash, content_hash)
+                )
+            """)
+
+    def known_hashes(self, rule_set_hash: str) -> Set[str]:
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT content_hash FROM validation_results WHERE rule_set_hash = ?",
+                (rule_set_hash,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def load(self, rule_set_hash: str, content_hashes: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        wanted = list(set(content_hashes))
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        with sqlite3.connect(self.db_path) as conn:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT content_hash, violations FROM validation_results "
+                    f"WHERE rule_set_hash = ? AND content_hash IN ({placeholders})",
+                    [rule_set_hash, *chunk]
+                ).fetchall()
+                for content_hash, payload in rows:
+                    results[content_hash] = json.loads(payload)
+        return results
+
+    def store(self, rule_set_hash: str, entries: Dict[str, List[Dict[str, Any]]]) -> None:
+        if not entries:
+            return
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO validation_results "
+                "(rule_set_hash, content_hash, violations, cached_at) VALUES (?, ?, ?, ?)",
+                [(rule_set_hash, h, json.dumps(v), now) for h, v in entries.items()]
+            )
+
+    def prune(self, keep_rule_set_hash: str) -> int:
+        """Drop entries produced by other rule sets"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM validation_results WHERE rule_set_hash != ?",
+                (keep_rule_set_hash,)
+            )
+            return cursor.rowcount
+
+
+@dataclass
+class ValidationRunStats:
+    """Counters describing one engine run"""
+    files: int = 0
+    rules: int = 0
+    files_evaluated: int = 0
+    cache_hits: int = 0
+    workers: int = 1
+    duration_seconds: float = 0.0
+
+    @property
+    def rule_file_pairs_per_second(self) -> float:
+        if self.duration_seconds <= 0:
+            return 0.0
+        return (self.rules * self.files) / self.duration_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'files': self.files,
+            'rules': self.rules,
+            'files_evaluated': self.files_evaluated,
+            'cache_hits': self.cache_hits,
+            'workers': self.workers,
+            'duration_seconds': round(self.duration_seconds, 4),
+            'rule_file_pairs_per_second': round(self.rule_file_pairs_per_second, 1),
+        }
+
+
+class ComplianceValidationEngine:
+    """
+    File-major, parallel evaluation of a compiled policy rule set.
+
+    Usage:
+        engine = ComplianceValidationEngine(cache_path=Path(".cortex/compliance.db"))
+        violations = engine.run(policy_doc, "src")
+        print(engine.last_run.to_dict())
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache_path: Optional[Path] = None,
+        parallel_threshold: int = PARALLEL_THRESHOLD
+    ):
+        """
+        Args:
+            max_workers: Process pool size (None = os.cpu_count(), 1 = in-process)
+            cache_path: SQLite cache location (None disables caching)
+            parallel_threshold: Minimum file count before the pool is used
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = ValidationResultCache(cache_path) if cache_path else None
+        self.parallel_threshold = parallel_threshold
+        self.last_run = ValidationRunStats()
+
+    def discover_files(self, codebase_path: str, rule_set: CompiledRuleSet) -> List[str]:
+        """Walk the codebase once, keeping files with at least one applicable rule"""
+        suffixes = set(rule_set.file_types)
+        files = []
+        for root, _dirs, names in os.walk(codebase_path):
+            for name in names:
+                if os.path.splitext(name)[1].lower() in suffixes:
+                    files.append(os.path.join(root, name))
+        files.sort()
+        return files
+
+    def run(self, policy_doc: PolicyDocument, codebase_path: str) -> List[Dict[str, Any]]:
+        """
+        Validate a codebase and return violation records.
+
+        Records are ordered rule-major (policy order, then file path), the
+        same order the rule-by-rule loop produced.
+        """
+        start = time.perf_counter()
+        rule_set = CompiledRuleSet.compile(policy_doc.rules)
+        files = self.discover_files(codebase_path, rule_set)
+
+        known = self.cache.known_hashes(rule_set.rule_set_hash) if self.cache else set()
+        use_pool = self.max_workers > 1 and len(files) >= self.parallel_threshold
+
+        if use_pool:
+            # Large chunks amortize per-task pickling of paths and results
+            chunksize = max(1, len(files) // (self.max_workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(rule_set, known)
+            ) as pool:
+                scanned = list(pool.map(_scan_file, files, chunksize=chunksize))
+        else:
+            _init_worker(rule_set, known)
+            scanned = [_scan_file(path) for path in files]
+
+        content_findings: Dict[str, List[Dict[str, Any]]] = {}
+        fresh: Dict[str, List[Dict[str, Any]]] = {}
+        hits = []
+        for _path, content_hash, found in scanned:
+            if content_hash is None:
+                continue
+            if found is None:
+                hits.append(content_hash)
+            else:
+                fresh[content_hash] = found
+        if self.cache:
+            content_findings.update(self.cache.load(rule_set.rule_set_hash, hits))
+            self.cache.store(rule_set.rule_set_hash, fresh)
+        content_findings.update(fresh)
+
+        violations: List[Dict[str, Any]] = []
+        path_rules = [r for r in rule_set.rules if any(c in PATH_CHECKS for c in r.checks)]
+        for file_path, content_hash, found in scanned:
+            for record in content_findings.get(content_hash, []) if content_hash else []:
+                violations.append({**record, 'file_path': file_path})
+            applicable = [r for r in path_rules if r in rule_set.rules_for(file_path)]
+            if applicable:
+                violations.extend(evaluate_rules(
+                    applicable, file_path, None, include_content_checks=False
+                ))
+
+        order = {rule.rule_id: index for index, rule in enumerate(rule_set.rules)}
+        violations.sort(key=lambda v: (order.get(v['rule_id'], len(order)), v['file_path']))
+
+        self.last_run = ValidationRunStats(
+            files=len(files),
+            rules=len(rule_set.rules),
+            files_evaluated=len(fresh),
+            cache_hits=len(hits),
+            workers=self.max_workers if use_pool else 1,
+            duration_seconds=time.perf_counter() - start,
+        )
+        return violations
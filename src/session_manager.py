@@ -11,13 +11,30 @@ Author: CORTEX Development Team
 Version: 1.0
 """
 
+import atexit
+import bisect
 import sqlite3
-from typing import Optional, Dict, List
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Tuple, Any
 from datetime import datetime, timedelta
 import uuid
 from pathlib import Path
 
 
+_OPEN_MANAGERS: "weakref.WeakSet[SessionManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_managers() -> None:
+    for manager in list(_OPEN_MANAGERS):
+        try:
+            manager.close()
+        except Exception:
+            pass
+
+
 class SessionManager:
     """
     Manage conversation sessions
@@ -32,8 +49,22 @@ class SessionManager:
     - 30 minutes of inactivity = new conversation
     - Active conversation never deleted (even if oldest)
     - When 51st conversation starts, oldest completed deleted (FIFO)
+    
+    State:
+    - Session rows, the active session and last-activity times are held in
+      memory, so get_active_session() is a dictionary lookup
+    - Writes go through one long-lived connection; deferred writes (idle
+      boundary ends) are batched into the next transaction
+    - SQLite's PRAGMA data_version changes whenever another connection
+      (e.g. another CLI process) commits, which triggers a refresh: sessions
+      are re-read and only messages past a rowid watermark are scanned;
+      writes run in BEGIN IMMEDIATE transactions so concurrent writers
+      serialize
     """
     
+    FIFO_LIMIT = 50
+    IDLE_TIMEOUT = timedelta(minutes=30)
+    
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize session manager
@@ -48,13 +79,27 @@ class SessionManager:
         
         self.db_path = Path(db_path) if isinstance(db_path, str) else db_path
         
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+        
+        # In-memory session state (mirrors working_memory_conversations)
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._last_message: Dict[str, datetime] = {}
+        self._message_rowid = 0  # working_memory_messages folded into _last_message
+        self._completed: List[Tuple[str, str]] = []  # (start_time, conversation_id), oldest first
+        self._active_id: Optional[str] = None
+        self._pending: List[Tuple[str, tuple]] = []
+        self._data_version: Optional[int] = None
+        
         # Ensure schema exists
         self._ensure_schema()
+        self._reload()
+        _OPEN_MANAGERS.add(self)
     
     def _ensure_schema(self):
         """Ensure session management tables exist"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
+        cursor.execute("BEGIN")
         
         # Create working_memory_conversations table if it doesn't exist
         cursor.execute("""
@@ -91,8 +136,142 @@ class SessionManager:
             ON working_memory_messages(conversation_id, timestamp)
         """)
         
-        conn.commit()
-        conn.close()
+        cursor.execute("COMMIT")
+    
+    def _current_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    def _reload(self) -> None:
+        """Rebuild in-memory state from the database"""
+        self._last_message = {}
+        self._message_rowid = 0
+        self._refresh()
+    
+    def _refresh(self) -> None:
+        """
+        Re-read sessions and fold in messages added since the last look.
+        
+        working_memory_conversations is bounded by the FIFO limit and read
+        whole; working_memory_messages is read only past the rowid watermark,
+        so a foreign commit costs a range scan over the new rows instead of
+        a GROUP BY over every message.
+        """
+        # Read first: a commit racing the refresh moves it again
+        data_version = self._current_data_version()
+        cursor = self._conn.cursor()
+        own_transaction = not self._conn.in_transaction
+        if own_transaction:
+            cursor.execute("BEGIN")  # one snapshot of both tables
+        try:
+            cursor.execute("""
+                SELECT conversation_id, start_time, end_time, intent, status
+                FROM working_memory_conversations
+            """)
+            self._sessions = {
+                row[0]: {
+                    'conversation_id': row[0],
+                    'start_time': row[1],
+                    'end_time': row[2],
+                    'intent': row[3],
+                    'status': row[4]
+                }
+                for row in cursor.fetchall()
+            }
+            
+            cursor.execute("""
+                SELECT conversation_id, MAX(timestamp), MAX(rowid)
+                FROM working_memory_messages
+                WHERE rowid > ?
+                GROUP BY conversation_id
+            """, (self._message_rowid,))
+            new_messages = cursor.fetchall()
+        finally:
+            if own_transaction:
+                cursor.execute("COMMIT")
+        
+        # Conversations deleted elsewhere (FIFO) take their activity with them
+        self._last_message = {
+            conversation_id: last_message
+            for conversation_id, last_message in self._last_message.items()
+            if conversation_id in self._sessions
+        }
+        for conversation_id, timestamp, rowid in new_messages:
+            self._message_rowid = max(self._message_rowid, rowid)
+            if conversation_id not in self._sessions or not timestamp:
+                continue
+            timestamp = datetime.fromisoformat(timestamp)
+            previous = self._last_message.get(conversation_id)
+            if previous is None or timestamp > previous:
+                self._last_message[conversation_id] = timestamp
+        
+        self._completed = sorted(
+            (session['start_time'], conversation_id)
+            for conversation_id, session in self._sessions.items()
+            if session['status'] == 'completed'
+        )
+        self._refresh_active()
+        self._data_version = data_version
+    
+    def _sync(self) -> None:
+        """Catch up if another connection committed since the last look"""
+        if self._current_data_version() != self._data_version:
+            if self._pending:
+                self.flush()  # refreshes inside its transaction
+            else:
+                self._refresh()
+    
+    def _refresh_active(self) -> None:
+        active = [
+            (session['start_time'], conversation_id)
+            for conversation_id, session in self._sessions.items()
+            if session['status'] == 'active'
+        ]
+        self._active_id = max(active)[1] if active else None
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        Write transaction holding SQLite's write lock (cross-process).
+        
+        Deferred writes are applied first, then in-memory state is reloaded
+        if another process committed; the caller appends its statements to
+        the yielded list after updating memory.
+        """
+        cursor = self._conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, params in self._pending:
+                cursor.execute(sql, params)
+            self._pending = []
+            if self._current_data_version() != self._data_version:
+                self._refresh()
+            statements: List[Tuple[str, tuple]] = []
+            yield statements
+            for sql, params in statements:
+                cursor.execute(sql, params)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            self._reload()
+            raise
+        # Our own commits do not change data_version
+    
+    def flush(self) -> None:
+        """Persist deferred writes"""
+        with self._lock:
+            if self._pending:
+                with self._transaction():
+                    pass
+    
+    def close(self) -> None:
+        """Flush deferred writes and close the connection"""
+        with self._lock:
+            if self._conn is None:
+                return
+            self.flush()
+            self._conn.close()
+            self._conn = None
+            _OPEN_MANAGERS.discard(self)
     
     def start_session(self, intent: Optional[str] = None, conversation_id: Optional[str] = None) -> str:
         """
@@ -108,23 +287,44 @@ class SessionManager:
         if conversation_id is None:
             conversation_id = str(uuid.uuid4())
         
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO working_memory_conversations 
-            (conversation_id, start_time, intent, status, last_activity)
-            VALUES (?, ?, ?, 'active', ?)
-        """, (conversation_id, datetime.now().isoformat(), intent, datetime.now().isoformat()))
-        
-        conn.commit()
-        conn.close()
-        
-        # Check FIFO queue limit (50 conversations)
-        self._enforce_fifo_limit()
+        with self._lock, self._transaction() as statements:
+            now = datetime.now().isoformat()
+            statements.append(("""
+                INSERT INTO working_memory_conversations 
+                (conversation_id, start_time, intent, status, last_activity)
+                VALUES (?, ?, ?, 'active', ?)
+            """, (conversation_id, now, intent, now)))
+            
+            self._sessions[conversation_id] = {
+                'conversation_id': conversation_id,
+                'start_time': now,
+                'end_time': None,
+                'intent': intent,
+                'status': 'active'
+            }
+            self._refresh_active()
+            
+            # Check FIFO queue limit (50 conversations)
+            statements.extend(self._enforce_fifo_limit())
         
         return conversation_id
     
+    def _complete(self, conversation_id: str) -> Tuple[str, tuple]:
+        """Mark a session completed in memory; returns its UPDATE statement"""
+        session = self._sessions.get(conversation_id)
+        end_time = datetime.now().isoformat()
+        if session and session['status'] != 'completed':
+            session['status'] = 'completed'
+            session['end_time'] = end_time
+            bisect.insort(self._completed, (session['start_time'], conversation_id))
+            if conversation_id == self._active_id:
+                self._refresh_active()
+        return ("""
+            UPDATE working_memory_conversations
+            SET end_time = ?, status = 'completed'
+            WHERE conversation_id = ?
+        """, (end_time, conversation_id))
+    
     def end_session(self, conversation_id: str) -> None:
         """
         End conversation session
@@ -132,17 +332,8 @@ class SessionManager:
         Args:
             conversation_id: UUID of conversation to end
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE working_memory_conversations
-            SET end_time = ?, status = 'completed'
-            WHERE conversation_id = ?
-        """, (datetime.now().isoformat(), conversation_id))
-        
-        conn.commit()
-        conn.close()
+        with self._lock, self._transaction() as statements:
+            statements.append(self._complete(conversation_id))
     
     def get_active_session(self) -> Optional[str]:
         """
@@ -155,35 +346,22 @@ class SessionManager:
         Returns:
             conversation_id or None
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        # Get most recent active conversation
-        cursor.execute("""
-            SELECT conversation_id, start_time
-            FROM working_memory_conversations
-            WHERE status = 'active'
-            ORDER BY start_time DESC
-            LIMIT 1
-        """)
-        
-        row = cursor.fetchone()
-        conn.close()
-        
-        if not row:
-            return None
-        
-        conversation_id, start_time = row
-        
-        # Check if conversation boundary reached (30 min idle per Rule #11)
-        last_activity = self._get_last_activity_time(conversation_id)
-        
-        if datetime.now() - last_activity > timedelta(minutes=30):
-            # Conversation boundary reached - end this session
-            self.end_session(conversation_id)
-            return None
-        
-        return conversation_id
+        with self._lock:
+            self._sync()
+            conversation_id = self._active_id
+            if conversation_id is None:
+                return None
+            
+            # Check if conversation boundary reached (30 min idle per Rule #11)
+            last_activity = self._get_last_activity_time(conversation_id)
+            
+            if datetime.now() - last_activity > self.IDLE_TIMEOUT:
+                # Conversation boundary reached - end this session (persisted
+                # with the next write, typically the start_session that follows)
+                self._pending.append(self._complete(conversation_id))
+                return None
+            
+            return conversation_id
     
     def _get_last_activity_time(self, conversation_id: str) -> datetime:
         """
@@ -195,25 +373,14 @@ class SessionManager:
         Returns:
             datetime of last activity
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT MAX(timestamp)
-            FROM working_memory_messages
-            WHERE conversation_id = ?
-        """, (conversation_id,))
-        
-        result = cursor.fetchone()[0]
-        conn.close()
-        
-        if result:
-            return datetime.fromisoformat(result)
+        last_message = self._last_message.get(conversation_id)
+        if last_message:
+            return last_message
         
         # No messages yet, use conversation start time
         return datetime.now()
     
-    def _enforce_fifo_limit(self) -> None:
+    def _enforce_fifo_limit(self) -> List[Tuple[str, tuple]]:
         """
         Enforce FIFO queue limit (50 conversations)
         
@@ -221,52 +388,35 @@ class SessionManager:
         - Delete oldest COMPLETED conversations until count <= 50
         - Never delete active conversations
         - Preserve patterns (extracted before deletion)
-        """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
         
-        # Count total conversations
-        cursor.execute("""
-            SELECT COUNT(*) FROM working_memory_conversations
-        """)
-        total_count = cursor.fetchone()[0]
-        
-        if total_count > 50:
-            # Calculate how many to delete
-            to_delete = total_count - 50
-            
-            # Get oldest completed conversations
-            cursor.execute("""
-                SELECT conversation_id
-                FROM working_memory_conversations
-                WHERE status = 'completed'
-                ORDER BY start_time ASC
-                LIMIT ?
-            """, (to_delete,))
+        Works on the in-memory completed queue; returns the DELETE
+        statements for the caller's transaction.
+        """
+        statements = []
+        to_delete = len(self._sessions) - self.FIFO_LIMIT
+        
+        while to_delete > 0 and self._completed:
+            _, oldest_id = self._completed.pop(0)
+            del self._sessions[oldest_id]
+            self._last_message.pop(oldest_id, None)
+            to_delete -= 1
             
-            rows_to_delete = cursor.fetchall()
+            # Delete messages first (foreign key)
+            statements.append(("""
+                DELETE FROM working_memory_messages
+                WHERE conversation_id = ?
+            """, (oldest_id,)))
             
-            for row in rows_to_delete:
-                oldest_id = row[0]
-                
-                # Delete messages first (foreign key)
-                cursor.execute("""
-                    DELETE FROM working_memory_messages
-                    WHERE conversation_id = ?
-                """, (oldest_id,))
-                
-                # Delete conversation from working_memory_conversations
-                cursor.execute("""
-                    DELETE FROM working_memory_conversations
-                    WHERE conversation_id = ?
-                """, (oldest_id,))
-                
-                # Log deletion event
-                print(f"[SessionManager] FIFO: Deleted conversation {oldest_id}")
+            # Delete conversation from working_memory_conversations
+            statements.append(("""
+                DELETE FROM working_memory_conversations
+                WHERE conversation_id = ?
+            """, (oldest_id,)))
             
-            conn.commit()
+            # Log deletion event
+            print(f"[SessionManager] FIFO: Deleted conversation {oldest_id}")
         
-        conn.close()
+        return statements
     
     def get_session_info(self, conversation_id: str) -> Optional[Dict]:
         """
@@ -285,42 +435,20 @@ class SessionManager:
                 'message_count': 5
             }
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        # Get conversation metadata
-        cursor.execute("""
-            SELECT conversation_id, start_time, end_time, intent, status
-            FROM working_memory_conversations
-            WHERE conversation_id = ?
-        """, (conversation_id,))
-        
-        row = cursor.fetchone()
-        
-        if not row:
-            conn.close()
-            return None
-        
-        conversation_id, start_time, end_time, intent, status = row
-        
-        # Get message count
-        cursor.execute("""
-            SELECT COUNT(*)
-            FROM working_memory_messages
-            WHERE conversation_id = ?
-        """, (conversation_id,))
-        
-        message_count = cursor.fetchone()[0]
-        conn.close()
-        
-        return {
-            'conversation_id': conversation_id,
-            'start_time': start_time,
-            'end_time': end_time,
-            'intent': intent,
-            'status': status,
-            'message_count': message_count
-        }
+        with self._lock:
+            self._sync()
+            session = self._sessions.get(conversation_id)
+            if not session:
+                return None
+            
+            # Get message count
+            message_count = self._conn.execute("""
+                SELECT COUNT(*)
+                FROM working_memory_messages
+                WHERE conversation_id = ?
+            """, (conversation_id,)).fetchone()[0]
+            
+            return {**session, 'message_count': message_count}
     
     def get_all_sessions(self, limit: int = 10) -> List[Dict]:
         """
@@ -332,28 +460,7 @@ class SessionManager:
         Returns:
             List of session info dicts
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT conversation_id, start_time, end_time, intent, status
-            FROM working_memory_conversations
-            ORDER BY start_time DESC
-            LIMIT ?
-        """, (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        sessions = []
-        for row in rows:
-            conversation_id, start_time, end_time, intent, status = row
-            sessions.append({
-                'conversation_id': conversation_id,
-                'start_time': start_time,
-                'end_time': end_time,
-                'intent': intent,
-                'status': status
-            })
-        
-        return sessions
+        with self._lock:
+            self._sync()
+            sessions = sorted(self._sessions.values(), key=lambda s: s['start_time'], reverse=True)
+            return [dict(session) for session in sessions[:limit]]
@@ -5,6 +5,7 @@ Demonstrates Test-Driven Development workflow in action.
 
 from .demo_engine import TDDDemoEngine, DemoScenario, DemoPhase
 from .code_runner import CodeRunner, ExecutionResult
+from .sandbox_pool import SandboxPool, SandboxUnavailable
 from .refactoring_advisor import RefactoringAdvisor, CodeSmell, RefactoringSuggestion
 from .demo_orchestrator import DemoOrchestrator, DemoSession
 
@@ -14,6 +15,8 @@ __all__ = [
     'DemoPhase',
     'CodeRunner',
     'ExecutionResult',
+    'SandboxPool',
+    'SandboxUnavailable',
     'RefactoringAdvisor',
     'CodeSmell',
     'RefactoringSuggestion',
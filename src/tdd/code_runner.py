@@ -17,6 +17,8 @@ import time
 import traceback
 import json
 
+from .sandbox_pool import SandboxPool, SandboxUnavailable
+
 
 @dataclass
 class ExecutionResult:
@@ -46,6 +48,7 @@ class CodeRunner:
     Executes Python code in isolated sandbox environment.
     
     Features:
+    - Warm sandbox worker pool (fork per job, rlimits), subprocess fallback
     - Isolated subprocess execution with timeout
     - Syntax validation before execution
     - Test integration with pytest
@@ -55,28 +58,95 @@ class CodeRunner:
     
     Safety:
     - 30-second timeout by default
+    - CPU and address-space rlimits per job (pool mode)
     - Isolated filesystem access
     - No access to parent process environment
     """
     
     DEFAULT_TIMEOUT = 30  # seconds
+    DEFAULT_MEMORY_LIMIT_MB = 1024
     
     def __init__(self, 
                  workspace: Optional[Path] = None,
                  timeout: int = DEFAULT_TIMEOUT,
-                 python_executable: str = sys.executable):
+                 python_executable: str = sys.executable,
+                 use_pool: bool = True,
+                 pool: Optional[SandboxPool] = None,
+                 memory_limit_mb: Optional[int] = DEFAULT_MEMORY_LIMIT_MB):
         """
         Initialize Code Runner.
         
         Args:
             workspace: Directory for temporary code files
-            timeout: Maximum execution time in seconds
+            timeout: Maximum execution time in seconds (also the CPU limit)
             python_executable: Path to Python interpreter
+            use_pool: Run jobs on warm sandbox workers when supported
+            pool: Shared SandboxPool (created lazily if None)
+            memory_limit_mb: Address-space limit per job in pool mode (None = unlimited)
         """
         self.workspace = workspace or Path(tempfile.mkdtemp(prefix="cortex_demo_"))
         self.workspace.mkdir(parents=True, exist_ok=True)
         self.timeout = timeout
         self.python_executable = python_executable
+        self.memory_limit_mb = memory_limit_mb
+        self.use_pool = use_pool and (pool is not None or SandboxPool.is_supported())
+        self._pool = pool
+        self._owns_pool = pool is None
+    
+    def _get_pool(self) -> Optional[SandboxPool]:
+        """Sandbox pool, started on first use; None if disabled or unavailable."""
+        if not self.use_pool:
+            return None
+        if self._pool is None:
+            try:
+                self._pool = SandboxPool(python_executable=self.python_executable)
+            except SandboxUnavailable:
+                self.use_pool = False
+        return self._pool
+    
+    def _run_in_pool(self, kind: str, path: Path, timeout_message: str) -> Optional[ExecutionResult]:
+        """
+        Run a job on the sandbox pool.
+        
+        Returns:
+            ExecutionResult, or None if the pool cannot run it (use subprocess)
+        """
+        pool = self._get_pool()
+        if pool is None:
+            return None
+        
+        try:
+            if kind == "pytest" and not pool.capabilities().get("pytest"):
+                return None
+            result = pool.run({
+                "kind": kind,
+                "path": str(path),
+                "cwd": str(self.workspace),
+                "timeout": self.timeout,
+                "cpu_seconds": int(self.timeout),
+                "memory_mb": self.memory_limit_mb
+            })
+        except SandboxUnavailable:
+            return None
+        
+        if result["timed_out"]:
+            error = timeout_message
+        elif result["exit_code"] != 0:
+            error = result["stderr"] or result["limit"]
+            if result["limit"] and result["limit"] not in error:
+                error = f"{error}\n{result['limit']}"
+        else:
+            error = None
+        
+        return ExecutionResult(
+            success=result["exit_code"] == 0,
+            output="" if result["timed_out"] else result["stdout"],
+            error=error,
+            execution_time=result["execution_time"],
+            test_results=result["test_results"],
+            memory_used=result["memory_used"],
+            exit_code=result["exit_code"]
+        )
     
     def validate_syntax(self, code: str) -> Optional[str]:
         """
@@ -123,7 +193,13 @@ class CodeRunner:
         code_file = self.workspace / file_name
         code_file.write_text(code)
         
-        # Execute in subprocess
+        pooled = self._run_in_pool(
+            "exec", code_file, f"Execution timeout after {self.timeout} seconds"
+        )
+        if pooled is not None:
+            return pooled
+        
+        # Execute in subprocess (fallback)
         start_time = time.time()
         
         try:
@@ -186,7 +262,13 @@ class CodeRunner:
             impl_file = self.workspace / "implementation.py"
             impl_file.write_text(implementation_code)
         
-        # Run pytest with JSON output
+        pooled = self._run_in_pool(
+            "pytest", test_file, f"Test execution timeout after {self.timeout} seconds"
+        )
+        if pooled is not None:
+            return pooled
+        
+        # Run pytest with JSON output (fallback)
         start_time = time.time()
         
         try:
@@ -327,7 +409,10 @@ class CodeRunner:
         return "\n".join(lines)
     
     def cleanup(self) -> None:
-        """Clean up temporary workspace files."""
+        """Clean up temporary workspace files (and the sandbox pool if owned)."""
+        if self._pool is not None and self._owns_pool:
+            self._pool.close()
+            self._pool = None
         try:
             import shutil
             if self.workspace.exists():
@@ -0,0 +1,264 @@
+"""
+Sandbox Pool
+Pool of warm, pre-started sandbox workers for fast code execution.
+
+Starting a Python interpreter (and importing pytest) dominates the cost of
+running a small demo or test file. SandboxPool keeps a few worker
+processes (see sandbox_worker.py) alive with pytest already imported and
+talks to them over a length-prefixed JSON protocol on their stdin/stdout.
+Each job runs in a fresh fork of a worker, under CPU/memory rlimits and a
+wall-clock deadline, and returns a structured result.
+
+Workers are recycled after max_jobs_per_worker jobs, when a job crashes
+its process, or when the RPC channel fails. The pool is POSIX-only
+(fork + resource); CodeRunner falls back to plain subprocess execution
+elsewhere or when the pool is unavailable.
+"""
+
+import json
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .sandbox_worker import HEADER
+
+WORKER_SCRIPT = Path(__file__).with_name("sandbox_worker.py")
+
+
+class SandboxUnavailable(RuntimeError):
+    """Raised when no sandbox worker can run a job (caller should fall back)."""
+
+
+class SandboxWorker:
+    """One warm worker process and its RPC channel."""
+
+    # Extra time on top of the job deadline before the worker itself is presumed hung
+    RPC_GRACE = 5.0
+
+    def __init__(self, python_executable: str = sys.executable):
+        self.process = subprocess.Popen(
+            [python_executable, str(WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self.jobs = 0
+        self.info: Optional[Dict[str, Any]] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def ready(self, timeout: float) -> Dict[str, Any]:
+        """Wait for the worker's ready message (sent once warm-up finishes)."""
+        if self.info is None:
+            self.info = self._recv(time.perf_counter() + timeout)
+        return self.info
+
+    def run(self, job: Dict[str, Any], startup_timeout: float) -> Dict[str, Any]:
+        self.ready(startup_timeout)
+        self._send({"op": "run", "job": job})
+        result = self._recv(time.perf_counter() + job["timeout"] + self.RPC_GRACE)
+        self.jobs += 1
+        return result
+
+    def close(self) -> None:
+        if self.alive:
+            try:
+                self._send({"op": "shutdown"})
+                self.process.wait(timeout=1)
+            except (SandboxUnavailable, OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        payload = json.dumps(message).encode("utf-8")
+        try:
+            self.process.stdin.write(HEADER.pack(len(payload)) + payload)
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise SandboxUnavailable(f"Sandbox worker channel closed: {e}") from e
+
+    def _recv(self, deadline: float) -> Dict[str, Any]:
+        header = self._read_exact(HEADER.size, deadline)
+        (length,) = HEADER.unpack(header)
+        return json.loads(self._read_exact(length, deadline))
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        fd = self.process.stdout.fileno()
+        chunks = []
+        while size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise SandboxUnavailable("Sandbox worker did not respond in time")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, size)
+            if not chunk:
+                raise SandboxUnavailable("Sandbox worker exited")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+
+class SandboxPool:
+    """
+    Pool of warm sandbox workers.
+
+    Example:
+        pool = SandboxPool(size=2)
+        result = pool.run({"kind": "exec", "path": "/tmp/demo.py", "cwd": "/tmp",
+                           "timeout": 30, "cpu_seconds": 30, "memory_mb": 1024})
+        pool.close()
+    """
+
+    def __init__(self,
+                 size: int = 2,
+                 python_executable: str = sys.executable,
+                 max_jobs_per_worker: int = 100,
+                 startup_timeout: float = 30.0):
+        """
+        Initialize and pre-start the pool.
+
+        Args:
+            size: Number of worker processes
+            python_executable: Interpreter for workers
+            max_jobs_per_worker: Recycle a worker after this many jobs
+            startup_timeout: Seconds to wait for a worker to warm up
+        """
+        if not self.is_supported():
+            raise SandboxUnavailable("Sandbox pool requires POSIX fork and resource limits")
+
+        self.size = max(1, size)
+        self.python_executable = python_executable
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+        self.startup_timeout = startup_timeout
+
+        self._idle: List[SandboxWorker] = []
+        self._busy = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self.stats = {"jobs": 0, "workers_started": 0, "workers_recycled": 0}
+
+        # Warm-up runs concurrently in the background processes
+        for _ in range(self.size):
+            self._idle.append(self._spawn())
+
+    @staticmethod
+    def is_supported() -> bool:
+        if os.name != "posix" or not hasattr(os, "fork"):
+            return False
+        try:
+            import resource  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def capabilities(self) -> Dict[str, Any]:
+        """Ready info of a warm worker (e.g. whether pytest is importable)."""
+        worker = self._acquire()
+        try:
+            info = worker.ready(self.startup_timeout)
+        except SandboxUnavailable:
+            self._release(worker, recycle=True)
+            raise
+        self._release(worker)
+        return info
+
+    def run(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a job on a warm worker.
+
+        Raises:
+            SandboxUnavailable: If no worker could run the job
+        """
+        worker = self._acquire()
+        try:
+            result = worker.run(job, self.startup_timeout)
+        except SandboxUnavailable:
+            self._release(worker, recycle=True)
+            raise
+
+        # Jobs killed by a signal (limit, timeout) count as failures
+        crashed = result.get("exit_code", 0) < 0
+        recycle = crashed or worker.jobs >= self.max_jobs_per_worker or not worker.alive
+        self._release(worker, recycle=recycle)
+        with self._condition:
+            self.stats["jobs"] += 1
+        return result
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            workers, self._idle = self._idle, []
+            self._condition.notify_all()
+        for worker in workers:
+            worker.close()
+
+    def _spawn(self) -> SandboxWorker:
+        try:
+            worker = SandboxWorker(self.python_executable)
+        except OSError as e:
+            raise SandboxUnavailable(f"Cannot start sandbox worker: {e}") from e
+        self.stats["workers_started"] += 1
+        return worker
+
+    def _acquire(self) -> SandboxWorker:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise SandboxUnavailable("Sandbox pool is closed")
+                if self._idle:
+                    self._busy += 1
+                    return self._idle.pop()
+                if self._busy < self.size:
+                    self._busy += 1
+                    break
+                self._condition.wait()
+        # Pool was short (a worker failed to respawn earlier)
+        try:
+            return self._spawn()
+        except SandboxUnavailable:
+            with self._condition:
+                self._busy -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, worker: SandboxWorker, recycle: bool = False) -> None:
+        replacement = None
+        if recycle or self._closed:
+            worker.close()
+            if not self._closed:
+                self.stats["workers_recycled"] += 1
+                try:
+                    replacement = self._spawn()
+                except SandboxUnavailable:
+                    replacement = None
+        else:
+            replacement = worker
+
+        with self._condition:
+            self._busy -= 1
+            if replacement is not None:
+                if self._closed:
+                    replacement.close()
+                else:
+                    self._idle.append(replacement)
+            self._condition.notify()
+
+    def __enter__(self) -> "SandboxPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
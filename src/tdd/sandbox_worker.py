@@ -0,0 +1,299 @@
+"""
+Sandbox Worker
+Warm worker process for SandboxPool (run as a script, not imported).
+
+The worker pre-imports pytest once, then serves jobs over a small RPC
+protocol on stdin/stdout: 4-byte big-endian length + JSON payload.
+Every job runs in a child forked from the warm worker, so:
+- each job starts from the same pristine module state (nothing a job
+  imports or mutates survives into the next one)
+- CPU/memory rlimits and the wall-clock deadline apply to the job only
+- a crashing job cannot take the worker down
+
+Job:    {"kind": "exec" | "pytest", "path": str, "cwd": str,
+         "timeout": float, "cpu_seconds": int, "memory_mb": int | null}
+Result: {"exit_code": int, "stdout": str, "stderr": str, "timed_out": bool,
+         "limit": str | null, "execution_time": float,
+         "memory_used": float | null, "test_results": dict | null}
+"""
+
+import json
+import os
+import select
+import signal
+import struct
+import sys
+import tempfile
+import time
+import traceback
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - pool is POSIX only
+    resource = None
+
+HEADER = struct.Struct(">I")
+
+# RPC pipe fds, closed in job children so jobs cannot reach the channel
+_RPC_FDS = []
+
+
+def read_frame(fd):
+    header = _read_exact(fd, HEADER.size)
+    if header is None:
+        return None
+    (length,) = HEADER.unpack(header)
+    payload = _read_exact(fd, length)
+    return json.loads(payload) if payload is not None else None
+
+
+def write_frame(fd, message):
+    payload = json.dumps(message).encode("utf-8")
+    _write_all(fd, HEADER.pack(len(payload)) + payload)
+
+
+def _read_exact(fd, size):
+    chunks = []
+    while size:
+        chunk = os.read(fd, size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+class _TestCollector:
+    """pytest plugin collecting structured per-test results"""
+
+    def __init__(self):
+        self.tests = []
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call":
+            outcome = report.outcome
+        elif report.failed:
+            outcome = "error"
+        elif report.skipped:
+            outcome = "skipped"
+        else:
+            return
+        self.tests.append({
+            "name": report.nodeid,
+            "outcome": outcome,
+            "duration": report.duration
+        })
+
+    def summary(self, duration):
+        outcomes = [test["outcome"] for test in self.tests]
+        return {
+            "total": len(outcomes),
+            "passed": outcomes.count("passed"),
+            "failed": outcomes.count("failed") + outcomes.count("error"),
+            "skipped": outcomes.count("skipped"),
+            "duration": duration,
+            "tests": self.tests
+        }
+
+
+def _run_exec(job):
+    path = job["path"]
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    sys.argv = [path]
+    namespace = {"__name__": "__main__", "__file__": path, "__builtins__": __builtins__}
+    try:
+        exec(compile(source, path, "exec"), namespace)
+        return 0
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException as e:
+        # Drop this frame so the traceback reads like a plain interpreter run
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        return 1
+
+
+def _run_pytest(job, report):
+    import pytest
+
+    collector = _TestCollector()
+    start = time.perf_counter()
+    exit_code = pytest.main([job["path"], "-v", "--tb=short"], plugins=[collector])
+    report["test_results"] = collector.summary(time.perf_counter() - start)
+    return int(exit_code)
+
+
+def _apply_limits(job):
+    if resource is None:
+        return
+    cpu = job.get("cpu_seconds")
+    if cpu:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+    memory_mb = job.get("memory_mb")
+    if memory_mb:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _child(job, stdout, stderr, result_fd):
+    """Runs in the forked child; never returns"""
+    report = {}
+    exit_code = 1
+    try:
+        for fd in _RPC_FDS:
+            os.close(fd)
+        os.dup2(stdout.fileno(), 1)
+        os.dup2(stderr.fileno(), 2)
+        os.chdir(job["cwd"])
+        sys.path.insert(0, job["cwd"])
+        _apply_limits(job)
+
+        if job["kind"] == "pytest":
+            exit_code = _run_pytest(job, report)
+        else:
+            exit_code = _run_exec(job)
+    except MemoryError:
+        print("MemoryError: job exceeded its memory limit", file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            report["exit_code"] = exit_code
+            if resource is not None:
+                # ru_maxrss is KiB on Linux
+                report["memory_used"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            _write_all(result_fd, json.dumps(report).encode("utf-8"))
+        finally:
+            os._exit(0)
+
+
+def _collect(result_fd, deadline):
+    """Read the child's report until EOF or deadline; (payload, timed_out)"""
+    chunks = []
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return b"".join(chunks), True
+        ready, _, _ = select.select([result_fd], [], [], remaining)
+        if not ready:
+            continue
+        chunk = os.read(result_fd, 65536)
+        if not chunk:
+            return b"".join(chunks), False
+        chunks.append(chunk)
+
+
+def _describe_signal(signum, job):
+    if signum == signal.SIGXCPU:
+        return f"CPU time limit exceeded ({job.get('cpu_seconds')}s)"
+    if signum == signal.SIGKILL:
+        return "Killed"
+    return f"Terminated by signal {signum}"
+
+
+def run_job(job):
+    stdout = tempfile.TemporaryFile()
+    stderr = tempfile.TemporaryFile()
+    result_r, result_w = os.pipe()
+    start = time.perf_counter()
+
+    pid = os.fork()
+    if pid == 0:
+        os.close(result_r)
+        _child(job, stdout, stderr, result_w)
+    os.close(result_w)
+
+    payload, timed_out = _collect(result_r, start + job["timeout"])
+    if timed_out:
+        os.kill(pid, signal.SIGKILL)
+    _, status = os.waitpid(pid, 0)
+    os.close(result_r)
+    execution_time = time.perf_counter() - start
+
+    try:
+        report = json.loads(payload) if payload else {}
+    except ValueError:
+        report = {}
+
+    stdout.seek(0)
+    stderr.seek(0)
+    result = {
+        "stdout": stdout.read().decode("utf-8", errors="replace"),
+        "stderr": stderr.read().decode("utf-8", errors="replace"),
+        "timed_out": timed_out,
+        "limit": None,
+        "execution_time": execution_time,
+        "memory_used": report.get("memory_used"),
+        "test_results": report.get("test_results")
+    }
+    stdout.close()
+    stderr.close()
+
+    if timed_out:
+        result["exit_code"] = -1
+        result["limit"] = "timeout"
+    elif os.WIFSIGNALED(status):
+        # Same convention as subprocess: negative signal number
+        result["exit_code"] = -os.WTERMSIG(status)
+        result["limit"] = _describe_signal(os.WTERMSIG(status), job)
+    else:
+        result["exit_code"] = report.get("exit_code", os.WEXITSTATUS(status))
+    return result
+
+
+def _warm_up():
+    """Import what jobs need so forked children start warm"""
+    capabilities = {"pytest": False}
+    try:
+        import pytest  # noqa: F401
+        from importlib.metadata import entry_points
+        capabilities["pytest"] = True
+        try:
+            for entry_point in entry_points(group="pytest11"):
+                entry_point.load()
+        except Exception:
+            pass
+    except ImportError:
+        pass
+    return capabilities
+
+
+def main():
+    # Keep the RPC channel private: jobs (and anything they spawn) only
+    # ever see /dev/null on fds 0 and 1
+    rpc_in = os.dup(0)
+    rpc_out = os.dup(1)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    _RPC_FDS.extend((rpc_in, rpc_out))
+
+    capabilities = _warm_up()
+    write_frame(rpc_out, {"ready": True, "pid": os.getpid(), **capabilities})
+
+    while True:
+        message = read_frame(rpc_in)
+        if message is None or message.get("op") == "shutdown":
+            break
+        if message.get("op") == "run":
+            write_frame(rpc_out, run_job(message["job"]))
+        else:
+            write_frame(rpc_out, {"error": f"unknown op: {message.get('op')}"})
+
+
+if __name__ == "__main__":
+    main()
@@ -210,15 +210,16 @@ def patch_brain_protector():
     """
     from src.tier0.brain_protector import BrainProtector
     
-    # Save original method
-    original_load_rules = BrainProtector._load_rules
+    # Save original method (BrainProtector publishes a shared rules
+    # snapshot per file, so this only affects rules files registered later)
+    original_load_rules = BrainProtector.__dict__['_load_rules']
     
     # Replace with cached version
-    def cached_load_rules(self) -> Dict[str, Any]:
+    def cached_load_rules(rules_path: Path) -> Dict[str, Any]:
         """Load rules using cached loader."""
-        return load_brain_protection_rules(rules_path=self.rules_path)
+        return load_brain_protection_rules(rules_path=rules_path)
     
-    BrainProtector._load_rules = cached_load_rules
+    BrainProtector._load_rules = staticmethod(cached_load_rules)
     BrainProtector._original_load_rules = original_load_rules
 
 
@@ -231,5 +232,5 @@ def unpatch_brain_protector():
     from src.tier0.brain_protector import BrainProtector
     
     if hasattr(BrainProtector, '_original_load_rules'):
-        BrainProtector._load_rules = BrainProtector._original_load_rules
+        BrainProtector._load_rules = BrainProtector.__dict__['_original_load_rules']
         delattr(BrainProtector, '_original_load_rules')
@@ -15,16 +15,23 @@ Date: November 6, 2025
 
 Updated: November 8, 2025 - YAML-based configuration
 Now loads rules from cortex-brain/brain-protection-rules.yaml
+
+Rules are compiled once per file change into an immutable ProtectionRules
+snapshot shared by all BrainProtector instances (see
+src/utils/config_snapshots.py); edits are picked up by the config watcher.
 """
 
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-import json
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 import yaml
 
+from ..infrastructure.persistence.event_log import EventLog
+from ..utils.config_snapshots import freeze, get_config_runtime
+
 
 class Severity(Enum):
     """Protection violation severity levels."""
@@ -86,6 +93,35 @@ class Challenge:
     options: List[str]
 
 
+@dataclass(frozen=True)
+class ProtectionRules:
+    """Compiled, immutable protection rules (one instance per rules file version)."""
+    config: Mapping[str, Any]
+    critical_paths: Tuple[str, ...]
+    tier0_instincts: Tuple[str, ...]
+    application_paths: Tuple[str, ...]
+    brain_state_files: Tuple[str, ...]
+    protection_layers: Tuple[Mapping[str, Any], ...]
+    layers_by_id: Mapping[str, Mapping[str, Any]]
+    
+    @classmethod
+    def compile(cls, config: Optional[Dict[str, Any]]) -> "ProtectionRules":
+        """Freeze raw YAML rules and index protection layers by ID."""
+        config = freeze(config or {})
+        layers = config.get('protection_layers') or ()
+        
+        return cls(
+            config=config,
+            critical_paths=config.get('critical_paths') or (),
+            tier0_instincts=config.get('tier0_instincts') or (),
+            application_paths=config.get('application_paths') or (),
+            brain_state_files=config.get('brain_state_files') or (),
+            protection_layers=layers,
+            # First layer wins on duplicate IDs, matching a linear scan
+            layers_by_id=MappingProxyType({layer.get('layer_id'): layer for layer in reversed(layers)})
+        )
+
+
 class BrainProtector:
     """
     Automates architectural protection challenges.
@@ -115,46 +151,68 @@ class BrainProtector:
             log_dir.mkdir(parents=True, exist_ok=True)
             log_path = log_dir / "protection-events.jsonl"
         self.log_path = Path(log_path)
+        self._event_log: Optional[EventLog] = None
         
         # Load rules from YAML
         if rules_path is None:
             rules_path = project_root / "cortex-brain" / "brain-protection-rules.yaml"
         
         self.rules_path = Path(rules_path)
-        self.rules_config = self._load_rules()
-        
-        # Extract configuration for easy access
-        self.CRITICAL_PATHS = self.rules_config.get('critical_paths', [])
-        self.TIER0_INSTINCTS = self.rules_config.get('tier0_instincts', [])
-        self.APPLICATION_PATHS = self.rules_config.get('application_paths', [])
-        self.BRAIN_STATE_FILES = self.rules_config.get('brain_state_files', [])
-        self.protection_layers = self.rules_config.get('protection_layers', [])
+        rules_path = self.rules_path.resolve()
+        load_rules = type(self)._load_rules
+        self._rules = get_config_runtime().register(
+            f"brain-protection-rules:{rules_path}",
+            [rules_path],
+            lambda: ProtectionRules.compile(load_rules(rules_path))
+        )
+    
+    @property
+    def rules(self) -> ProtectionRules:
+        """Current compiled rules snapshot (lock-free)."""
+        return self._rules.value
+    
+    # Configuration for easy access
+    @property
+    def rules_config(self) -> Mapping[str, Any]:
+        return self.rules.config
+    
+    @property
+    def CRITICAL_PATHS(self) -> Tuple[str, ...]:
+        return self.rules.critical_paths
+    
+    @property
+    def TIER0_INSTINCTS(self) -> Tuple[str, ...]:
+        return self.rules.tier0_instincts
     
-    def _load_rules(self) -> Dict[str, Any]:
+    @property
+    def APPLICATION_PATHS(self) -> Tuple[str, ...]:
+        return self.rules.application_paths
+    
+    @property
+    def BRAIN_STATE_FILES(self) -> Tuple[str, ...]:
+        return self.rules.brain_state_files
+    
+    @property
+    def protection_layers(self) -> Tuple[Mapping[str, Any], ...]:
+        return self.rules.protection_layers
+    
+    @classmethod
+    def _load_rules(cls, rules_path: Path) -> Dict[str, Any]:
         """
         Load protection rules from YAML configuration file.
         
-        Uses universal YAML cache for performance (99.9% faster on subsequent loads).
-        First load: ~550ms, subsequent loads: ~0.1-0.5ms.
+        Called by the config runtime once per file change; readers use the
+        published ProtectionRules snapshot instead of re-reading the file.
         """
         try:
-            # Use universal YAML cache
-            from src.utils.yaml_cache import load_yaml_cached
-            return load_yaml_cached(self.rules_path)
-        except ImportError:
-            # Fallback to direct loading if cache not available
-            try:
-                import yaml
-                with open(self.rules_path, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f)
-            except ImportError:
-                print("WARNING: PyYAML not installed. Using minimal fallback rules.")
-                return self._get_fallback_rules()
+            with open(rules_path, 'r', encoding='utf-8') as f:
+                return yaml.safe_load(f)
         except FileNotFoundError:
-            print(f"WARNING: Rules file not found at {self.rules_path}. Using fallback rules.")
-            return self._get_fallback_rules()
+            print(f"WARNING: Rules file not found at {rules_path}. Using fallback rules.")
+            return cls._get_fallback_rules()
     
-    def _get_fallback_rules(self) -> Dict[str, Any]:
+    @staticmethod
+    def _get_fallback_rules() -> Dict[str, Any]:
         """Provide minimal fallback rules if YAML can't be loaded."""
         return {
             'critical_paths': ["CORTEX/src/tier0/", "prompts/internal/", "cortex-brain/tier0/"],
@@ -242,10 +300,7 @@ class BrainProtector:
     
     def _get_layer_by_id(self, layer_id: str) -> Optional[Dict[str, Any]]:
         """Get protection layer configuration by ID."""
-        for layer in self.protection_layers:
-            if layer.get('layer_id') == layer_id:
-                return layer
-        return None
+        return self.rules.layers_by_id.get(layer_id)
     
     def _check_rule(self, request: ModificationRequest, rule: Dict[str, Any], layer: ProtectionLayer) -> bool:
         """Check if a rule is violated based on YAML detection config."""
@@ -339,7 +394,7 @@ class BrainProtector:
                     
                     # Check contains_any condition
                     if contains_any:
-                        if isinstance(contains_any, list):
+                        if isinstance(contains_any, (list, tuple)):
                             # Case-insensitive check
                             if any(val.lower().strip('/') in file_lower for val in contains_any):
                                 return True
@@ -743,6 +798,24 @@ Your choice:
             "override_required": challenge.result.override_required
         }
         
-        # Append to log
-        with open(self.log_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(event) + '\n')
+        self.event_log.append(event)
+    
+    @property
+    def event_log(self) -> EventLog:
+        """
+        Segmented protection-events log, opened on first use.
+        
+        Segments live in '<log_path>.d/'; an existing single-file log is
+        adopted as the first segment. Writes are unbuffered (audit trail).
+        """
+        if self._event_log is None:
+            self._event_log = EventLog(
+                self.log_path.with_name(self.log_path.name + ".d"),
+                max_batch_delay=0,
+                legacy_file=self.log_path
+            )
+        return self._event_log
+    
+    def recent_events(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent protection events, oldest first"""
+        return self.event_log.tail(limit)
@@ -13,6 +13,7 @@ from typing import Dict, List, Optional, Any
 from pathlib import Path
 import json
 
+from ..infrastructure.persistence.event_log import tail_jsonl
 from .context_optimizer import (
     ContextOptimizer,
     PatternRelevanceScorer,
@@ -279,20 +280,8 @@ class OptimizedContextLoader:
         """Fallback: Load conversations from JSONL file"""
         conv_file = self.brain_dir / "conversation-history.jsonl"
         
-        if not conv_file.exists():
-            return []
-        
-        conversations = []
-        with open(conv_file, 'r') as f:
-            lines = f.readlines()
-            # Get last N lines
-            for line in lines[-limit:]:
-                try:
-                    conversations.append(json.loads(line))
-                except:
-                    continue
-        
-        return conversations
+        # Read backwards from the end so cost tracks limit, not history size
+        return tail_jsonl(conv_file, limit)
     
     def _load_patterns_from_file(self) -> List[Dict]:
         """Fallback: Load patterns from knowledge graph file"""
@@ -0,0 +1,274 @@
+"""
+CORTEX Tier 1 - File Access Aggregates
+
+Incrementally maintained summaries of file_access_history for Smart
+Recommendations, so recommending files never scans the access history:
+
+- file_access_stats: per-file access count, exponentially decayed
+  frequency and last access time
+- file_label_scores: decayed per-(kind, label, file) counters, e.g.
+  ("intent", "debugging", path) or ("phase", "testing", path)
+- file_keyword_index: keyword -> file inverted index with decayed weights
+
+Decayed scores are stored in log space relative to a fixed origin:
+
+    log_score = log(sum(exp(t_i / tau)))     t_i = access time (epoch seconds)
+
+so an access only adds to its own rows (log-sum-exp, no rewrite of other
+rows as time passes) and every row decays at the same rate, which makes
+ordering by log_score the same as ordering by the current decayed score.
+Every top-k read is therefore an index range scan. The decayed value at
+time `now` is exp(log_score - now / tau).
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+License: Proprietary - See LICENSE file for terms
+"""
+
+import math
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+DEFAULT_HALF_LIFE_DAYS = 7.0
+
+# (keywords, [(kind, label), ...]) describing one access
+AccessFeatures = Tuple[Sequence[str], Sequence[Tuple[str, str]]]
+
+
+def _logaddexp(a: Optional[float], b: float) -> float:
+    if a is None:
+        return b
+    high, low = (a, b) if a >= b else (b, a)
+    return high + math.log1p(math.exp(low - high))
+
+
+@dataclass
+class AccessScore:
+    """Aggregated access statistics for one file"""
+    file_path: str
+    access_count: int
+    frequency: float  # Decayed access count at query time
+    last_access: float  # Epoch seconds
+
+
+class AccessAggregateStore:
+    """
+    Decayed access aggregates kept next to file_access_history.
+
+    Methods take an open connection so updates join the caller's
+    transaction (the history insert and its aggregates commit together).
+    """
+
+    def __init__(self, half_life_days: float = DEFAULT_HALF_LIFE_DAYS):
+        self.half_life_days = half_life_days
+        # Time constant: exp(-half_life / tau) == 0.5
+        self.tau = half_life_days * 86400 / math.log(2)
+
+    # ============ Setup ============
+
+    def initialize(self, conn: sqlite3.Connection,
+                   features: Callable[[str], AccessFeatures]) -> int:
+        """
+        Create the aggregate tables and fold in any history rows not yet
+        aggregated (existing databases, or rows written by older code).
+
+        Args:
+            conn: Open connection to the recommendations database
+            features: Maps an access context to its keywords and labels
+
+        Returns:
+            Number of history rows folded in
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_access_stats (
+                file_path TEXT PRIMARY KEY,
+                access_count INTEGER NOT NULL DEFAULT 0,
+                log_score REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_label_scores (
+                kind TEXT NOT NULL,  -- "intent", "phase", "activity"
+                label TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                access_count INTEGER NOT NULL DEFAULT 0,
+                log_score REAL NOT NULL,
+                PRIMARY KEY (kind, label, file_path)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_keyword_index (
+                keyword TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                log_score REAL NOT NULL,
+                PRIMARY KEY (keyword, file_path)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS access_aggregate_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_access_stats_score ON file_access_stats(log_score DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_access_stats_last ON file_access_stats(last_access DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_label_scores_rank ON file_label_scores(kind, label, log_score DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_keyword_index_rank ON file_keyword_index(keyword, log_score DESC)")
+
+        return self._catch_up(conn, features)
+
+    def _catch_up(self, conn: sqlite3.Connection, features: Callable[[str], AccessFeatures]) -> int:
+        row = conn.execute("SELECT value FROM access_aggregate_meta WHERE key = 'history_id'").fetchone()
+        last_id = row[0] if row else 0
+
+        folded = 0
+        cursor = conn.execute("""
+            SELECT id, file_path, context, CAST(strftime('%s', timestamp) AS REAL)
+            FROM file_access_history
+            WHERE id > ?
+            ORDER BY id
+        """, (last_id,))
+        for history_id, file_path, context, accessed_at in cursor.fetchall():
+            keywords, labels = features(context or "")
+            self.record(conn, file_path, keywords, labels, accessed_at, history_id=history_id)
+            folded += 1
+        return folded
+
+    # ============ Updates ============
+
+    def record(self, conn: sqlite3.Connection, file_path: str,
+               keywords: Iterable[str] = (), labels: Iterable[Tuple[str, str]] = (),
+               accessed_at: Optional[float] = None, history_id: Optional[int] = None) -> None:
+        """
+        Fold one access into the aggregates.
+
+        Args:
+            conn: Open connection (caller commits)
+            file_path: Accessed file
+            keywords: Context keywords for the inverted index
+            labels: (kind, label) pairs, e.g. ("intent", "debugging")
+            accessed_at: Access time in epoch seconds (default: now)
+            history_id: file_access_history row id this access came from
+        """
+        conn.create_function("logaddexp", 2, _logaddexp, deterministic=True)
+        accessed_at = time.time() if accessed_at is None else accessed_at
+        weight = accessed_at / self.tau
+
+        conn.execute("""
+            INSERT INTO file_access_stats (file_path, access_count, log_score, last_access)
+            VALUES (?, 1, ?, ?)
+            ON CONFLICT(file_path) DO UPDATE SET
+                access_count = access_count + 1,
+                log_score = logaddexp(log_score, excluded.log_score),
+                last_access = MAX(last_access, excluded.last_access)
+        """, (file_path, weight, accessed_at))
+
+        conn.executemany("""
+            INSERT INTO file_label_scores (kind, label, file_path, access_count, log_score)
+            VALUES (?, ?, ?, 1, ?)
+            ON CONFLICT(kind, label, file_path) DO UPDATE SET
+                access_count = access_count + 1,
+                log_score = logaddexp(log_score, excluded.log_score)
+        """, [(kind, label, file_path, weight) for kind, label in set(labels) if label])
+
+        conn.executemany("""
+            INSERT INTO file_keyword_index (keyword, file_path, log_score)
+            VALUES (?, ?, ?)
+            ON CONFLICT(keyword, file_path) DO UPDATE SET
+                log_score = logaddexp(log_score, excluded.log_score)
+        """, [(keyword, file_path, weight) for keyword in set(keywords)])
+
+        if history_id is not None:
+            conn.execute("""
+                INSERT INTO access_aggregate_meta (key, value) VALUES ('history_id', ?)
+                ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)
+            """, (history_id,))
+
+    def prune(self, conn: sqlite3.Connection, min_score: float = 0.01) -> int:
+        """Drop aggregate rows whose decayed score fell below min_score"""
+        cutoff = self._log_cutoff(min_score)
+        removed = 0
+        for table in ("file_access_stats", "file_label_scores", "file_keyword_index"):
+            removed += conn.execute(f"DELETE FROM {table} WHERE log_score < ?", (cutoff,)).rowcount
+        return removed
+
+    # ============ Queries ============
+
+    def decayed(self, log_score: float, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return math.exp(log_score - now / self.tau)
+
+    def _log_cutoff(self, min_score: float, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return math.log(min_score) + now / self.tau
+
+    def _scores(self, rows) -> List[AccessScore]:
+        now = time.time()
+        return [
+            AccessScore(file_path, access_count, self.decayed(log_score, now), last_access)
+            for file_path, access_count, log_score, last_access in rows
+        ]
+
+    def top_files(self, conn: sqlite3.Connection, limit: int) -> List[AccessScore]:
+        """Files with the highest decayed frequency"""
+        return self._scores(conn.execute("""
+            SELECT file_path, access_count, log_score, last_access
+            FROM file_access_stats
+            ORDER BY log_score DESC
+            LIMIT ?
+        """, (limit,)))
+
+    def recent_files(self, conn: sqlite3.Connection, limit: int, within_seconds: float) -> List[AccessScore]:
+        """Most recently accessed files, newest first"""
+        return self._scores(conn.execute("""
+            SELECT file_path, access_count, log_score, last_access
+            FROM file_access_stats
+            WHERE last_access > ?
+            ORDER BY last_access DESC
+            LIMIT ?
+        """, (time.time() - within_seconds, limit)))
+
+    def stats_for(self, conn: sqlite3.Connection, file_paths: Iterable[str]) -> Dict[str, AccessScore]:
+        """Access statistics for specific files"""
+        file_paths = list(file_paths)
+        if not file_paths:
+            return {}
+        placeholders = ",".join("?" * len(file_paths))
+        rows = conn.execute(f"""
+            SELECT file_path, access_count, log_score, last_access
+            FROM file_access_stats
+            WHERE file_path IN ({placeholders})
+        """, file_paths)
+        return {score.file_path: score for score in self._scores(rows)}
+
+    def files_for_label(self, conn: sqlite3.Connection, kind: str, label: str,
+                        limit: int) -> List[Tuple[str, float]]:
+        """(file_path, decayed score) for a label, strongest first"""
+        now = time.time()
+        rows = conn.execute("""
+            SELECT file_path, log_score
+            FROM file_label_scores
+            WHERE kind = ? AND label = ?
+            ORDER BY log_score DESC
+            LIMIT ?
+        """, (kind, label, limit))
+        return [(file_path, self.decayed(log_score, now)) for file_path, log_score in rows]
+
+    def files_for_keywords(self, conn: sqlite3.Connection, keywords: Iterable[str],
+                           per_keyword: int) -> Dict[str, Set[str]]:
+        """Matched keywords per file, over the strongest per_keyword files of each keyword"""
+        matches: Dict[str, Set[str]] = {}
+        for keyword in set(keywords):
+            rows = conn.execute("""
+                SELECT file_path
+                FROM file_keyword_index
+                WHERE keyword = ?
+                ORDER BY log_score DESC
+                LIMIT ?
+            """, (keyword, per_keyword))
+            for (file_path,) in rows:
+                matches.setdefault(file_path, set()).add(keyword)
+        return matches
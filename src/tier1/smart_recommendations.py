@@ -29,6 +29,8 @@ import re
 from collections import defaultdict, Counter
 import math
 
+from src.tier1.access_aggregates import AccessAggregateStore, AccessFeatures
+
 
 @dataclass
 class FileRecommendation:
@@ -83,12 +85,22 @@ class SmartRecommendations:
     
     This system learns from conversation patterns, file access history, and user feedback
     to provide intelligent file suggestions that improve development workflow efficiency.
+    
+    File access history is summarized incrementally (see AccessAggregateStore) as it is
+    recorded, so generating recommendations costs the same however long the history is.
     """
     
+    # Candidates read per keyword / label from the aggregate indexes
+    CANDIDATES_PER_KEY = 50
+    
+    # Decayed access count (half-life: one week) a file needs for frequency recommendations
+    MIN_FREQUENCY = 2.0
+    
     def __init__(self, db_path: str = None, pattern_engine=None):
         self.db_path = db_path or "cortex-brain/tier1/smart_recommendations.db"
         self.pattern_engine = pattern_engine  # Pattern Learning Engine instance
         self.logger = logging.getLogger(__name__)
+        self.aggregates = AccessAggregateStore()
         
         # Recommendation weights
         self.weights = {
@@ -189,6 +201,11 @@ class SmartRecommendations:
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_patterns_type ON recommendation_patterns(pattern_type)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_rating ON recommendation_feedback(effectiveness_rating)")
                 
+                # Access aggregates (folds in history not yet aggregated)
+                folded = self.aggregates.initialize(conn, self._access_features)
+                if folded:
+                    self.logger.info(f"Aggregated {folded} file access history entries")
+                
                 self.logger.info("Smart Recommendations database initialized successfully")
                 
         except Exception as e:
@@ -346,35 +363,32 @@ class SmartRecommendations:
         try:
             # Extract keywords from conversation
             keywords = self._extract_keywords(context.current_conversation)
-            keywords.extend(context.keywords)
+            keywords.extend(k.lower() for k in context.keywords if k.lower() not in keywords)
+            if not keywords:
+                return recommendations
             
-            # Query for files with similar contexts
+            # Look up files previously accessed in contexts sharing these keywords
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT file_path, context, COUNT(*) as frequency
-                    FROM file_access_history
-                    WHERE timestamp > datetime('now', '-30 days')
-                    GROUP BY file_path
-                    HAVING frequency > 1
-                    ORDER BY frequency DESC
-                    LIMIT 50
-                """)
-                
-                for row in cursor.fetchall():
-                    file_path, file_context, frequency = row
-                    
-                    # Calculate similarity score based on keyword overlap
-                    if file_context:
-                        similarity = self._calculate_context_similarity(keywords, file_context)
-                        if similarity > 0.1:  # Lowered minimum similarity threshold
-                            recommendations.append(FileRecommendation(
-                                file_path=file_path,
-                                confidence_score=similarity * self.weights["context_similarity"],
-                                reasoning=f"Similar context (similarity: {similarity:.2f})",
-                                recommendation_type="context_similarity",
-                                supporting_evidence=[f"Keyword overlap with previous usage"],
-                                frequency_score=min(frequency / 10.0, 1.0)  # Normalize frequency
-                            ))
+                matches = self.aggregates.files_for_keywords(conn, keywords, self.CANDIDATES_PER_KEY)
+                stats = self.aggregates.stats_for(conn, matches)
+            
+            for file_path, matched in matches.items():
+                score = stats.get(file_path)
+                # Require repeated recent use, as a one-off access says little
+                if score is None or score.frequency <= 1.0:
+                    continue
+                
+                # Share of the conversation keywords seen with this file
+                similarity = len(matched) / len(keywords)
+                if similarity > 0.1:  # Lowered minimum similarity threshold
+                    recommendations.append(FileRecommendation(
+                        file_path=file_path,
+                        confidence_score=similarity * self.weights["context_similarity"],
+                        reasoning=f"Similar context (similarity: {similarity:.2f})",
+                        recommendation_type="context_similarity",
+                        supporting_evidence=[f"Keyword overlap with previous usage"],
+                        frequency_score=min(score.frequency / 10.0, 1.0)  # Normalize frequency
+                    ))
         
         except Exception as e:
             self.logger.error(f"Error getting context similarity recommendations: {e}")
@@ -389,37 +403,47 @@ class SmartRecommendations:
             # Determine file types appropriate for current development phase
             appropriate_types = self._get_file_types_for_phase(context.development_phase, context.user_intent)
             
-            # Query recent file access history
+            # Files accessed under the current intent/phase (explicitly or by context keywords)
+            lookups = [
+                ("intent", context.user_intent),
+                ("phase", context.development_phase),
+                ("activity", context.user_intent),
+                ("activity", context.development_phase),
+            ]
+            label_strength = defaultdict(float)
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT file_path, access_type, context, timestamp
-                    FROM file_access_history
-                    WHERE timestamp > datetime('now', '-7 days')
-                    ORDER BY timestamp DESC
-                    LIMIT 100
-                """)
+                for kind, label in lookups:
+                    ranked = self.aggregates.files_for_label(conn, kind, label, self.CANDIDATES_PER_KEY)
+                    if not ranked:
+                        continue
+                    strongest = ranked[0][1]
+                    for file_path, score in ranked:
+                        label_strength[file_path] = max(label_strength[file_path], score / strongest)
                 
-                for row in cursor.fetchall():
-                    file_path, access_type, file_context, timestamp = row
+                # Recently used files stay candidates even without a label match
+                for score in self.aggregates.recent_files(conn, 100, timedelta(days=7).total_seconds()):
+                    label_strength.setdefault(score.file_path, 0.0)
+                
+                stats = self.aggregates.stats_for(conn, label_strength)
+            
+            for file_path, strength in label_strength.items():
+                # Check if file type matches development phase
+                file_type_score = self._calculate_file_type_score(file_path, appropriate_types)
+                if file_type_score > 0.1:  # Lowered from 0.2 to 0.1
                     
-                    # Check if file type matches development phase
-                    file_type_score = self._calculate_file_type_score(file_path, appropriate_types)
-                    if file_type_score > 0.1:  # Lowered from 0.2 to 0.1
-                        
-                        # Calculate development flow score
-                        flow_score = self._calculate_development_flow_score(
-                            context.development_phase, context.user_intent, file_context
-                        )
-                        
-                        if flow_score > 0.2:  # Lowered from 0.3 to 0.2
-                            recommendations.append(FileRecommendation(
-                                file_path=file_path,
-                                confidence_score=flow_score * self.weights["development_flow"],
-                                reasoning=f"Relevant for {context.development_phase} phase",
-                                recommendation_type="development_flow",
-                                supporting_evidence=[f"File type match: {file_type_score:.2f}"],
-                                last_accessed=datetime.fromisoformat(timestamp.replace('Z', '+00:00')) if 'T' in timestamp else None
-                            ))
+                    # Development flow score: base plus how strongly the file is tied to this work
+                    flow_score = min(0.4 + 0.5 * strength, 1.0)
+                    
+                    if flow_score > 0.2:  # Lowered from 0.3 to 0.2
+                        score = stats.get(file_path)
+                        recommendations.append(FileRecommendation(
+                            file_path=file_path,
+                            confidence_score=flow_score * self.weights["development_flow"],
+                            reasoning=f"Relevant for {context.development_phase} phase",
+                            recommendation_type="development_flow",
+                            supporting_evidence=[f"File type match: {file_type_score:.2f}"],
+                            last_accessed=datetime.fromtimestamp(score.last_access) if score else None
+                        ))
         
         except Exception as e:
             self.logger.error(f"Error getting development flow recommendations: {e}")
@@ -432,33 +456,24 @@ class SmartRecommendations:
         
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT file_path, COUNT(*) as access_count, MAX(timestamp) as last_access
-                    FROM file_access_history
-                    WHERE timestamp > datetime('now', '-30 days')
-                    GROUP BY file_path
-                    ORDER BY access_count DESC
-                    LIMIT 20
-                """)
-                
-                max_count = 0
-                results = cursor.fetchall()
-                if results:
-                    max_count = results[0][1]  # Highest access count for normalization
-                
-                for file_path, access_count, last_access in results:
-                    if access_count >= 3:  # Minimum frequency threshold
-                        frequency_score = access_count / max(max_count, 1)
-                        
-                        recommendations.append(FileRecommendation(
-                            file_path=file_path,
-                            confidence_score=frequency_score * self.weights["frequency"],
-                            reasoning=f"Frequently accessed ({access_count} times)",
-                            recommendation_type="frequency",
-                            supporting_evidence=[f"Access count: {access_count}"],
-                            frequency_score=frequency_score,
-                            last_accessed=datetime.fromisoformat(last_access.replace('Z', '+00:00')) if last_access and 'T' in last_access else None
-                        ))
+                results = self.aggregates.top_files(conn, 20)
+            
+            # Highest decayed frequency for normalization
+            max_frequency = results[0].frequency if results else 0.0
+            
+            for score in results:
+                if score.frequency >= self.MIN_FREQUENCY:  # Minimum frequency threshold
+                    frequency_score = score.frequency / max(max_frequency, 1e-9)
+                    
+                    recommendations.append(FileRecommendation(
+                        file_path=score.file_path,
+                        confidence_score=frequency_score * self.weights["frequency"],
+                        reasoning=f"Frequently accessed ({score.access_count} times)",
+                        recommendation_type="frequency",
+                        supporting_evidence=[f"Access count: {score.access_count}"],
+                        frequency_score=frequency_score,
+                        last_accessed=datetime.fromtimestamp(score.last_access)
+                    ))
         
         except Exception as e:
             self.logger.error(f"Error getting frequency recommendations: {e}")
@@ -471,36 +486,26 @@ class SmartRecommendations:
         
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT file_path, timestamp, context
-                    FROM file_access_history
-                    WHERE timestamp > datetime('now', '-2 days')
-                    ORDER BY timestamp DESC
-                    LIMIT 15
-                """)
-                
-                now = datetime.now()
-                for file_path, timestamp, file_context in cursor.fetchall():
-                    try:
-                        access_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00')) if 'T' in timestamp else datetime.fromisoformat(timestamp)
-                        hours_ago = (now - access_time).total_seconds() / 3600
-                        
-                        # Recency score decreases with time (0-1 scale)
-                        recency_score = max(0, 1 - (hours_ago / 48))  # 48 hours max
-                        
-                        if recency_score > 0.1:
-                            recommendations.append(FileRecommendation(
-                                file_path=file_path,
-                                confidence_score=recency_score * self.weights["recency"],
-                                reasoning=f"Recently accessed ({hours_ago:.1f} hours ago)",
-                                recommendation_type="recency",
-                                supporting_evidence=[f"Last access: {access_time.strftime('%Y-%m-%d %H:%M')}"],
-                                recency_score=recency_score,
-                                last_accessed=access_time
-                            ))
-                    except (ValueError, TypeError):
-                        # Skip invalid timestamps
-                        continue
+                results = self.aggregates.recent_files(conn, 15, timedelta(days=2).total_seconds())
+            
+            now = datetime.now()
+            for score in results:
+                access_time = datetime.fromtimestamp(score.last_access)
+                hours_ago = (now - access_time).total_seconds() / 3600
+                
+                # Recency score decreases with time (0-1 scale)
+                recency_score = max(0, 1 - (hours_ago / 48))  # 48 hours max
+                
+                if recency_score > 0.1:
+                    recommendations.append(FileRecommendation(
+                        file_path=score.file_path,
+                        confidence_score=recency_score * self.weights["recency"],
+                        reasoning=f"Recently accessed ({hours_ago:.1f} hours ago)",
+                        recommendation_type="recency",
+                        supporting_evidence=[f"Last access: {access_time.strftime('%Y-%m-%d %H:%M')}"],
+                        recency_score=recency_score,
+                        last_accessed=access_time
+                    ))
         
         except Exception as e:
             self.logger.error(f"Error getting recency recommendations: {e}")
@@ -690,17 +695,6 @@ class SmartRecommendations:
         
         return unique_keywords[:20]  # Limit to top 20 keywords
     
-    def _calculate_context_similarity(self, keywords: List[str], context: str) -> float:
-        """Calculate similarity between keywords and context text"""
-        if not keywords or not context:
-            return 0.0
-        
-        context_lower = context.lower()
-        matches = sum(1 for keyword in keywords if keyword in context_lower)
-        
-        # Jaccard similarity approximation
-        return matches / len(keywords)
-    
     def _get_file_types_for_phase(self, development_phase: str, user_intent: str) -> List[str]:
         """Get appropriate file types for development phase and intent"""
         phase_types = {
@@ -746,32 +740,6 @@ class SmartRecommendations:
         
         return max_score
     
-    def _calculate_development_flow_score(self, development_phase: str, user_intent: str, context: str) -> float:
-        """Calculate development flow appropriateness score"""
-        score = 0.4  # Higher base score
-        
-        if not context:
-            return 0.5  # Higher default score for missing context
-        
-        context_lower = context.lower()
-        
-        # Check for phase-appropriate keywords
-        phase_keywords = self.activity_keywords.get(development_phase, [])
-        phase_matches = sum(1 for keyword in phase_keywords if keyword in context_lower)
-        
-        # Check for intent-appropriate keywords  
-        intent_keywords = self.activity_keywords.get(user_intent, [])
-        intent_matches = sum(1 for keyword in intent_keywords if keyword in context_lower)
-        
-        # Calculate score based on keyword matches
-        total_keywords = len(phase_keywords) + len(intent_keywords)
-        total_matches = phase_matches + intent_matches
-        
-        if total_keywords > 0:
-            score += min(total_matches / total_keywords * 1.5, 0.5)  # More generous scoring
-        
-        return min(score, 1.0)  # Cap at 1.0
-    
     def _store_recommendations(self, recommendations: List[FileRecommendation], context: RecommendationContext):
         """Store recommendations for feedback tracking and analytics"""
         try:
@@ -803,16 +771,33 @@ class SmartRecommendations:
         except Exception as e:
             self.logger.error(f"Failed to store recommendations: {e}")
     
-    def record_file_access(self, file_path: str, conversation_id: str, access_type: str, context: str = None):
-        """Record file access for learning and recommendations"""
+    def record_file_access(self, file_path: str, conversation_id: str, access_type: str, context: str = None,
+                           user_intent: str = None, development_phase: str = None):
+        """
+        Record file access for learning and recommendations.
+        
+        The access is appended to file_access_history and folded into the access
+        aggregates in the same transaction.
+        
+        Args:
+            file_path: Accessed file
+            conversation_id: Conversation the access happened in
+            access_type: "mentioned", "modified", "viewed"
+            context: Text describing the access
+            user_intent: Current user intent, if known
+            development_phase: Current development phase, if known
+        """
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+                cursor = conn.execute("""
                     INSERT INTO file_access_history
                     (file_path, conversation_id, access_type, context)
                     VALUES (?, ?, ?, ?)
                 """, (file_path, conversation_id, access_type, context or ""))
                 
+                keywords, labels = self._access_features(context or "", user_intent, development_phase)
+                self.aggregates.record(conn, file_path, keywords, labels, history_id=cursor.lastrowid)
+                
                 # Update pattern learning if we have pattern engine
                 if self.pattern_engine and access_type == "modified":
                     self.pattern_engine.record_file_interaction(file_path, conversation_id, context)
@@ -820,6 +805,19 @@ class SmartRecommendations:
         except Exception as e:
             self.logger.error(f"Failed to record file access: {e}")
     
+    def _access_features(self, context: str, user_intent: str = None,
+                         development_phase: str = None) -> AccessFeatures:
+        """Keywords and (kind, label) pairs an access is aggregated under"""
+        keywords = self._extract_keywords(context) if context else []
+        
+        labels = [("intent", user_intent), ("phase", development_phase)]
+        context_lower = context.lower()
+        for activity, activity_keywords in self.activity_keywords.items():
+            if any(keyword in context_lower for keyword in activity_keywords):
+                labels.append(("activity", activity))
+        
+        return keywords, labels
+    
     def record_feedback(self, feedback: RecommendationFeedback):
         """Record user feedback on recommendation quality"""
         try:
@@ -987,6 +985,9 @@ class SmartRecommendations:
                     WHERE timestamp < datetime('now', '-180 days')
                 """).rowcount
                 
+                # Drop access aggregates that have decayed to nothing
+                pruned_aggregates = self.aggregates.prune(conn)
+                
                 # Refresh pattern cache
                 self._refresh_pattern_cache()
                 
@@ -996,7 +997,8 @@ class SmartRecommendations:
                 return {
                     'removed_patterns': removed_patterns,
                     'archived_recommendations': archived_recs,
-                    'archived_history': archived_history
+                    'archived_history': archived_history,
+                    'pruned_aggregates': pruned_aggregates
                 }
         
         except Exception as e:
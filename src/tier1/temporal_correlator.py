@@ -19,6 +19,10 @@ from dataclasses import dataclass
 import json
 import logging
 
+import numpy as np
+
+from .temporal_join import MICROSECONDS, to_microseconds, window_join
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,10 +70,21 @@ class TemporalCorrelator:
     1. Temporal proximity (±1 hour window)
     2. File mention matching (backtick paths in conversations)
     3. Plan verification (multi-phase tracking)
+    
+    Turns and events are each fetched with one query and paired by a
+    window join; scores are computed per batch of pairs with numpy.
     """
     
     DEFAULT_TIME_WINDOW_SECONDS = 3600  # ±1 hour
     
+    HIGH_SCORE_EVENT_TYPES = ('file_change', 'git_operation')
+    PLAN_INDICATORS = (
+        'phase', 'step', 'milestone', 'implementation',
+        'feature', 'refactor', 'test', 'deploy'
+    )
+    FILE_MATCH_RANK = {'exact': 1.0, 'filename': 0.7, 'partial': 0.4}
+    FILE_MATCH_MULTIPLIER = {'exact': 1.0, 'filename': 0.8, 'partial': 0.6}
+    
     def __init__(self, db_path: str, time_window_seconds: int = None):
         """
         Initialize temporal correlator.
@@ -178,14 +193,12 @@ class TemporalCorrelator:
             logger.warning(f"No turns found for conversation {conversation_id}")
             return []
         
-        # Get ambient events in time window around conversation
-        all_correlations = []
-        for turn in turns:
-            events = self._get_ambient_events_in_window(turn.timestamp, self.time_window)
-            
-            for event in events:
-                correlations = self._calculate_correlations(turn, event)
-                all_correlations.extend(correlations)
+        # One query for every event that can fall in any turn's window
+        start = min(turn.timestamp for turn in turns) - timedelta(seconds=self.time_window)
+        end = max(turn.timestamp for turn in turns) + timedelta(seconds=self.time_window)
+        events = self._get_ambient_events_between(start, end)
+        
+        all_correlations = self._correlate_turns_with_events(turns, events)
         
         # Sort by confidence score (highest first)
         all_correlations.sort(key=lambda x: x.confidence_score, reverse=True)
@@ -238,15 +251,12 @@ class TemporalCorrelator:
         
         return turns
     
-    def _get_ambient_events_in_window(
+    def _get_ambient_events_between(
         self, 
-        center_time: datetime, 
-        window_seconds: int
+        start_time: datetime, 
+        end_time: datetime
     ) -> List[AmbientEvent]:
-        """Get ambient events within time window of center_time."""
-        start_time = center_time - timedelta(seconds=window_seconds)
-        end_time = center_time + timedelta(seconds=window_seconds)
-        
+        """Get ambient events between start_time and end_time (uses idx_ambient_timestamp)."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
@@ -279,204 +289,207 @@ class TemporalCorrelator:
         
         return events
     
-    def _calculate_correlations(
-        self, 
-        turn: ConversationTurn, 
-        event: AmbientEvent
+    def _correlate_turns_with_events(
+        self,
+        turns: List[ConversationTurn],
+        events: List[AmbientEvent]
     ) -> List[CorrelationResult]:
-        """Calculate all possible correlations between a turn and event."""
-        correlations = []
+        """
+        Join turns with events inside the time window and score every pair.
+        
+        Results are emitted per turn, per event (in time order), as
+        temporal, file mention, then plan verification correlations.
+        """
+        if not turns or not events:
+            return []
+        
+        origin = min(turn.timestamp for turn in turns)
+        turn_times = to_microseconds([turn.timestamp for turn in turns], origin)
+        event_times = to_microseconds([event.timestamp for event in events], origin)
+        order = np.argsort(event_times, kind='stable')
+        events = [events[j] for j in order]
+        event_times = event_times[order]
         
-        # 1. Temporal correlation (always present if in window)
-        time_diff = abs((event.timestamp - turn.timestamp).total_seconds())
-        temporal_correlation = self._calculate_temporal_correlation(turn, event, time_diff)
-        if temporal_correlation:
-            correlations.append(temporal_correlation)
+        turn_idx, event_idx = window_join(turn_times, event_times, self.time_window * MICROSECONDS)
+        if turn_idx.size == 0:
+            return []
         
-        # 2. File mention correlation
-        file_correlation = self._calculate_file_mention_correlation(turn, event, time_diff)
-        if file_correlation:
-            correlations.append(file_correlation)
+        time_diff = np.abs(event_times[event_idx] - turn_times[turn_idx]) / MICROSECONDS
+        window_ratio = time_diff / self.time_window
         
-        # 3. Plan verification correlation
-        plan_correlation = self._calculate_plan_verification_correlation(turn, event, time_diff)
-        if plan_correlation:
-            correlations.append(plan_correlation)
+        temporal_scores = self._score_temporal(events, event_idx, window_ratio)
+        file_scores, file_matches = self._score_file_mentions(turns, events, turn_idx, event_idx, window_ratio)
+        plan_scores, plan_matches = self._score_plan_verification(turns, events, turn_idx, event_idx, window_ratio)
+        
+        correlations = []
+        for k in range(turn_idx.size):
+            turn = turns[turn_idx[k]]
+            event = events[event_idx[k]]
+            diff_seconds = int(time_diff[k])
+            
+            if temporal_scores[k] >= 0.1:
+                correlations.append(CorrelationResult(
+                    conversation_id=turn.conversation_id,
+                    event_id=event.event_id,
+                    correlation_type='temporal',
+                    confidence_score=float(temporal_scores[k]),
+                    time_diff_seconds=diff_seconds,
+                    match_details={
+                        'event_type': event.event_type,
+                        'event_pattern': event.pattern,
+                        'event_score': event.score,
+                        'event_summary': event.summary
+                    }
+                ))
+            
+            matched_files = file_matches.get(k)
+            if matched_files:
+                correlations.append(CorrelationResult(
+                    conversation_id=turn.conversation_id,
+                    event_id=event.event_id,
+                    correlation_type='file_mention',
+                    confidence_score=float(file_scores[k]),
+                    time_diff_seconds=diff_seconds,
+                    match_details={
+                        'matched_files': matched_files,
+                        'best_match': max(matched_files, key=lambda m: self.FILE_MATCH_RANK[m['match_type']]),
+                        'event_summary': event.summary
+                    }
+                ))
+            
+            indicators = plan_matches.get(k)
+            if indicators:
+                correlations.append(CorrelationResult(
+                    conversation_id=turn.conversation_id,
+                    event_id=event.event_id,
+                    correlation_type='plan_verification',
+                    confidence_score=float(plan_scores[k]),
+                    time_diff_seconds=diff_seconds,
+                    match_details={
+                        'phases_mentioned': turn.phases_mentioned,
+                        'plan_indicators_found': indicators,
+                        'event_pattern': event.pattern,
+                        'event_summary': event.summary
+                    }
+                ))
         
         return correlations
     
-    def _calculate_temporal_correlation(
-        self, 
-        turn: ConversationTurn, 
-        event: AmbientEvent, 
-        time_diff: float
-    ) -> Optional[CorrelationResult]:
-        """Calculate basic temporal correlation score."""
-        # Base score based on temporal proximity
-        max_time_diff = self.time_window  # Maximum time difference
-        temporal_score = 1.0 - (time_diff / max_time_diff)
-        
-        # Boost for high-score events
-        if event.score and event.score > 70:
-            temporal_score *= 1.2
-        
-        # Boost for certain event types
-        if event.event_type in ['file_change', 'git_operation']:
-            temporal_score *= 1.1
-        
-        # Cap at 1.0
-        temporal_score = min(1.0, temporal_score)
-        
-        # Only create correlation if score is meaningful
-        if temporal_score < 0.1:
-            return None
-        
-        return CorrelationResult(
-            conversation_id=turn.conversation_id,
-            event_id=event.event_id,
-            correlation_type='temporal',
-            confidence_score=temporal_score,
-            time_diff_seconds=int(time_diff),
-            match_details={
-                'event_type': event.event_type,
-                'event_pattern': event.pattern,
-                'event_score': event.score,
-                'event_summary': event.summary
-            }
-        )
+    def _score_temporal(
+        self,
+        events: List[AmbientEvent],
+        event_idx: np.ndarray,
+        window_ratio: np.ndarray
+    ) -> np.ndarray:
+        """Temporal proximity score per pair (pairs below 0.1 are dropped by the caller)."""
+        high_score = np.array([bool(e.score and e.score > 70) for e in events])
+        boosted_type = np.array([e.event_type in self.HIGH_SCORE_EVENT_TYPES for e in events])
+        
+        scores = 1.0 - window_ratio
+        scores = np.where(high_score[event_idx], scores * 1.2, scores)
+        scores = np.where(boosted_type[event_idx], scores * 1.1, scores)
+        return np.minimum(1.0, scores)
     
-    def _calculate_file_mention_correlation(
-        self, 
-        turn: ConversationTurn, 
-        event: AmbientEvent, 
-        time_diff: float
-    ) -> Optional[CorrelationResult]:
-        """Calculate file mention correlation score."""
-        if not turn.files_mentioned or not event.file_path:
-            return None
-        
-        # Check for file path matches
-        event_file = Path(event.file_path)
+    def _score_file_mentions(
+        self,
+        turns: List[ConversationTurn],
+        events: List[AmbientEvent],
+        turn_idx: np.ndarray,
+        event_idx: np.ndarray,
+        window_ratio: np.ndarray
+    ) -> Tuple[np.ndarray, Dict[int, List[Dict[str, str]]]]:
+        """File mention score per pair; matches are computed once per (turn, event file)."""
+        scores = np.zeros(turn_idx.size)
+        matches: Dict[int, List[Dict[str, str]]] = {}
+        
+        has_files = np.array([bool(t.files_mentioned) for t in turns])
+        has_path = np.array([bool(e.file_path) for e in events])
+        candidates = np.flatnonzero(has_files[turn_idx] & has_path[event_idx])
+        if candidates.size == 0:
+            return scores, matches
+        
+        cache: Dict[Tuple[int, str], List[Dict[str, str]]] = {}
+        multipliers = np.zeros(turn_idx.size)
+        for k in candidates:
+            turn_i = int(turn_idx[k])
+            event_file = events[event_idx[k]].file_path
+            key = (turn_i, event_file)
+            if key not in cache:
+                cache[key] = self._match_files(turns[turn_i].files_mentioned, event_file)
+            matched = cache[key]
+            if matched:
+                matches[int(k)] = matched
+                best = max(matched, key=lambda m: self.FILE_MATCH_RANK[m['match_type']])
+                multipliers[k] = self.FILE_MATCH_MULTIPLIER[best['match_type']]
+        
+        # base 0.8 x match quality x temporal proximity bonus
+        scores = np.minimum(1.0, (0.8 * multipliers) * (1.0 - window_ratio * 0.3))
+        return scores, matches
+    
+    def _match_files(self, files_mentioned: List[str], event_file_path: str) -> List[Dict[str, str]]:
+        """Match mentioned file paths against an event's file path."""
+        event_file = Path(event_file_path)
         matched_files = []
         
-        for mentioned_file in turn.files_mentioned:
+        for mentioned_file in files_mentioned:
             mentioned_path = Path(mentioned_file)
             
             # Exact match
             if event_file == mentioned_path:
-                matched_files.append({
-                    'mentioned': mentioned_file,
-                    'actual': event.file_path,
-                    'match_type': 'exact'
-                })
+                match_type = 'exact'
             # Name match (same filename, different path)
             elif event_file.name == mentioned_path.name:
-                matched_files.append({
-                    'mentioned': mentioned_file,
-                    'actual': event.file_path,
-                    'match_type': 'filename'
-                })
+                match_type = 'filename'
             # Parent directory match
             elif str(mentioned_path) in str(event_file) or str(event_file) in str(mentioned_path):
-                matched_files.append({
-                    'mentioned': mentioned_file,
-                    'actual': event.file_path,
-                    'match_type': 'partial'
-                })
-        
-        if not matched_files:
-            return None
-        
-        # Calculate confidence based on match quality and temporal proximity
-        base_score = 0.8  # High base score for file matches
-        
-        # Adjust based on match type
-        best_match = max(matched_files, key=lambda x: {
-            'exact': 1.0, 'filename': 0.7, 'partial': 0.4
-        }[x['match_type']])
-        
-        match_multiplier = {
-            'exact': 1.0,
-            'filename': 0.8, 
-            'partial': 0.6
-        }[best_match['match_type']]
-        
-        # Temporal proximity bonus
-        temporal_bonus = 1.0 - (time_diff / self.time_window) * 0.3
-        
-        confidence_score = base_score * match_multiplier * temporal_bonus
-        confidence_score = min(1.0, confidence_score)
-        
-        return CorrelationResult(
-            conversation_id=turn.conversation_id,
-            event_id=event.event_id,
-            correlation_type='file_mention',
-            confidence_score=confidence_score,
-            time_diff_seconds=int(time_diff),
-            match_details={
-                'matched_files': matched_files,
-                'best_match': best_match,
-                'event_summary': event.summary
-            }
-        )
+                match_type = 'partial'
+            else:
+                continue
+            
+            matched_files.append({
+                'mentioned': mentioned_file,
+                'actual': event_file_path,
+                'match_type': match_type
+            })
+        
+        return matched_files
     
-    def _calculate_plan_verification_correlation(
-        self, 
-        turn: ConversationTurn, 
-        event: AmbientEvent, 
-        time_diff: float
-    ) -> Optional[CorrelationResult]:
-        """Calculate plan verification correlation score."""
-        if not turn.phases_mentioned:
-            return None
-        
-        # Look for plan execution indicators in event
-        plan_indicators = [
-            'phase', 'step', 'milestone', 'implementation', 
-            'feature', 'refactor', 'test', 'deploy'
-        ]
-        
-        event_text = (event.summary or '').lower()
-        pattern_text = (event.pattern or '').lower()
-        
-        plan_matches = []
-        for indicator in plan_indicators:
-            if indicator in event_text or indicator in pattern_text:
-                plan_matches.append(indicator)
-        
-        if not plan_matches:
-            return None
-        
-        # Base score for plan correlation
-        base_score = 0.6
-        
-        # Boost for high-score events (likely important)
-        if event.score and event.score > 80:
-            base_score *= 1.3
-        
-        # Boost for multiple plan indicators
-        if len(plan_matches) > 1:
-            base_score *= 1.2
-        
-        # Temporal proximity factor
-        temporal_factor = 1.0 - (time_diff / self.time_window) * 0.4
-        
-        confidence_score = base_score * temporal_factor
-        confidence_score = min(1.0, confidence_score)
-        
-        return CorrelationResult(
-            conversation_id=turn.conversation_id,
-            event_id=event.event_id,
-            correlation_type='plan_verification',
-            confidence_score=confidence_score,
-            time_diff_seconds=int(time_diff),
-            match_details={
-                'phases_mentioned': turn.phases_mentioned,
-                'plan_indicators_found': plan_matches,
-                'event_pattern': event.pattern,
-                'event_summary': event.summary
-            }
-        )
+    def _score_plan_verification(
+        self,
+        turns: List[ConversationTurn],
+        events: List[AmbientEvent],
+        turn_idx: np.ndarray,
+        event_idx: np.ndarray,
+        window_ratio: np.ndarray
+    ) -> Tuple[np.ndarray, Dict[int, List[str]]]:
+        """Plan verification score per pair; event indicators are found once per event."""
+        indicators_by_event = []
+        base_scores = np.zeros(len(events))
+        for j, event in enumerate(events):
+            event_text = (event.summary or '').lower()
+            pattern_text = (event.pattern or '').lower()
+            indicators = [
+                indicator for indicator in self.PLAN_INDICATORS
+                if indicator in event_text or indicator in pattern_text
+            ]
+            indicators_by_event.append(indicators)
+            
+            base_score = 0.6
+            # Boost for high-score events (likely important)
+            if event.score and event.score > 80:
+                base_score *= 1.3
+            # Boost for multiple plan indicators
+            if len(indicators) > 1:
+                base_score *= 1.2
+            base_scores[j] = base_score
+        
+        has_phases = np.array([bool(t.phases_mentioned) for t in turns])
+        has_indicators = np.array([bool(found) for found in indicators_by_event])
+        candidates = has_phases[turn_idx] & has_indicators[event_idx]
+        
+        scores = np.minimum(1.0, base_scores[event_idx] * (1.0 - window_ratio * 0.4))
+        matches = {int(k): indicators_by_event[event_idx[k]] for k in np.flatnonzero(candidates)}
+        return scores, matches
     
     def _extract_file_mentions(self, content: str) -> List[str]:
         """Extract file paths mentioned in conversation content."""
@@ -573,22 +586,25 @@ class TemporalCorrelator:
             WHERE conversation_id IN ({placeholders})
         """, conversation_ids)
         
-        # Insert new correlations
-        for correlation in correlations:
-            cursor.execute("""
-                INSERT INTO temporal_correlations 
-                (conversation_id, event_id, correlation_type, confidence_score,
-                 time_diff_seconds, match_details, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+        # Insert new correlations in one batch
+        created_at = datetime.now().isoformat()
+        cursor.executemany("""
+            INSERT INTO temporal_correlations 
+            (conversation_id, event_id, correlation_type, confidence_score,
+             time_diff_seconds, match_details, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
                 correlation.conversation_id,
                 correlation.event_id,
                 correlation.correlation_type,
                 correlation.confidence_score,
                 correlation.time_diff_seconds,
                 json.dumps(correlation.match_details),
-                datetime.now().isoformat()
-            ))
+                created_at
+            )
+            for correlation in correlations
+        ])
         
         conn.commit()
         conn.close()
@@ -0,0 +1,74 @@
+"""
+CORTEX Tier 1 - Temporal Window Join
+
+Pairs items of two event streams whose timestamps lie within ±window of
+each other. The right stream is sorted once; every left item then finds
+its window with two binary searches, and all pairs are expanded with array
+operations, so cost is O((n + m) log m + matches) instead of one query or
+one inner loop per item.
+
+Timestamps are converted to integer microseconds from a common origin so
+time differences are exact (no float epoch rounding).
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+License: Proprietary - See LICENSE file for terms
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+MICROSECONDS = 1_000_000
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_microseconds(timestamps: Sequence[datetime], origin: Optional[datetime] = None) -> np.ndarray:
+    """Integer microsecond offsets of timestamps from origin (default: the earliest)"""
+    if not timestamps:
+        return np.zeros(0, dtype=np.int64)
+    origin = origin or min(timestamps)
+    return np.fromiter(
+        ((ts - origin) // _ONE_MICROSECOND for ts in timestamps),
+        dtype=np.int64,
+        count=len(timestamps)
+    )
+
+
+def window_join(
+    left_times: np.ndarray,
+    right_times: np.ndarray,
+    window: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All index pairs (i, j) with |left_times[i] - right_times[j]| <= window.
+
+    Args:
+        left_times: Left stream times (any order)
+        right_times: Right stream times, sorted ascending
+        window: Maximum absolute difference, same unit as the times
+
+    Returns:
+        (left_indices, right_indices), grouped by left index in input order
+        and ascending in right index within each group
+    """
+    left_times = np.asarray(left_times)
+    right_times = np.asarray(right_times)
+    if left_times.size == 0 or right_times.size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+
+    lo = np.searchsorted(right_times, left_times - window, side="left")
+    hi = np.searchsorted(right_times, left_times + window, side="right")
+    counts = hi - lo
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+
+    left_indices = np.repeat(np.arange(left_times.size, dtype=np.int64), counts)
+    # Position of each pair inside its group, then offset from the group's window start
+    group_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    right_indices = np.repeat(lo, counts) + (np.arange(total, dtype=np.int64) - group_starts)
+    return left_indices, right_indices
@@ -13,9 +13,9 @@ class DatabaseSchema:
     Manages Knowledge Graph database schema.
     
     Responsibilities:
-    - Create tables (patterns, relationships, tags, decay log)
+    - Create tables (patterns, relationships, tags, decay log, tombstones)
     - Create FTS5 virtual table for search
-    - Set up triggers for FTS5 sync
+    - Set up triggers for FTS5 sync and change tracking
     - Create performance indexes
     """
     
@@ -35,10 +35,13 @@ class DatabaseSchema:
         DatabaseSchema._create_relationships_table(cursor)
         DatabaseSchema._create_tags_table(cursor)
         DatabaseSchema._create_decay_log_table(cursor)
+        DatabaseSchema._create_tombstones_table(cursor)
         DatabaseSchema._create_fts_table(cursor)
+        DatabaseSchema._migrate_patterns_table(cursor)
         
         # Create triggers
         DatabaseSchema._create_fts_triggers(cursor)
+        DatabaseSchema._create_change_triggers(cursor)
         
         # Create indexes
         DatabaseSchema._create_indexes(cursor)
@@ -65,12 +68,34 @@ class DatabaseSchema:
                 is_pinned INTEGER DEFAULT 0,
                 scope TEXT DEFAULT 'cortex',
                 namespaces TEXT DEFAULT '["CORTEX-core"]',
+                decay_days_applied INTEGER DEFAULT 0,
+                updated_at TIMESTAMP,
                 CHECK (confidence >= 0.0 AND confidence <= 1.0),
                 CHECK (pattern_type IN ('workflow', 'principle', 'anti_pattern', 'solution', 'context')),
                 CHECK (scope IN ('cortex', 'application'))
             )
         """)
     
+    @staticmethod
+    def _migrate_patterns_table(cursor: sqlite3.Cursor) -> None:
+        """Add columns introduced after the initial schema."""
+        cursor.execute("PRAGMA table_info(patterns)")
+        columns = {row[1] for row in cursor.fetchall()}
+        
+        # Decay days already folded into confidence (see PatternDecay)
+        if "decay_days_applied" not in columns:
+            cursor.execute("ALTER TABLE patterns ADD COLUMN decay_days_applied INTEGER DEFAULT 0")
+        
+        # Time of the last write of any kind (see _create_change_triggers);
+        # existing rows start from their newest known timestamp
+        if "updated_at" not in columns:
+            cursor.execute("ALTER TABLE patterns ADD COLUMN updated_at TIMESTAMP")
+            cursor.execute("""
+                UPDATE patterns SET updated_at = CASE
+                    WHEN julianday(last_accessed) > julianday(created_at) THEN last_accessed
+                    ELSE created_at END
+            """)
+    
     @staticmethod
     def _create_relationships_table(cursor: sqlite3.Cursor) -> None:
         """Create pattern relationships table (graph edges)."""
@@ -118,6 +143,17 @@ class DatabaseSchema:
             )
         """)
     
+    @staticmethod
+    def _create_tombstones_table(cursor: sqlite3.Cursor) -> None:
+        """Create deleted-pattern tombstones (read by incremental brain export)."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS pattern_tombstones (
+                pattern_id TEXT PRIMARY KEY,
+                scope TEXT,
+                deleted_at TIMESTAMP NOT NULL
+            )
+        """)
+    
     @staticmethod
     def _create_fts_table(cursor: sqlite3.Cursor) -> None:
         """Create FTS5 virtual table for semantic search."""
@@ -157,6 +193,38 @@ class DatabaseSchema:
             END
         """)
     
+    @staticmethod
+    def _create_change_triggers(cursor: sqlite3.Cursor) -> None:
+        """
+        Maintain patterns.updated_at and pattern_tombstones.
+        
+        Triggers rather than PatternStore code, so every writer (decay
+        materialization, cleanup, imports, repositories) is covered.
+        """
+        now = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+        
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS patterns_touch_ai AFTER INSERT ON patterns BEGIN
+                UPDATE patterns SET updated_at = {now} WHERE id = new.id;
+                DELETE FROM pattern_tombstones WHERE pattern_id = new.pattern_id;
+            END
+        """)
+        
+        # Updates that already moved updated_at are left alone (no recursion)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS patterns_touch_au AFTER UPDATE ON patterns
+            WHEN new.updated_at IS old.updated_at BEGIN
+                UPDATE patterns SET updated_at = {now} WHERE id = new.id;
+            END
+        """)
+        
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS patterns_tombstone_ad AFTER DELETE ON patterns BEGIN
+                INSERT OR REPLACE INTO pattern_tombstones (pattern_id, scope, deleted_at)
+                VALUES (old.pattern_id, old.scope, {now});
+            END
+        """)
+    
     @staticmethod
     def _create_indexes(cursor: sqlite3.Cursor) -> None:
         """Create performance indexes."""
@@ -9,6 +9,19 @@ Decay Logic:
     - Minimum confidence: 0.3 (delete below this)
     - Pinned patterns: immune to decay
 
+Decay is a function of the stored confidence and last_accessed, evaluated
+in SQL at read time (effective_confidence_sql / patterns_current view), so
+ranking queries always see current confidence:
+
+    effective = confidence - DECAY_RATE * pending_days
+    pending_days = max(0, days_since_access - DECAY_THRESHOLD_DAYS - decay_days_applied)
+
+apply_decay() only materializes that value (set-based, in bounded chunks)
+and prunes patterns below MIN_CONFIDENCE; decay_days_applied records how
+many days are already folded into the stored confidence. Accessing a
+pattern (PatternStore.get_pattern) materializes decay and restarts the
+clock.
+
 Responsibilities:
     - Calculate decay for patterns
     - Apply decay adjustments
@@ -45,6 +58,15 @@ class PatternDecay:
     DECAY_THRESHOLD_DAYS = 60  # Days before decay starts
     MIN_CONFIDENCE = 0.3  # Delete below this
     
+    # Rows materialized per transaction in apply_decay()
+    CHUNK_SIZE = 500
+    
+    NOW_SQL = "julianday('now', 'localtime')"
+    
+    # Bump when patterns_current changes shape; the view is rebuilt once per
+    # database instead of on every PatternDecay construction
+    VIEW_SCHEMA_VERSION = 1
+    
     def __init__(self, db):
         """
         Initialize Pattern Decay manager.
@@ -53,6 +75,59 @@ class PatternDecay:
             db: DatabaseConnection instance
         """
         self.db = db
+        self._create_current_view()
+    
+    @classmethod
+    def pending_decay_days_sql(cls, alias: str = "", now_sql: Optional[str] = None) -> str:
+        """SQL expression: decay days not yet folded into the stored confidence."""
+        a = f"{alias}." if alias else ""
+        now_sql = now_sql or cls.NOW_SQL
+        return (
+            f"MAX(0, CAST({now_sql} - julianday({a}last_accessed) AS INTEGER)"
+            f" - {cls.DECAY_THRESHOLD_DAYS} - COALESCE({a}decay_days_applied, 0))"
+        )
+    
+    @classmethod
+    def effective_confidence_sql(cls, alias: str = "", now_sql: Optional[str] = None) -> str:
+        """
+        SQL expression: confidence with pending decay applied.
+        
+        Use in SELECT, WHERE and ORDER BY of ranking queries, e.g.
+        f"SELECT {PatternDecay.effective_confidence_sql('p')} AS confidence ..."
+        """
+        a = f"{alias}." if alias else ""
+        pending = cls.pending_decay_days_sql(alias, now_sql)
+        return (
+            f"(CASE WHEN {a}is_pinned = 1 THEN {a}confidence"
+            f" ELSE MAX(0.0, {a}confidence - {cls.DECAY_RATE} * {pending}) END)"
+        )
+    
+    @classmethod
+    def current_view_body_sql(cls) -> str:
+        """Definition of patterns_current, tagged with VIEW_SCHEMA_VERSION."""
+        return (
+            f"AS /* schema v{cls.VIEW_SCHEMA_VERSION} */"
+            f" SELECT p.*, p.confidence AS stored_confidence,"
+            f" {cls.effective_confidence_sql('p')} AS effective_confidence"
+            f" FROM patterns p"
+        )
+    
+    def _create_current_view(self) -> None:
+        """Create patterns_current if missing, rebuild it if its version or decay SQL changed."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        body = self.current_view_body_sql()
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'view' AND name = 'patterns_current'"
+        )
+        row = cursor.fetchone()
+        if row and row[0].endswith(body):
+            return
+        
+        if row:
+            cursor.execute("DROP VIEW IF EXISTS patterns_current")
+        cursor.execute(f"CREATE VIEW IF NOT EXISTS patterns_current {body}")
+        conn.commit()
     
     def calculate_decay(
         self,
@@ -83,9 +158,13 @@ class PatternDecay:
         conn = self.db.get_connection()
         cursor = conn.cursor()
         
-        # Get pattern data
-        cursor.execute("""
-            SELECT confidence, last_accessed, is_pinned
+        now_sql = self._julianday_literal(as_of_date)
+        
+        # Get pattern data with decay evaluated in SQL
+        cursor.execute(f"""
+            SELECT confidence, is_pinned,
+                   CAST({now_sql} - julianday(last_accessed) AS INTEGER),
+                   {self.pending_decay_days_sql(now_sql=now_sql)}
             FROM patterns
             WHERE pattern_id = ?
         """, (pattern_id,))
@@ -98,13 +177,8 @@ class PatternDecay:
                 "error": "Pattern not found"
             }
         
-        current_confidence = row[0]
-        last_accessed = datetime.fromisoformat(row[1])
-        is_pinned = bool(row[2])
-        
-        # Calculate days since last access
-        days_since_access = (as_of_date - last_accessed).days
-        days_to_decay = max(0, days_since_access - self.DECAY_THRESHOLD_DAYS)
+        current_confidence, is_pinned, days_since_access, days_to_decay = row
+        is_pinned = bool(is_pinned)
         
         # No decay if pinned or within threshold
         if is_pinned or days_to_decay == 0:
@@ -133,15 +207,25 @@ class PatternDecay:
             "reason": f"{days_to_decay} days since last access"
         }
     
-    def apply_decay(self) -> Dict[str, Any]:
+    @staticmethod
+    def _julianday_literal(as_of_date: datetime) -> str:
+        """Pin 'now' for a whole operation so every statement sees the same day."""
+        return f"julianday('{as_of_date.isoformat()}')"
+    
+    def apply_decay(self, chunk_size: Optional[int] = None) -> Dict[str, Any]:
         """
-        Apply decay to all eligible patterns.
+        Materialize decay and prune patterns below minimum confidence.
         
-        Process:
-        1. Find patterns eligible for decay (not pinned, >60 days old)
-        2. Calculate decay for each
-        3. Update confidence or delete if below minimum
-        4. Log all operations
+        Process (set-based, one transaction per chunk of eligible rows):
+        1. Log and delete patterns already below MIN_CONFIDENCE
+        2. Log and delete patterns whose decayed confidence falls below it
+        3. Log and fold pending decay into confidence for the rest
+        
+        Reads do not depend on this job (they evaluate decay in SQL); it
+        keeps stored values close to effective ones and removes dead rows.
+        
+        Args:
+            chunk_size: Eligible rows per transaction (default: CHUNK_SIZE)
         
         Returns:
             Dictionary with:
@@ -150,91 +234,96 @@ class PatternDecay:
                 - patterns_deleted: Patterns removed (confidence < MIN_CONFIDENCE)
                 - decay_log_entries: Audit trail records created
         
-        Performance: <500ms for 1000 patterns
+        Performance: O(eligible rows), chunked
         """
+        chunk_size = chunk_size or self.CHUNK_SIZE
         conn = self.db.get_connection()
         cursor = conn.cursor()
         
         now = datetime.now()
+        now_sql = self._julianday_literal(now)
         decay_threshold_date = (now - timedelta(days=self.DECAY_THRESHOLD_DAYS)).isoformat()
+        pending = self.pending_decay_days_sql(now_sql=now_sql)
+        effective = self.effective_confidence_sql(now_sql=now_sql)
+        min_conf = self.MIN_CONFIDENCE
+        
+        # Eligible: unpinned and old enough to decay, or already below minimum
+        eligible = "is_pinned = 0 AND (last_accessed < ? OR confidence <= ?)"
+        
+        totals = {
+            "patterns_checked": 0,
+            "patterns_decayed": 0,
+            "patterns_deleted": 0,
+            "decay_log_entries": 0
+        }
         
-        # Get patterns eligible for decay or already below minimum
-        cursor.execute("""
-            SELECT pattern_id, confidence, last_accessed
-            FROM patterns
-            WHERE is_pinned = 0
-              AND (last_accessed < ? OR confidence <= ?)
-        """, (decay_threshold_date, self.MIN_CONFIDENCE))
-        
-        candidates = cursor.fetchall()
-        patterns_checked = len(candidates)
-        patterns_decayed = 0
-        patterns_deleted = 0
-        decay_log_entries = 0
-        
-        for pattern_id, confidence, last_accessed in candidates:
-            # Check if already below threshold
-            if confidence < self.MIN_CONFIDENCE:
-                # Delete immediately
-                cursor.execute("DELETE FROM patterns WHERE pattern_id = ?", (pattern_id,))
-                patterns_deleted += 1
-                
-                # Log deletion
-                cursor.execute("""
-                    INSERT INTO confidence_decay_log (pattern_id, old_confidence, new_confidence, reason)
-                    VALUES (?, ?, ?, ?)
-                """, (pattern_id, confidence, 0.0, "Deleted: Already below minimum confidence"))
-                decay_log_entries += 1
-                continue
-            
-            # Calculate decay
-            last_access_date = datetime.fromisoformat(last_accessed)
-            days_since_access = (now - last_access_date).days
-            days_to_decay = max(0, days_since_access - self.DECAY_THRESHOLD_DAYS)
-            
-            # Skip if no decay needed
-            if days_to_decay == 0:
-                continue
+        last_id = 0
+        while True:
+            cursor.execute(f"""
+                SELECT id FROM patterns
+                WHERE id > ? AND {eligible}
+                ORDER BY id
+                LIMIT ?
+            """, (last_id, decay_threshold_date, min_conf, chunk_size))
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                break
             
-            # Apply decay
-            decay_amount = self.DECAY_RATE * days_to_decay
-            new_confidence = max(0.0, confidence - decay_amount)
+            chunk = f"id > {last_id} AND id <= {ids[-1]} AND {eligible}"
+            params = (decay_threshold_date, min_conf)
+            last_id = ids[-1]
+            totals["patterns_checked"] += len(ids)
             
-            if new_confidence < self.MIN_CONFIDENCE:
-                # Delete pattern
-                cursor.execute("DELETE FROM patterns WHERE pattern_id = ?", (pattern_id,))
-                patterns_deleted += 1
+            try:
+                cursor.execute(f"""
+                    INSERT INTO confidence_decay_log (pattern_id, old_confidence, new_confidence, reason)
+                    SELECT pattern_id, confidence, 0.0, 'Deleted: Already below minimum confidence'
+                    FROM patterns
+                    WHERE {chunk} AND confidence < {min_conf}
+                """, params)
+                already_below = cursor.rowcount
                 
-                # Log deletion
-                cursor.execute("""
+                cursor.execute(f"""
                     INSERT INTO confidence_decay_log (pattern_id, old_confidence, new_confidence, reason)
-                    VALUES (?, ?, ?, ?)
-                """, (pattern_id, confidence, new_confidence, 
-                      f"Deleted: Decayed below minimum confidence ({days_to_decay} days since access)"))
-                decay_log_entries += 1
-            else:
-                # Update confidence
-                cursor.execute("""
-                    UPDATE patterns SET confidence = ? WHERE pattern_id = ?
-                """, (new_confidence, pattern_id))
-                patterns_decayed += 1
+                    SELECT pattern_id, confidence, {effective},
+                           'Deleted: Decayed below minimum confidence (' || {pending} || ' days since access)'
+                    FROM patterns
+                    WHERE {chunk} AND confidence >= {min_conf}
+                      AND {pending} > 0 AND {effective} < {min_conf}
+                """, params)
+                decayed_below = cursor.rowcount
                 
-                # Log decay
-                cursor.execute("""
+                cursor.execute(f"""
+                    DELETE FROM patterns
+                    WHERE {chunk} AND (confidence < {min_conf} OR {effective} < {min_conf})
+                """, params)
+                totals["patterns_deleted"] += cursor.rowcount
+                
+                cursor.execute(f"""
                     INSERT INTO confidence_decay_log (pattern_id, old_confidence, new_confidence, reason)
-                    VALUES (?, ?, ?, ?)
-                """, (pattern_id, confidence, new_confidence, 
-                      f"Decayed: {days_to_decay} days since last access"))
-                decay_log_entries += 1
-        
-        conn.commit()
+                    SELECT pattern_id, confidence, {effective},
+                           'Decayed: ' || {pending} || ' days since last access'
+                    FROM patterns
+                    WHERE {chunk} AND {pending} > 0
+                """, params)
+                decayed = cursor.rowcount
+                
+                # Right-hand sides read the pre-update row, so both use the same pending days
+                cursor.execute(f"""
+                    UPDATE patterns
+                    SET confidence = {effective},
+                        decay_days_applied = COALESCE(decay_days_applied, 0) + {pending}
+                    WHERE {chunk} AND {pending} > 0
+                """, params)
+                totals["patterns_decayed"] += cursor.rowcount
+                totals["decay_log_entries"] += already_below + decayed_below + decayed
+                
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
         
-        return {
-            "patterns_checked": patterns_checked,
-            "patterns_decayed": patterns_decayed,
-            "patterns_deleted": patterns_deleted,
-            "decay_log_entries": decay_log_entries
-        }
+        return totals
     
     def get_decay_candidates(self) -> List[Dict[str, Any]]:
         """
@@ -256,23 +345,23 @@ class PatternDecay:
         now = datetime.now()
         decay_threshold_date = (now - timedelta(days=self.DECAY_THRESHOLD_DAYS)).isoformat()
         
-        cursor.execute("""
-            SELECT pattern_id, title, confidence, last_accessed
+        pending = self.pending_decay_days_sql()
+        cursor.execute(f"""
+            SELECT pattern_id, title, confidence, last_accessed,
+                   CAST({self.NOW_SQL} - julianday(last_accessed) AS INTEGER),
+                   {pending}
             FROM patterns
             WHERE is_pinned = 0
               AND last_accessed < ?
               AND confidence > ?
+              AND {pending} > 0
             ORDER BY confidence ASC, last_accessed ASC
         """, (decay_threshold_date, self.MIN_CONFIDENCE))
         
         rows = cursor.fetchall()
         
         candidates = []
-        for row in rows:
-            pattern_id, title, confidence, last_accessed = row
-            last_access_date = datetime.fromisoformat(last_accessed)
-            days_since_access = (now - last_access_date).days
-            days_to_decay = max(0, days_since_access - self.DECAY_THRESHOLD_DAYS)
+        for pattern_id, title, confidence, last_accessed, days_since_access, days_to_decay in rows:
             decay_amount = self.DECAY_RATE * days_to_decay
             new_confidence = max(0.0, confidence - decay_amount)
             
@@ -26,13 +26,21 @@ Example:
 from typing import List, Dict, Any, Optional
 import json
 
+from .pattern_decay import PatternDecay
+
+# Confidence with pending decay applied (evaluated at query time)
+EFFECTIVE_CONFIDENCE = PatternDecay.effective_confidence_sql()
+EFFECTIVE_CONFIDENCE_P = PatternDecay.effective_confidence_sql("p")
+
 
 class PatternSearch:
     """
     Semantic pattern search using FTS5.
     
     Implements BM25-ranked full-text search with namespace awareness
-    and confidence-based filtering.
+    and confidence-based filtering. Confidence filters and ordering use
+    the decayed (effective) confidence, so results are current between
+    decay maintenance runs.
     """
     
     def __init__(self, db):
@@ -77,9 +85,10 @@ class PatternSearch:
         conn = self.db.get_connection()
         cursor = conn.cursor()
         
-        # Build WHERE clause for filters
-        where_clauses = ["p.confidence >= ?"]
-        params = [min_confidence]
+        # Build WHERE clause for filters (stored confidence bounds the decayed
+        # value from above, so the indexed column pre-filters)
+        where_clauses = ["p.confidence >= ?", f"{EFFECTIVE_CONFIDENCE_P} >= ?"]
+        params = [min_confidence, min_confidence]
         
         if scope:
             where_clauses.append("p.scope = ?")
@@ -97,7 +106,7 @@ class PatternSearch:
         
         # FTS5 search with BM25 ranking
         query_sql = f"""
-            SELECT p.pattern_id, p.title, p.content, p.pattern_type, p.confidence,
+            SELECT p.pattern_id, p.title, p.content, p.pattern_type, {EFFECTIVE_CONFIDENCE_P},
                    p.created_at, p.last_accessed, p.access_count, p.source, p.metadata,
                    p.is_pinned, p.scope, p.namespaces,
                    bm25(pattern_fts) as rank
@@ -216,15 +225,15 @@ class PatternSearch:
         conn = self.db.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT pattern_id, title, content, pattern_type, confidence,
+        cursor.execute(f"""
+            SELECT pattern_id, title, content, pattern_type, {EFFECTIVE_CONFIDENCE} AS effective_confidence,
                    created_at, last_accessed, access_count, source, metadata,
                    is_pinned, scope, namespaces
             FROM patterns
-            WHERE namespaces LIKE ? AND confidence >= ?
-            ORDER BY confidence DESC, last_accessed DESC
+            WHERE namespaces LIKE ? AND confidence >= ? AND {EFFECTIVE_CONFIDENCE} >= ?
+            ORDER BY effective_confidence DESC, last_accessed DESC
             LIMIT ?
-        """, (f'%"{namespace}"%', min_confidence, limit))
+        """, (f'%"{namespace}"%', min_confidence, min_confidence, limit))
         
         rows = cursor.fetchall()
         
@@ -288,17 +297,18 @@ class PatternSearch:
         conn = self.db.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT pattern_id, title, content, pattern_type, confidence,
+        cursor.execute(f"""
+            SELECT pattern_id, title, content, pattern_type, {EFFECTIVE_CONFIDENCE} AS effective_confidence,
                    created_at, last_accessed, access_count, source, metadata,
                    is_pinned, scope, namespaces
             FROM patterns
             WHERE scope = 'application' 
               AND namespaces LIKE ? 
               AND confidence >= ?
-            ORDER BY confidence DESC, last_accessed DESC
+              AND {EFFECTIVE_CONFIDENCE} >= ?
+            ORDER BY effective_confidence DESC, last_accessed DESC
             LIMIT ?
-        """, (f'%"{namespace}"%', min_confidence, limit))
+        """, (f'%"{namespace}"%', min_confidence, min_confidence, limit))
         
         rows = cursor.fetchall()
         
@@ -39,6 +39,11 @@ from datetime import datetime
 from enum import Enum
 import json
 
+from .pattern_decay import PatternDecay
+
+# Confidence with pending decay applied (evaluated at query time)
+EFFECTIVE_CONFIDENCE = PatternDecay.effective_confidence_sql()
+
 
 class PatternType(Enum):
     """Pattern classification types."""
@@ -200,8 +205,8 @@ class PatternStore:
         cursor = conn.cursor()
         
         # Get pattern
-        cursor.execute("""
-            SELECT pattern_id, title, content, pattern_type, confidence,
+        cursor.execute(f"""
+            SELECT pattern_id, title, content, pattern_type, {EFFECTIVE_CONFIDENCE},
                    created_at, last_accessed, access_count, source, metadata, is_pinned,
                    scope, namespaces
             FROM patterns
@@ -213,11 +218,14 @@ class PatternStore:
         if not row:
             return None
         
-        # Update access timestamp and count
+        # Update access timestamp and count; decay accrued so far is kept
+        # (folded into confidence) and the decay clock restarts
         now = datetime.now().isoformat()
-        cursor.execute("""
+        cursor.execute(f"""
             UPDATE patterns
-            SET last_accessed = ?, access_count = access_count + 1
+            SET confidence = {EFFECTIVE_CONFIDENCE},
+                decay_days_applied = 0,
+                last_accessed = ?, access_count = access_count + 1
             WHERE pattern_id = ?
         """, (now, pattern_id))
         
@@ -293,7 +301,13 @@ class PatternStore:
         
         if not update_clauses:
             return False
-        
+
+        # An explicit confidence is the current value: mark pending decay as applied
+        if "confidence" in updates:
+            update_clauses.append(
+                f"decay_days_applied = COALESCE(decay_days_applied, 0) + {PatternDecay.pending_decay_days_sql()}"
+            )
+
         # Execute update
         query = f"UPDATE patterns SET {', '.join(update_clauses)} WHERE pattern_id = ?"
         params.append(pattern_id)
@@ -367,19 +381,22 @@ class PatternStore:
             where_clauses.append("scope = ?")
             params.append(scope)
         
+        # Stored confidence bounds the decayed value, so it pre-filters via index
         where_clauses.append("confidence >= ?")
         params.append(min_confidence)
+        where_clauses.append(f"{EFFECTIVE_CONFIDENCE} >= ?")
+        params.append(min_confidence)
         
         where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
         
         # Execute query
         query = f"""
-            SELECT pattern_id, title, content, pattern_type, confidence,
+            SELECT pattern_id, title, content, pattern_type, {EFFECTIVE_CONFIDENCE} AS effective_confidence,
                    created_at, last_accessed, access_count, source, metadata,
                    is_pinned, scope, namespaces
             FROM patterns
             WHERE {where_sql}
-            ORDER BY confidence DESC, last_accessed DESC
+            ORDER BY effective_confidence DESC, last_accessed DESC
             LIMIT ?
         """
         params.append(limit)
@@ -23,7 +23,6 @@ Args:
 import sqlite3
 import json
 import argparse
-import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import Tuple, List, Dict, Any
@@ -74,7 +73,14 @@ class BoundaryMigration:
         backup_path = self.db_path.parent / f"{self.db_path.stem}_backup_{timestamp}.db"
         
         if not self.dry_run:
-            shutil.copy2(self.db_path, backup_path)
+            # Online backup API: a consistent snapshot even while the brain is in use
+            source = sqlite3.connect(str(self.db_path))
+            target = sqlite3.connect(str(backup_path))
+            try:
+                source.backup(target, pages=256)
+            finally:
+                target.close()
+                source.close()
             print(f"✅ Backup created: {backup_path}")
         else:
             print(f"[DRY RUN] Would create backup: {backup_path}")
@@ -0,0 +1,469 @@
+"""
+Oracle Catalog Extraction - Batched Data Dictionary Introspection
+
+Pulls the data dictionary for a whole schema owner in a fixed number of
+round-trips instead of several queries per table:
+
+    tables (+ LAST_DDL_TIME)   ALL_TABLES / ALL_OBJECTS
+    table comments             ALL_TAB_COMMENTS
+    columns (+ comments)       ALL_TAB_COLUMNS / ALL_COL_COMMENTS
+    indexes                    ALL_INDEXES
+    index columns              ALL_IND_COLUMNS
+    constraints                ALL_CONSTRAINTS
+    constraint columns         ALL_CONS_COLUMNS
+    referenced keys            one query per other owner referenced by FKs
+
+Result sets are fetched with a large array size and joined in memory into
+plain per-table records (JSON-serializable dicts shaped like the
+OracleTable dataclasses).
+
+SchemaSnapshot persists those records with LAST_DDL_TIME and a content
+hash per table, so a re-crawl lists tables once, re-extracts only tables
+whose LAST_DDL_TIME moved (as an IN-list subset when few changed) and
+reports which tables actually changed shape.
+
+Every query carries a /* catalog:<name> */ tag so a recorded-catalog
+driver (oracle_replay.py) can answer it offline.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rows per network round-trip when fetching dictionary views
+DEFAULT_ARRAYSIZE = 2000
+
+# Oracle caps IN lists at 1000 expressions
+MAX_IN_LIST = 1000
+
+# Above this many stale tables, re-extract the whole owner instead of IN-list subsets
+SUBSET_LIMIT = 200
+
+# Oracle-maintained schemas skipped unless include_system is requested
+SYSTEM_SCHEMAS = frozenset({
+    'SYS', 'SYSTEM', 'OUTLN', 'DBSNMP', 'APPQOSSYS',
+    'WMSYS', 'EXFSYS', 'CTXSYS', 'XDB', 'ANONYMOUS',
+    'ORACLE_OCM', 'APEX_PUBLIC_USER', 'FLOWS_FILES',
+    'APEX_040000', 'APEX_040200'
+})
+
+
+@dataclass(frozen=True)
+class CatalogQuery:
+    """A tagged dictionary query, optionally narrowed by an IN list."""
+    name: str
+    sql: str  # Contains {keys} where the optional IN-list filter goes
+    key_expression: str  # Column the IN list filters on
+    key_index: int  # Position of that column in result rows
+
+
+CATALOG_QUERIES: Dict[str, CatalogQuery] = {q.name: q for q in [
+    CatalogQuery(
+        "current_user",
+        "SELECT /* catalog:current_user */ USER FROM DUAL {keys}",
+        "", 0
+    ),
+    CatalogQuery(
+        "tables",
+        """
+        SELECT /* catalog:tables */
+            t.owner, t.table_name, t.tablespace_name, t.num_rows, o.last_ddl_time
+        FROM all_tables t
+        JOIN all_objects o
+            ON o.owner = t.owner
+            AND o.object_name = t.table_name
+            AND o.object_type = 'TABLE'
+        WHERE t.owner = :owner {keys}
+        ORDER BY t.table_name
+        """,
+        "t.table_name", 1
+    ),
+    CatalogQuery(
+        "table_comments",
+        """
+        SELECT /* catalog:table_comments */ table_name, comments
+        FROM all_tab_comments
+        WHERE owner = :owner AND comments IS NOT NULL {keys}
+        """,
+        "table_name", 0
+    ),
+    CatalogQuery(
+        "columns",
+        """
+        SELECT /* catalog:columns */
+            c.table_name, c.column_name, c.data_type, c.data_length,
+            c.data_precision, c.data_scale, c.nullable, c.data_default,
+            cm.comments
+        FROM all_tab_columns c
+        LEFT JOIN all_col_comments cm
+            ON c.owner = cm.owner
+            AND c.table_name = cm.table_name
+            AND c.column_name = cm.column_name
+        WHERE c.owner = :owner {keys}
+        ORDER BY c.table_name, c.column_id
+        """,
+        "c.table_name", 0
+    ),
+    CatalogQuery(
+        "indexes",
+        """
+        SELECT /* catalog:indexes */
+            table_name, owner, index_name, index_type, uniqueness
+        FROM all_indexes
+        WHERE table_owner = :owner {keys}
+        ORDER BY table_name, index_name
+        """,
+        "table_name", 0
+    ),
+    CatalogQuery(
+        "index_columns",
+        """
+        SELECT /* catalog:index_columns */
+            table_name, index_owner, index_name, column_name
+        FROM all_ind_columns
+        WHERE table_owner = :owner {keys}
+        ORDER BY index_owner, index_name, column_position
+        """,
+        "table_name", 0
+    ),
+    CatalogQuery(
+        "constraints",
+        """
+        SELECT /* catalog:constraints */
+            table_name, constraint_name, constraint_type, r_owner, r_constraint_name
+        FROM all_constraints
+        WHERE owner = :owner
+            AND constraint_type IN ('P', 'R', 'U', 'C') {keys}
+        ORDER BY table_name, constraint_name
+        """,
+        "table_name", 0
+    ),
+    CatalogQuery(
+        "constraint_columns",
+        """
+        SELECT /* catalog:constraint_columns */
+            table_name, constraint_name, column_name
+        FROM all_cons_columns
+        WHERE owner = :owner {keys}
+        ORDER BY constraint_name, position
+        """,
+        "table_name", 0
+    ),
+    CatalogQuery(
+        "referenced_keys",
+        """
+        SELECT /* catalog:referenced_keys */
+            c.table_name, c.constraint_name, cc.column_name
+        FROM all_constraints c
+        JOIN all_cons_columns cc
+            ON cc.owner = c.owner
+            AND cc.constraint_name = c.constraint_name
+        WHERE c.owner = :owner
+            AND c.constraint_type IN ('P', 'U') {keys}
+        ORDER BY c.constraint_name, cc.position
+        """,
+        "c.constraint_name", 1
+    ),
+]}
+
+
+@dataclass
+class TableListing:
+    """A table as listed by the cheap first query."""
+    tablespace_name: Optional[str]
+    num_rows: Optional[int]
+    last_ddl_time: Optional[str]  # ISO 8601
+
+
+@dataclass
+class SnapshotEntry:
+    """Persisted state of one table."""
+    last_ddl_time: Optional[str]
+    content_hash: str
+    record: Dict[str, Any]
+
+
+def ddl_time(value: Any) -> Optional[str]:
+    """Normalize LAST_DDL_TIME (datetime from the driver, or ISO text from a fixture)."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def content_hash(record: Dict[str, Any]) -> str:
+    """
+    Change-detection hash of a table's structure.
+
+    Statistics (num_rows) are excluded so gathering stats does not count
+    as a schema change.
+    """
+    structural = {key: value for key, value in record.items() if key != 'num_rows'}
+    payload = json.dumps(structural, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CatalogExtractor:
+    """
+    Batched data dictionary reader for one connection.
+
+    Works with any DB-API style connection whose cursors accept named
+    binds: python-oracledb, or RecordedCatalogConnection for offline runs.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        arraysize: int = DEFAULT_ARRAYSIZE,
+        subset_limit: int = SUBSET_LIMIT
+    ):
+        """
+        Initialize catalog extractor.
+
+        Args:
+            connection: Open database connection
+            arraysize: Rows fetched per round-trip
+            subset_limit: Max stale tables re-extracted via IN lists
+        """
+        self.connection = connection
+        self.arraysize = arraysize
+        self.subset_limit = subset_limit
+        self.round_trips = 0
+
+    # ============ Fetching ============
+
+    def _execute(self, sql: str, binds: Dict[str, Any]) -> List[tuple]:
+        cursor = self.connection.cursor()
+        try:
+            cursor.arraysize = self.arraysize
+            cursor.prefetchrows = self.arraysize + 1  # First batch arrives with execute
+            cursor.execute(sql, binds)
+            self.round_trips += 1
+            return [tuple(row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def fetch(self, name: str, owner: str, keys: Optional[Iterable[str]] = None) -> List[tuple]:
+        """
+        Run a catalog query for an owner.
+
+        Args:
+            name: Query name from CATALOG_QUERIES
+            owner: Schema owner
+            keys: Restrict to these key values (IN lists of up to 1000)
+        """
+        query = CATALOG_QUERIES[name]
+        if keys is None:
+            return self._execute(query.sql.format(keys=""), {"owner": owner})
+
+        keys = sorted(set(keys))
+        rows: List[tuple] = []
+        for start in range(0, len(keys), MAX_IN_LIST):
+            chunk = keys[start:start + MAX_IN_LIST]
+            binds: Dict[str, Any] = {"owner": owner}
+            binds.update((f"k{i}", key) for i, key in enumerate(chunk))
+            in_list = ", ".join(f":k{i}" for i in range(len(chunk)))
+            sql = query.sql.format(keys=f"AND {query.key_expression} IN ({in_list})")
+            rows.extend(self._execute(sql, binds))
+        return rows
+
+    def current_user(self) -> str:
+        return self._execute(CATALOG_QUERIES["current_user"].sql.format(keys=""), {})[0][0]
+
+    # ============ Extraction ============
+
+    def list_tables(self, owner: str) -> Dict[str, TableListing]:
+        """Tables of an owner with tablespace, row count and LAST_DDL_TIME (one query)."""
+        return {
+            table_name: TableListing(tablespace_name, num_rows, ddl_time(last_ddl))
+            for _, table_name, tablespace_name, num_rows, last_ddl in self.fetch("tables", owner)
+        }
+
+    def extract_tables(
+        self,
+        owner: str,
+        listing: Dict[str, TableListing],
+        names: Optional[Sequence[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Full metadata records for tables of an owner.
+
+        Args:
+            owner: Schema owner
+            listing: Result of list_tables(owner)
+            names: Only these tables (default: all listed tables)
+
+        Returns:
+            Table name -> record, in listing order
+        """
+        if names is None:
+            wanted = list(listing)
+        else:
+            selected = set(names)
+            wanted = [name for name in listing if name in selected]
+        if not wanted:
+            return {}
+        keys = None if names is None or len(wanted) > self.subset_limit else wanted
+
+        records: Dict[str, Dict[str, Any]] = {}
+        for table_name in wanted:
+            info = listing[table_name]
+            records[table_name] = {
+                "owner": owner,
+                "table_name": table_name,
+                "tablespace_name": info.tablespace_name,
+                "num_rows": info.num_rows,
+                "comments": None,
+                "columns": [],
+                "indexes": [],
+                "constraints": [],
+            }
+
+        for table_name, comments in self.fetch("table_comments", owner, keys):
+            if table_name in records and comments:
+                records[table_name]["comments"] = comments
+
+        for row in self.fetch("columns", owner, keys):
+            record = records.get(row[0])
+            if record is not None:
+                record["columns"].append({
+                    "column_name": row[1],
+                    "data_type": row[2],
+                    "data_length": row[3],
+                    "data_precision": row[4],
+                    "data_scale": row[5],
+                    "nullable": row[6],
+                    "default_value": row[7],
+                    "comments": row[8],
+                })
+
+        self._join_indexes(owner, records, keys)
+        self._join_constraints(owner, records, keys)
+        return records
+
+    def _join_indexes(self, owner: str, records: Dict[str, Dict[str, Any]], keys) -> None:
+        index_columns: Dict[Tuple[str, str], List[str]] = {}
+        for _, index_owner, index_name, column_name in self.fetch("index_columns", owner, keys):
+            index_columns.setdefault((index_owner, index_name), []).append(column_name)
+
+        for table_name, index_owner, index_name, index_type, uniqueness in self.fetch("indexes", owner, keys):
+            record = records.get(table_name)
+            if record is not None:
+                record["indexes"].append({
+                    "index_name": index_name,
+                    "index_type": index_type,
+                    "uniqueness": uniqueness,
+                    "columns": index_columns.get((index_owner, index_name), []),
+                })
+
+    def _join_constraints(self, owner: str, records: Dict[str, Dict[str, Any]], keys) -> None:
+        constraint_columns: Dict[str, List[str]] = {}
+        for _, constraint_name, column_name in self.fetch("constraint_columns", owner, keys):
+            constraint_columns.setdefault(constraint_name, []).append(column_name)
+
+        rows = self.fetch("constraints", owner, keys)
+
+        # Referenced keys: resolve from this batch where possible, then one
+        # query per remaining referenced owner
+        known: Dict[Tuple[str, str], Tuple[str, List[str]]] = {
+            (owner, constraint_name): (table_name, constraint_columns.get(constraint_name, []))
+            for table_name, constraint_name, constraint_type, _, _ in rows
+            if constraint_type in ('P', 'U')
+        }
+        missing: Dict[str, set] = {}
+        for _, _, constraint_type, r_owner, r_constraint_name in rows:
+            if constraint_type == 'R' and r_constraint_name and (r_owner, r_constraint_name) not in known:
+                missing.setdefault(r_owner, set()).add(r_constraint_name)
+        for r_owner, names in missing.items():
+            referenced: Dict[str, Tuple[str, List[str]]] = {}
+            for table_name, constraint_name, column_name in self.fetch("referenced_keys", r_owner, names):
+                referenced.setdefault(constraint_name, (table_name, []))[1].append(column_name)
+            known.update(((r_owner, name), value) for name, value in referenced.items())
+
+        for table_name, constraint_name, constraint_type, r_owner, r_constraint_name in rows:
+            record = records.get(table_name)
+            if record is None:
+                continue
+            r_table = None
+            r_columns = None
+            if constraint_type == 'R' and r_constraint_name:
+                r_table, r_columns = known.get((r_owner, r_constraint_name), (None, []))
+            record["constraints"].append({
+                "constraint_name": constraint_name,
+                "constraint_type": constraint_type,
+                "columns": constraint_columns.get(constraint_name, []),
+                "r_owner": r_owner,
+                "r_table": r_table,
+                "r_columns": r_columns,
+            })
+
+
+class SchemaSnapshot:
+    """
+    Persisted per-table catalog records with change-detection hashes.
+
+    Keyed by (namespace, owner, table_name) so one file can hold several
+    databases.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS schema_objects (
+                    namespace TEXT NOT NULL,
+                    owner TEXT NOT NULL,
+                    object_name TEXT NOT NULL,
+                    last_ddl_time TEXT,
+                    content_hash TEXT NOT NULL,
+                    record TEXT NOT NULL,
+                    crawled_at TEXT NOT NULL,
+                    PRIMARY KEY (namespace, owner, object_name)
+                )
+            """)
+
+    def load(self, namespace: str, owner: str) -> Dict[str, SnapshotEntry]:
+        rows = self.conn.execute(
+            "SELECT object_name, last_ddl_time, content_hash, record FROM schema_objects "
+            "WHERE namespace = ? AND owner = ?",
+            (namespace, owner)
+        )
+        return {
+            name: SnapshotEntry(last_ddl, digest, json.loads(record))
+            for name, last_ddl, digest, record in rows
+        }
+
+    def replace(self, namespace: str, owner: str, entries: Dict[str, SnapshotEntry]) -> None:
+        """Make the owner's snapshot exactly entries (dropped tables are removed)."""
+        crawled_at = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM schema_objects WHERE namespace = ? AND owner = ?",
+                (namespace, owner)
+            )
+            self.conn.executemany(
+                "INSERT INTO schema_objects "
+                "(namespace, owner, object_name, last_ddl_time, content_hash, record, crawled_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (namespace, owner, name, entry.last_ddl_time, entry.content_hash,
+                     json.dumps(entry.record, default=str), crawled_at)
+                    for name, entry in entries.items()
+                ]
+            )
+
+    def close(self) -> None:
+        self.conn.close()
@@ -10,14 +10,25 @@ CORTEX Tier 2 Integration:
 - Pattern Title: "Oracle: {table_name} schema"
 - Confidence: 0.95 (high confidence from direct schema introspection)
 
+Catalog extraction is batched per schema owner (see oracle_catalog.py):
+a fixed number of dictionary queries per owner, joined in memory. With a
+snapshot_path, re-crawls only re-extract tables whose LAST_DDL_TIME moved.
+
 Usage:
-    crawler = OracleCrawler(connection_string="user/pass@host:port/service")
-    patterns = crawler.extract_schema()
-    crawler.store_patterns(patterns, knowledge_graph)
+    crawler = OracleCrawler(user, password, dsn, snapshot_path=Path("oracle_snapshot.db"))
+    crawler.connect()
+    crawl = crawler.crawl_schema()
+    crawler.store_patterns(crawl.changed_tables, knowledge_graph)
+
+Offline (recorded catalog, see oracle_replay.py):
+    crawler = OracleCrawler(user, "", dsn, connection=RecordedCatalogConnection("catalog.json"))
 """
 
-import oracledb
-from dataclasses import dataclass
+try:
+    import oracledb
+except ImportError:  # Optional: only needed for live connections
+    oracledb = None
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 import json
@@ -26,6 +37,14 @@ import sys
 # Add CORTEX to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from tier2.knowledge_graph import KnowledgeGraph
+from tier2.oracle_catalog import (
+    CatalogExtractor,
+    DEFAULT_ARRAYSIZE,
+    SYSTEM_SCHEMAS,
+    SchemaSnapshot,
+    SnapshotEntry,
+    content_hash,
+)
 
 
 @dataclass
@@ -74,6 +93,21 @@ class OracleConstraint:
     r_columns: Optional[List[str]]  # Referenced columns (for FK)
 
 
+@dataclass
+class SchemaCrawl:
+    """Result of a (possibly incremental) schema crawl."""
+    tables: List[OracleTable]
+    changed: List[str] = field(default_factory=list)  # "OWNER.TABLE" new or structurally changed
+    dropped: List[str] = field(default_factory=list)  # "OWNER.TABLE" gone since the snapshot
+    extracted: int = 0  # Tables whose metadata was re-read from the dictionary
+    round_trips: int = 0
+    
+    @property
+    def changed_tables(self) -> List[OracleTable]:
+        changed = set(self.changed)
+        return [table for table in self.tables if f"{table.owner}.{table.table_name}" in changed]
+
+
 class OracleCrawler:
     """
     Extracts schema metadata from Oracle databases.
@@ -81,6 +115,8 @@ class OracleCrawler:
     Architecture:
     - Uses oracledb (python-oracledb) for connectivity
     - Queries data dictionary views (ALL_TABLES, ALL_TAB_COLUMNS, etc.)
+      once per owner and joins them in memory (CatalogExtractor)
+    - Optional SchemaSnapshot for LAST_DDL_TIME-driven incremental re-crawls
     - Converts metadata to CORTEX knowledge patterns
     - Stores in Tier 2 with scope='application', namespace=[db_name]
     """
@@ -90,7 +126,10 @@ class OracleCrawler:
         user: str,
         password: str,
         dsn: str,
-        namespace: Optional[str] = None
+        namespace: Optional[str] = None,
+        snapshot_path: Optional[Path] = None,
+        arraysize: int = DEFAULT_ARRAYSIZE,
+        connection: Optional[Any] = None
     ):
         """
         Initialize Oracle crawler.
@@ -100,12 +139,17 @@ class OracleCrawler:
             password: User password
             dsn: Data Source Name (host:port/service_name)
             namespace: Override namespace (default: extracts from DSN)
+            snapshot_path: SQLite schema snapshot enabling incremental re-crawls
+            arraysize: Rows fetched per round-trip from dictionary views
+            connection: Already-open connection (e.g. RecordedCatalogConnection)
         """
         self.user = user
         self.password = password
         self.dsn = dsn
         self.namespace = namespace or self._extract_namespace_from_dsn(dsn)
-        self.connection: Optional[oracledb.Connection] = None
+        self.arraysize = arraysize
+        self.snapshot = SchemaSnapshot(snapshot_path) if snapshot_path else None
+        self.connection: Optional[Any] = connection
     
     def _extract_namespace_from_dsn(self, dsn: str) -> str:
         """Extract database name from DSN for namespace."""
@@ -117,6 +161,10 @@ class OracleCrawler:
     
     def connect(self) -> None:
         """Establish connection to Oracle database."""
+        if self.connection:
+            return
+        if oracledb is None:
+            raise ConnectionError("python-oracledb is not installed (pip install oracledb)")
         try:
             self.connection = oracledb.connect(
                 user=self.user,
@@ -149,273 +197,93 @@ class OracleCrawler:
         Returns:
             List of OracleTable objects with full metadata
         """
-        if not self.connection:
-            raise RuntimeError("Not connected to Oracle. Call connect() first.")
-        
-        # Default to current user if no owners specified
-        if owners is None:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT USER FROM DUAL")
-            current_user = cursor.fetchone()[0]
-            owners = [current_user]
-            cursor.close()
-        
-        tables = []
-        for owner in owners:
-            tables.extend(self._extract_tables_for_owner(owner, include_system))
-        
-        return tables
+        return self.crawl_schema(owners, include_system).tables
     
-    def _extract_tables_for_owner(
+    def crawl_schema(
         self,
-        owner: str,
-        include_system: bool
-    ) -> List[OracleTable]:
-        """Extract all tables for a specific schema owner."""
-        cursor = self.connection.cursor()
-        
-        # Query: Get all tables for owner
-        query = """
-            SELECT 
-                owner,
-                table_name,
-                tablespace_name,
-                num_rows
-            FROM all_tables
-            WHERE owner = :owner
+        owners: Optional[List[str]] = None,
+        include_system: bool = False
+    ) -> SchemaCrawl:
         """
+        Extract schema metadata, re-reading only tables changed since the snapshot.
         
-        # Exclude system schemas unless requested
-        if not include_system:
-            query += """
-                AND owner NOT IN (
-                    'SYS', 'SYSTEM', 'OUTLN', 'DBSNMP', 'APPQOSSYS',
-                    'WMSYS', 'EXFSYS', 'CTXSYS', 'XDB', 'ANONYMOUS',
-                    'ORACLE_OCM', 'APEX_PUBLIC_USER', 'FLOWS_FILES',
-                    'APEX_040000', 'APEX_040200'
-                )
-            """
+        Without a snapshot every table is extracted and reported as changed.
         
-        cursor.execute(query, owner=owner.upper())
-        
-        tables = []
-        for row in cursor:
-            table = OracleTable(
-                owner=row[0],
-                table_name=row[1],
-                tablespace_name=row[2],
-                num_rows=row[3],
-                comments=self._get_table_comments(row[0], row[1]),
-                columns=self._get_columns(row[0], row[1]),
-                indexes=self._get_indexes(row[0], row[1]),
-                constraints=self._get_constraints(row[0], row[1])
-            )
-            tables.append(table)
-        
-        cursor.close()
-        return tables
-    
-    def _get_table_comments(self, owner: str, table_name: str) -> Optional[str]:
-        """Get table comments from data dictionary."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            SELECT comments 
-            FROM all_tab_comments 
-            WHERE owner = :owner AND table_name = :table_name
-            """,
-            owner=owner,
-            table_name=table_name
-        )
-        result = cursor.fetchone()
-        cursor.close()
-        return result[0] if result and result[0] else None
-    
-    def _get_columns(self, owner: str, table_name: str) -> List[OracleColumn]:
-        """Get all columns for a table."""
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            SELECT 
-                c.column_name,
-                c.data_type,
-                c.data_length,
-                c.data_precision,
-                c.data_scale,
-                c.nullable,
-                c.data_default,
-                cm.comments
-            FROM all_tab_columns c
-            LEFT JOIN all_col_comments cm
-                ON c.owner = cm.owner 
-                AND c.table_name = cm.table_name 
-                AND c.column_name = cm.column_name
-            WHERE c.owner = :owner 
-                AND c.table_name = :table_name
-            ORDER BY c.column_id
-            """,
-            owner=owner,
-            table_name=table_name
-        )
+        Args:
+            owners: List of schema owners to extract (default: current user)
+            include_system: Include Oracle system schemas (SYS, SYSTEM, etc.)
         
-        columns = []
-        for row in cursor:
-            col = OracleColumn(
-                column_name=row[0],
-                data_type=row[1],
-                data_length=row[2],
-                data_precision=row[3],
-                data_scale=row[4],
-                nullable=row[5],
-                default_value=row[6],
-                comments=row[7]
-            )
-            columns.append(col)
+        Returns:
+            SchemaCrawl with all tables plus changed/dropped table names
+        """
+        if not self.connection:
+            raise RuntimeError("Not connected to Oracle. Call connect() first.")
         
-        cursor.close()
-        return columns
-    
-    def _get_indexes(self, owner: str, table_name: str) -> List[OracleIndex]:
-        """Get all indexes for a table."""
-        cursor = self.connection.cursor()
+        extractor = CatalogExtractor(self.connection, arraysize=self.arraysize)
         
-        # Get index metadata
-        cursor.execute(
-            """
-            SELECT 
-                index_name,
-                index_type,
-                uniqueness
-            FROM all_indexes
-            WHERE table_owner = :owner 
-                AND table_name = :table_name
-            """,
-            owner=owner,
-            table_name=table_name
-        )
+        # Default to current user if no owners specified
+        if owners is None:
+            owners = [extractor.current_user()]
         
-        indexes = []
-        for row in cursor:
-            index_name = row[0]
+        crawl = SchemaCrawl(tables=[])
+        for owner in owners:
+            owner = owner.upper()
             
-            # Get columns for this index
-            col_cursor = self.connection.cursor()
-            col_cursor.execute(
-                """
-                SELECT column_name
-                FROM all_ind_columns
-                WHERE index_owner = :owner
-                    AND index_name = :index_name
-                ORDER BY column_position
-                """,
-                owner=owner,
-                index_name=index_name
-            )
-            columns = [col[0] for col in col_cursor]
-            col_cursor.close()
+            # Exclude system schemas unless requested
+            if not include_system and owner in SYSTEM_SCHEMAS:
+                continue
             
-            idx = OracleIndex(
-                index_name=index_name,
-                index_type=row[1],
-                uniqueness=row[2],
-                columns=columns
-            )
-            indexes.append(idx)
+            self._crawl_owner(extractor, owner, crawl)
         
-        cursor.close()
-        return indexes
+        crawl.round_trips = extractor.round_trips
+        return crawl
     
-    def _get_constraints(self, owner: str, table_name: str) -> List[OracleConstraint]:
-        """Get all constraints for a table."""
-        cursor = self.connection.cursor()
+    def _crawl_owner(self, extractor: CatalogExtractor, owner: str, crawl: SchemaCrawl) -> None:
+        """Crawl one owner into crawl, refreshing its snapshot."""
+        listing = extractor.list_tables(owner)
+        previous = self.snapshot.load(self.namespace, owner) if self.snapshot else {}
         
-        # Get constraint metadata
-        cursor.execute(
-            """
-            SELECT 
-                constraint_name,
-                constraint_type,
-                r_owner,
-                r_constraint_name
-            FROM all_constraints
-            WHERE owner = :owner 
-                AND table_name = :table_name
-                AND constraint_type IN ('P', 'R', 'U', 'C')
-            """,
-            owner=owner,
-            table_name=table_name
-        )
+        # Only tables that are new or whose DDL time moved are re-extracted
+        stale = [
+            name for name, info in listing.items()
+            if name not in previous or previous[name].last_ddl_time != info.last_ddl_time
+        ]
+        fresh = extractor.extract_tables(owner, listing, names=stale if previous else None)
+        crawl.extracted += len(fresh)
         
-        constraints = []
-        for row in cursor:
-            constraint_name = row[0]
-            constraint_type = row[1]
-            r_owner = row[2]
-            r_constraint_name = row[3]
-            
-            # Get columns for this constraint
-            col_cursor = self.connection.cursor()
-            col_cursor.execute(
-                """
-                SELECT column_name
-                FROM all_cons_columns
-                WHERE owner = :owner
-                    AND constraint_name = :constraint_name
-                ORDER BY position
-                """,
-                owner=owner,
-                constraint_name=constraint_name
-            )
-            columns = [col[0] for col in col_cursor]
-            col_cursor.close()
-            
-            # For foreign keys, get referenced table/columns
-            r_table = None
-            r_columns = None
-            if constraint_type == 'R' and r_constraint_name:
-                ref_cursor = self.connection.cursor()
-                
-                # Get referenced table
-                ref_cursor.execute(
-                    """
-                    SELECT table_name
-                    FROM all_constraints
-                    WHERE owner = :owner
-                        AND constraint_name = :constraint_name
-                    """,
-                    owner=r_owner,
-                    constraint_name=r_constraint_name
-                )
-                r_table_row = ref_cursor.fetchone()
-                r_table = r_table_row[0] if r_table_row else None
-                
-                # Get referenced columns
-                ref_cursor.execute(
-                    """
-                    SELECT column_name
-                    FROM all_cons_columns
-                    WHERE owner = :owner
-                        AND constraint_name = :constraint_name
-                    ORDER BY position
-                    """,
-                    owner=r_owner,
-                    constraint_name=r_constraint_name
-                )
-                r_columns = [col[0] for col in ref_cursor]
-                ref_cursor.close()
+        entries: Dict[str, SnapshotEntry] = {}
+        for name, info in listing.items():
+            if name in fresh:
+                record = fresh[name]
+            else:
+                # Unchanged DDL: reuse the snapshot, refreshing the statistics
+                record = dict(previous[name].record)
+                record["tablespace_name"] = info.tablespace_name
+                record["num_rows"] = info.num_rows
             
-            cons = OracleConstraint(
-                constraint_name=constraint_name,
-                constraint_type=constraint_type,
-                columns=columns,
-                r_owner=r_owner,
-                r_table=r_table,
-                r_columns=r_columns
-            )
-            constraints.append(cons)
+            digest = content_hash(record)
+            if name not in previous or previous[name].content_hash != digest:
+                crawl.changed.append(f"{owner}.{name}")
+            entries[name] = SnapshotEntry(info.last_ddl_time, digest, record)
+            crawl.tables.append(self._table_from_record(record))
         
-        cursor.close()
-        return constraints
+        crawl.dropped.extend(f"{owner}.{name}" for name in previous if name not in listing)
+        
+        if self.snapshot:
+            self.snapshot.replace(self.namespace, owner, entries)
+    
+    def _table_from_record(self, record: Dict[str, Any]) -> OracleTable:
+        """Build an OracleTable from a catalog record."""
+        return OracleTable(
+            owner=record["owner"],
+            table_name=record["table_name"],
+            tablespace_name=record["tablespace_name"],
+            num_rows=record["num_rows"],
+            comments=record["comments"],
+            columns=[OracleColumn(**column) for column in record["columns"]],
+            indexes=[OracleIndex(**index) for index in record["indexes"]],
+            constraints=[OracleConstraint(**constraint) for constraint in record["constraints"]]
+        )
     
     def table_to_pattern(self, table: OracleTable) -> Dict[str, Any]:
         """
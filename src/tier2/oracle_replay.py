@@ -0,0 +1,231 @@
+"""
+Recorded Oracle Catalog - Offline Stand-in Driver
+
+Lets OracleCrawler run without an Oracle server by replaying recorded
+data dictionary result sets.
+
+- RecordingConnection wraps a live python-oracledb connection and captures
+  the result sets of every tagged catalog query, per owner. Rows from
+  IN-list queries are merged into the owner's set.
+- RecordedCatalogConnection replays a fixture through the same cursor API.
+  IN-list subset queries (incremental re-crawls) are answered by filtering
+  the recorded owner-wide rows, so one fixture covers full and incremental
+  crawls.
+
+Fixture format (JSON):
+    {
+        "current_user": "HR",
+        "result_sets": {
+            "tables": {"HR": [["HR", "EMPLOYEES", "USERS", 107, "2025-01-01T10:00:00"], ...]},
+            "columns": {"HR": [...]},
+            ...
+        }
+    }
+
+Usage:
+    # Record once against a real database (full crawl)
+    recorder = RecordingConnection(oracledb.connect(...))
+    OracleCrawler(user, password, dsn, connection=recorder).extract_schema()
+    recorder.save("catalog.json")
+
+    # Replay offline
+    crawler = OracleCrawler("hr", "", "host:1521/ORCL",
+                            connection=RecordedCatalogConnection("catalog.json"))
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import json
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .oracle_catalog import CATALOG_QUERIES
+
+_TAG = re.compile(r"/\*\s*catalog:(\w+)\s*\*/")
+_KEY_BIND = re.compile(r"k\d+$")
+
+
+def _query_name(sql: str) -> str:
+    match = _TAG.search(sql)
+    if not match:
+        raise ValueError("Query is not a tagged catalog query; it cannot be recorded or replayed")
+    return match.group(1)
+
+
+def _binds(parameters: Optional[Dict[str, Any]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    binds = dict(parameters or {})
+    binds.update(kwargs)
+    return binds
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+
+class RecordedCursor:
+    """DB-API cursor over recorded rows."""
+
+    def __init__(self, connection: "RecordedCatalogConnection"):
+        self.connection = connection
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self._rows: List[tuple] = []
+        self._position = 0
+
+    def execute(self, sql: str, parameters: Optional[Dict[str, Any]] = None, **kwargs) -> "RecordedCursor":
+        name = _query_name(sql)
+        binds = _binds(parameters, kwargs)
+        self.connection.executed.append(name)
+
+        if name == "current_user":
+            rows = [[self.connection.fixture["current_user"]]]
+        else:
+            rows = self.connection.result_set(name, binds.get("owner"))
+            keys = {value for bind, value in binds.items() if _KEY_BIND.match(bind)}
+            if keys:
+                index = CATALOG_QUERIES[name].key_index
+                rows = [row for row in rows if row[index] in keys]
+
+        self._rows = [tuple(row) for row in rows]
+        self._position = 0
+        return self
+
+    def fetchone(self) -> Optional[tuple]:
+        if self._position >= len(self._rows):
+            return None
+        row = self._rows[self._position]
+        self._position += 1
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List[tuple]:
+        size = size or self.arraysize
+        rows = self._rows[self._position:self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def fetchall(self) -> List[tuple]:
+        rows = self._rows[self._position:]
+        self._position = len(self._rows)
+        return rows
+
+    def __iter__(self) -> Iterator[tuple]:
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def close(self) -> None:
+        self._rows = []
+
+
+class RecordedCatalogConnection:
+    """
+    Connection stand-in that replays a recorded catalog fixture.
+
+    The names of executed queries are kept in `executed`, so callers can
+    assert on round-trip counts.
+    """
+
+    def __init__(self, fixture: Union[Path, str, Dict[str, Any]]):
+        if isinstance(fixture, dict):
+            self.fixture = fixture
+        else:
+            self.fixture = json.loads(Path(fixture).read_text(encoding="utf-8"))
+        self.executed: List[str] = []
+
+    def cursor(self) -> RecordedCursor:
+        return RecordedCursor(self)
+
+    def result_set(self, name: str, owner: Optional[str]) -> List[list]:
+        """Recorded owner-wide rows of a query."""
+        rows = self.fixture.get("result_sets", {}).get(name, {}).get(owner, [])
+        if name != "referenced_keys":
+            return rows
+
+        # A full crawl resolves same-owner keys in memory, so derive them
+        # from the recorded constraints for incremental replays
+        key_columns: Dict[str, List[list]] = {}
+        for table_name, constraint_name, column_name in self.result_set("constraint_columns", owner):
+            key_columns.setdefault(constraint_name, []).append([table_name, constraint_name, column_name])
+        derived = [
+            row
+            for _, constraint_name, constraint_type, _, _ in self.result_set("constraints", owner)
+            if constraint_type in ('P', 'U')
+            for row in key_columns.get(constraint_name, [])
+        ]
+        recorded = {tuple(row) for row in rows}
+        return rows + [row for row in derived if tuple(row) not in recorded]
+
+    def close(self) -> None:
+        pass
+
+
+class RecordingCursor:
+    """Cursor wrapper that records catalog result sets."""
+
+    def __init__(self, recorder: "RecordingConnection", cursor: Any):
+        self._recorder = recorder
+        self._cursor = cursor
+        self._record_as: Optional[tuple] = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+        else:
+            setattr(self._cursor, name, value)
+
+    def execute(self, sql: str, parameters: Optional[Dict[str, Any]] = None, **kwargs) -> "RecordingCursor":
+        name = _query_name(sql)
+        binds = _binds(parameters, kwargs)
+        self._cursor.execute(sql, binds)
+        self._record_as = (name, binds.get("owner"))
+        return self
+
+    def fetchall(self) -> List[tuple]:
+        rows = self._cursor.fetchall()
+        if self._record_as:
+            name, owner = self._record_as
+            if name == "current_user":
+                self._recorder.fixture["current_user"] = rows[0][0] if rows else None
+            else:
+                # Merge, so IN-list subsets (e.g. referenced keys) accumulate
+                recorded = self._recorder.fixture["result_sets"].setdefault(name, {}).setdefault(owner, [])
+                seen = {tuple(row) for row in recorded}
+                for row in rows:
+                    values = [_json_value(value) for value in row]
+                    if tuple(values) not in seen:
+                        seen.add(tuple(values))
+                        recorded.append(values)
+        return rows
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class RecordingConnection:
+    """Wraps a live connection and captures catalog result sets for replay."""
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.fixture: Dict[str, Any] = {"current_user": None, "result_sets": {}}
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self, self.connection.cursor())
+
+    def save(self, path: Union[Path, str]) -> None:
+        Path(path).write_text(json.dumps(self.fixture, indent=2), encoding="utf-8")
+
+    def close(self) -> None:
+        self.connection.close()
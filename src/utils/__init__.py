@@ -19,6 +19,7 @@ from .progress_decorator import (
 
 # Performance tools
 from .performance_profiler import PerformanceProfiler
+from .memory_observer import MemoryObserver, MemoryPressure, PressureSignal, track_cache
 
 # Testing tools
 from .incremental_test_runner import IncrementalTestRunner
@@ -26,6 +27,10 @@ from .incremental_test_runner import IncrementalTestRunner
 # Configuration tools
 from .user_dictionary import UserDictionary
 from .yaml_cache import YAMLCache
+from .config_snapshots import ConfigRuntime, ConfigSnapshot, freeze, thaw, get_config_runtime
+
+# Dependency analysis
+from .graph_analysis import DirectedGraph, NodeMetrics
 
 
 __all__ = [
@@ -40,6 +45,10 @@ __all__ = [
     
     # Performance
     'PerformanceProfiler',
+    'MemoryObserver',
+    'MemoryPressure',
+    'PressureSignal',
+    'track_cache',
     
     # Testing
     'IncrementalTestRunner',
@@ -47,4 +56,13 @@ __all__ = [
     # Configuration
     'UserDictionary',
     'YAMLCache',
+    'ConfigRuntime',
+    'ConfigSnapshot',
+    'freeze',
+    'thaw',
+    'get_config_runtime',
+    
+    # Dependency analysis
+    'DirectedGraph',
+    'NodeMetrics',
 ]
@@ -0,0 +1,383 @@
+"""
+CORTEX Configuration Snapshots - Copy-on-Write Config Runtime
+
+Configuration used on hot paths (router setup, protection checks, document
+governance, design sync) is parsed once per change and published as an
+immutable snapshot. Readers dereference one attribute and never lock, parse
+or stat a file.
+
+- freeze()/thaw(): dicts become read-only mapping proxies, lists become
+  tuples, sets become frozensets (and back to fresh mutable copies for
+  callers that need to edit a value)
+- ConfigSnapshot: one published, pre-validated version of a source
+- ConfigSource: watched files + loader; refresh() builds the next snapshot
+  off to the side and swaps the reference atomically
+- ConfigRuntime: registry of sources and a single background watcher that
+  polls file signatures (mtime_ns, size) and rebuilds changed sources
+
+Writers pay for the rebuild; subscribers are notified once per published
+version so compiled artefacts (path lists, regexes, derived objects) are
+rebuilt exactly once per change. A failed rebuild keeps the previous
+snapshot in place.
+
+Usage:
+    from src.utils.config_snapshots import get_config_runtime
+
+    rules = get_config_runtime().yaml_file("cortex-brain/brain-protection-rules.yaml")
+    layers = rules.current.get("protection_layers", ())   # lock-free read
+    rules.subscribe(lambda snapshot: rebuild(snapshot.value))
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import json
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, replace
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+Subscriber = Callable[["ConfigSnapshot"], None]
+
+
+def freeze(value: Any) -> Any:
+    """Deep read-only copy: dict -> MappingProxyType, list -> tuple, set -> frozenset."""
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Deep mutable copy of a frozen value: mapping -> dict, tuple -> list, frozenset -> set."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return {thaw(item) for item in value}
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """One published version of a configuration source."""
+    name: str
+    version: int
+    value: Any
+    signature: Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]
+    loaded_at: float
+
+    def get(self, key_path: str, default: Any = None) -> Any:
+        """Dot-path lookup into the snapshot (e.g. "governance_rules.search_before_create")."""
+        value = self.value
+        for key in key_path.split('.'):
+            if not isinstance(value, Mapping):
+                return default
+            value = value.get(key)
+            if value is None:
+                return default
+        return value
+
+
+def file_signature(paths: Iterable[Path]) -> Tuple[Tuple[str, Optional[Tuple[int, int]]], ...]:
+    """(mtime_ns, size) per path; None for files that don't exist."""
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((str(path), (stat.st_mtime_ns, stat.st_size)))
+        except OSError:
+            signature.append((str(path), None))
+    return tuple(signature)
+
+
+class ConfigSource:
+    """
+    A watched configuration source and its currently published snapshot.
+
+    `current` is a plain attribute read: rebuilds happen under a writer lock,
+    the new snapshot is fully built and frozen before the reference is
+    swapped, so readers see either the old or the new version, never a
+    partially updated one.
+    """
+
+    def __init__(self, name: str, paths: Iterable[PathLike], load: Callable[[], Any]):
+        self.name = name
+        self.paths = tuple(Path(path) for path in paths)
+        self._load = load
+        self._current: Optional[ConfigSnapshot] = None
+        self._subscribers: List[Callable[[], Optional[Subscriber]]] = []
+        self._write_lock = threading.Lock()
+        self._failed_signature = None
+        self.failures = 0
+
+    @property
+    def current(self) -> ConfigSnapshot:
+        """Latest published snapshot (lock-free)."""
+        return self._current
+
+    @property
+    def value(self) -> Any:
+        """Frozen value of the latest published snapshot (lock-free)."""
+        return self._current.value
+
+    def is_stale(self) -> bool:
+        """True if a watched file changed since the current snapshot was built."""
+        current = self._current
+        return current is None or file_signature(self.paths) != current.signature
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Rebuild and publish a new snapshot if the source files changed.
+
+        Returns:
+            True if a new snapshot was published
+
+        Raises:
+            Exception: from the loader, only when there is no snapshot yet
+        """
+        with self._write_lock:
+            # Take the signature before loading: a write racing the load
+            # leaves the source stale and is picked up on the next check
+            signature = file_signature(self.paths)
+            previous = self._current
+            if not force and previous is not None and signature in (previous.signature, self._failed_signature):
+                return False
+
+            try:
+                value = freeze(self._load())
+            except Exception as e:
+                if previous is None:
+                    raise
+                self.failures += 1
+                self._failed_signature = signature
+                logger.warning(f"Keeping config snapshot '{self.name}' v{previous.version}: rebuild failed: {e}")
+                return False
+
+            if previous is not None and value == previous.value:
+                # Touched or re-read mid-write: same content, no new version
+                self._current = replace(previous, signature=signature)
+                return False
+
+            snapshot = ConfigSnapshot(
+                name=self.name,
+                version=previous.version + 1 if previous else 1,
+                value=value,
+                signature=signature,
+                loaded_at=time.time()
+            )
+            self._current = snapshot
+
+        if previous is not None:
+            self._notify(snapshot)
+        return True
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """
+        Call `callback(snapshot)` once per newly published snapshot.
+
+        Bound methods are held weakly, so subscribing an object doesn't keep
+        it alive. Returns an unsubscribe function.
+        """
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        self._subscribers.append(ref)
+
+        def unsubscribe() -> None:
+            try:
+                self._subscribers.remove(ref)
+            except ValueError:
+                pass
+
+        return unsubscribe
+
+    def _notify(self, snapshot: ConfigSnapshot) -> None:
+        for ref in list(self._subscribers):
+            callback = ref()
+            if callback is None:
+                try:
+                    self._subscribers.remove(ref)
+                except ValueError:
+                    pass
+                continue
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.warning(f"Config subscriber for '{self.name}' failed: {e}")
+
+
+def _load_json(path: Path) -> Any:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_yaml(path: Path) -> Any:
+    import yaml
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+class ConfigRuntime:
+    """
+    Registry of configuration sources with one background watcher.
+
+    Sources are keyed by name; registering an existing name returns the
+    shared source (refreshed if its files changed), so every consumer of a
+    file reads the same snapshot.
+    """
+
+    def __init__(self, poll_interval: float = 1.0, watch: bool = True):
+        """
+        Args:
+            poll_interval: Seconds between file signature checks
+            watch: Start the background watcher on first registration
+        """
+        self.poll_interval = poll_interval
+        self.watch = watch
+        self._sources: Dict[str, ConfigSource] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, paths: Iterable[PathLike], load: Callable[[], Any]) -> ConfigSource:
+        """
+        Register a source and publish its first snapshot synchronously.
+
+        Args:
+            name: Unique source name (existing sources are refreshed and
+                returned, so callers never start from a stale snapshot)
+            paths: Files whose changes trigger a rebuild
+            load: Builds the (validated) value; runs on the watcher thread later
+
+        Returns:
+            The shared ConfigSource
+        """
+        source = self._sources.get(name)
+        if source is not None:
+            # The watcher may be off or between polls; unchanged files cost a stat
+            source.refresh()
+            return source
+
+        with self._lock:
+            source = self._sources.get(name)
+            if source is None:
+                source = ConfigSource(name, paths, load)
+                source.refresh(force=True)
+                self._sources[name] = source
+
+        if self.watch:
+            self.start()
+        return source
+
+    def json_file(
+        self,
+        path: PathLike,
+        default: Optional[Callable[[], Any]] = None
+    ) -> ConfigSource:
+        """Shared snapshot of a JSON file; `default()` is used while it doesn't exist."""
+        return self._file_source('json', Path(path), _load_json, default)
+
+    def yaml_file(
+        self,
+        path: PathLike,
+        default: Optional[Callable[[], Any]] = None
+    ) -> ConfigSource:
+        """Shared snapshot of a YAML file; `default()` is used while it doesn't exist."""
+        return self._file_source('yaml', Path(path), _load_yaml, default)
+
+    def _file_source(
+        self,
+        kind: str,
+        path: Path,
+        parse: Callable[[Path], Any],
+        default: Optional[Callable[[], Any]]
+    ) -> ConfigSource:
+        path = path.resolve()
+
+        def load() -> Any:
+            if default is not None and not path.exists():
+                return default()
+            return parse(path)
+
+        return self.register(f"{kind}:{path}", [path], load)
+
+    def source(self, name: str) -> Optional[ConfigSource]:
+        """Registered source by name."""
+        return self._sources.get(name)
+
+    def refresh(self, name: Optional[str] = None, force: bool = False) -> List[str]:
+        """
+        Rebuild changed sources now (all sources if `name` is None).
+
+        Writers call this after saving a file so readers don't wait for the
+        next poll. Returns the names of sources that published a new snapshot.
+        """
+        sources = [self._sources[name]] if name is not None else list(self._sources.values())
+        return [source.name for source in sources if source.refresh(force=force)]
+
+    def start(self) -> None:
+        """Start the background watcher (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="cortex-config-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background watcher."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=self.poll_interval + 1.0)
+        self._thread = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Config watcher check failed: {e}")
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Version, age and failure count per source."""
+        now = time.time()
+        return {
+            name: {
+                'version': source.current.version,
+                'age_seconds': round(now - source.current.loaded_at, 3),
+                'failures': source.failures,
+                'paths': [str(path) for path in source.paths],
+            }
+            for name, source in list(self._sources.items())
+        }
+
+
+# Global runtime shared by all configuration consumers
+_global_runtime: Optional[ConfigRuntime] = None
+_global_runtime_lock = threading.Lock()
+
+
+def get_config_runtime() -> ConfigRuntime:
+    """Get the global configuration runtime (singleton)."""
+    global _global_runtime
+    if _global_runtime is None:
+        with _global_runtime_lock:
+            if _global_runtime is None:
+                _global_runtime = ConfigRuntime()
+    return _global_runtime
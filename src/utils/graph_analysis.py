@@ -0,0 +1,537 @@
+"""
+CORTEX Graph Analysis - Strongly Connected Components and Layering
+
+Reusable directed-graph engine for dependency analysis (module imports,
+workflow stage DAGs, crawler import graphs):
+
+- Iterative Tarjan SCC: O(V + E), no recursion limit on deep graphs
+- Condensation DAG: one node per SCC, so cycles never block layering
+- Longest-path layering over the condensation (layer 0 = nothing depends on it)
+- Incremental edge insertion and deletion that keeps the SCCs current
+  without recomputing the whole graph
+- Afferent/efferent coupling, instability and degree centrality in one pass
+
+Layering and metrics read edges as dependent -> dependency (importer ->
+imported). topological_order() lists sources first, so a workflow graph
+built as dependency -> stage yields the execution order directly.
+
+Usage:
+    graph = DirectedGraph()
+    graph.add_edge("app", "models")
+    graph.add_edge("models", "app")      # creates a cycle
+    graph.cycles()                       # [['app', 'models']]
+    graph.layers()                       # [['app', 'models']]
+    graph.metrics()["models"].instability
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+Node = Hashable
+
+
+@dataclass
+class NodeMetrics:
+    """Coupling and centrality metrics for one node."""
+    afferent: int  # Ca: distinct nodes depending on this one
+    efferent: int  # Ce: distinct nodes this one depends on
+    instability: float  # I = Ce / (Ca + Ce), 0.0 when isolated
+    degree_centrality: float  # (Ca + Ce) / (V - 1)
+    layer: int
+    component_size: int
+
+
+class DirectedGraph:
+    """
+    Directed multigraph with lazily built, incrementally maintained SCCs.
+
+    Parallel edges are counted so that removing one import of a module that
+    is imported twice keeps the dependency. Node iteration order is
+    insertion order, and all results are deterministic for a given
+    insertion sequence.
+    """
+
+    def __init__(self, edges: Iterable[Tuple[Node, Node]] = (), nodes: Iterable[Node] = ()):
+        self._succ: Dict[Node, Dict[Node, int]] = {}
+        self._pred: Dict[Node, Dict[Node, int]] = {}
+
+        # SCC state (built on first query, then maintained per edge change)
+        self._built = False
+        self._comp_of: Dict[Node, int] = {}
+        self._members: Dict[int, List[Node]] = {}
+        self._comp_succ: Dict[int, Dict[int, int]] = {}
+        self._comp_pred: Dict[int, Dict[int, int]] = {}
+        self._next_comp = 0
+
+        # Layer state (rebuilt lazily when an update may lower a layer)
+        self._layer: Dict[int, int] = {}
+        self._layers_valid = False
+
+        for node in nodes:
+            self.add_node(node)
+        for source, target in edges:
+            self.add_edge(source, target)
+
+    # ============ Structure ============
+
+    def __len__(self) -> int:
+        return len(self._succ)
+
+    def __contains__(self, node: Node) -> bool:
+        return node in self._succ
+
+    @property
+    def nodes(self) -> List[Node]:
+        return list(self._succ)
+
+    def edges(self) -> List[Tuple[Node, Node]]:
+        """Distinct edges (parallel edges reported once)."""
+        return [(source, target) for source, targets in self._succ.items() for target in targets]
+
+    def successors(self, node: Node) -> List[Node]:
+        return list(self._succ.get(node, ()))
+
+    def predecessors(self, node: Node) -> List[Node]:
+        return list(self._pred.get(node, ()))
+
+    def has_edge(self, source: Node, target: Node) -> bool:
+        return target in self._succ.get(source, ())
+
+    def add_node(self, node: Node) -> None:
+        if node in self._succ:
+            return
+        self._succ[node] = {}
+        self._pred[node] = {}
+        if self._built:
+            comp = self._new_component([node])
+            self._layer[comp] = 0
+
+    def add_edge(self, source: Node, target: Node) -> None:
+        """Add an edge, merging SCCs if it closes a cycle."""
+        self.add_node(source)
+        self.add_node(target)
+        count = self._succ[source].get(target, 0)
+        self._succ[source][target] = count + 1
+        self._pred[target][source] = count + 1
+        if self._built and count == 0:
+            self._link(self._comp_of[source], self._comp_of[target])
+
+    def remove_edge(self, source: Node, target: Node) -> None:
+        """Remove one occurrence of an edge, splitting its SCC if the cycle breaks."""
+        count = self._succ.get(source, {}).get(target, 0)
+        if not count:
+            raise KeyError(f"No edge {source!r} -> {target!r}")
+        if count > 1:
+            self._succ[source][target] = count - 1
+            self._pred[target][source] = count - 1
+            return
+        del self._succ[source][target]
+        del self._pred[target][source]
+        if self._built:
+            self._unlink(self._comp_of[source], self._comp_of[target])
+
+    def remove_node(self, node: Node) -> None:
+        """Remove a node and all its edges."""
+        if node not in self._succ:
+            raise KeyError(f"No node {node!r}")
+        for target in list(self._succ[node]):
+            self._succ[node][target] = 1
+            self._pred[target][node] = 1
+            self.remove_edge(node, target)
+        for source in list(self._pred[node]):
+            self._succ[source][node] = 1
+            self._pred[node][source] = 1
+            self.remove_edge(source, node)
+        del self._succ[node]
+        del self._pred[node]
+        if self._built:
+            comp = self._comp_of.pop(node)
+            self._drop_component(comp)
+
+    # ============ Queries ============
+
+    def strongly_connected_components(self) -> List[List[Node]]:
+        """SCCs in topological order of the condensation (dependents first)."""
+        self._ensure_built()
+        return [list(self._members[comp]) for comp in self._topological_components()]
+
+    def component_of(self, node: Node) -> List[Node]:
+        """Members of the SCC containing node."""
+        self._ensure_built()
+        return list(self._members[self._comp_of[node]])
+
+    def cycles(self) -> List[List[Node]]:
+        """SCCs that contain a cycle (more than one member, or a self-loop)."""
+        self._ensure_built()
+        return [
+            list(self._members[comp]) for comp in self._topological_components()
+            if self._is_cyclic(comp)
+        ]
+
+    def is_acyclic(self) -> bool:
+        self._ensure_built()
+        return not any(self._is_cyclic(comp) for comp in self._members)
+
+    def cycle_path(self, node: Node) -> Optional[List[Node]]:
+        """
+        A shortest concrete cycle through node, as [node, ..., node].
+
+        Returns None when node is not on a cycle. The search stays inside
+        the node's SCC, so it is bounded by the component size.
+        """
+        self._ensure_built()
+        comp = self._comp_of[node]
+        if node in self._succ[node]:
+            return [node, node]
+        if len(self._members[comp]) < 2:
+            return None
+        parent: Dict[Node, Node] = {}
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for target in self._succ[current]:
+                if self._comp_of[target] != comp:
+                    continue
+                if target == node:
+                    path = [current]
+                    while path[-1] != node:
+                        path.append(parent[path[-1]])
+                    return path[::-1] + [node]
+                if target not in parent:
+                    parent[target] = current
+                    queue.append(target)
+        return None
+
+    def condensation(self) -> Tuple[List[List[Node]], List[Tuple[int, int]]]:
+        """
+        Condensation DAG.
+
+        Returns:
+            (components, edges) where components are in topological order
+            and edges are (i, j) index pairs into that list
+        """
+        self._ensure_built()
+        order = self._topological_components()
+        index = {comp: i for i, comp in enumerate(order)}
+        edges = [
+            (index[comp], index[target])
+            for comp in order for target in self._comp_succ[comp]
+        ]
+        return [list(self._members[comp]) for comp in order], edges
+
+    def layers(self) -> List[List[Node]]:
+        """
+        Longest-path layering of the condensation.
+
+        Layer 0 holds nodes nothing depends on; every node sits one layer
+        below its deepest dependent. Members of a cycle share a layer.
+        """
+        self._ensure_layers()
+        if not self._layer:
+            return []
+        result: List[List[Node]] = [[] for _ in range(max(self._layer.values()) + 1)]
+        for node in self._succ:
+            result[self._layer[self._comp_of[node]]].append(node)
+        return result
+
+    def layer_of(self, node: Node) -> int:
+        self._ensure_layers()
+        return self._layer[self._comp_of[node]]
+
+    def topological_order(self) -> List[Node]:
+        """
+        Nodes with every dependent before its dependencies.
+
+        Raises:
+            ValueError: If the graph contains a cycle
+        """
+        self._ensure_built()
+        cyclic = self.cycles()
+        if cyclic:
+            raise ValueError(f"Graph contains {len(cyclic)} cycle(s): {cyclic[0]}")
+        return [node for comp in self._topological_components() for node in self._members[comp]]
+
+    def metrics(self) -> Dict[Node, NodeMetrics]:
+        """Coupling, instability, degree centrality, layer and SCC size per node."""
+        self._ensure_layers()
+        scale = 1.0 / (len(self._succ) - 1) if len(self._succ) > 1 else 0.0
+        result = {}
+        for node, targets in self._succ.items():
+            efferent = len(targets)
+            afferent = len(self._pred[node])
+            total = afferent + efferent
+            comp = self._comp_of[node]
+            result[node] = NodeMetrics(
+                afferent=afferent,
+                efferent=efferent,
+                instability=efferent / total if total else 0.0,
+                degree_centrality=total * scale,
+                layer=self._layer[comp],
+                component_size=len(self._members[comp])
+            )
+        return result
+
+    # ============ Tarjan ============
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._comp_of.clear()
+        self._members.clear()
+        self._comp_succ.clear()
+        self._comp_pred.clear()
+        for members in _tarjan(self._succ, self._succ):
+            self._new_component(members)
+        for comp in list(self._members):
+            self._rebuild_component_edges(comp)
+        self._built = True
+        self._layers_valid = False
+
+    def _new_component(self, members: List[Node]) -> int:
+        comp = self._next_comp
+        self._next_comp += 1
+        self._members[comp] = members
+        self._comp_succ[comp] = {}
+        self._comp_pred[comp] = {}
+        for node in members:
+            self._comp_of[node] = comp
+        return comp
+
+    def _rebuild_component_edges(self, comp: int) -> None:
+        """Count condensation edges leaving comp (edges into comp come from the other side)."""
+        for node in self._members[comp]:
+            for target in self._succ[node]:
+                target_comp = self._comp_of[target]
+                if target_comp != comp:
+                    self._add_comp_edge(comp, target_comp)
+
+    def _add_comp_edge(self, comp: int, target: int) -> None:
+        self._comp_succ[comp][target] = self._comp_succ[comp].get(target, 0) + 1
+        self._comp_pred[target][comp] = self._comp_succ[comp][target]
+
+    def _drop_component(self, comp: int) -> None:
+        for target in self._comp_succ.pop(comp):
+            del self._comp_pred[target][comp]
+        for source in self._comp_pred.pop(comp):
+            del self._comp_succ[source][comp]
+        del self._members[comp]
+        self._layer.pop(comp, None)
+
+    def _is_cyclic(self, comp: int) -> bool:
+        members = self._members[comp]
+        return len(members) > 1 or members[0] in self._succ[members[0]]
+
+    def _topological_components(self) -> List[int]:
+        """Kahn's algorithm over the condensation, ties broken by node insertion order."""
+        position = {node: i for i, node in enumerate(self._succ)}
+        in_degree = {comp: len(preds) for comp, preds in self._comp_pred.items()}
+        roots = [comp for comp in self._members if not in_degree[comp]]
+        roots.sort(key=lambda comp: min(position[node] for node in self._members[comp]))
+        queue = deque(roots)
+        order = []
+        while queue:
+            comp = queue.popleft()
+            order.append(comp)
+            for target in self._comp_succ[comp]:
+                in_degree[target] -= 1
+                if not in_degree[target]:
+                    queue.append(target)
+        return order
+
+    # ============ Incremental maintenance ============
+
+    def _link(self, source: int, target: int) -> None:
+        """A new distinct edge between nodes of components source and target."""
+        if source == target:
+            return
+        if target in self._comp_succ[source]:
+            self._add_comp_edge(source, target)
+            return
+
+        # With valid layers, a path target -> ... -> source needs
+        # layer(target) < layer(source); otherwise no cycle can close
+        bound = self._layer[source] if self._layers_valid else None
+        if bound is not None and self._layer[target] >= bound:
+            merged = None
+        else:
+            merged = self._cycle_components(source, target, bound)
+
+        if not merged:
+            self._add_comp_edge(source, target)
+            if self._layers_valid:
+                self._raise_layers(target, self._layer[source] + 1)
+            return
+
+        # Collapse every component on a target -> source path into one
+        members = [node for comp in merged for node in self._members[comp]]
+        for comp in merged:
+            self._drop_component(comp)
+        comp = self._new_component(members)
+        self._rebuild_component_edges(comp)
+        for node in members:
+            for pred in self._pred[node]:
+                pred_comp = self._comp_of[pred]
+                if pred_comp != comp:
+                    self._add_comp_edge(pred_comp, comp)
+        self._layers_valid = False
+
+    def _cycle_components(self, source: int, target: int, bound: Optional[int]) -> List[int]:
+        """Components on paths target -> ... -> source (empty if source is unreachable)."""
+        forward = {target}
+        stack = [target]
+        while stack:
+            comp = stack.pop()
+            for succ in self._comp_succ[comp]:
+                if succ in forward or (bound is not None and self._layer[succ] > bound):
+                    continue
+                forward.add(succ)
+                stack.append(succ)
+        if source not in forward:
+            return []
+
+        backward = {source}
+        stack = [source]
+        while stack:
+            comp = stack.pop()
+            for pred in self._comp_pred[comp]:
+                if pred in forward and pred not in backward:
+                    backward.add(pred)
+                    stack.append(pred)
+        return sorted(backward)
+
+    def _unlink(self, source: int, target: int) -> None:
+        """The last edge between two nodes was removed."""
+        if source != target:
+            count = self._comp_succ[source][target] - 1
+            if count:
+                self._comp_succ[source][target] = count
+                self._comp_pred[target][source] = count
+            else:
+                del self._comp_succ[source][target]
+                del self._comp_pred[target][source]
+                if self._layers_valid and self._layer[target] == self._layer[source] + 1:
+                    self._layers_valid = False
+            return
+
+        members = self._members[source]
+        if len(members) == 1:
+            return
+
+        # Re-run Tarjan inside the component only; it may split
+        inside = set(members)
+        parts = _tarjan(members, self._succ, inside)
+        if len(parts) == 1:
+            return
+        self._drop_component(source)
+        new = [self._new_component(part) for part in parts]
+        for comp in new:
+            self._rebuild_component_edges(comp)
+        for comp in new:
+            for node in self._members[comp]:
+                for pred in self._pred[node]:
+                    if self._comp_of[pred] not in new:
+                        self._add_comp_edge(self._comp_of[pred], comp)
+        self._layers_valid = False
+
+    # ============ Layers ============
+
+    def _ensure_layers(self) -> None:
+        self._ensure_built()
+        if self._layers_valid:
+            return
+        self._layer = {comp: 0 for comp in self._members}
+        for comp in self._topological_components():
+            next_layer = self._layer[comp] + 1
+            for target in self._comp_succ[comp]:
+                if self._layer[target] < next_layer:
+                    self._layer[target] = next_layer
+        self._layers_valid = True
+
+    def _raise_layers(self, comp: int, layer: int) -> None:
+        """Push comp (and everything below it) down to at least layer."""
+        if self._layer[comp] >= layer:
+            return
+        self._layer[comp] = layer
+        stack = [comp]
+        while stack:
+            current = stack.pop()
+            next_layer = self._layer[current] + 1
+            for target in self._comp_succ[current]:
+                if self._layer[target] < next_layer:
+                    self._layer[target] = next_layer
+                    stack.append(target)
+
+
+def _tarjan(
+    roots: Iterable[Node],
+    succ: Dict[Node, Dict[Node, int]],
+    within: Optional[Set[Node]] = None
+) -> List[List[Node]]:
+    """
+    Iterative Tarjan SCC.
+
+    Args:
+        roots: Nodes to start from (in order)
+        succ: Adjacency map
+        within: Restrict the search to these nodes
+
+    Returns:
+        Components in reverse topological order (dependencies first),
+        members in discovery order
+    """
+    index: Dict[Node, int] = {}
+    low: Dict[Node, int] = {}
+    on_stack: Set[Node] = set()
+    stack: List[Node] = []
+    components: List[List[Node]] = []
+    counter = 0
+
+    for root in roots:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(succ[root]))]
+
+        while work:
+            node, neighbours = work[-1]
+            advanced = False
+            for target in neighbours:
+                if within is not None and target not in within:
+                    continue
+                if target not in index:
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(succ[target])))
+                    advanced = True
+                    break
+                if target in on_stack and index[target] < low[node]:
+                    low[node] = index[target]
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                component.reverse()
+                components.append(component)
+
+    return components
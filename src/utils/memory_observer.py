@@ -0,0 +1,529 @@
+"""
+CORTEX Memory Observer
+
+Low-overhead memory observability for long-running brain processes.
+Replaces always-on tracemalloc (which slows every allocation for the life
+of the process) with sampling:
+
+- Every interval: RSS (psutil, /proc/self/statm as fallback), gc
+  generation counts and object counts of registered caches. This costs
+  microseconds.
+- Every `trace_every` intervals: a short tracemalloc window. Tracing is
+  switched on, two snapshots bracket the window, and tracing is switched
+  off again. The snapshot diff is attributed to components by module path
+  (src/tier2/... -> "tier2"), giving net allocation growth per component.
+  The window is capped to `max_trace_duty` of the time, so tracing cost
+  stays within that share of runtime.
+- Pressure signals: each sample maps RSS onto MemoryPressure levels.
+  Listeners are notified on HIGH/CRITICAL or on a level change, and
+  registered caches are shrunk (oldest entries first) under pressure.
+
+Caches register themselves by owner and attribute; the registry only
+holds weak references, so tracking never keeps a cache alive:
+
+    track_cache("context_cache", self, attr="cache")
+    track_cache("query_cache", engine, attr="cache", shrink="shrink")
+
+Example:
+    observer = MemoryObserver(interval_seconds=30)
+    observer.add_pressure_listener(lambda signal: print(signal.level))
+    observer.start()
+    observer.attribution          # {'tier2': ComponentGrowth(...), ...}
+    observer.stats()['trace_duty'] # 0.008
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import gc
+import itertools
+import logging
+import math
+import os
+import sysconfig
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryPressure(Enum):
+    """Memory pressure levels."""
+    LOW = "low"        # <100MB usage
+    MEDIUM = "medium"  # 100-300MB usage
+    HIGH = "high"      # 300-500MB usage
+    CRITICAL = "critical"  # >500MB usage
+
+
+PRESSURE_ORDER = [MemoryPressure.LOW, MemoryPressure.MEDIUM, MemoryPressure.HIGH, MemoryPressure.CRITICAL]
+
+DEFAULT_THRESHOLDS = {
+    MemoryPressure.MEDIUM: 300 * 1024 * 1024,
+    MemoryPressure.HIGH: 500 * 1024 * 1024,
+    MemoryPressure.CRITICAL: 700 * 1024 * 1024,
+}
+
+# Share of each registered cache dropped when pressure reaches a level
+DEFAULT_SHRINK_FRACTIONS = {
+    MemoryPressure.HIGH: 0.25,
+    MemoryPressure.CRITICAL: 0.5,
+}
+
+# (module path prefix below src/, component); first match wins. Modules
+# without an entry fall back to their top-level package under src/.
+DEFAULT_COMPONENTS: Tuple[Tuple[str, str], ...] = (
+    ("operations/modules/brain/query_cache", "query_cache"),
+    ("core/context_management/", "context"),
+    ("response_templates/", "templates"),
+    ("operations/modules/questions/template_", "templates"),
+    ("tier1/", "tier1"),
+    ("tier2/", "tier2"),
+    ("tier3/", "tier3"),
+)
+
+
+def pressure_level(rss_bytes: int, thresholds: Dict[MemoryPressure, int]) -> MemoryPressure:
+    """Highest pressure level whose threshold rss_bytes reaches"""
+    for level in reversed(PRESSURE_ORDER[1:]):
+        if level in thresholds and rss_bytes >= thresholds[level]:
+            return level
+    return MemoryPressure.LOW
+
+
+def read_rss() -> int:
+    """Resident set size of this process in bytes (0 if unavailable)"""
+    if PSUTIL_AVAILABLE:
+        try:
+            return _process().memory_info().rss
+        except Exception:
+            pass
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+_PROCESS = None
+
+
+def _process():
+    global _PROCESS
+    if _PROCESS is None or _PROCESS.pid != os.getpid():
+        _PROCESS = psutil.Process()
+    return _PROCESS
+
+
+# ============ Cache registry ============
+
+@dataclass
+class _TrackedCache:
+    name: str
+    owner: weakref.ref
+    attr: str
+    shrink: Optional[str]
+
+
+class CacheRegistry:
+    """Weakly referenced caches whose sizes are sampled and shrunk under pressure"""
+
+    def __init__(self):
+        self._caches: Dict[Tuple[int, str], _TrackedCache] = {}
+        self._lock = threading.Lock()
+
+    def track(self, name: str, owner: Any, attr: str = "cache", shrink: Optional[str] = None) -> None:
+        """
+        Track owner.<attr> under `name`.
+
+        Args:
+            name: Cache name; caches sharing a name are summed
+            owner: Object holding the cache (weakly referenced)
+            attr: Attribute holding a sized mapping
+            shrink: Name of an owner method taking a fraction and returning
+                entries removed; defaults to dropping the oldest entries
+        """
+        key = (id(owner), attr)
+        ref = weakref.ref(owner, lambda _, key=key: self._forget(key))
+        with self._lock:
+            self._caches[key] = _TrackedCache(name, ref, attr, shrink)
+
+    def _forget(self, key: Tuple[int, str]) -> None:
+        with self._lock:
+            self._caches.pop(key, None)
+
+    def _live(self) -> List[Tuple[_TrackedCache, Any]]:
+        with self._lock:
+            tracked = list(self._caches.values())
+        return [(entry, owner) for entry in tracked if (owner := entry.owner()) is not None]
+
+    def counts(self) -> Dict[str, int]:
+        """Entries per cache name"""
+        counts: Dict[str, int] = {}
+        for entry, owner in self._live():
+            try:
+                size = len(getattr(owner, entry.attr))
+            except (AttributeError, TypeError):
+                continue
+            counts[entry.name] = counts.get(entry.name, 0) + size
+        return counts
+
+    def shrink(self, fraction: float) -> Dict[str, int]:
+        """Drop `fraction` of every tracked cache; returns entries removed per name"""
+        removed: Dict[str, int] = {}
+        for entry, owner in self._live():
+            try:
+                if entry.shrink:
+                    count = getattr(owner, entry.shrink)(fraction)
+                else:
+                    count = _drop_oldest(getattr(owner, entry.attr), fraction)
+            except Exception as e:
+                logger.warning(f"Failed to shrink cache {entry.name}: {e}")
+                continue
+            removed[entry.name] = removed.get(entry.name, 0) + count
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._live())
+
+
+def _drop_oldest(mapping: Any, fraction: float) -> int:
+    """Remove the first (oldest-inserted) share of a mapping's keys"""
+    count = math.ceil(len(mapping) * fraction)
+    try:
+        keys = list(itertools.islice(iter(mapping), count))
+    except RuntimeError:
+        return 0  # Mutated concurrently; the next signal retries
+    for key in keys:
+        mapping.pop(key, None)
+    return len(keys)
+
+
+CACHES = CacheRegistry()
+
+
+def track_cache(name: str, owner: Any, attr: str = "cache", shrink: Optional[str] = None) -> None:
+    """Register a cache with the process-wide registry (see CacheRegistry.track)"""
+    CACHES.track(name, owner, attr, shrink)
+
+
+# ============ Samples and signals ============
+
+@dataclass
+class MemorySample:
+    """Cheap periodic reading"""
+    timestamp: float
+    rss_bytes: int
+    gc_counts: Tuple[int, int, int]
+    caches: Dict[str, int]
+    pressure: MemoryPressure
+
+
+@dataclass
+class ComponentGrowth:
+    """Allocation growth attributed to one component across trace windows"""
+    component: str
+    last_bytes: int = 0           # Net bytes still allocated at the end of the last window
+    last_blocks: int = 0
+    rate_bytes_per_sec: float = 0.0  # Exponentially weighted across windows
+    windows: Deque[int] = field(default_factory=lambda: deque(maxlen=3))
+
+
+@dataclass
+class PressureSignal:
+    """Emitted to listeners when pressure is high or changes level"""
+    level: MemoryPressure
+    previous: MemoryPressure
+    rss_bytes: int
+    rss_growth_bytes_per_min: float
+    top_components: List[Tuple[str, int]]
+    caches: Dict[str, int]
+    shrunk: Dict[str, int] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+class MemoryObserver:
+    """
+    Sampled memory observer.
+
+    Args:
+        interval_seconds: Time between cheap samples
+        trace_every: Run a tracemalloc window every N samples (0 disables)
+        trace_window_seconds: Length of each tracing window
+        max_trace_duty: Upper bound on the share of time spent tracing;
+            longer windows are clipped to it
+        thresholds: RSS bytes at which each MemoryPressure level starts
+        components: (path prefix under src/, component) attribution rules
+        shrink_fractions: Cache share dropped at each pressure level
+        shrink_cooldown_seconds: Minimum time between cache shrinks
+        registry: Cache registry to sample (process-wide by default)
+    """
+
+    def __init__(self, interval_seconds: float = 30.0, trace_every: int = 10,
+                 trace_window_seconds: float = 1.0, max_trace_duty: float = 0.01,
+                 thresholds: Optional[Dict[MemoryPressure, int]] = None,
+                 components: Sequence[Tuple[str, str]] = DEFAULT_COMPONENTS,
+                 shrink_fractions: Optional[Dict[MemoryPressure, float]] = None,
+                 shrink_cooldown_seconds: float = 60.0, history: int = 120,
+                 registry: Optional[CacheRegistry] = None):
+        self.interval_seconds = interval_seconds
+        self.trace_every = trace_every
+        cycle = interval_seconds * max(trace_every, 1)
+        self.trace_window_seconds = min(trace_window_seconds, cycle * max_trace_duty)
+        self.thresholds = dict(thresholds if thresholds is not None else DEFAULT_THRESHOLDS)
+        self.components = tuple(components)
+        self.shrink_fractions = dict(shrink_fractions if shrink_fractions is not None
+                                     else DEFAULT_SHRINK_FRACTIONS)
+        self.shrink_cooldown_seconds = shrink_cooldown_seconds
+        self.registry = registry if registry is not None else CACHES
+
+        self.samples: Deque[MemorySample] = deque(maxlen=history)
+        self.attribution: Dict[str, ComponentGrowth] = {}
+        self.windows_traced = 0
+        self.last_signal: Optional[PressureSignal] = None
+
+        self._listeners: List[Callable[[PressureSignal], None]] = []
+        self._component_cache: Dict[str, str] = {}
+        self._level = MemoryPressure.LOW
+        self._last_shrink = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+        # Cost accounting, so the overhead claim can be checked in production
+        self._started_at: Optional[float] = None
+        self._sample_seconds = 0.0
+        self._trace_seconds = 0.0
+
+        stdlib = sysconfig.get_paths().get("stdlib", "")
+        self._stdlib_prefix = stdlib.replace("\\", "/") + "/" if stdlib else None
+
+    # ============ Lifecycle ============
+
+    def start(self) -> None:
+        if self.thread and self.thread.is_alive():
+            return
+        self._stop.clear()
+        self._started_at = time.perf_counter()
+        self._sample_seconds = self._trace_seconds = 0.0
+        self.thread = threading.Thread(target=self._run, name="memory-observer", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self.thread:
+            self.thread.join(timeout=timeout)
+        self.thread = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self.thread and self.thread.is_alive())
+
+    def _run(self) -> None:
+        ticks = 0
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                ticks += 1
+                if self.trace_every and ticks % self.trace_every == 0:
+                    self.trace_window()
+                self._signal(self.sample())
+            except Exception as e:
+                logger.error(f"Memory observer error: {e}")
+
+    # ============ Sampling ============
+
+    def sample(self) -> MemorySample:
+        """Take a cheap reading (RSS, gc counts, cache sizes)"""
+        started = time.perf_counter()
+        rss = read_rss()
+        sample = MemorySample(
+            timestamp=time.time(),
+            rss_bytes=rss,
+            gc_counts=gc.get_count(),
+            caches=self.registry.counts(),
+            pressure=pressure_level(rss, self.thresholds),
+        )
+        with self._lock:
+            self.samples.append(sample)
+        self._sample_seconds += time.perf_counter() - started
+        return sample
+
+    def latest(self, max_age: float = 1.0) -> MemorySample:
+        """Most recent sample, re-sampling if it is older than max_age seconds"""
+        with self._lock:
+            sample = self.samples[-1] if self.samples else None
+        if sample is None or time.time() - sample.timestamp > max_age:
+            sample = self.sample()
+        return sample
+
+    def pressure(self, max_age: float = 1.0) -> MemoryPressure:
+        return self.latest(max_age).pressure
+
+    def rss_growth_per_minute(self) -> float:
+        """RSS slope across the sample history"""
+        with self._lock:
+            if len(self.samples) < 2:
+                return 0.0
+            first, last = self.samples[0], self.samples[-1]
+        elapsed = last.timestamp - first.timestamp
+        return (last.rss_bytes - first.rss_bytes) / elapsed * 60 if elapsed > 0 else 0.0
+
+    # ============ Attribution ============
+
+    def trace_window(self, seconds: Optional[float] = None) -> Dict[str, ComponentGrowth]:
+        """
+        Trace allocations for a short window and attribute the net growth.
+
+        Leaves tracing alone if someone else already started tracemalloc.
+        Blocks the calling thread for the window.
+        """
+        seconds = self.trace_window_seconds if seconds is None else seconds
+        started = time.perf_counter()
+        owned = not tracemalloc.is_tracing()
+        if owned:
+            tracemalloc.start(1)
+        try:
+            before = tracemalloc.take_snapshot()
+            self._stop.wait(seconds)
+            after = tracemalloc.take_snapshot()
+        finally:
+            if owned:
+                tracemalloc.stop()
+        traced = time.perf_counter() - started
+        self._trace_seconds += traced
+
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        diffs = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+
+        window_bytes: Dict[str, int] = {}
+        window_blocks: Dict[str, int] = {}
+        for stat in diffs:
+            component = self.component_for(stat.traceback[0].filename)
+            window_bytes[component] = window_bytes.get(component, 0) + stat.size_diff
+            window_blocks[component] = window_blocks.get(component, 0) + stat.count_diff
+
+        with self._lock:
+            for component in set(window_bytes) | set(self.attribution):
+                growth = self.attribution.setdefault(component, ComponentGrowth(component))
+                growth.last_bytes = window_bytes.get(component, 0)
+                growth.last_blocks = window_blocks.get(component, 0)
+                rate = growth.last_bytes / max(traced, 1e-6)
+                growth.rate_bytes_per_sec = rate if not growth.windows else 0.3 * rate + 0.7 * growth.rate_bytes_per_sec
+                growth.windows.append(growth.last_bytes)
+            self.windows_traced += 1
+            return dict(self.attribution)
+
+    def component_for(self, filename: str) -> str:
+        """Component owning a source file, by module path"""
+        component = self._component_cache.get(filename)
+        if component is not None:
+            return component
+
+        path = filename.replace("\\", "/")
+        if path.startswith("<"):
+            component = "interpreter"
+        elif "/site-packages/" in path or "/dist-packages/" in path:
+            component = "third_party"
+        elif "/src/" in path or path.startswith("src/"):
+            relative = path.split("src/", 1)[1] if path.startswith("src/") else path.rsplit("/src/", 1)[1]
+            component = next((name for prefix, name in self.components if relative.startswith(prefix)), None)
+            if component is None:
+                parts = relative.split("/")
+                if parts[:2] == ["operations", "modules"] and len(parts) > 3:
+                    component = f"operations.{parts[2]}"
+                else:
+                    component = parts[0][:-3] if parts[0].endswith(".py") else parts[0]
+        elif self._stdlib_prefix and path.startswith(self._stdlib_prefix):
+            component = "stdlib"
+        else:
+            component = "other"
+
+        self._component_cache[filename] = component
+        return component
+
+    def top_components(self, limit: int = 5) -> List[Tuple[str, int]]:
+        """Components with the most net growth in the last window"""
+        with self._lock:
+            ranked = sorted(((g.component, g.last_bytes) for g in self.attribution.values()),
+                            key=lambda item: item[1], reverse=True)
+        return [item for item in ranked[:limit] if item[1] > 0]
+
+    def sustained_growth(self, min_bytes: int = 64 * 1024) -> List[str]:
+        """Components that grew by at least min_bytes in each of the last windows"""
+        with self._lock:
+            return sorted(
+                g.component for g in self.attribution.values()
+                if len(g.windows) == g.windows.maxlen and min(g.windows) >= min_bytes
+            )
+
+    # ============ Pressure signals ============
+
+    def add_pressure_listener(self, listener: Callable[[PressureSignal], None]) -> None:
+        self._listeners.append(listener)
+
+    def _signal(self, sample: MemorySample) -> Optional[PressureSignal]:
+        previous, self._level = self._level, sample.pressure
+        high = PRESSURE_ORDER.index(sample.pressure) >= PRESSURE_ORDER.index(MemoryPressure.HIGH)
+        if not high and sample.pressure == previous:
+            return None
+
+        signal = PressureSignal(
+            level=sample.pressure,
+            previous=previous,
+            rss_bytes=sample.rss_bytes,
+            rss_growth_bytes_per_min=self.rss_growth_per_minute(),
+            top_components=self.top_components(),
+            caches=sample.caches,
+        )
+
+        fraction = self.shrink_fractions.get(sample.pressure)
+        now = time.monotonic()
+        if fraction and now - self._last_shrink >= self.shrink_cooldown_seconds:
+            signal.shrunk = self.registry.shrink(fraction)
+            self._last_shrink = now
+            logger.info(f"Memory pressure {sample.pressure.value}: shrank caches {signal.shrunk}")
+
+        self.last_signal = signal
+        for listener in list(self._listeners):
+            try:
+                listener(signal)
+            except Exception as e:
+                logger.error(f"Memory pressure listener failed: {e}")
+        return signal
+
+    # ============ Reporting ============
+
+    def stats(self) -> Dict[str, Any]:
+        """Latest reading, attribution and the observer's own cost"""
+        latest = self.samples[-1] if self.samples else None
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            'rss_mb': round(latest.rss_bytes / (1024 * 1024), 2) if latest else None,
+            'pressure': latest.pressure.value if latest else None,
+            'rss_growth_kb_per_min': round(self.rss_growth_per_minute() / 1024, 1),
+            'caches': latest.caches if latest else self.registry.counts(),
+            'component_growth_kb_per_sec': {
+                g.component: round(g.rate_bytes_per_sec / 1024, 2) for g in self.attribution.values()
+            },
+            'sustained_growth': self.sustained_growth(),
+            'windows_traced': self.windows_traced,
+            'trace_duty': round(self._trace_seconds / elapsed, 4) if elapsed else 0.0,
+            'sample_seconds': round(self._sample_seconds, 4),
+        }
+
+
+__all__ = ['MemoryObserver', 'MemoryPressure', 'MemorySample', 'PressureSignal', 'ComponentGrowth',
+           'CacheRegistry', 'CACHES', 'track_cache', 'pressure_level', 'read_rss']
@@ -15,10 +15,10 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, List, Set, Tuple, Optional
 from dataclasses import dataclass, field
-import importlib.util
-import ast
 import yaml
 
+from src.discovery.symbol_index import SymbolIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,14 +55,28 @@ class ConflictDetector:
     2. Orphaned Wiring: YAML triggers pointing to non-existent modules
     3. Architectural Drift: Modules in wrong directory structure
     4. Missing Dependencies: Import statements that don't resolve
+    
+    All detectors query a SymbolIndex of src/ (refreshed once per run,
+    re-parsing only changed files) instead of walking the tree themselves.
     """
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, symbol_index: Optional[SymbolIndex] = None):
         """Initialize conflict detector."""
         self.project_root = project_root
         self.src_path = project_root / "src"
         self.brain_path = project_root / "cortex-brain"
         self.conflicts: List[Conflict] = []
+        self._symbol_index = symbol_index
+    
+    @property
+    def symbol_index(self) -> SymbolIndex:
+        if self._symbol_index is None:
+            self._symbol_index = SymbolIndex(self.project_root, self.src_path)
+        return self._symbol_index
+    
+    @staticmethod
+    def _is_private_or_test(py_file: Path) -> bool:
+        return py_file.stem.startswith("_") or "test_" in py_file.stem
     
     def detect_all_conflicts(self) -> List[Conflict]:
         """
@@ -74,6 +88,7 @@ class ConflictDetector:
         logger.info("🔍 Running conflict detection...")
         
         self.conflicts = []
+        self.symbol_index.refresh()
         
         # Run all detectors
         self._detect_duplicate_modules()
@@ -93,28 +108,12 @@ class ConflictDetector:
         """Detect duplicate module names across directories."""
         logger.debug("Checking for duplicate module names...")
         
-        # Scan all Python files for class definitions
         class_registry: Dict[str, List[Path]] = {}
         
-        for py_file in self.src_path.rglob("*.py"):
-            if py_file.stem.startswith("_") or "test_" in py_file.stem:
+        for symbol in self.symbol_index.classes(suffixes=('Orchestrator', 'Agent', 'Module', 'Handler')):
+            if self._is_private_or_test(symbol.file_path):
                 continue  # Skip private and test files
-            
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
-                        class_name = node.name
-                        if class_name.endswith(('Orchestrator', 'Agent', 'Module', 'Handler')):
-                            if class_name not in class_registry:
-                                class_registry[class_name] = []
-                            class_registry[class_name].append(py_file)
-            
-            except Exception as e:
-                logger.debug(f"Could not parse {py_file}: {e}")
-                continue
+            class_registry.setdefault(symbol.name, []).append(symbol.file_path)
         
         # Find duplicates
         for class_name, files in class_registry.items():
@@ -181,18 +180,13 @@ class ConflictDetector:
             ''.join(w.capitalize() for w in words) + 'Module',
         ]
         
-        # Search src/ for these class names
-        for py_file in self.src_path.rglob("*.py"):
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                for class_name in possible_names:
-                    if f"class {class_name}" in content:
-                        return True
-            
-            except Exception:
-                continue
+        # Index lookups: exact prefix (PlanAdoOrchestratorV2 counts), then
+        # normalized spelling (PlanADOOrchestrator, Plan_Ado_Orchestrator)
+        for class_name in possible_names:
+            if self.symbol_index.find_prefix(class_name, kind='class'):
+                return True
+            if self.symbol_index.find_normalized(class_name, kind='class'):
+                return True
         
         return False
     
@@ -220,86 +214,61 @@ class ConflictDetector:
             ]
         }
         
-        # Scan all Python files
-        for py_file in self.src_path.rglob("*.py"):
-            if py_file.stem.startswith("_") or "test_" in py_file.stem:
+        for symbol in self.symbol_index.classes(suffixes=expected_locations.keys()):
+            py_file = symbol.file_path
+            if self._is_private_or_test(py_file):
                 continue
+            class_name = symbol.name
             
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
-                        class_name = node.name
+            # Check if class matches expected pattern
+            for suffix, expected_dirs in expected_locations.items():
+                if class_name.endswith(suffix):
+                    # Check if file is in expected location
+                    in_correct_location = any(
+                        py_file.is_relative_to(expected_dir)
+                        for expected_dir in expected_dirs
+                        if expected_dir.exists()
+                    )
+                    
+                    if not in_correct_location:
+                        expected_str = ' or '.join(str(d.relative_to(self.project_root)) for d in expected_dirs if d.exists())
+                        actual_str = str(py_file.relative_to(self.project_root).parent)
                         
-                        # Check if class matches expected pattern
-                        for suffix, expected_dirs in expected_locations.items():
-                            if class_name.endswith(suffix):
-                                # Check if file is in expected location
-                                in_correct_location = any(
-                                    py_file.is_relative_to(expected_dir)
-                                    for expected_dir in expected_dirs
-                                    if expected_dir.exists()
-                                )
-                                
-                                if not in_correct_location:
-                                    expected_str = ' or '.join(str(d.relative_to(self.project_root)) for d in expected_dirs if d.exists())
-                                    actual_str = str(py_file.relative_to(self.project_root).parent)
-                                    
-                                    self.conflicts.append(Conflict(
-                                        conflict_type='drift',
-                                        severity='warning',
-                                        title=f"Architectural drift: {class_name}",
-                                        description=f"{class_name} should be in {expected_str} but found in {actual_str}",
-                                        affected_files=[py_file],
-                                        suggested_fix=f"Move {py_file.name} to one of: {expected_str}",
-                                        auto_fixable=True  # Can auto-generate move command
-                                    ))
-            
-            except Exception as e:
-                logger.debug(f"Could not parse {py_file}: {e}")
-                continue
+                        self.conflicts.append(Conflict(
+                            conflict_type='drift',
+                            severity='warning',
+                            title=f"Architectural drift: {class_name}",
+                            description=f"{class_name} should be in {expected_str} but found in {actual_str}",
+                            affected_files=[py_file],
+                            suggested_fix=f"Move {py_file.name} to one of: {expected_str}",
+                            auto_fixable=True  # Can auto-generate move command
+                        ))
     
     def _detect_missing_dependencies(self) -> None:
         """Detect import statements that don't resolve."""
         logger.debug("Checking for missing dependencies...")
         
-        # Scan all Python files for imports
-        for py_file in self.src_path.rglob("*.py"):
+        resolved: Dict[str, bool] = {}
+        
+        for ref in self.symbol_index.imports(prefix='src.'):
+            py_file = ref.file_path
             if py_file.stem.startswith("_"):
                 continue
             
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.Import, ast.ImportFrom)):
-                        # Get module name
-                        if isinstance(node, ast.Import):
-                            module_names = [alias.name for alias in node.names]
-                        else:
-                            module_names = [node.module] if node.module else []
-                        
-                        # Check if module can be resolved
-                        for module_name in module_names:
-                            if module_name and module_name.startswith('src.'):
-                                # Internal CORTEX import - verify it exists
-                                if not self._can_resolve_import(module_name):
-                                    self.conflicts.append(Conflict(
-                                        conflict_type='missing_dependency',
-                                        severity='critical',
-                                        title=f"Unresolved import: {module_name}",
-                                        description=f"{py_file.name} imports '{module_name}' which cannot be resolved",
-                                        affected_files=[py_file],
-                                        suggested_fix=f"Check if module exists or fix import path",
-                                        auto_fixable=False
-                                    ))
-            
-            except Exception as e:
-                logger.debug(f"Could not parse {py_file}: {e}")
-                continue
+            # Internal CORTEX import - verify it exists
+            module_name = ref.module
+            if module_name not in resolved:
+                resolved[module_name] = self._can_resolve_import(module_name)
+            if not resolved[module_name]:
+                self.conflicts.append(Conflict(
+                    conflict_type='missing_dependency',
+                    severity='critical',
+                    title=f"Unresolved import: {module_name}",
+                    description=f"{py_file.name} imports '{module_name}' which cannot be resolved",
+                    affected_files=[py_file],
+                    suggested_fix=f"Check if module exists or fix import path",
+                    auto_fixable=False
+                ))
     
     def _can_resolve_import(self, module_name: str) -> bool:
         """Check if an import can be resolved."""
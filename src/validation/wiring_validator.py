@@ -16,7 +16,9 @@ import logging
 import re
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List, Set, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from src.discovery.symbol_index import Symbol, SymbolIndex
 
 logger = logging.getLogger(__name__)
 
@@ -27,18 +29,43 @@ class WiringValidator:
     
     Validates that all user-facing entry points (response templates)
     are properly connected to orchestrator implementations.
+    
+    Orphaned triggers are looked up in the workspace SymbolIndex, so an
+    orchestrator that exists outside the discovery paths (or under a
+    differently cased name) gets a registration suggestion instead of a
+    create-from-scratch template.
     """
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, symbol_index: Optional[SymbolIndex] = None):
         """
         Initialize wiring validator.
         
         Args:
             project_root: Root directory of CORTEX project
+            symbol_index: Shared symbol index (created on first lookup if omitted)
         """
         self.project_root = Path(project_root)
         self._documented_commands_cache = None
         self._routing_triggers_cache = None
+        self._symbol_index = symbol_index
+        self._symbol_index_fresh = False
+    
+    @property
+    def symbol_index(self) -> SymbolIndex:
+        """Symbol index, refreshed once per validator"""
+        if self._symbol_index is None:
+            self._symbol_index = SymbolIndex(self.project_root)
+        if not self._symbol_index_fresh:
+            self._symbol_index.refresh()
+            self._symbol_index_fresh = True
+        return self._symbol_index
+    
+    def _locate_orchestrator(self, orchestrator_name: str) -> List[Symbol]:
+        """Class definitions matching an orchestrator name (exact, then normalized)"""
+        return (
+            self.symbol_index.find(orchestrator_name, kind="class")
+            or self.symbol_index.find_normalized(orchestrator_name, kind="class")
+        )
     
     def validate_wiring(
         self,
@@ -77,14 +104,19 @@ class WiringValidator:
                 results["wired_orchestrators"].add(expected_orch)
             else:
                 # Orphaned trigger
+                locations = self._locate_orchestrator(expected_orch)
                 results["orphaned_triggers"].append({
                     "trigger": trigger,
                     "expected_orchestrator": expected_orch,
-                    "template": metadata.get("template")
+                    "template": metadata.get("template"),
+                    "found_at": [self._format_location(symbol) for symbol in locations]
                 })
                 
                 # Generate suggestion
-                suggestion = self._generate_wiring_suggestion(trigger, expected_orch)
+                if locations:
+                    suggestion = self._generate_registration_suggestion(trigger, expected_orch, locations)
+                else:
+                    suggestion = self._generate_wiring_suggestion(trigger, expected_orch)
                 results["wiring_suggestions"].append(suggestion)
         
         # Check for ghost features (orchestrators without entry points)
@@ -153,6 +185,44 @@ class {orchestrator_name}(BaseOperationModule):
 """.strip()
         }
     
+    def _format_location(self, symbol: Symbol) -> str:
+        try:
+            path = symbol.file_path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            path = str(symbol.file_path)
+        return f"{path}:{symbol.line}"
+    
+    def _generate_registration_suggestion(
+        self,
+        trigger: str,
+        orchestrator_name: str,
+        locations: List[Symbol]
+    ) -> Dict[str, str]:
+        """
+        Generate suggestion for a trigger whose orchestrator exists but was not discovered.
+        
+        Args:
+            trigger: Trigger phrase
+            orchestrator_name: Expected orchestrator name
+            locations: Matching class definitions from the symbol index
+        
+        Returns:
+            Suggestion dict pointing at the existing implementation
+        """
+        found = locations[0]
+        where = ", ".join(self._format_location(symbol) for symbol in locations)
+        if found.name != orchestrator_name:
+            action = f"Rename {found.name} to {orchestrator_name} or set expected_orchestrator: {found.name}"
+        else:
+            action = "Move it under src/operations/modules, src/workflows or src/orchestrators"
+        
+        return {
+            "trigger": trigger,
+            "orchestrator": orchestrator_name,
+            "action": "register_orchestrator",
+            "template": f"# {found.name} already exists at {where}\n# {action}"
+        }
+    
     def check_orchestrator_wired(
         self,
         orchestrator_name: str,
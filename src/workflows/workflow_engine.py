@@ -20,6 +20,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable, Protocol
 from collections import defaultdict, deque
 
+from src.utils.graph_analysis import DirectedGraph
+
 
 class StageStatus(Enum):
     """Status of a workflow stage"""
@@ -202,34 +204,25 @@ class WorkflowDefinition:
     
     def _topological_sort(self) -> List[str]:
         """Topological sort of stages (returns execution order)"""
-        # Build adjacency list and in-degree count
-        graph = defaultdict(list)
-        in_degree = {s.id: 0 for s in self.stages}
+        stage_ids = {s.id for s in self.stages}
         
+        # Edges run from each dependency to the stage that needs it
+        graph = DirectedGraph(nodes=(s.id for s in self.stages))
         for stage in self.stages:
             for dep in stage.depends_on:
-                graph[dep].append(stage.id)
-                in_degree[stage.id] += 1
-        
-        # Find all stages with no dependencies
-        queue = deque([s_id for s_id, deg in in_degree.items() if deg == 0])
-        result = []
-        
-        while queue:
-            current = queue.popleft()
-            result.append(current)
-            
-            # Reduce in-degree for dependent stages
-            for neighbor in graph[current]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+                if dep not in stage_ids:
+                    raise ValueError(f"Stage '{stage.id}' depends on non-existent stage '{dep}'")
+                graph.add_edge(dep, stage.id)
         
-        # If not all stages processed, there's a cycle
-        if len(result) != len(self.stages):
-            raise ValueError("Workflow contains circular dependencies (cycle detected)")
+        # A cyclic strongly connected component means the stages are not a DAG
+        cycles = graph.cycles()
+        if cycles:
+            raise ValueError(
+                "Workflow contains circular dependencies (cycle detected): "
+                + " -> ".join(graph.cycle_path(cycles[0][0]))
+            )
         
-        return result
+        return graph.topological_order()
     
     def get_execution_order(self) -> List[str]:
         """Get the order stages should be executed in"""
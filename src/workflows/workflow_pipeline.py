@@ -21,6 +21,8 @@ from datetime import datetime
 import yaml
 import uuid
 
+from src.utils.graph_analysis import DirectedGraph
+
 
 class StageStatus(Enum):
     """Stage execution status"""
@@ -188,29 +190,37 @@ class WorkflowDefinition:
                         f"Stage '{stage.id}' depends on unknown stage '{dep}'"
                     )
         
-        # Check for cycles (simplified - use topological sort in production)
-        visited = set()
-        
-        def has_cycle(stage_id: str, path: set) -> bool:
-            if stage_id in path:
-                return True
-            if stage_id in visited:
-                return False
-            
-            path.add(stage_id)
-            visited.add(stage_id)
-            
-            stage = next((s for s in self.stages if s.id == stage_id), None)
-            if stage:
-                for dep in stage.depends_on:
-                    if has_cycle(dep, path.copy()):
-                        return True
-            
-            return False
+        # Check for cycles (Tarjan SCC over the stage dependency graph)
+        graph = DirectedGraph(nodes=(stage.id for stage in self.stages))
+        for stage in self.stages:
+            for dep in stage.depends_on:
+                if dep in stage_ids:
+                    graph.add_edge(stage.id, dep)
         
+        cyclic_stages = {stage_id for component in graph.cycles() for stage_id in component}
+
+        # Stages that (transitively) depend on a cycle can never run either;
+        # remember the cyclic stage each one is blocked by
+        blocked_by = {}
+        frontier = [stage.id for stage in self.stages if stage.id in cyclic_stages]
+        while frontier:
+            stage_id = frontier.pop()
+            for dependent in graph.predecessors(stage_id):
+                if dependent not in cyclic_stages and dependent not in blocked_by:
+                    blocked_by[dependent] = blocked_by.get(stage_id, stage_id)
+                    frontier.append(dependent)
+
         for stage in self.stages:
-            if has_cycle(stage.id, set()):
-                errors.append(f"Cycle detected in dependencies for stage '{stage.id}'")
+            if stage.id in cyclic_stages:
+                errors.append(
+                    f"Cycle detected in dependencies for stage '{stage.id}': "
+                    + " -> ".join(graph.cycle_path(stage.id))
+                )
+            elif stage.id in blocked_by:
+                errors.append(
+                    f"Cycle detected in dependencies for stage '{stage.id}': "
+                    f"depends on cyclic stage '{blocked_by[stage.id]}'"
+                )
         
         return errors
     
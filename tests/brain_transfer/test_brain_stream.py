@@ -0,0 +1,194 @@
+"""
+Tests for incremental brain stream export, tombstones and import audit logs
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.brain_transfer.brain_exporter import BrainExporter
+from src.brain_transfer.brain_importer import BrainImporter
+from src.brain_transfer.brain_stream import BrainStreamReader
+from src.tier2.knowledge_graph.database.schema import DatabaseSchema
+
+
+PATTERNS_SCHEMA = """
+    CREATE TABLE patterns (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        pattern_id TEXT UNIQUE NOT NULL,
+        title TEXT NOT NULL,
+        pattern_type TEXT NOT NULL,
+        confidence REAL NOT NULL,
+        content TEXT,
+        scope TEXT DEFAULT 'cortex',
+        namespaces TEXT,
+        created_at TEXT NOT NULL,
+        last_accessed TEXT NOT NULL,
+        access_count INTEGER DEFAULT 0
+    )
+"""
+
+
+def make_brain(root, patterns=()):
+    (root / "tier2").mkdir(parents=True)
+    conn = sqlite3.connect(root / "tier2" / "knowledge_graph.db")
+    conn.execute(PATTERNS_SCHEMA)
+    conn.executemany(
+        "INSERT INTO patterns (pattern_id, title, pattern_type, confidence, content, "
+        "namespaces, created_at, last_accessed) VALUES (?, ?, 'workflow', 0.9, '{}', '[]', ?, ?)",
+        [(pattern_id, pattern_id, created, accessed) for pattern_id, created, accessed in patterns]
+    )
+    conn.commit()
+    conn.close()
+    return root
+
+
+class TestIncrementalWatermark:
+    """ISO watermarks compare as time against ' '-separated timestamps"""
+
+    def test_space_separated_timestamps_after_watermark(self, tmp_path):
+        brain = make_brain(tmp_path / "brain", [
+            ("before", "2025-01-10 09:00:00", "2025-01-10 09:00:00"),
+            # Same day as the watermark: text comparison ranks ' ' below 'T'
+            ("same_day_later", "2025-01-10 15:00:00", "2025-01-10 15:00:00"),
+            ("accessed_later", "2025-01-01 08:00:00", "2025-01-10 12:30:00"),
+        ])
+        exporter = BrainExporter(brain_path=brain)
+
+        result = exporter.export_brain_stream(scope="all", compression="none", since="2025-01-10T12:00:00")
+
+        assert result["incremental"]
+        assert result["patterns_exported"] == 2
+
+    def test_same_day_earlier_pattern_excluded(self, tmp_path):
+        brain = make_brain(tmp_path / "brain", [
+            ("earlier", "2025-01-10 11:59:59", "2025-01-10 11:59:59"),
+        ])
+        exporter = BrainExporter(brain_path=brain)
+
+        result = exporter.export_brain_stream(scope="all", compression="none", since="2025-01-10T12:00:00")
+
+        assert result["patterns_exported"] == 0
+
+
+class TestImportAuditLog:
+    """A failed import leaves no open or partial audit log"""
+
+    def test_unexpected_error_removes_audit_log(self, tmp_path):
+        source = make_brain(tmp_path / "source", [("p1", "2025-01-10 09:00:00", "2025-01-10 09:00:00")])
+        export = BrainExporter(brain_path=source).export_brain_stream(scope="all", compression="none")
+
+        target = tmp_path / "target"
+        (target / "tier2").mkdir(parents=True)
+        sqlite3.connect(target / "tier2" / "knowledge_graph.db").close()  # No patterns table
+        importer = BrainImporter(brain_path=target)
+
+        with pytest.raises(sqlite3.Error):
+            importer.import_brain_stream(export["export_path"])
+
+        assert not list(importer.applied_dir.glob("*.log"))
+
+
+def make_tracked_brain(root, patterns=()):
+    """Brain created by DatabaseSchema (updated_at and tombstone triggers)"""
+    (root / "tier2").mkdir(parents=True)
+    db_path = root / "tier2" / "knowledge_graph.db"
+    DatabaseSchema.initialize(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO patterns (pattern_id, title, content, pattern_type, confidence, "
+        "namespaces, created_at, last_accessed) VALUES (?, ?, '{}', 'workflow', 0.9, '[]', ?, ?)",
+        [(pattern_id, pattern_id, accessed, accessed) for pattern_id, accessed in patterns]
+    )
+    conn.commit()
+    conn.close()
+    return root
+
+
+def execute(brain, sql, params=()):
+    conn = sqlite3.connect(brain / "tier2" / "knowledge_graph.db")
+    rows = conn.execute(sql, params).fetchall()
+    conn.commit()
+    conn.close()
+    return rows
+
+
+def stream_records(path):
+    return [record for chunk in BrainStreamReader(path).iter_chunks() for record in chunk]
+
+
+class TestIncrementalChangeTracking:
+    """Incremental exports see every write, deletions and read-time decay"""
+
+    def test_confidence_only_update_is_exported(self, tmp_path):
+        recent = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        brain = make_tracked_brain(tmp_path / "brain", [("p1", recent), ("p2", recent)])
+        exporter = BrainExporter(brain_path=brain)
+        base = exporter.export_brain_stream(scope="all", compression="none")
+
+        execute(brain, "UPDATE patterns SET confidence = 0.7 WHERE pattern_id = 'p1'")
+        result = exporter.export_brain_stream(scope="all", compression="none", since=base["export_path"])
+
+        records = stream_records(result["export_path"])
+        assert [(r["pattern_id"], r["confidence"]) for r in records] == [("p1", 0.7)]
+
+    def test_deleted_pattern_is_sent_as_tombstone_and_applied(self, tmp_path):
+        recent = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        source = make_tracked_brain(tmp_path / "source", [("p1", recent), ("p2", recent)])
+        target = make_tracked_brain(tmp_path / "target", [("p1", recent), ("p2", recent)])
+        exporter = BrainExporter(brain_path=source)
+        base = exporter.export_brain_stream(scope="all", compression="none")
+
+        execute(source, "DELETE FROM patterns WHERE pattern_id = 'p2'")
+        result = exporter.export_brain_stream(scope="all", compression="none", since=base["export_path"])
+
+        assert result["patterns_exported"] == 0
+        assert result["tombstones_exported"] == 1
+
+        report = BrainImporter(brain_path=target).import_brain_stream(result["export_path"])
+
+        assert report["statistics"]["deleted_patterns"] == 1
+        assert execute(target, "SELECT pattern_id FROM patterns") == [("p1",)]
+
+    def test_recreated_pattern_clears_tombstone(self, tmp_path):
+        brain = make_tracked_brain(tmp_path / "brain", [("p1", "2025-01-10 09:00:00")])
+        execute(brain, "DELETE FROM patterns")
+        insert = (
+            "INSERT INTO patterns (pattern_id, title, content, pattern_type, created_at, last_accessed) "
+            "VALUES ('p1', 'p1', '{}', 'workflow', '2025-01-11', '2025-01-11')"
+        )
+        execute(brain, insert)
+
+        assert execute(brain, "SELECT * FROM pattern_tombstones") == []
+
+    def test_decay_without_write_exports_effective_confidence(self, tmp_path):
+        # Idle 100 days: 40 days of decay pending now, 30 at the watermark
+        accessed = (datetime.now() - timedelta(days=100)).strftime("%Y-%m-%d %H:%M:%S")
+        brain = make_tracked_brain(tmp_path / "brain", [("p1", accessed)])
+        execute(brain, "UPDATE patterns SET updated_at = ?", (accessed,))
+        since = (datetime.now() - timedelta(days=10)).isoformat()
+        exporter = BrainExporter(brain_path=brain)
+
+        result = exporter.export_brain_stream(scope="all", compression="none", since=since)
+
+        records = stream_records(result["export_path"])
+        assert [r["pattern_id"] for r in records] == ["p1"]
+        assert records[0]["confidence"] == pytest.approx(0.5)
+
+    def test_decay_below_threshold_is_sent_as_tombstone(self, tmp_path):
+        accessed = (datetime.now() - timedelta(days=100)).strftime("%Y-%m-%d %H:%M:%S")
+        brain = make_tracked_brain(tmp_path / "brain", [("p1", accessed)])
+        execute(brain, "UPDATE patterns SET updated_at = ?", (accessed,))
+        since = (datetime.now() - timedelta(days=10)).isoformat()
+        exporter = BrainExporter(brain_path=brain)
+
+        result = exporter.export_brain_stream(
+            scope="all", min_confidence=0.55, compression="none", since=since
+        )
+
+        records = stream_records(result["export_path"])
+        assert records == [{"pattern_id": "p1", "reason": "below_min_confidence", "deleted": True}]
@@ -0,0 +1,16 @@
+"""
+Shared pytest configuration for CORTEX internal tests.
+
+Makes the repository root importable so tests can use `src.` imports.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
@@ -0,0 +1,29 @@
+"""
+Import the test_generator package without its __init__.
+
+The package __init__ imports TestGenerator, whose agent module depends on a
+test_counter module that is not in this tree, so any import of a submodule
+would fail. Registering the package by path lets the standalone analyzers
+(code_smell_detector, clone_detector) be imported and tested directly.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import src.cortex_agents
+
+PACKAGE = "src.cortex_agents.test_generator"
+
+if PACKAGE not in sys.modules:
+    package_dir = Path(src.cortex_agents.__file__).parent / "test_generator"
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE, package_dir / "__init__.py", submodule_search_locations=[str(package_dir)]
+    )
+    package = importlib.util.module_from_spec(spec)
+    # Deliberately not executed: only submodule lookup through __path__ is needed
+    sys.modules[PACKAGE] = package
+    src.cortex_agents.test_generator = package
@@ -0,0 +1,113 @@
+"""
+Tests for CodeSmellDetector clone-based duplication detection
+
+Covers the similarity threshold on duplicate pairs and the persistent
+clone index behaviour on subset runs and unreadable files.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.cortex_agents.test_generator.clone_detector import CloneDetector
+from src.cortex_agents.test_generator.code_smell_detector import (
+    CodeSmellDetector,
+    SmellDetectionConfig,
+    SmellType
+)
+
+
+CLONED_FUNCTION = '''
+def summarize(records, limit):
+    totals = {}
+    for record in records:
+        key = record.get("category", "other")
+        totals[key] = totals.get(key, 0) + record.get("amount", 0)
+        if len(totals) > limit:
+            break
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    result = []
+    for name, amount in ranked[:limit]:
+        result.append({"name": name, "amount": amount, "share": amount / max(1, sum(totals.values()))})
+    return result
+'''
+
+
+@pytest.fixture
+def cloned_files(tmp_path):
+    """Two files sharing a renamed copy of the same function"""
+    first = tmp_path / "first.py"
+    second = tmp_path / "second.py"
+    first.write_text(CLONED_FUNCTION)
+    second.write_text(CLONED_FUNCTION.replace("summarize", "aggregate").replace("totals", "sums"))
+    return [str(first), str(second)]
+
+
+class TestDuplicationThreshold:
+    """min_duplication_similarity filters reported clone pairs"""
+
+    def test_clone_reported_at_default_threshold(self, cloned_files):
+        detector = CodeSmellDetector(SmellDetectionConfig(clone_kgram_tokens=10, clone_window=4))
+
+        smells = detector.detect_duplication_across_files(cloned_files)
+
+        assert smells
+        assert all(s.smell_type == SmellType.DUPLICATED_CODE for s in smells)
+        assert all(s.metrics["similarity"] >= 0.85 for s in smells)
+
+    def test_pairs_below_threshold_are_dropped(self, cloned_files):
+        config = SmellDetectionConfig(clone_kgram_tokens=10, clone_window=4)
+        baseline = CodeSmellDetector(config).detect_duplication_across_files(cloned_files)
+        best = max(s.metrics["similarity"] for s in baseline)
+
+        config.min_duplication_similarity = best + 0.001
+        smells = CodeSmellDetector(config).detect_duplication_across_files(cloned_files)
+
+        assert smells == []
+
+
+class TestCloneIndex:
+    """Persisted clone index survives subset runs and unreadable files"""
+
+    def test_subset_run_keeps_other_indexed_files(self, cloned_files, tmp_path):
+        index_path = str(tmp_path / "clone-index.db")
+        detector = CloneDetector(index_path=index_path, k=10, window=4)
+        assert detector.detect_pairs(cloned_files)
+
+        subset_pairs = detector.detect_pairs(cloned_files[:1])
+        indexed = {r[0] for r in detector.index.conn.execute("SELECT file_path FROM clone_files")}
+        detector.close()
+
+        assert subset_pairs == []
+        assert indexed == set(cloned_files)
+
+    def test_deleted_files_are_pruned(self, cloned_files, tmp_path):
+        detector = CloneDetector(index_path=str(tmp_path / "clone-index.db"), k=10, window=4)
+        detector.detect_pairs(cloned_files)
+
+        (tmp_path / "second.py").unlink()
+        detector.detect_pairs(cloned_files[:1])
+        indexed = {r[0] for r in detector.index.conn.execute("SELECT file_path FROM clone_files")}
+        detector.close()
+
+        assert indexed == {cloned_files[0]}
+
+    def test_unreadable_file_is_skipped(self, cloned_files, monkeypatch):
+        detector = CloneDetector(k=10, window=4)
+        original_read_bytes = Path.read_bytes
+
+        def read_bytes(path):
+            if str(path) == cloned_files[1]:
+                raise PermissionError("locked")
+            return original_read_bytes(path)
+
+        monkeypatch.setattr(Path, "read_bytes", read_bytes)
+        pairs = detector.detect_pairs(cloned_files)
+        indexed = {r[0] for r in detector.index.conn.execute("SELECT file_path FROM clone_files")}
+        detector.close()
+
+        assert pairs == []
+        assert indexed == {cloned_files[0]}
@@ -0,0 +1,103 @@
+"""
+Tests for ParallelProcessor execution modes, shared inputs and pool reuse
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("watchdog")  # src.crawlers imports its file watcher eagerly
+
+from src.crawlers import parallel_processor
+from src.crawlers.parallel_processor import ExecutionMode, ParallelProcessor, get_shared
+
+
+def read_label(file_path):
+    return f"{get_shared('label')}:{file_path}"
+
+
+def worker_pid(file_path):
+    return os.getpid()
+
+
+@pytest.fixture
+def files():
+    return [f"file_{i}.py" for i in range(12)]
+
+
+class TestExecutionMode:
+    """Thread mode stays the default; process and auto modes are opt-in"""
+
+    def test_default_mode_is_thread(self, files):
+        processor = ParallelProcessor(max_workers=2)
+
+        result = processor.process_files(files, read_label)
+
+        assert processor.mode == ExecutionMode.THREAD
+        assert result.mode == "thread"
+        assert result.processed_files == len(files)
+
+
+class TestSharedInputs:
+    """Shared inputs are scoped to the processor that owns them"""
+
+    def test_processors_do_not_leak_shared_values(self, files):
+        first = ParallelProcessor(max_workers=2, shared={'label': 'first'})
+        second = ParallelProcessor(max_workers=2, shared={'label': 'second'})
+
+        first_result = first.process_files(files, read_label)
+        second_result = second.process_files(files, read_label)
+
+        assert all(r.startswith("first:") for r in first_result.results)
+        assert all(r.startswith("second:") for r in second_result.results)
+        assert parallel_processor._WORKER_SHARED == {}
+
+    def test_auto_sample_reads_own_shared_values(self, files):
+        processor = ParallelProcessor(max_workers=2, mode=ExecutionMode.AUTO, shared={'label': 'auto'})
+
+        result = processor.process_files(files, read_label)
+
+        assert all(r.startswith("auto:") for r in result.results)
+        assert get_shared('label') is None
+
+
+class TestBatchPoolReuse:
+    """process_in_batches runs every batch on one pool"""
+
+    def test_thread_pool_created_once(self, files, monkeypatch):
+        created = []
+        original = parallel_processor.ThreadPoolExecutor
+
+        def counting_pool(*args, **kwargs):
+            created.append(kwargs)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(parallel_processor, "ThreadPoolExecutor", counting_pool)
+        processor = ParallelProcessor(max_workers=2)
+
+        result = processor.process_in_batches(files, read_label, batch_size=3)
+
+        assert len(created) == 1
+        assert result.processed_files == len(files)
+
+    def test_process_pool_created_once(self, files):
+        processor = ParallelProcessor(mode=ExecutionMode.PROCESS, process_workers=2)
+
+        result = processor.process_in_batches(files, worker_pid, batch_size=3)
+
+        assert result.mode == "process"
+        assert result.processed_files == len(files)
+        assert len(set(result.results)) <= 2
+        assert os.getpid() not in result.results
+
+    def test_utilization_covers_every_batch(self, files):
+        processor = ParallelProcessor(max_workers=2)
+
+        result = processor.process_in_batches(files, read_label, batch_size=3)
+
+        assert result.worker_utilization
+        assert sum(stats['tasks'] for stats in result.worker_utilization.values()) == len(files)
+        assert all(0.0 <= stats['utilization'] <= 1.0 for stats in result.worker_utilization.values())
@@ -0,0 +1,60 @@
+"""
+Tests for ErrorAnalytics performance degradation detection
+
+The degradation baseline is the earlier half of the window by event
+timestamp, including for events that arrive out of order.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import time
+
+import pytest
+
+from src.epmo.error_handling.error_analytics import ErrorAnalytics, PatternType
+
+
+@pytest.fixture
+def analytics():
+    return ErrorAnalytics(enable_real_time_analysis=False)
+
+
+def degradation_patterns(analytics):
+    return [
+        pattern for pattern in analytics.analyze_patterns()
+        if pattern.pattern_type == PatternType.PERFORMANCE_DEGRADATION
+    ]
+
+
+class TestPerformanceDegradation:
+    """Baseline and degraded responses follow event time"""
+
+    def test_in_order_slowdown_is_detected(self, analytics):
+        start = time.time() - 600
+        for i in range(10):
+            analytics.add_error_event(
+                "E_TIMEOUT", f"svc{i % 2}", "warning",
+                timestamp=start + i * 10, response_time=100.0 if i < 5 else 300.0
+            )
+
+        patterns = degradation_patterns(analytics)
+
+        assert len(patterns) == 1
+        assert patterns[0].metadata['baseline_response_time'] == 100.0
+        assert patterns[0].occurrences == 5
+
+    def test_late_arrivals_are_placed_by_timestamp(self, analytics):
+        start = time.time() - 600
+        # Slow responses from the second half are reported first
+        for i in list(range(5, 10)) + list(range(5)):
+            analytics.add_error_event(
+                "E_TIMEOUT", "svc", "warning",
+                timestamp=start + i * 10, response_time=100.0 if i < 5 else 300.0
+            )
+
+        patterns = degradation_patterns(analytics)
+
+        assert len(patterns) == 1
+        assert patterns[0].metadata['baseline_response_time'] == 100.0
+        assert patterns[0].first_detected == start + 50
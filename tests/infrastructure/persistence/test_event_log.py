@@ -0,0 +1,104 @@
+"""
+Tests for EventLog compaction
+
+Compaction writes fsynced temp files and swaps them in with os.replace,
+so a failure part-way never loses events.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import os
+
+import pytest
+
+from src.infrastructure.persistence import event_log
+from src.infrastructure.persistence.event_log import EventLog
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = EventLog(tmp_path / "events", segment_bytes=512, batch_size=1, max_batch_delay=0)
+    start = 1_700_000_000
+    for i in range(60):
+        log.append({"timestamp": start + i, "n": i, "kind": "noise" if i % 3 else "signal"})
+    log.flush()
+    yield log
+    log.close()
+
+
+def event_numbers(log):
+    return [event["n"] for event in log.since(0)]
+
+
+class TestCompact:
+    """Sealed segments are rewritten through temp files"""
+
+    def test_compact_drops_filtered_events(self, log):
+        before = event_numbers(log)
+        sealed_before = len(log.segments()) - 1
+
+        dropped = log.compact(keep=lambda event: event["kind"] == "signal")
+
+        after = event_numbers(log)
+        assert dropped > 0
+        assert len(after) == len(before) - dropped
+        assert [n for n in after if n % 3 == 0] == [n for n in before if n % 3 == 0]
+        assert len(log.segments()) - 1 < sealed_before
+        assert not list(log.directory.glob("*.compact"))
+
+    def test_temp_files_are_fsynced_before_replace(self, log, monkeypatch):
+        synced = set()
+        replaced = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd):
+            synced.add(os.readlink(f"/proc/self/fd/{fd}") if os.path.exists("/proc/self/fd") else fd)
+            real_fsync(fd)
+
+        def replace(src, dst):
+            replaced.append(str(src))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(event_log.os, "fsync", fsync)
+        monkeypatch.setattr(event_log.os, "replace", replace)
+
+        log.compact()
+
+        # The only other rename is the active segment moving behind the output
+        staged = [src for src in replaced if src.endswith(".compact")]
+        assert staged
+        assert len(replaced) - len(staged) == 2
+        if os.path.exists("/proc/self/fd"):
+            assert set(staged) <= synced
+
+    def test_failed_replace_keeps_every_event(self, log, monkeypatch):
+        expected = event_numbers(log)
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(event_log.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            log.compact(keep=lambda event: event["kind"] == "signal")
+        monkeypatch.undo()
+
+        assert event_numbers(log) == expected
+
+    def test_output_may_outnumber_input_segments(self, log, tmp_path):
+        expected = event_numbers(log)
+        log.close()
+        # Reopened with a smaller segment size: compaction needs more segments
+        smaller = EventLog(tmp_path / "events", segment_bytes=128, batch_size=1, max_batch_delay=0)
+        sealed_before = len(smaller.segments()) - 1
+
+        smaller.compact()
+        smaller.append({"timestamp": 1_800_000_000, "n": 60, "kind": "signal"})
+
+        assert len(smaller.segments()) - 1 > sealed_before
+        assert event_numbers(smaller) == expected + [60]
+        smaller.close()
+
+        reopened = EventLog(tmp_path / "events")
+        assert event_numbers(reopened) == expected + [60]
+        reopened.close()
@@ -0,0 +1,74 @@
+"""
+Tests for trigger-maintained MaterializedStats
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.infrastructure.persistence.materialized_stats import MaterializedStats, Stat, TableStats
+
+
+SPECS = [
+    TableStats('messages', (
+        Stat('rows'),
+        Stat('by_conversation', key='{row}.conversation_id', distinct=True),
+    )),
+]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE messages (id INTEGER PRIMARY KEY, conversation_id TEXT)")
+    conn.executemany(
+        "INSERT INTO messages (conversation_id) VALUES (?)",
+        [("c1",), ("c1",), ("c2",)]
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def grouped_scans(statements):
+    return [sql for sql in statements if "GROUP BY" in sql]
+
+
+class TestInstalledStats:
+    """Installed triggers keep reads off the source tables"""
+
+    def test_load_after_install_does_not_scan(self, conn):
+        MaterializedStats(conn, SPECS).install()
+        executed = []
+        conn.set_trace_callback(executed.append)
+
+        stats = MaterializedStats(conn, SPECS)
+        assert stats.load()
+        assert stats.count('messages') == 3
+        assert stats.distinct('messages', 'by_conversation') == 2
+
+        assert grouped_scans(executed) == []
+
+    def test_distinct_keys_follow_writes(self, conn):
+        stats = MaterializedStats(conn, SPECS)
+        stats.install()
+
+        conn.execute("INSERT INTO messages (conversation_id) VALUES ('c3')")
+        conn.execute("DELETE FROM messages WHERE conversation_id = 'c2'")
+        conn.execute("UPDATE messages SET conversation_id = 'c4' WHERE id = 1")
+        conn.execute("UPDATE messages SET conversation_id = 'c4' WHERE id = 2")
+
+        assert stats.distinct('messages', 'by_conversation') == 2  # c3, c4
+        assert len(stats.groups('messages', 'by_conversation')) == 2
+        assert stats.reconcile() == {'messages': 0}
+
+    def test_snapshot_matches_triggers(self, conn):
+        snapshot = MaterializedStats(conn, SPECS)
+        snapshot.load()
+
+        assert not snapshot.installed
+        assert snapshot.distinct('messages', 'by_conversation') == 2
+        assert snapshot.count('messages', 'by_conversation', 'c1') == 2
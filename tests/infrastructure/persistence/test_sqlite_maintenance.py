@@ -0,0 +1,142 @@
+"""
+Tests for SQLiteMaintenanceEngine free-page reclaim
+
+Incremental databases give pages back in bounded incremental_vacuum
+steps; auto_vacuum=NONE databases are converted once, then reclaimed
+incrementally like any other.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import itertools
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.persistence import sqlite_maintenance
+from src.infrastructure.persistence.sqlite_maintenance import MaintenancePolicy, SQLiteMaintenanceEngine
+
+
+def fill_and_free(db_path, rows=600):
+    """Write rows of ~1 KB each, then delete them all to build a freelist"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE IF NOT EXISTS blobs (id INTEGER PRIMARY KEY, data BLOB)")
+    conn.executemany("INSERT INTO blobs (data) VALUES (?)", [(b"x" * 1024,) for _ in range(rows)])
+    conn.commit()
+    conn.execute("DELETE FROM blobs")
+    conn.commit()
+    freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    conn.close()
+    return freelist
+
+
+def make_db(db_path, auto_vacuum):
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"PRAGMA auto_vacuum = {auto_vacuum}")
+    conn.execute("CREATE TABLE blobs (id INTEGER PRIMARY KEY, data BLOB)")
+    conn.commit()
+    conn.close()
+    return fill_and_free(db_path)
+
+
+def pragma(db_path, name):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"PRAGMA {name}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def incremental_db(tmp_path):
+    db_path = tmp_path / "incremental.db"
+    freelist = make_db(db_path, "INCREMENTAL")
+    assert freelist >= 128
+    return db_path, freelist
+
+
+class TestIncrementalReclaim:
+    """Reclaim in auto_vacuum=INCREMENTAL mode, within the policy's bounds"""
+
+    def test_reclaims_whole_freelist(self, incremental_db):
+        db_path, freelist = incremental_db
+        engine = SQLiteMaintenanceEngine(MaintenancePolicy(step_pages=64))
+
+        report = engine.run(db_path)
+
+        assert report.success
+        assert "incremental_vacuum" in report.actions
+        assert report.pages_reclaimed == freelist
+        assert report.bytes_reclaimed == freelist * report.health.page_size
+        assert pragma(db_path, "freelist_count") == 0
+
+    def test_max_steps_caps_pages_released(self, incremental_db):
+        db_path, freelist = incremental_db
+        engine = SQLiteMaintenanceEngine(MaintenancePolicy(step_pages=16, max_steps=3))
+
+        report = engine.run(db_path)
+
+        assert report.pages_reclaimed == 48
+        assert pragma(db_path, "freelist_count") == freelist - 48
+
+    def test_max_seconds_stops_between_steps(self, incremental_db, monkeypatch):
+        db_path, freelist = incremental_db
+        # Each monotonic() call is one second later: the budget lasts three steps
+        clock = itertools.count()
+        monkeypatch.setattr(sqlite_maintenance, "time", SimpleNamespace(
+            monotonic=lambda: next(clock),
+            perf_counter=time.perf_counter,
+            sleep=time.sleep
+        ))
+        engine = SQLiteMaintenanceEngine(MaintenancePolicy(step_pages=16, max_seconds=2.5))
+
+        report = engine.run(db_path)
+
+        assert report.pages_reclaimed == 48
+        assert pragma(db_path, "freelist_count") == freelist - 48
+
+
+class TestConversion:
+    """auto_vacuum=NONE databases get exactly one rebuild"""
+
+    def test_plan_converts_without_vacuum_steps(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        make_db(db_path, "NONE")
+        engine = SQLiteMaintenanceEngine()
+        conn = engine.connect(db_path)
+        try:
+            actions, _ = engine.plan(engine.inspect(conn))
+        finally:
+            conn.close()
+
+        assert [action.name for action in actions] == ["enable_incremental", "optimize"]
+
+    def test_conversion_happens_once(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        make_db(db_path, "NONE")
+        engine = SQLiteMaintenanceEngine()
+
+        first = engine.run(db_path)
+        assert first.actions == ["enable_incremental", "optimize"]
+        assert pragma(db_path, "auto_vacuum") == 2  # INCREMENTAL
+        assert pragma(db_path, "freelist_count") == 0
+
+        freelist = fill_and_free(db_path)
+        second = engine.run(db_path)
+
+        assert second.actions == ["incremental_vacuum", "optimize"]
+        assert second.pages_reclaimed == freelist
+
+    def test_conversion_disabled_only_recommends(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        freelist = make_db(db_path, "NONE")
+        engine = SQLiteMaintenanceEngine(MaintenancePolicy(convert_to_incremental=False))
+
+        report = engine.run(db_path)
+
+        assert report.actions == ["optimize"]
+        assert any("auto_vacuum=INCREMENTAL" in note for note in report.recommendations)
+        assert pragma(db_path, "freelist_count") == freelist
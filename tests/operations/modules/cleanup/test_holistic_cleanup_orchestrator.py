@@ -0,0 +1,90 @@
+"""
+Tests for HolisticCleanupOrchestrator workspace snapshot sharing
+
+The orchestrator walks the workspace once and every cleanup consumer in
+the run reuses that walk through context['workspace_snapshot'].
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import pytest
+from pathlib import Path
+
+from src.operations.modules.cleanup import workspace_scanner
+from src.operations.modules.cleanup.holistic_cleanup_orchestrator import HolisticCleanupOrchestrator
+from src.operations.modules.cleanup.workspace_scanner import WorkspaceScanner
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Small workspace with source, docs and a stray backup file"""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "module.py").write_text("print('hello')\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n")
+    (tmp_path / "notes.md").write_text("# Notes\n")
+    (tmp_path / "notes.md.bak").write_text("# Old notes\n")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    return tmp_path
+
+
+@pytest.fixture
+def walk_calls(monkeypatch):
+    """Count WorkspaceScanner.walk calls"""
+    calls = []
+    original_walk = WorkspaceScanner.walk
+
+    def counting_walk(self):
+        calls.append(self.root)
+        return original_walk(self)
+
+    monkeypatch.setattr(workspace_scanner.WorkspaceScanner, "walk", counting_walk)
+    return calls
+
+
+class TestWorkspaceSnapshotSharing:
+    """The workspace is walked once per cleanup run"""
+
+    # dry_run=False without a manifest only generates the manifest and
+    # report; it skips the dry-run validation phase
+
+    def test_execute_publishes_snapshot_before_scanning(self, workspace, walk_calls):
+        orchestrator = HolisticCleanupOrchestrator(project_root=workspace)
+        context = {'dry_run': False, 'enable_test_validation': False}
+
+        result = orchestrator.execute(context)
+
+        assert result.success
+        assert len(walk_calls) == 1
+        snapshot = context['workspace_snapshot']
+        paths = {f.relative_path for f in snapshot.files}
+        assert "notes.md.bak" in paths
+        assert not any(p.startswith(".git/") for p in paths)
+
+    def test_existing_snapshot_is_reused(self, workspace, walk_calls):
+        orchestrator = HolisticCleanupOrchestrator(project_root=workspace)
+        context = {'dry_run': False, 'enable_test_validation': False}
+        orchestrator.prepare_workspace_snapshot(context)
+        assert len(walk_calls) == 1
+
+        orchestrator.execute(context)
+
+        assert len(walk_calls) == 1
+
+    def test_sweeper_reuses_orchestrator_walk(self, workspace, walk_calls, monkeypatch):
+        sweeper_plugin = pytest.importorskip("src.plugins.sweeper_plugin")
+        trashed = []
+        monkeypatch.setattr(sweeper_plugin, "send2trash", trashed.append)
+        monkeypatch.chdir(workspace)
+
+        orchestrator = HolisticCleanupOrchestrator(project_root=workspace)
+        context = {'dry_run': False, 'sweep': True, 'enable_test_validation': False}
+
+        result = orchestrator.execute(context)
+
+        assert result.success
+        assert len(walk_calls) == 1
+        assert result.data['sweep']['success']
+        assert result.data['sweep']['stats']['files_scanned'] > 0
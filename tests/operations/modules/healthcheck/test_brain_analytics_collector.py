@@ -0,0 +1,74 @@
+"""
+Tests for BrainAnalyticsCollector materialized statistics
+
+The first collection installs stat triggers; later collections read
+summary rows without scanning the brain tables.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.operations.modules.healthcheck import brain_analytics_collector
+from src.operations.modules.healthcheck.brain_analytics_collector import BrainAnalyticsCollector
+
+
+@pytest.fixture
+def brain(tmp_path):
+    (tmp_path / "tier1").mkdir()
+    conn = sqlite3.connect(tmp_path / "tier1" / "working_memory.db")
+    conn.executescript("""
+        CREATE TABLE conversations (id TEXT PRIMARY KEY, created_at TEXT, last_activity TEXT);
+        CREATE TABLE messages (id INTEGER PRIMARY KEY, conversation_id TEXT);
+        INSERT INTO conversations VALUES ('c1', datetime('now'), datetime('now'));
+        INSERT INTO conversations VALUES ('c2', datetime('now'), datetime('now'));
+        INSERT INTO messages (conversation_id) VALUES ('c1'), ('c1'), ('c1'), ('c2');
+    """)
+    conn.commit()
+    conn.close()
+    return tmp_path
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    """SQL executed on connections opened by the collector"""
+    executed = []
+    real_connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        conn = real_connect(*args, **kwargs)
+        conn.set_trace_callback(executed.append)
+        return conn
+
+    monkeypatch.setattr(brain_analytics_collector.sqlite3, "connect", tracing_connect)
+    return executed
+
+
+class TestCollection:
+    """Healthchecks read summary rows once triggers are installed"""
+
+    def test_first_collection_installs_triggers(self, brain, statements):
+        collector = BrainAnalyticsCollector(brain_path=brain)
+
+        first = collector.get_tier1_stats()
+        statements.clear()
+        second = collector.get_tier1_stats()
+
+        assert first['conversations'] == second['conversations']
+        assert second['conversations']['total_conversations'] == 2
+        assert second['conversations']['avg_conversation_length'] == 2.0
+        assert not [sql for sql in statements if "GROUP BY" in sql]
+
+    def test_read_only_collection_never_writes(self, brain):
+        collector = BrainAnalyticsCollector(brain_path=brain, install_triggers=False)
+
+        stats = collector.get_tier1_stats()
+
+        conn = sqlite3.connect(brain / "tier1" / "working_memory.db")
+        triggers = conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall()
+        conn.close()
+        assert stats['conversations']['total_conversations'] == 2
+        assert triggers == []
@@ -0,0 +1,57 @@
+"""
+Tests for IdeaQueue writer lifecycle
+
+Captures are committed on close(), and an IdeaQueue that is dropped
+without close() is garbage collected, stopping its writer thread.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import gc
+import sqlite3
+import weakref
+
+import pytest
+
+from src.operations.modules.ideas.idea_queue import IdeaQueue
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "idea-queue.db")
+
+
+def stored_ideas(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT raw_text FROM ideas")}
+    finally:
+        conn.close()
+
+
+class TestWriterLifecycle:
+    """The writer thread never keeps its IdeaQueue alive"""
+
+    def test_close_commits_captures(self, db_path):
+        idea_queue = IdeaQueue(db_path=db_path)
+        idea_queue.capture("add retry to auth login", {'project': 'cortex'})
+        idea_queue.close()
+
+        assert not idea_queue._writer.is_alive()
+        assert stored_ideas(db_path) == {"add retry to auth login"}
+
+    def test_unclosed_queue_is_collected(self, db_path):
+        idea_queue = IdeaQueue(db_path=db_path)
+        idea_queue.capture("cache api responses", {'project': 'cortex'})
+        idea_queue.flush()
+        writer = idea_queue._writer
+        queue_ref = weakref.ref(idea_queue)
+
+        del idea_queue
+        gc.collect()
+
+        assert queue_ref() is None
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+        assert stored_ideas(db_path) == {"cache api responses"}
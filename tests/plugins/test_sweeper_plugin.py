@@ -0,0 +1,52 @@
+"""
+Tests for SweeperPlugin candidate selection on shared workspace walks
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import os
+
+import pytest
+
+from src.operations.modules.cleanup.workspace_scanner import WorkspaceScanner
+from src.plugins.sweeper_plugin import FileCategory, SweeperPlugin
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Workspace with a protected log, a stray log and a symlink into src/"""
+    root = tmp_path / "workspace"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "runtime.log").write_text("keep me\n")
+    (root / "stray.log").write_text("sweep me\n")
+    os.symlink(root / "src" / "runtime.log", root / "linked.log")
+    return root
+
+
+@pytest.fixture
+def sweeper(workspace):
+    plugin = SweeperPlugin()
+    plugin._set_default_protections()
+    plugin.workspace_root = workspace.resolve()
+    return plugin
+
+
+class TestSweeperCandidates:
+    """Protected targets stay protected however the walk reached them"""
+
+    def test_symlink_into_protected_dir_is_not_swept(self, sweeper):
+        classified = sweeper._scan_and_classify()
+
+        assert [c.path.name for c in classified] == ["stray.log"]
+
+    def test_snapshot_from_unresolved_root(self, sweeper, workspace, tmp_path):
+        alias = tmp_path / "alias"
+        os.symlink(workspace, alias, target_is_directory=True)
+        snapshot = WorkspaceScanner(alias).walk()
+
+        classified = sweeper._scan_and_classify(snapshot)
+
+        assert [c.path.name for c in classified] == ["stray.log"]
+        assert classified[0].category != FileCategory.UNKNOWN
+        assert classified[0].metadata["location"] == "."
@@ -0,0 +1,101 @@
+"""
+Tests for SessionManager cross-process refresh
+
+Foreign commits are picked up through PRAGMA data_version; messages are
+folded in past a rowid watermark instead of re-aggregating the table.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.session_manager import SessionManager
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "conversations.db"
+
+
+@pytest.fixture
+def manager(db_path):
+    manager = SessionManager(db_path=str(db_path))
+    yield manager
+    manager.close()
+
+
+def add_message(db_path, conversation_id, timestamp):
+    """Insert a message from another connection (another process)"""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO working_memory_messages (message_id, conversation_id, timestamp, role, content) "
+        "VALUES (?, ?, ?, 'user', 'hello')",
+        (str(uuid.uuid4()), conversation_id, timestamp.isoformat())
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestForeignCommits:
+    """Another connection's writes are seen without a full reload"""
+
+    def test_foreign_message_updates_last_activity(self, manager, db_path):
+        conversation_id = manager.start_session(intent="PLAN")
+        assert manager.get_active_session() == conversation_id
+
+        add_message(db_path, conversation_id, datetime.now() - timedelta(minutes=45))
+
+        # Last message is older than the idle timeout: boundary reached
+        assert manager.get_active_session() is None
+
+    def test_only_new_messages_are_scanned(self, manager, db_path):
+        conversation_id = manager.start_session(intent="PLAN")
+        for minutes in (3, 2, 1):
+            add_message(db_path, conversation_id, datetime.now() - timedelta(minutes=minutes))
+        manager.get_active_session()
+
+        statements = []
+        manager._conn.set_trace_callback(statements.append)
+        newest = datetime.now()
+        add_message(db_path, conversation_id, newest)
+        manager.get_active_session()
+        manager._conn.set_trace_callback(None)
+
+        message_reads = [sql for sql in statements if "FROM working_memory_messages" in sql]
+        assert message_reads
+        assert all("rowid > 3" in sql for sql in message_reads)
+        assert manager._last_message[conversation_id] == newest
+
+    def test_unrelated_commit_keeps_state(self, manager, db_path):
+        conversation_id = manager.start_session(intent="PLAN")
+        add_message(db_path, conversation_id, datetime.now())
+        manager.get_active_session()
+        before = dict(manager._last_message)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE unrelated (value TEXT)")
+        conn.execute("INSERT INTO unrelated VALUES ('x')")
+        conn.commit()
+        conn.close()
+
+        assert manager.get_active_session() == conversation_id
+        assert manager._last_message == before
+
+    def test_foreign_fifo_delete_drops_activity(self, manager, db_path):
+        conversation_id = manager.start_session(intent="PLAN")
+        add_message(db_path, conversation_id, datetime.now())
+        manager.get_active_session()
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM working_memory_messages WHERE conversation_id = ?", (conversation_id,))
+        conn.execute("DELETE FROM working_memory_conversations WHERE conversation_id = ?", (conversation_id,))
+        conn.commit()
+        conn.close()
+
+        assert manager.get_active_session() is None
+        assert conversation_id not in manager._last_message
@@ -0,0 +1,69 @@
+"""
+Tests for the patterns_current view managed by PatternDecay
+
+The view is created once per database and only rebuilt when its schema
+version (or the decay SQL it embeds) changes.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import pytest
+
+from src.tier2.knowledge_graph.database.connection import ConnectionManager
+from src.tier2.knowledge_graph.patterns.pattern_decay import PatternDecay
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = ConnectionManager(tmp_path / "knowledge-graph.db")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def statements(db):
+    executed = []
+    db.get_connection().set_trace_callback(executed.append)
+    yield executed
+    db.get_connection().set_trace_callback(None)
+
+
+def view_ddl(statements):
+    return [sql for sql in statements if "VIEW" in sql.upper() and "sqlite_master" not in sql]
+
+
+class TestCurrentView:
+    """patterns_current is not rebuilt on every construction"""
+
+    def test_view_created_once(self, db, statements):
+        PatternDecay(db)
+        created = view_ddl(statements)
+        statements.clear()
+
+        PatternDecay(db)
+
+        assert len(created) == 1
+        assert view_ddl(statements) == []
+
+    def test_version_bump_rebuilds_view(self, db, statements, monkeypatch):
+        PatternDecay(db)
+        statements.clear()
+
+        monkeypatch.setattr(PatternDecay, "VIEW_SCHEMA_VERSION", PatternDecay.VIEW_SCHEMA_VERSION + 1)
+        PatternDecay(db)
+
+        ddl = view_ddl(statements)
+        assert any(sql.startswith("DROP VIEW") for sql in ddl)
+        stored = db.get_connection().execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'patterns_current'"
+        ).fetchone()[0]
+        assert f"schema v{PatternDecay.VIEW_SCHEMA_VERSION}" in stored
+
+    def test_view_reports_effective_confidence(self, db):
+        PatternDecay(db)
+        conn = db.get_connection()
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(patterns_current)")]
+
+        assert "stored_confidence" in columns
+        assert "effective_confidence" in columns
@@ -0,0 +1,126 @@
+"""
+Tests for OracleCrawler batched catalog extraction and incremental snapshots
+
+Runs offline against a recorded data dictionary fixture replayed through
+RecordedCatalogConnection.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from src.tier2.oracle_crawler import OracleCrawler
+from src.tier2.oracle_replay import RecordedCatalogConnection
+
+FIXTURE = Path(__file__).parent / "fixtures" / "oracle_catalog_hr.json"
+
+
+@pytest.fixture
+def catalog():
+    return json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+
+def crawl(catalog, snapshot_path=None):
+    connection = RecordedCatalogConnection(catalog)
+    crawler = OracleCrawler("hr", "", "localhost:1521/ORCL", snapshot_path=snapshot_path, connection=connection)
+    try:
+        return crawler.crawl_schema(), connection
+    finally:
+        if crawler.snapshot:
+            crawler.snapshot.close()
+
+
+class TestBatchedExtraction:
+    """A full crawl costs a fixed number of dictionary queries"""
+
+    def test_full_crawl_from_recording(self):
+        result, connection = crawl(FIXTURE)
+
+        tables = {table.table_name: table for table in result.tables}
+        assert list(tables) == ["DEPARTMENTS", "EMPLOYEES"]
+        # current_user, seven owner-wide queries, one referenced-owner lookup
+        assert result.round_trips == 9
+        assert connection.executed.count("referenced_keys") == 1
+
+        employees = tables["EMPLOYEES"]
+        assert employees.comments == "Employee master data"
+        assert [c.column_name for c in employees.columns] == [
+            "EMPLOYEE_ID", "LAST_NAME", "DEPARTMENT_ID", "LOCATION_ID"
+        ]
+        assert {i.index_name: i.columns for i in employees.indexes}["EMP_EMP_ID_PK"] == ["EMPLOYEE_ID"]
+
+        foreign_keys = {c.constraint_name: c for c in employees.constraints if c.constraint_type == 'R'}
+        assert (foreign_keys["EMP_DEPT_FK"].r_table, foreign_keys["EMP_DEPT_FK"].r_columns) == (
+            "DEPARTMENTS", ["DEPARTMENT_ID"]
+        )
+        assert (foreign_keys["EMP_LOC_FK"].r_table, foreign_keys["EMP_LOC_FK"].r_columns) == (
+            "LOCATIONS", ["LOCATION_ID"]
+        )
+
+    def test_without_snapshot_every_table_is_changed(self):
+        result, _ = crawl(FIXTURE)
+
+        assert result.changed == ["HR.DEPARTMENTS", "HR.EMPLOYEES"]
+        assert result.extracted == 2
+
+
+class TestSnapshotDiff:
+    """Re-crawls re-extract only tables whose LAST_DDL_TIME moved"""
+
+    def test_unchanged_recrawl_lists_tables_only(self, catalog, tmp_path):
+        snapshot = tmp_path / "oracle_snapshot.db"
+        crawl(catalog, snapshot)
+
+        result, connection = crawl(catalog, snapshot)
+
+        assert result.changed == []
+        assert result.dropped == []
+        assert result.extracted == 0
+        assert connection.executed == ["current_user", "tables"]
+        assert [table.table_name for table in result.tables] == ["DEPARTMENTS", "EMPLOYEES"]
+
+    def test_statistics_only_change_is_not_a_schema_change(self, catalog, tmp_path):
+        snapshot = tmp_path / "oracle_snapshot.db"
+        crawl(catalog, snapshot)
+
+        updated = copy.deepcopy(catalog)
+        updated["result_sets"]["tables"]["HR"][1][3] = 250
+        result, _ = crawl(updated, snapshot)
+
+        assert result.changed == []
+        assert {t.table_name: t.num_rows for t in result.tables}["EMPLOYEES"] == 250
+
+    def test_ddl_change_reextracts_subset(self, catalog, tmp_path):
+        snapshot = tmp_path / "oracle_snapshot.db"
+        crawl(catalog, snapshot)
+
+        updated = copy.deepcopy(catalog)
+        sets = updated["result_sets"]
+        sets["tables"]["HR"][1][4] = "2025-02-01T09:30:00"
+        sets["columns"]["HR"].append(["EMPLOYEES", "HIRE_DATE", "DATE", 7, None, None, "Y", None, None])
+        result, connection = crawl(updated, snapshot)
+
+        assert result.changed == ["HR.EMPLOYEES"]
+        assert result.extracted == 1
+        employees = {t.table_name: t for t in result.tables}["EMPLOYEES"]
+        assert employees.columns[-1].column_name == "HIRE_DATE"
+        # Same-owner FK target is outside the subset: resolved by one key lookup
+        fk = {c.constraint_name: c for c in employees.constraints}["EMP_DEPT_FK"]
+        assert (fk.r_table, fk.r_columns) == ("DEPARTMENTS", ["DEPARTMENT_ID"])
+        assert connection.executed.count("referenced_keys") == 2
+
+    def test_dropped_table_is_reported(self, catalog, tmp_path):
+        snapshot = tmp_path / "oracle_snapshot.db"
+        crawl(catalog, snapshot)
+
+        updated = copy.deepcopy(catalog)
+        updated["result_sets"]["tables"]["HR"] = updated["result_sets"]["tables"]["HR"][1:]
+        result, _ = crawl(updated, snapshot)
+
+        assert result.dropped == ["HR.DEPARTMENTS"]
+        assert [table.table_name for table in result.tables] == ["EMPLOYEES"]
@@ -0,0 +1,99 @@
+"""
+Tests for copy-on-write configuration snapshots
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import json
+
+import pytest
+
+from src.utils.config_snapshots import ConfigRuntime, freeze, thaw
+
+
+def write_json(path, value):
+    path.write_text(json.dumps(value), encoding="utf-8")
+
+
+@pytest.fixture
+def runtime():
+    runtime = ConfigRuntime(watch=False)
+    yield runtime
+    runtime.stop()
+
+
+class TestFreezeThaw:
+    """Frozen values are deep read-only; thawed copies are independent"""
+
+    def test_freeze_is_deep_and_read_only(self):
+        frozen = freeze({"rules": [{"name": "a", "tags": {"x"}}]})
+
+        with pytest.raises(TypeError):
+            frozen["rules"] = ()
+        with pytest.raises(TypeError):
+            frozen["rules"][0]["name"] = "b"
+        assert frozen["rules"][0]["tags"] == frozenset({"x"})
+        assert isinstance(frozen["rules"], tuple)
+
+    def test_thaw_round_trip_is_mutable_copy(self):
+        original = {"rules": [{"name": "a", "tags": {"x"}}]}
+        thawed = thaw(freeze(original))
+
+        thawed["rules"][0]["name"] = "b"
+
+        assert thawed["rules"][0]["tags"] == {"x"}
+        assert original["rules"][0]["name"] == "a"
+        assert thaw(freeze(original)) == original
+
+
+class TestConfigSource:
+    """Rebuilds publish whole versions and never replace a good snapshot with a failure"""
+
+    def test_parse_failure_keeps_last_good_snapshot(self, runtime, tmp_path):
+        path = tmp_path / "config.json"
+        write_json(path, {"mode": "strict"})
+        source = runtime.json_file(path)
+
+        path.write_text("{not json", encoding="utf-8")
+
+        assert runtime.refresh() == []
+        assert source.current.version == 1
+        assert source.value["mode"] == "strict"
+        assert source.failures == 1
+
+        # Same broken file: not re-parsed on every poll
+        runtime.refresh()
+        assert source.failures == 1
+
+        write_json(path, {"mode": "relaxed"})
+        assert runtime.refresh() == [source.name]
+        assert source.current.version == 2
+        assert source.value["mode"] == "relaxed"
+
+    def test_subscribers_notified_once_per_version(self, runtime, tmp_path):
+        path = tmp_path / "config.json"
+        write_json(path, {"limit": 1})
+        source = runtime.json_file(path)
+        seen = []
+        source.subscribe(lambda snapshot: seen.append(snapshot.version))
+
+        write_json(path, {"limit": 22})
+        runtime.refresh()
+        runtime.refresh()
+        # Rewritten with identical content: no new version
+        write_json(path, {"limit": 22})
+        runtime.refresh()
+
+        assert seen == [2]
+
+    def test_register_existing_source_refreshes(self, runtime, tmp_path):
+        path = tmp_path / "config.json"
+        write_json(path, {"enabled": False})
+        first = runtime.json_file(path)
+
+        write_json(path, {"enabled": True, "changed": 1})
+        second = runtime.json_file(path)
+
+        assert second is first
+        assert second.value["enabled"] is True
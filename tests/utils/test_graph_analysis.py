@@ -0,0 +1,139 @@
+"""
+Tests for DirectedGraph incremental SCC and layer maintenance
+
+Random edit sequences are checked against a from-scratch recompute after
+every step, so each incremental path (merge on insert, split on delete,
+node removal, layer bounds) is compared with the naive answer.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import random
+
+import pytest
+
+from src.utils.graph_analysis import DirectedGraph
+
+
+def reachable(edges, node):
+    seen = {node}
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        for source, target in edges:
+            if source == current and target not in seen:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+def naive_components(nodes, edges):
+    """SCCs by mutual reachability, as a set of frozensets."""
+    reach = {node: reachable(edges, node) for node in nodes}
+    return {
+        frozenset(other for other in nodes if other in reach[node] and node in reach[other])
+        for node in nodes
+    }
+
+
+def naive_cycles(nodes, edges, components):
+    return {
+        component for component in components
+        if len(component) > 1 or any((node, node) in edges for node in component)
+    }
+
+
+def naive_layers(nodes, edges, components):
+    """Longest-path layer per node by relaxing condensation edges to a fixpoint."""
+    comp_of = {node: component for component in components for node in component}
+    layer = {component: 0 for component in components}
+    changed = True
+    while changed:
+        changed = False
+        for source, target in edges:
+            if comp_of[source] is comp_of[target]:
+                continue
+            if layer[comp_of[target]] < layer[comp_of[source]] + 1:
+                layer[comp_of[target]] = layer[comp_of[source]] + 1
+                changed = True
+    return {node: layer[comp_of[node]] for node in nodes}
+
+
+def assert_matches_naive(graph, nodes, edges):
+    distinct = set(edges)
+    components = naive_components(nodes, distinct)
+
+    assert set(graph.nodes) == set(nodes)
+    assert {frozenset(c) for c in graph.strongly_connected_components()} == components
+    assert {frozenset(c) for c in graph.cycles()} == naive_cycles(nodes, distinct, components)
+    assert graph.is_acyclic() == (not naive_cycles(nodes, distinct, components))
+
+    expected_layers = naive_layers(nodes, distinct, components)
+    assert {node: graph.layer_of(node) for node in nodes} == expected_layers
+
+    # Condensation order: every edge between components points forward
+    order = {node: i for i, c in enumerate(graph.strongly_connected_components()) for node in c}
+    for source, target in distinct:
+        assert order[source] <= order[target]
+
+
+class TestIncrementalAgainstNaive:
+    """Incremental updates agree with a full recompute after every edit"""
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_random_edit_sequence(self, seed):
+        rng = random.Random(seed)
+        node_pool = list(range(12))
+        nodes = list(range(6))
+        edges = []  # with multiplicity, like the graph's parallel-edge counts
+        graph = DirectedGraph(nodes=nodes)
+        graph.layers()  # build now so every later edit is incremental
+
+        for _ in range(120):
+            op = rng.random()
+            if op < 0.5 or not edges:
+                source, target = rng.choice(node_pool), rng.choice(node_pool)
+                graph.add_edge(source, target)
+                edges.append((source, target))
+                for node in (source, target):
+                    if node not in nodes:
+                        nodes.append(node)
+            elif op < 0.85:
+                edge = rng.choice(edges)
+                graph.remove_edge(*edge)
+                edges.remove(edge)
+            elif op < 0.95 and nodes:
+                node = rng.choice(nodes)
+                graph.remove_node(node)
+                nodes.remove(node)
+                edges = [edge for edge in edges if node not in edge]
+            else:
+                node = rng.choice(node_pool)
+                graph.add_node(node)
+                if node not in nodes:
+                    nodes.append(node)
+
+            # Only query some of the time, so layers are sometimes stale
+            # and sometimes valid when the next edit arrives
+            if rng.random() < 0.6:
+                assert_matches_naive(graph, nodes, edges)
+
+        assert_matches_naive(graph, nodes, edges)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_incremental_equals_batch_build(self, seed):
+        rng = random.Random(1000 + seed)
+        edges = [(rng.randrange(40), rng.randrange(40)) for _ in range(120)]
+
+        incremental = DirectedGraph(nodes=range(40))
+        incremental.layers()
+        for edge in edges:
+            incremental.add_edge(*edge)
+        batch = DirectedGraph(edges, nodes=range(40))
+
+        assert incremental.layers() == batch.layers()
+        assert (
+            {frozenset(c) for c in incremental.cycles()}
+            == {frozenset(c) for c in batch.cycles()}
+        )
@@ -0,0 +1,29 @@
+"""
+Import the workflows package without its __init__.
+
+The package __init__ imports TDDWorkflow, which pulls in the test_generator
+agent and its missing test_counter module (see
+tests/cortex_agents/test_generator/conftest.py). Registering the package
+by path lets standalone modules such as workflow_pipeline be tested.
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import src
+
+PACKAGE = "src.workflows"
+
+if PACKAGE not in sys.modules:
+    package_dir = Path(src.__file__).parent / "workflows"
+    spec = importlib.util.spec_from_file_location(
+        PACKAGE, package_dir / "__init__.py", submodule_search_locations=[str(package_dir)]
+    )
+    package = importlib.util.module_from_spec(spec)
+    # Deliberately not executed: only submodule lookup through __path__ is needed
+    sys.modules[PACKAGE] = package
+    src.workflows = package
@@ -0,0 +1,41 @@
+"""
+Tests for WorkflowDefinition.validate_dag
+
+Author: Asif Hussain
+Copyright: © 2024-2025 Asif Hussain. All rights reserved.
+"""
+
+from src.workflows.workflow_pipeline import StageDefinition, WorkflowDefinition
+
+
+def workflow(**depends_on):
+    stages = [
+        StageDefinition(id=stage_id, script=f"{stage_id}_module", depends_on=deps)
+        for stage_id, deps in depends_on.items()
+    ]
+    return WorkflowDefinition(workflow_id="wf", name="wf", description="", stages=stages)
+
+
+class TestValidateDag:
+    """Cycles are reported for stages on them and for stages behind them"""
+
+    def test_acyclic_workflow_is_valid(self):
+        assert workflow(a=[], b=["a"], c=["a", "b"]).validate_dag() == []
+
+    def test_cycle_members_name_the_cycle(self):
+        errors = workflow(a=["b"], b=["a"]).validate_dag()
+
+        assert errors == [
+            "Cycle detected in dependencies for stage 'a': a -> b -> a",
+            "Cycle detected in dependencies for stage 'b': b -> a -> b",
+        ]
+
+    def test_stages_depending_on_a_cycle_are_reported(self):
+        errors = workflow(
+            a=["b"], b=["a"], c=["a"], d=["c"], e=[]
+        ).validate_dag()
+
+        assert len(errors) == 4
+        assert "Cycle detected in dependencies for stage 'c': depends on cyclic stage 'a'" in errors
+        assert "Cycle detected in dependencies for stage 'd': depends on cyclic stage 'a'" in errors
+        assert not any("'e'" in error for error in errors)